@@ -144,6 +144,14 @@ def _IsLogRDConsoleSinkEnabled() -> bool:
     return not _FwRteConfig._GetInstance()._isLogRDConsoleSinkDisabled
 def _IsLogRDActiveServiceRequired() -> bool:
     return _FwRteConfig._GetInstance()._isLogRDActiveServiceRequired
+def _IsCompactMsgSerDesEnabled() -> bool:
+    return _FwRteConfig._GetInstance()._isCompactMessageSerDesEnabled
+def _IsMsgLatencyTracingEnabled() -> bool:
+    return _FwRteConfig._GetInstance()._isMessageLatencyTracingEnabled
+def _GetMsgTraceSink():
+    return _FwRteConfig._GetInstance()._msgTraceSink
+def _GetNumMsgDispatchShards() -> int:
+    return _FwRteConfig._GetInstance()._numMsgDispatchShards
 def _GetRteConfig() -> _FwRteConfig:
     return _FwRteConfig._GetInstance()
 
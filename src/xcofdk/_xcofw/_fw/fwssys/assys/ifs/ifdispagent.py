@@ -7,10 +7,13 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
+from typing import Union
+
 from _fw.fwssys.fwcore.base.fwcallable   import _FwCallable
 from _fw.fwssys.fwcore.types.aobject     import _AbsSlotsObject
 from _fw.fwssys.fwcore.types.commontypes import _EExecutionCmdID
 from _fw.fwssys.fwmsg.msg                import _IFwMessage
+from _fw.fwssys.fwmsg.disp.fwshareddump  import _FwSharedDump
 
 class _IDispAgent(_AbsSlotsObject):
     __slots__ = []
@@ -38,6 +41,8 @@ class _IDispAgent(_AbsSlotsObject):
     def _agentName(self) -> str:
         pass
 
-    def _PushMessage(self, msg_ : _IFwMessage, msgDump_: bytes, pldDump_=None, bCustomPL_=None, customDesCB_=None, callback_: _FwCallable =None) -> _EExecutionCmdID:
+    def _PushMessage(self, msg_ : _IFwMessage, msgDump_: Union[bytes, _FwSharedDump], pldDump_=None, bCustomPL_=None, customDesCB_=None, callback_: _FwCallable =None) -> _EExecutionCmdID:
         pass
 
+    def _PushMessages(self, lstPushArgs_ : list, callback_: _FwCallable =None) -> list:
+        pass
@@ -12,6 +12,7 @@ from typing import Tuple
 from typing import Union
 
 from xcofdk.fwcom     import LcFailure
+from xcofdk.fwcom     import TaskMetrics
 from xcofdk.fwapi     import IRCTask
 from xcofdk.fwapi     import IRCCommTask
 from xcofdk.fwapi.xmt import IXTask
@@ -36,6 +37,9 @@ class _IFwApiConn(_ProtAbsSlotsObject):
     def _GetLcFailure(self) -> Union[LcFailure, None]:
         pass
 
+    def _GetTaskMetrics(self, tasks_: Union[int, List[int], None] =None) -> List[TaskMetrics]:
+        pass
+
     def _GetXTask(self, xtUID_ : int =0) -> Union[IXTask, None]:
         pass
 
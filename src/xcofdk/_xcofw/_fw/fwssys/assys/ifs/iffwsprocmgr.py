@@ -22,5 +22,11 @@ class _IFwsProcMgr:
     def _AddProcess(self, xprocConn_ : _IXProcConn, puid_ : int) -> bool:
         pass
 
+    def _AddProcessPool(self, xpool_) -> bool:
+        pass
+
+    def _AddProcessChannel(self, xchnl_) -> bool:
+        pass
+
     def _GetXProcesses(self, lstPIDs_ : list =None) -> Union[List[_IXProcAgent], None]:
         pass
@@ -8,6 +8,7 @@
 # ------------------------------------------------------------------------------
 
 from typing import Any
+from typing import Union
 
 from _fw.fwssys.fwcore.types.aobject import _AbsSlotsObject
 from _fw.fwssys.fwmp.xprocessstate   import _EPState
@@ -34,6 +35,10 @@ class _IXProcAgent(_AbsSlotsObject):
     def _xprocessPID(self) -> int:
         pass
 
+    @property
+    def _xprocessSentinel(self) -> Union[int, None]:
+        pass
+
     @property
     def _xprocessName(self) -> str:
         pass
@@ -42,5 +47,8 @@ class _IXProcAgent(_AbsSlotsObject):
     def _xprocessAliasName(self):
         pass
 
+    def _OpenWaitable(self) -> Union[int, None]:
+        pass
+
     def _OnPTerminated(self, tst_ : _EPState, xc_ : int, sd_ : Any):
         pass
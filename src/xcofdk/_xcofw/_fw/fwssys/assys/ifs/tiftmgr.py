@@ -11,6 +11,7 @@ from typing import List
 from typing import Tuple
 from typing import Union
 
+from xcofdk.fwcom     import TaskMetrics
 from xcofdk.fwapi.xmt import IXTask
 
 class _ITTMgr:
@@ -25,6 +26,9 @@ class _ITTMgr:
     def _GetXTasks(self, bRunningOnly_ =True, bJoinableOnly_ =True, bUID_ =True, lstUIDs_ : list =None) -> Tuple[List[Union[int, IXTask]], Union[List[int], None]]:
         pass
 
+    def _GetTaskMetrics(self, lstUIDs_ : list =None) -> List[TaskMetrics]:
+        pass
+
     def _GetProxyInfoReplacementData(self):
         pass
 
@@ -46,6 +46,17 @@ class _TimeUtil:
     def GetCurTicksNS():
         return int(time.time_ns() // _TimeUtil.TICKS_PER_NSECOND)
 
+    @staticmethod
+    def GetMonotonicTicksNS() -> int:
+        return time.monotonic_ns()
+
+    @staticmethod
+    def MonotonicTicksNS2DateTime(monoTicksNS_ : int) -> _PyDateTime:
+        if monoTicksNS_ is None:
+            return None
+        _usDiff = max(0, time.monotonic_ns() - monoTicksNS_) // _TimeUtil.TICKS_PER_USECOND
+        return _PyDateTime.now() - _PyTimeDelta(microseconds=_usDiff)
+
     @staticmethod
     def GetCurTicksSEC():
         return float(time.time_ns() / _TimeUtil.TICKS_PER_SECOND)
@@ -7,6 +7,9 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
+from typing import Tuple
+from typing import Union
+
 from xcofdk.fwapi import IPayload
 
 from _fw.fwssys.assys                     import fwsubsysshare as _ssshare
@@ -23,12 +26,13 @@ from _fw.fwssys.fwcore.ipc.tsk.taskxcard  import _TaskXCard
 from _fw.fwssys.fwcore.ipc.tsk.fwtaskprf  import _FwTaskProfile
 from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _ETaskRightFlag
 from _fw.fwssys.fwcore.types.aobject      import _AbsSlotsObject
-from _fw.fwssys.fwcore.types.serdes       import SerDes
 from _fw.fwssys.fwmsg.msg                 import _IFwMessage
 from _fw.fwssys.fwmsg.msg                 import _FwMessage
 from _fw.fwssys.fwmsg.disp.fwqueue        import _FwQueue
+from _fw.fwssys.fwmsg.disp.fwshareddump   import _FwSharedDump
 from _fw.fwssys.fwmsg.disp.dispfilter     import _DispatchFilter
 from _fw.fwssys.fwmsg.disp.dispregistry   import _DispatchRegistry
+from _fw.fwssys.fwmsg.apiimpl.xmsgserdes  import _XMsgSerDes
 from _fw.fwssys.fwerrh.fwerrorcodes       import _EFwErrorCode
 from _fwa.fwsubsyscoding                  import _FwSubsysCoding
 
@@ -122,7 +126,7 @@ class _FwsDispatcher(_AbsFwService):
 
         _MAX_RETRY_COUNT = 3
 
-        def __init__(self, bXMsg_ : bool, msgUID_ : int, msgDump_ : bytes, lstDispTgt_ : list, retryMap_ : dict, pldDump_ =None, bCustomPL_ =None, customDesCB_ =None):
+        def __init__(self, bXMsg_ : bool, msgUID_ : int, msgDump_ : Union[bytes, _FwSharedDump], lstDispTgt_ : list, retryMap_ : dict, pldDump_ =None, bCustomPL_ =None, customDesCB_ =None):
             super().__init__()
             self.__m   = None
             self.__at  = lstDispTgt_
@@ -146,7 +150,10 @@ class _FwsDispatcher(_AbsFwService):
             if self.__m is not None:
                 return self.__m
 
-            self.__m = _FwsDispatcher._DeserializeMsg(self.__bX, self.__uid, self.__dm, pldDump_=self.__dp, bCustomPL_=self.__bC, customDesCB_=self.__cb)
+            if isinstance(self.__dm, _FwSharedDump):
+                self.__m = _FwsDispatcher._DeserializeMsg(self.__bX, self.__uid, self.__dm._msgDump, pldDump_=self.__dm._pldDump, bCustomPL_=self.__bC, customDesCB_=self.__cb)
+            else:
+                self.__m = _FwsDispatcher._DeserializeMsg(self.__bX, self.__uid, self.__dm, pldDump_=self.__dp, bCustomPL_=self.__bC, customDesCB_=self.__cb)
             return self.__m
 
         @property
@@ -166,7 +173,7 @@ class _FwsDispatcher(_AbsFwService):
             return self.__at
 
         @property
-        def _msgDump(self) -> bytes:
+        def _msgDump(self) -> Union[bytes, _FwSharedDump]:
             return self.__dm
 
         @property
@@ -216,9 +223,10 @@ class _FwsDispatcher(_AbsFwService):
                 return
 
             _bPldDump = False if self.__dp is None else True
+            _bShdPld  = isinstance(self.__dm, _FwSharedDump) and (self.__dm._pldDump is not None)
 
             if self.__m is not None:
-                if self.__dp is not None:
+                if _bPldDump or _bShdPld:
                     self.__m.AttachPayload(None)
                 self.__m.CleanUp()
                 del self.__m
@@ -245,7 +253,58 @@ class _FwsDispatcher(_AbsFwService):
             self.__rc  = None
             self.__uid = None
 
-    __slots__ = [ '__a' , '__ma' , '__md' , '__tr' , '__iq', '__p' , '__iam' ]
+    class _DispShard(_AbsSlotsObject):
+        __slots__ = [ '__md' , '__iq' , '__p' , '__iam' ]
+
+        def __init__(self, maxRetry_ : int):
+            super().__init__()
+            self.__p   = []
+            self.__md  = _Mutex()
+            self.__iq  = _FwQueue.CreateInstance(maxSize_=_FwQueue.GetFiniteQueueDefaultSize())
+            self.__iam = _FwsDispatcher._DeliveryRetryMap(maxRetry_=maxRetry_)
+
+        @property
+        def _lock(self) -> _Mutex:
+            return self.__md
+
+        @property
+        def _backlog(self) -> _FwQueue:
+            return self.__iq
+
+        @property
+        def _pendingAgents(self) -> list:
+            return self.__p
+
+        @property
+        def _retryMap(self):
+            return self.__iam
+
+        @property
+        def _backlogSize(self) -> int:
+            _iq = self.__iq
+            return 0 if _iq is None else _iq.qsize
+
+        def _ToString(self):
+            pass
+
+        def _CleanUp(self):
+            if self.__md is None:
+                return
+
+            with self.__md:
+                self.__iam.CleanUp()
+                self.__iam = None
+
+                self.__p.clear()
+                self.__p = None
+
+                self.__iq.CleanUp()
+                self.__iq = None
+
+            self.__md.CleanUp()
+            self.__md = None
+
+    __slots__ = [ '__a' , '__ma' , '__tr' , '__sh' ]
 
     __IRRESP_THRESHOLD = 9
 
@@ -253,13 +312,10 @@ class _FwsDispatcher(_AbsFwService):
     __tskPrf = None
 
     def __init__(self):
-        self.__a   = None
-        self.__p   = None
-        self.__iq  = None
-        self.__ma  = None
-        self.__md  = None
-        self.__tr  = None
-        self.__iam = None
+        self.__a  = None
+        self.__ma = None
+        self.__tr = None
+        self.__sh = None
 
         if _FwsDispatcher.__sgltn is not None:
             vlogif._LogOEC(True, _EFwErrorCode.VFE_00061)
@@ -276,13 +332,12 @@ class _FwsDispatcher(_AbsFwService):
             return
 
         _tout = _Timeout.CreateTimeoutSec(3)
-        self.__a   = _TimeAlert(_tout.toNSec)
-        self.__p   = []
-        self.__ma  = _Mutex()
-        self.__md  = _Mutex()
-        self.__iq  = _FwQueue.CreateInstance(maxSize_=_FwQueue.GetFiniteQueueDefaultSize())
-        self.__tr  = _DispatchRegistry(bTaskRegistry_=True)
-        self.__iam = _FwsDispatcher._DeliveryRetryMap(maxRetry_=_FwsDispatcher.__IRRESP_THRESHOLD)
+        self.__a  = _TimeAlert(_tout.toNSec)
+        self.__ma = _Mutex()
+        self.__tr = _DispatchRegistry(bTaskRegistry_=True)
+
+        _numSH = _ssshare._GetNumMsgDispatchShards()
+        self.__sh = [ _FwsDispatcher._DispShard(_FwsDispatcher.__IRRESP_THRESHOLD) for _ in range(max(1, _numSH)) ]
 
         _tout.CleanUp()
 
@@ -315,7 +370,7 @@ class _FwsDispatcher(_AbsFwService):
         return res
 
     @staticmethod
-    def _DeserializeMsg(bXMsg_: bool, msgUID_: int, msgDump_: bytes, pldDump_=None, bCustomPL_=None, customDesCB_=None):
+    def _DeserializeMsg(bXMsg_: bool, msgUID_: int, msgDump_: Union[bytes, memoryview], pldDump_=None, bCustomPL_=None, customDesCB_=None):
         _pldDes = None
 
         if pldDump_ is not None:
@@ -345,7 +400,7 @@ class _FwsDispatcher(_AbsFwService):
         if not bXMsg_:
             res = _FwMessage.DeserializeFwMsg(msgDump_)
         else:
-            res = SerDes.DeserializeData(msgDump_, bTreatAsUserError_=True)
+            res = _XMsgSerDes._DeserializeXMsg(msgDump_)
 
         if res is None:
             logif._LogErrorEC(_EFwErrorCode.UE_00058, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_009).format(msgUID_))
@@ -391,6 +446,105 @@ class _FwsDispatcher(_AbsFwService):
             vlogif._LogOEC(True, _EFwErrorCode.VFE_00064)
             return False
 
+        _dj = self.__PrepareDispatch(msg_)
+        if _dj is None:
+            return False
+
+        with self.__ma:
+            _allTgt = self.__tr._GetAllDispatchTargets(msg_.header)
+
+            if _allTgt is None:
+                self.__DiscardDispatch(msg_, _dj)
+                return False
+
+        res = False
+        for _shd, _shdTgts in self.__GetShards(_allTgt):
+            with _shd._lock:
+                res = self.__PushToTargets(_shd, msg_, _dj, _shdTgts) or res
+        return res
+
+    def _DispatchMessages(self, msgs_ : list) -> list:
+        res = [False] * len(msgs_)
+
+        if _ssshare._WarnOnDisabledSubsysMsg():
+            return res
+
+        if self._isInvalid or self._isInLcCeaseMode or not self.isRunning:
+            vlogif._LogOEC(True, _EFwErrorCode.VFE_00063)
+            return res
+
+        for _mm in msgs_:
+            if not (isinstance(_mm, _IFwMessage) and _mm.isValid and not _mm.isInternalMsg):
+                vlogif._LogOEC(True, _EFwErrorCode.VFE_00064)
+                return res
+
+        _lstDJ = []
+        for _ii, _mm in enumerate(msgs_):
+            _dj = self.__PrepareDispatch(_mm)
+            if _dj is not None:
+                _lstDJ.append((_ii, _mm, _dj))
+
+        if len(_lstDJ) < 1:
+            return res
+
+        with self.__ma:
+            _lstTgt = [ self.__tr._GetAllDispatchTargets(_mm.header) for _, _mm, _ in _lstDJ ]
+
+        _shdJobs = dict()
+        for _job, _allTgt in zip(_lstDJ, _lstTgt):
+            if _allTgt is None:
+                _, _mm, _dj = _job
+                self.__DiscardDispatch(_mm, _dj)
+                continue
+
+            for _shd, _shdTgts in self.__GetShards(_allTgt):
+                _lst = _shdJobs.get(id(_shd), None)
+                if _lst is None:
+                    _lst = _shdJobs[id(_shd)] = (_shd, [])
+                _lst[1].append((_job, _shdTgts))
+
+        for _shd, _lstJobs in _shdJobs.values():
+            with _shd._lock:
+                _p    = _shd._pendingAgents
+                _grps = dict()
+
+                for (_ii, _mm, _dj), _allTgt in _lstJobs:
+                    if len(_allTgt) == 1:
+                        _dt = _allTgt[0]
+                        if _dt.isValid and (_dt._dispatchAgent._agentTaskID not in _p):
+                            _grp = _grps.get(id(_dt), None)
+                            if _grp is None:
+                                _grp = _grps[id(_dt)] = (_dt, [])
+                            _grp[1].append((_ii, _mm, _dj))
+                            continue
+
+                    self.__PushGroups(_shd, _grps, res)
+                    res[_ii] = self.__PushToTargets(_shd, _mm, _dj, _allTgt) or res[_ii]
+
+                self.__PushGroups(_shd, _grps, res)
+            _lstJobs.clear()
+
+        _shdJobs.clear()
+        _lstDJ.clear()
+        _lstTgt.clear()
+        return res
+
+    def __GetShards(self, allTgt_ : list) -> list:
+        _lstSH = self.__sh
+        _numSH = len(_lstSH)
+        if _numSH == 1:
+            return [ (_lstSH[0], allTgt_) ]
+
+        res = dict()
+        for _dt in allTgt_:
+            _shd = _lstSH[0] if not _dt.isValid else _lstSH[_dt._dispatchAgent._agentTaskID % _numSH]
+            _grp = res.get(id(_shd), None)
+            if _grp is None:
+                _grp = res[id(_shd)] = (_shd, [])
+            _grp[1].append(_dt)
+        return list(res.values())
+
+    def __PrepareDispatch(self, msg_ : _IFwMessage):
         _pldOrig    = msg_.payload
         _pldDump    = None
         _bCSerDes   = False  
@@ -407,7 +561,7 @@ class _FwsDispatcher(_AbsFwService):
         else:
             if _pldOrig.isCustomMarshalingRequired:
                 if not _FwSubsysCoding.IsCustomPayloadSerDesEnabled():
-                    return False
+                    return None
 
                 _bCSerDes = True
 
@@ -430,142 +584,187 @@ class _FwsDispatcher(_AbsFwService):
         if _bSerDesErr:
             if _bNonSerDes:
                 msg_.AttachPayload(_pldOrig)
-            return False
+            return None
 
         if msg_.isFwMsg:
             _dump = _FwMessage.SerializeFwMsg(msg_)
         else:
-            _dump = SerDes.SerializeObject(msg_, bTreatAsUserError_=True)
-
-        _bABack = _bNonSerDes or _bCSerDes
+            _dump = _XMsgSerDes._SerializeXMsg(msg_)
 
         if _dump is None:
-            if _bABack:
+            if _bNonSerDes or _bCSerDes:
                 msg_.AttachPayload(_pldOrig)
-            return False
+            return None
+        return _dump, _pldOrig, _pldDump, _bNonSerDes, _bCSerDes, _customDesCallback
+
+    def __DiscardDispatch(self, msg_ : _IFwMessage, dispJob_ : tuple):
+        _, _pldOrig, _, _bNonSerDes, _bCSerDes, _ = dispJob_
+        if _bNonSerDes or _bCSerDes:
+            msg_.AttachPayload(_pldOrig)
+        logif._LogErrorEC(_EFwErrorCode.UE_00061, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_001).format(msg_.header))
+
+    def __PushGroups(self, shd_ : _DispShard, grps_ : dict, res_ : list):
+        if len(grps_) < 1:
+            return
+
+        for _dt, _lstDJ in grps_.values():
+            _dagt      = _dt._dispatchAgent
+            _lstPushed = None
+
+            if self.isRunning and _dagt._isOperating:
+                _lstArgs = []
+                for _, _mm, (_dump, _pldOrig, _pldDump, _bNonSerDes, _bCSerDes, _customDesCallback) in _lstDJ:
+                    if _bNonSerDes:
+                        _lstArgs.append((_mm, _dump, _pldOrig, False, _customDesCallback))
+                    elif _bCSerDes:
+                        _lstArgs.append((_mm, _dump, _pldDump, True, _customDesCallback))
+                    else:
+                        _lstArgs.append((_mm, _dump, None, None, _customDesCallback))
+
+                _lstPushed = _dagt._PushMessages(_lstArgs, callback_=_dt._dispatchCallback)
+                _lstArgs.clear()
+
+                if any(_lstPushed):
+                    shd_._retryMap.RemoveTask(_dagt._agentTaskID)
+
+            for _jj, (_ii, _mm, _dj) in enumerate(_lstDJ):
+                if (_lstPushed is not None) and _lstPushed[_jj]:
+                    res_[_ii] = True
+                    _, _pldOrig, _, _bNonSerDes, _bCSerDes, _ = _dj
+                    if _bNonSerDes or _bCSerDes:
+                        _mm.AttachPayload(_pldOrig)
+                else:
+                    res_[_ii] = self.__PushToTargets(shd_, _mm, _dj, [_dt]) or res_[_ii]
+            _lstDJ.clear()
+        grps_.clear()
 
+    def __PushToTargets(self, shd_ : _DispShard, msg_ : _IFwMessage, dispJob_ : tuple, allTgt_ : list) -> bool:
+        _dump, _pldOrig, _pldDump, _bNonSerDes, _bCSerDes, _customDesCallback = dispJob_
+
+        _p, _iam = shd_._pendingAgents, shd_._retryMap
+
+        _bABack   = _bNonSerDes or _bCSerDes
         _lstP     = []
-        _allTgt   = None
         _retryMap = dict()
 
-        with self.__ma:
-            _allTgt = self.__tr._GetAllDispatchTargets(msg_.header)
+        _numPushed = 0
+        _bMultiTgt = len(allTgt_) > 1
 
-            if _allTgt is None:
+        _shd = None
+        if _bMultiTgt:
+            _shd = _FwSharedDump(_dump, pldDump_=_pldOrig if _bNonSerDes else _pldDump)
+
+        for _dt in allTgt_:
+            if not self.isRunning:
                 del _dump
                 if _bABack:
                     msg_.AttachPayload(_pldOrig)
-                logif._LogErrorEC(_EFwErrorCode.UE_00061, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_001).format(msg_.header))
                 return False
 
-        with self.__md:
-            _numPushed = 0
-            _bMultiTgt = len(_allTgt) > 1
+            _dagt = _dt._dispatchAgent
+            _atid = None if not _dt.isValid else _dagt._agentTaskID
 
-            for _dt in _allTgt:
-                if not self.isRunning:
-                    del _dump
-                    if _bABack:
-                        msg_.AttachPayload(_pldOrig)
-                    return False
+            if (_atid is None) or not _dagt._isOperating:
+                if _atid is None:
+                    logif._LogErrorEC(_EFwErrorCode.UE_00150, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_005).format(msg_.header))
+                else:
+                    logif._LogErrorEC(_EFwErrorCode.UE_00151, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_002).format(_atid, msg_.header))
+                    _iam.RemoveTask(_atid)
+                continue
 
-                _dagt = _dt._dispatchAgent
-                _atid = None if not _dt.isValid else _dagt._agentTaskID
+            if _atid in _p:
+                _lstP.append(_dt)
+                _retryMap[_atid] = 2 if _iam.IsThresholdReached(_atid) else 0
+                continue
 
-                if (_atid is None) or not _dagt._isOperating:
-                    if _atid is None:
-                        logif._LogErrorEC(_EFwErrorCode.UE_00150, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_005).format(msg_.header))
-                    else:
-                        logif._LogErrorEC(_EFwErrorCode.UE_00151, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_002).format(_atid, msg_.header))
-                        self.__iam.RemoveTask(_atid)
-                    continue
+            if _bNonSerDes:
+                _pldTgt = _pldOrig
+                _bCustomPL = False
+            elif _bCSerDes:
+                _pldTgt = _pldDump
+                _bCustomPL = True
+            else:
+                _pldTgt    = None
+                _bCustomPL = None
 
-                if _atid in self.__p:
-                    _lstP.append(_dt)
-                    _retryMap[_atid] = 2 if self.__iam.IsThresholdReached(_atid) else 0
-                    continue
+            _dumpTgt = _dump
+            if _shd is not None:
+                _dumpTgt, _pldTgt = _shd, None
 
-                if _bNonSerDes:
-                    _pldTgt = _pldOrig
-                    _bCustomPL = False
-                elif _bCSerDes:
-                    _pldTgt = bytes(_pldDump) if _bMultiTgt else _pldDump
-                    _bCustomPL = True
-                else:
-                    _pldTgt    = None
-                    _bCustomPL = None
+            _opRes = _dagt._PushMessage(msg_, _dumpTgt, _pldTgt, bCustomPL_=_bCustomPL, customDesCB_=_customDesCallback, callback_=_dt._dispatchCallback)
 
-                _dumpTgt = bytes(_dump) if _bMultiTgt else _dump
+            if not self.isRunning:
+                return False
 
-                _opRes = _dagt._PushMessage(msg_, _dumpTgt, _pldTgt, bCustomPL_=_bCustomPL, customDesCB_=_customDesCallback, callback_=_dt._dispatchCallback)
+            if _opRes.isAbort:
+                _iam.UpdateMap(_atid)
+                logif._LogErrorEC(_EFwErrorCode.UE_00152, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_013).format(_atid, msg_.header))
 
-                if not self.isRunning:
-                    return False
+                if _bMultiTgt:
+                    del _dumpTgt
+                    if _bCSerDes:
+                        del _pldTgt
+                continue
 
-                if _opRes.isAbort:
-                    self.__iam.UpdateMap(_atid)
+            if _opRes.isNOK:
+                if not _dagt._isOperating:
+                    _iam.UpdateMap(_atid)
                     logif._LogErrorEC(_EFwErrorCode.UE_00152, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_013).format(_atid, msg_.header))
 
                     if _bMultiTgt:
                         del _dumpTgt
                         if _bCSerDes:
                             del _pldTgt
-                    continue
 
-                if _opRes.isNOK:
-                    if not _dagt._isOperating:
-                        self.__iam.UpdateMap(_atid)
-                        logif._LogErrorEC(_EFwErrorCode.UE_00152, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_013).format(_atid, msg_.header))
-
-                        if _bMultiTgt:
-                            del _dumpTgt
-                            if _bCSerDes:
-                                del _pldTgt
-
-                    elif not self.__iam.UpdateMap(_atid):
-                        _lstP.append(_dt)
-                        _retryMap[_atid] = 1
-                    continue
+                elif not _iam.UpdateMap(_atid):
+                    _lstP.append(_dt)
+                    _retryMap[_atid] = 1
+                continue
 
-                _numPushed += 1
-                self.__iam.RemoveTask(_atid)
+            _numPushed += 1
+            _iam.RemoveTask(_atid)
 
-            _bPushedAny  = _numPushed > 0
-            _bBackLogged = False
+        _bPushedAny  = _numPushed > 0
+        _bBackLogged = False
 
-            if len(_lstP) > 0:
-                if _bNonSerDes:
-                    _pldTgt    = _pldOrig
-                    _bCustomPL = False
-                elif _bCSerDes:
-                    _pldTgt    = _pldDump
-                    _bCustomPL = True
-                else:
-                    _pldTgt    = None
-                    _bCustomPL = None
+        if len(_lstP) > 0:
+            if _bNonSerDes:
+                _pldTgt    = _pldOrig
+                _bCustomPL = False
+            elif _bCSerDes:
+                _pldTgt    = _pldDump
+                _bCustomPL = True
+            else:
+                _pldTgt    = None
+                _bCustomPL = None
 
+            if _shd is not None:
+                _bl = _FwsDispatcher._DispBackLogEntry(msg_.isXcoMsg, msg_.uniqueID, _shd, _lstP, _retryMap, bCustomPL_=_bCustomPL, customDesCB_=_customDesCallback)
+            else:
                 _bl = _FwsDispatcher._DispBackLogEntry(msg_.isXcoMsg, msg_.uniqueID, _dump, _lstP, _retryMap, pldDump_=_pldTgt, bCustomPL_=_bCustomPL, customDesCB_=_customDesCallback)
 
-                if not self.__iq.PushNowait(_bl):
-                    _bl.CleanUp()
-                    _myTxt = _FwTDbEngine.GetText(_EFwTextID.eMisc_Shared_FmtStr_027).join([str(_ee._dispatchAgent._agentTaskID) for _ee in _lstP])
-                    logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_003).format(self.__iq.qsize, _myTxt, msg_.header))
-                else:
-                    _bBackLogged = True
-                    for _dt in _lstP:
-                        _dagt = _dt._dispatchAgent
-                        if _dagt._agentTaskID not in self.__p:
-                            self.__p.append(_dagt._agentTaskID)
-
-            if not _bBackLogged:
-                if (not _bPushedAny) or _bMultiTgt:
-                    del _dump
-                    if _pldDump is not None:
-                        del _pldDump
-            if _bABack:
-                msg_.AttachPayload(_pldOrig)
+            if not shd_._backlog.PushNowait(_bl):
+                _bl.CleanUp()
+                _myTxt = _FwTDbEngine.GetText(_EFwTextID.eMisc_Shared_FmtStr_027).join([str(_ee._dispatchAgent._agentTaskID) for _ee in _lstP])
+                logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_003).format(shd_._backlog.qsize, _myTxt, msg_.header))
+            else:
+                _bBackLogged = True
+                for _dt in _lstP:
+                    _dagt = _dt._dispatchAgent
+                    if _dagt._agentTaskID not in _p:
+                        _p.append(_dagt._agentTaskID)
 
-            return _bPushedAny or _bBackLogged
+        if not _bBackLogged:
+            if (not _bPushedAny) or _bMultiTgt:
+                del _dump
+                if _pldDump is not None:
+                    del _pldDump
+                if (_shd is not None) and not _bPushedAny:
+                    _shd.CleanUp()
+        if _bABack:
+            msg_.AttachPayload(_pldOrig)
+
+        return _bPushedAny or _bBackLogged
 
     def _ToString(self, bVerbose_ =False, annex_ : str =None):
         if self._isInvalid:
@@ -591,23 +790,14 @@ class _FwsDispatcher(_AbsFwService):
 
                 self.__a = None
 
-                if self.__iam is not None:
-                    self.__iam.CleanUp()
-                    self.__iam = None
-
-                if self.__p is not None:
-                    self.__p.clear()
-                    self.__p = None
-
-                if self.__iq is not None:
-                    self.__iq.CleanUp()
-                    self.__iq = None
+                if self.__sh is not None:
+                    for _shd in self.__sh:
+                        _shd.CleanUp()
+                    self.__sh.clear()
+                    self.__sh = None
 
                 self.__tr.CleanUp()
                 self.__tr = None
-
-                self.__md.CleanUp()
-                self.__md = None
     
             _mtx.CleanUp()
 
@@ -617,18 +807,27 @@ class _FwsDispatcher(_AbsFwService):
         if not self.isRunning:
             return False
         self.__tr._DropInvalidTargets()
-        return self.__ProcFwDispInternalQueue()
+        for _shd in self.__sh:
+            if not self.__ProcFwDispInternalQueue(_shd):
+                return False
+        return self.isRunning
+
+    def _GetRblQueueSizes(self) -> Tuple[int, int]:
+        _lstSH = self.__sh
+        return 0, (0 if _lstSH is None else sum(_shd._backlogSize for _shd in _lstSH))
+
+    def __ProcFwDispInternalQueue(self, shd_ : _DispShard) -> bool:
+        _p, _iq, _iam = shd_._pendingAgents, shd_._backlog, shd_._retryMap
 
-    def __ProcFwDispInternalQueue(self) -> bool:
-        with self.__md:
-            _blNum = self.__iq.qsize
+        with shd_._lock:
+            _blNum = _iq.qsize
             if _blNum < 1:
-                self.__p.clear()
+                _p.clear()
                 return self.isRunning
 
             _ii, _lstBL = _blNum, []
             while _ii > 0:
-                _bl = self.__iq.PopNowait()
+                _bl = _iq.PopNowait()
                 if _bl is None:
                     break
                 _lstBL.append(_bl)
@@ -638,6 +837,10 @@ class _FwsDispatcher(_AbsFwService):
             if _blNum < 1:
                 return self.isRunning
 
+            _rm = self._rblMetrics
+            _rm._UpdateQueueSize(_blNum, False)
+            _rm._AddProcessedMsgs(_blNum, False)
+
             _lstBL = sorted(_lstBL, key=lambda _bl: _bl._msgUID)
 
             _lstPendingAgents = []
@@ -652,14 +855,9 @@ class _FwsDispatcher(_AbsFwService):
 
                 _lstP = []
 
-                _dt        = None
-                _bMultiTgt = len(_bl._dispatchTargets) > 0
-
+                _dt      = None
+                _dump    = _bl._msgDump
                 _dumpPLD = _bl._pldDump
-                if _dumpPLD is not None:
-                    if _bl._bCustomPayload and _bMultiTgt:
-                        _dumpPLD = bytes(_dumpPLD)
-                _dump = bytes(_bl._msgDump) if _bMultiTgt else _bl._msgDump
 
                 for _dt in _bl._dispatchTargets:
                     _dagt = _dt._dispatchAgent
@@ -670,10 +868,10 @@ class _FwsDispatcher(_AbsFwService):
                             logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_005).format(_msg.header))
                         else:
                             logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_002).format(_atid, _msg.header))
-                            self.__iam.RemoveTask(_atid)
+                            _iam.RemoveTask(_atid)
                         continue
 
-                    if self.__iam.IsThresholdReached(_atid):
+                    if _iam.IsThresholdReached(_atid):
                         continue
 
                     _opRes = _dagt._PushMessage(_msg, _dump, _dumpPLD, bCustomPL_=_bl._bCustomPayload, customDesCB_=_bl._customDesCallback, callback_=_dt._dispatchCallback)
@@ -682,18 +880,18 @@ class _FwsDispatcher(_AbsFwService):
                         return False
 
                     if _opRes.isAbort:
-                        self.__iam.UpdateMap(_atid)
+                        _iam.UpdateMap(_atid)
                         logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_013).format(_atid, _msg.header))
 
                     elif _opRes.isNOK:
                         if not _dagt._isOperating:
-                            self.__iam.UpdateMap(_atid)
+                            _iam.UpdateMap(_atid)
 
-                        elif not self.__iam.UpdateMap(_atid):
+                        elif not _iam.UpdateMap(_atid):
                             _lstP.append(_dt)
 
                     else:
-                        self.__iam.RemoveTask(_atid)
+                        _iam.RemoveTask(_atid)
 
                 if len(_lstP) > 0:
                     _lstMaxRetryReached =_bl._UpdateDispTargetList(_lstP)
@@ -706,12 +904,13 @@ class _FwsDispatcher(_AbsFwService):
                         _bl.CleanUp()
                         break
 
-                    if not self.__iq.PushNowait(_bl):
+                    if not _iq.PushNowait(_bl):
                         _myTxt = _FwTDbEngine.GetText(_EFwTextID.eMisc_Shared_FmtStr_027).join([str(_ee._dispatchAgent._agentTaskID) for _ee in _lstP])
-                        logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_003).format(self.__iq.qsize, _myTxt, _msg.header))
+                        logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwsDispatcher_TID_003).format(_iq.qsize, _myTxt, _msg.header))
                         _bl.CleanUp()
 
                     else:
+                        _rm._AddDispatchRetries(len(_lstP))
                         for _dt in _lstP:
                             _atid = _dt._dispatchAgent._agentTaskID
                             if _atid not in _lstPendingAgents:
@@ -719,9 +918,9 @@ class _FwsDispatcher(_AbsFwService):
                 else:
                     _bl.CleanUp()
 
-            self.__p.clear()
+            _p.clear()
 
             if len(_lstPendingAgents) > 0:
-                self.__p.extend(_lstPendingAgents)
+                _p.extend(_lstPendingAgents)
 
             return self.isRunning
@@ -82,16 +82,20 @@ class _FwsLogRD(_AbsFwService, _ILogRDService):
 
     @override
     def _AddLR(self, logRec_ : _LogRecord):
-        with self.__l:
-            if logRec_._recType.isError and not self.__lt.isError:
-                self.__lt = logRec_._recType
+        _lt = logRec_._recType
+        if _lt.isError and not self.__lt.isError:
+            self.__lt = _lt
 
-            for _ss in self.__as:
-                _ss.AddLR(logRec_)
-                if not _ss.isActiveSink:
-                    continue
-                if self.__lt.isFatal or self.__bPF:
-                    _ss.Flush()
+        _bF = self.__lt.isFatal or self.__bPF
+        _rr = _LogRecord(logRec_._recToStr, color_=logRec_._recColor, logType_=_lt)
+        for _ss in self.__as:
+            _ss.AddLR(_rr, bCopy_=False, bBlocking_=not _bF)
+
+        if _bF:
+            with self.__l:
+                for _ss in self.__as:
+                    if _ss.isActiveSink:
+                        _ss.Flush()
 
     @override
     def _FlushBacklog(self, backlog_ : List[_LogRecord], bHLEnabled_ : bool):
@@ -100,9 +104,11 @@ class _FwsLogRD(_AbsFwService, _ILogRDService):
             if not _rteCfg._isLogRDConsoleSinkDisabled:
                 self.__as.append(_ConsoleSink(bHLEnabled_=bHLEnabled_))
             if _rteCfg._isLogRDFileSinkEnabled:
-                self.__as.append(_FileSink(_rteCfg._rdFileSinkConfig.pyLogger))
+                _fc = _rteCfg._rdFileSinkConfig
+                self.__as.append(_FileSink(_fc.pyLogger, overflowPolicy_=_fc.overflowPolicy))
             if _rteCfg._isLogRDTcpSinkEnabled:
-                self.__ts = _TCPSink(terminator_=_rteCfg._rdTcpSinkConfig.lineEnding)
+                _tc = _rteCfg._rdTcpSinkConfig
+                self.__ts = _TCPSink(terminator_=_tc.lineEnding, overflowPolicy_=_tc.overflowPolicy)
                 self.__as.append(self.__ts)
 
             for _ss in self.__as:
@@ -178,10 +184,10 @@ class _FwsLogRD(_AbsFwService, _ILogRDService):
             _bC = (self.__ts is not None) and not self.__ts.isActiveSink
 
             _bF = True if self.__lt.isError else self.__fa.CheckAlert()
-            if _bF:
-                for _ss in self.__as:
-                    if not _ss.isActiveSink:
-                        continue
+            for _ss in self.__as:
+                if not _ss.isActiveSink:
+                    continue
+                if _bF or (_ss.backlogSize >= (_ss.capacity // 2)):
                     _ss.Flush()
             if not self.__lt.isFatal:
                 self.__lt = _ELRType.LR_FREE
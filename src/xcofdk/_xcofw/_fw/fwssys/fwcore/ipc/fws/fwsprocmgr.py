@@ -7,8 +7,10 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
-from typing import List
-from typing import Union
+from multiprocessing.connection import wait  as _PyMPWait
+from os                         import close as _PyClose
+from typing                     import List
+from typing                     import Union
 
 from _fw.fwssys.assys.ifs                 import _IFwsProcMgr
 from _fw.fwssys.assys.ifs                 import _IXProcAgent
@@ -18,11 +20,13 @@ from _fw.fwssys.fwcore.logging            import vlogif
 from _fw.fwssys.fwcore.base.timeutil      import _TimeAlert
 from _fw.fwssys.fwcore.base.gtimeout      import _Timeout
 from _fw.fwssys.fwcore.ipc.fws.afwservice import _AbsFwService
+from _fw.fwssys.fwcore.ipc.rbl.rblmetrics import _RblMetrics
 from _fw.fwssys.fwcore.ipc.sync.mutex     import _Mutex
 from _fw.fwssys.fwcore.ipc.tsk.taskdefs   import _ERblType
 from _fw.fwssys.fwcore.ipc.tsk.taskxcard  import _TaskXCard
 from _fw.fwssys.fwcore.ipc.tsk.fwtaskprf  import _FwTaskProfile
 from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _ETaskRightFlag
+from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _TaskUtil
 from _fw.fwssys.fwcore.types.aobject      import _AbsSlotsObject
 from _fw.fwssys.fwerrh.fwerrorcodes       import _EFwErrorCode
 
@@ -31,23 +35,46 @@ from _fw.fwtdb.fwtdbengine import _FwTDbEngine
 
 class _FwsProcMgr(_AbsFwService, _IFwsProcMgr):
     class _ProcEntry(_AbsSlotsObject):
-        __slots__ = [ '__xpa' ]
+        __slots__ = [ '__xpa' , '__w' ]
 
         def __init__(self, xpa_ : _IXProcAgent):
             super().__init__()
+            self.__w   = None
             self.__xpa = xpa_
 
         @property
         def _xpAgent(self) -> _IXProcAgent:
             return self.__xpa
 
+        @property
+        def _waitable(self) -> Union[int, None]:
+            return self.__w
+
+        def _SetWaitable(self, w_ : int):
+            self._CloseWaitable()
+            self.__w = w_
+
+        def _CloseWaitable(self):
+            _w = self.__w
+            if _w is not None:
+                self.__w = None
+                try:
+                    _PyClose(_w)
+                except OSError:
+                    pass
+
         def _ToString(self):
             pass
 
         def _CleanUp(self):
+            self._CloseWaitable()
             self.__xpa = None
 
-    __slots__ = [ '__ma' , '__md' ]
+    __slots__ = [ '__ma' , '__md' , '__wt' , '__uw' , '__pl' , '__cl' , '__cs' ]
+
+    __WAIT_TIMEOUT_MS    = 30
+    __CHNL_MIN_SLICE_MS  = 1
+    __CHNL_BATCH_SIZE    = 64
 
     __tbl    = None
     __sgltn  = None
@@ -55,14 +82,19 @@ class _FwsProcMgr(_AbsFwService, _IFwsProcMgr):
 
     def __init__(self):
         self.__ma = None
+        self.__cl = None
+        self.__cs = None
         self.__md = None
+        self.__pl = None
+        self.__uw = None
+        self.__wt = None
         _IFwsProcMgr.__init__(self)
 
         if _FwsProcMgr.__sgltn is not None:
             vlogif._LogOEC(True, _EFwErrorCode.VFE_00951)
             return
 
-        _FreqMS  = 40
+        _FreqMS  = 10
         _CeaseMS = 20
         _xc = _TaskXCard(runPhaseFreqMS_=_FreqMS, cceaseFreqMS_=_CeaseMS)
 
@@ -78,7 +110,12 @@ class _FwsProcMgr(_AbsFwService, _IFwsProcMgr):
             return
 
         self.__ma = _Mutex()
+        self.__cl = []
+        self.__cs = _FwsProcMgr.__CHNL_MIN_SLICE_MS
         self.__md = _Mutex()
+        self.__pl = []
+        self.__uw = set()
+        self.__wt = dict()
 
     @staticmethod
     def _GetInstance(bCreate_ =False):
@@ -129,29 +166,77 @@ class _FwsProcMgr(_AbsFwService, _IFwsProcMgr):
                 self.__ma = None
 
                 self.__md.CleanUp()
+                self.__cl = None
                 self.__md = None
+                self.__pl = None
+                self.__uw = None
+                self.__wt = None
     
             _mtx.CleanUp()
 
         _AbsFwService._CleanUp(self)
 
     def _TearDownExecutable(self):
+        if self.__pl is not None:
+            with self.__ma:
+                _lstPools = list(self.__pl)
+                self.__pl.clear()
+            for _xpp in _lstPools:
+                _xpp._RequestShutdown()
+
+        if self.__cl is not None:
+            with self.__ma:
+                _lstChnls = list(self.__cl)
+                self.__cl.clear()
+            for _xpc in _lstChnls:
+                _xpc._Close()
+
         _tbl = _FwsProcMgr.__GetTable()
         for _vv in _tbl.values():
             if _vv._xpAgent is not None:
-                _vv._DetachFromFW()
+                _vv._xpAgent._DetachFromFW()
             _vv.CleanUp()
         _tbl.clear()
         _FwsProcMgr.__tbl = None
+
+        if self.__wt is not None:
+            self.__uw.clear()
+            self.__wt.clear()
         return self.isRunning
 
     def _RunExecutable(self):
         with self.__md:
-            _tbl = _FwsProcMgr.__GetTable()
-            _rm  = _FwsProcMgr.__GetProcEntryList(bRemovableOnly_=True)
-            for _kk in _rm:
-                _tbl.pop(_kk)
+            self.__UpdateUnwatched()
+            _lstW = list(self.__wt.keys())
+
+        with self.__ma:
+            _lstChnls = [ _xpc for _xpc in self.__cl if not _xpc._isClosed ]
 
+        _rm = self._rblMetrics
+        if len(_lstChnls) < 1:
+            _lstRdy = _FwsProcMgr.__Wait(_lstW, _FwsProcMgr.__WAIT_TIMEOUT_MS, _rm)
+        else:
+            _lstRdy = []
+            _remMS  = _FwsProcMgr.__WAIT_TIMEOUT_MS
+            while _remMS > 0:
+                _numD = 0
+                for _xpc in _lstChnls:
+                    _numD += _xpc._DeliverPending(_FwsProcMgr.__CHNL_BATCH_SIZE)
+
+                if _numD > 0:
+                    self.__cs = _FwsProcMgr.__CHNL_MIN_SLICE_MS
+                else:
+                    self.__cs = min(2*self.__cs, _FwsProcMgr.__WAIT_TIMEOUT_MS)
+                _sliceMS = min(self.__cs, _remMS)
+
+                _lstRdy = _FwsProcMgr.__Wait(_lstW, _sliceMS, _rm)
+                if (len(_lstRdy) > 0) or not self.isRunning:
+                    break
+                _remMS -= _sliceMS
+
+        if len(_lstRdy) > 0:
+            with self.__md:
+                self.__ReapTerminated(_lstRdy)
         return self.isRunning
 
     def _AddProcess(self, xprocConn_ : _IXProcConn, puid_ : int) -> bool:
@@ -179,8 +264,27 @@ class _FwsProcMgr(_AbsFwService, _IFwsProcMgr):
 
                 _tbl = _FwsProcMgr.__GetTable()
                 _tbl[-1*puid_] = _FwsProcMgr._ProcEntry(xprocConn_._xprocessAgent)
+                self.__uw.add(-1*puid_)
                 return True
 
+    def _AddProcessPool(self, xpool_) -> bool:
+        if not self.isRunning:
+            return False
+
+        with self.__ma:
+            self.__pl = [ _xpp for _xpp in self.__pl if not _xpp._isShutdown ]
+            self.__pl.append(xpool_)
+            return True
+
+    def _AddProcessChannel(self, xchnl_) -> bool:
+        if not self.isRunning:
+            return False
+
+        with self.__ma:
+            self.__cl = [ _xpc for _xpc in self.__cl if not _xpc._isClosed ]
+            self.__cl.append(xchnl_)
+            return True
+
     def _GetJoinableList(self, lstPIDs_ : list =None) -> Union[List[_IXProcAgent], None]:
         if not self.isRunning:
             return None
@@ -192,7 +296,7 @@ class _FwsProcMgr(_AbsFwService, _IFwsProcMgr):
         with self.__md:
             res      = []
             _tbl     = _FwsProcMgr.__GetTable()
-            _lst     = _FwsProcMgr.__GetProcEntryList(bJoiniableOnly_=True)
+            _lst     = _FwsProcMgr.__GetJoinableEntryList()
             _lstAvbl = []
             for _kk in _lst:
                 _xpa = _tbl[_kk]._xpAgent
@@ -206,6 +310,65 @@ class _FwsProcMgr(_AbsFwService, _IFwsProcMgr):
                 res.append(_xpa)
         return res
 
+    def __UpdateUnwatched(self):
+        _tbl = _FwsProcMgr.__GetTable()
+        for _kk in list(self.__uw):
+            _pe  = _tbl.get(_kk, None)
+            _xpa = None if _pe is None else _pe._xpAgent
+
+            if (_xpa is None) or (not _xpa._isAttachedToFW) or _xpa._isTerminated:
+                self.__uw.discard(_kk)
+                if _pe is not None:
+                    _tbl.pop(_kk)
+                    _pe.CleanUp()
+                continue
+            if not _xpa._isStarted:
+                continue
+
+            _w = _xpa._OpenWaitable()
+            if _w is not None:
+                _pe._SetWaitable(_w)
+                self.__wt[_w] = _kk
+                self.__uw.discard(_kk)
+
+    def __ReapTerminated(self, lstRdy_ : list):
+        _tbl = _FwsProcMgr.__GetTable()
+        for _w in lstRdy_:
+            _kk = self.__wt.pop(_w, None)
+            if _kk is None:
+                continue
+
+            _pe = _tbl.get(_kk, None)
+            if _pe is None:
+                try:
+                    _PyClose(_w)
+                except OSError:
+                    pass
+                continue
+
+            _pe._CloseWaitable()
+            _xpa = _pe._xpAgent
+            if (_xpa is None) or (not _xpa._isAttachedToFW) or _xpa._isTerminated:
+                _tbl.pop(_kk)
+                _pe.CleanUp()
+            else:
+                self.__uw.add(_kk)
+
+    @staticmethod
+    def __Wait(lstW_ : list, timeoutMS_ : int, rm_ : _RblMetrics =None) -> list:
+        _tS = _RblMetrics._Now()
+        if len(lstW_) < 1:
+            _TaskUtil.SleepMS(timeoutMS_)
+            res = []
+        else:
+            try:
+                res = _PyMPWait(lstW_, timeout=timeoutMS_/1000)
+            except (OSError, ValueError):
+                res = lstW_
+        if rm_ is not None:
+            rm_._AddBlocked(_RblMetrics._Now() - _tS, bInIteration_=True)
+        return res
+
     @staticmethod
     def __GetTable():
         res = _FwsProcMgr.__tbl
@@ -215,23 +378,16 @@ class _FwsProcMgr(_AbsFwService, _IFwsProcMgr):
         return res
 
     @staticmethod
-    def __GetProcEntryList(bRemovableOnly_ =False, bJoiniableOnly_ =False) -> List[int]:
+    def __GetJoinableEntryList() -> List[int]:
         res = []
 
         _tbl = _FwsProcMgr.__GetTable()
         for _kk, _vv in _tbl.items():
             _xpa = _vv._xpAgent
             if _xpa is None:
-                if bRemovableOnly_:
-                    res.append(_kk)
                 continue
-
-            _bAttached = _xpa._isAttachedToFW
-            if (not _bAttached) or _xpa._isTerminated:
-                if bRemovableOnly_:
-                    res.append(_kk)
-            elif _bAttached and _xpa._isStarted:
-                if bJoiniableOnly_:
-                    res.append(_kk)
+            if (not _xpa._isAttachedToFW) or _xpa._isTerminated:
                 continue
+            if _xpa._isStarted:
+                res.append(_kk)
         return res
@@ -11,6 +11,7 @@ import socket
 import ipaddress
 from   collections import namedtuple
 from   socket      import socket as _PySocket
+from   typing      import List
 from   typing      import Union
 
 from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
@@ -98,20 +99,29 @@ class _TCPSocket:
         if not self._isConnected:
             return False
 
-        if not isinstance(terminator_, str):
-            terminator_ = _TCPSocket.__NOLE
-        if len(terminator_):
-            if not msg_.endswith(terminator_):
-                if terminator_ == _TCPSocket.__CRLF:
-                    if msg_.endswith(_CommonDefines._CHAR_SIGN_LF) or msg_.endswith(_CommonDefines._CHAR_SIGN_CR):
-                        msg_ = msg_[:len(msg_)-1]
-                msg_ += terminator_
+        msg_ = _TCPSocket.__Terminate(msg_, terminator_)
         try:
             _num = self.__s.send(msg_.encode(_CommonDefines._STR_ENCODING_UTF8))
         except (BrokenPipeError, Exception) as _xcp:
             _num = 0
         return _num > 0
 
+    def _SendAll(self, msgs_ : List[str], terminator_ : Union[str, None] =None) -> bool:
+        if not isinstance(msgs_, list):
+            return False
+        if not self._isConnected:
+            return False
+        if len(msgs_) < 1:
+            return True
+
+        _dmp = _CommonDefines._STR_EMPTY.join([ _TCPSocket.__Terminate(_mm, terminator_) for _mm in msgs_ ])
+        try:
+            self.__s.sendall(_dmp.encode(_CommonDefines._STR_ENCODING_UTF8))
+            res = True
+        except (BrokenPipeError, Exception) as _xcp:
+            res = False
+        return res
+
     def _Close(self, bShutdown_ =True):
         if not self._isConnected:
            return
@@ -139,6 +149,18 @@ class _TCPSocket:
             res += f'  remote={self._peerIP}:{self._peerPort}'
         return res
 
+    @staticmethod
+    def __Terminate(msg_ : str, terminator_ : Union[str, None]) -> str:
+        if not isinstance(terminator_, str):
+            terminator_ = _TCPSocket.__NOLE
+        if len(terminator_):
+            if not msg_.endswith(terminator_):
+                if terminator_ == _TCPSocket.__CRLF:
+                    if msg_.endswith(_CommonDefines._CHAR_SIGN_LF) or msg_.endswith(_CommonDefines._CHAR_SIGN_CR):
+                        msg_ = msg_[:len(msg_)-1]
+                msg_ += terminator_
+        return msg_
+
     @property
     def __isInvalid(self):
         return self.__s is None
@@ -7,9 +7,13 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
-from typing import Union
+from collections import deque          as _PyDeque
+from time        import perf_counter_ns as _PyPerfCounterNS
+from typing      import Tuple
+from typing      import Union
 
 from xcofdk.fwcom      import EExecutionCmdID
+from xcofdk.fwcom      import TaskMetrics
 from xcofdk.fwapi.xmt  import ITaskProfile
 from xcofdk.fwapi.xmsg import XMessage
 from xcofdk.fwapi.xmsg import XPayload
@@ -33,11 +37,13 @@ from _fw.fwssys.fwcore.ipc.rbl.arbldefs   import _ARblApiGuide
 from _fw.fwssys.fwcore.ipc.rbl.arbldefs   import _ERunProgressID
 from _fw.fwssys.fwcore.ipc.rbl.arbldefs   import _ERblApiFuncTag
 from _fw.fwssys.fwcore.ipc.rbl.arbldefs   import _ERblExecStepID
+from _fw.fwssys.fwcore.ipc.rbl.rblmetrics import _RblMetrics
 from _fw.fwssys.fwcore.ipc.tsk            import taskmgr
 from _fw.fwssys.fwcore.ipc.tsk.afwtask    import _AbsFwTask
 from _fw.fwssys.fwcore.ipc.tsk.taskdefs   import _ERblType
 from _fw.fwssys.fwcore.ipc.tsk.taskdefs   import _ETaskSelfCheckResultID
 from _fw.fwssys.fwcore.ipc.tsk.taskstate  import _TaskState
+from _fw.fwssys.fwcore.ipc.tsk.rcsched    import _RunCycleScheduler
 from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _TaskUtil
 from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _ETaskApiContextID
 from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _ETaskXPhaseID
@@ -54,6 +60,7 @@ from _fw.fwssys.fwcore.types.afwprofile   import _AbsSlotsObject
 from _fw.fwssys.fwcore.types.commontypes  import override
 from _fw.fwssys.fwcore.types.commontypes  import _CommonDefines
 from _fw.fwssys.fwcore.types.commontypes  import _EExecutionCmdID
+from _fw.fwssys.fwmsg.disp.fwshareddump   import _FwSharedDump
 from _fw.fwssys.fwerrh.fwerrorcodes       import _EFwErrorCode
 from _fw.fwssys.fwerrh.pcerrhandler       import _EPcErrHandlerCBID
 from _fw.fwssys.fwerrh.pcerrhandler       import _PcErrHandler
@@ -65,6 +72,8 @@ from _fw.fwssys.fwerrh.logs.xcoexception  import _XcoBaseException
 from _fw.fwssys.fwmsg.msg                 import _IFwMessage
 from _fw.fwssys.fwmsg.disp.dispfilter     import _DispatchFilter
 from _fw.fwssys.fwmsg.disp.dispregistry   import _DispatchRegistry
+from _fw.fwssys.fwmsg.disp.msgtracer      import _MsgTracer
+from _fw.fwssys.fwmsg.disp.fwprioritylane import _FwPriorityLane
 from _fwa.fwsubsyscoding                  import _FwSubsysCoding
 
 from _fw.fwtdb.fwtdbengine import _EFwTextID
@@ -175,21 +184,32 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
                 self.__dx = None
 
     class _ARBackLogEntry(_AbsSlotsObject):
-        __slots__  = [ '__m' , '__cb' , '__bC' , '__bX' , '__uid' , '__dm' , '__dp' , '__cdcb' ]
+        __slots__  = [ '__m' , '__cb' , '__bC' , '__bX' , '__uid' , '__dm' , '__dp' , '__cdcb' , '__rk' , '__tq' ]
 
         _FwDispInst = None
 
-        def __init__(self, bXMsg_ : bool, msgUID_ : int, msgDump_ : bytes, pldDump_ =None, bCustomPL_ =None, customDesCB_ =None, callback_ : _FwCallable =None):
+        def __init__(self, bXMsg_ : bool, msgUID_ : int, msgDump_ : Union[bytes, _FwSharedDump], pldDump_ =None, bCustomPL_ =None, customDesCB_ =None, callback_ : _FwCallable =None, rcvKey_ =None, enqNS_ : int =None):
             super().__init__()
+            self._Reinit(bXMsg_, msgUID_, msgDump_, pldDump_=pldDump_, bCustomPL_=bCustomPL_, customDesCB_=customDesCB_, callback_=callback_, rcvKey_=rcvKey_, enqNS_=enqNS_)
+
+        def _Reinit(self, bXMsg_ : bool, msgUID_ : int, msgDump_ : Union[bytes, _FwSharedDump], pldDump_ =None, bCustomPL_ =None, customDesCB_ =None, callback_ : _FwCallable =None, rcvKey_ =None, enqNS_ : int =None):
             self.__m    = None
+            self.__tq   = enqNS_
             self.__bC   = bCustomPL_
             self.__bX   = bXMsg_
             self.__cb   = callback_
             self.__dm   = msgDump_
             self.__dp   = pldDump_
+            self.__rk   = None
             self.__uid  = msgUID_
             self.__cdcb = customDesCB_
 
+            if isinstance(msgDump_, _FwSharedDump):
+                if (rcvKey_ is not None) and msgDump_._AddRef(rcvKey_):
+                    self.__rk = rcvKey_
+                else:
+                    self.__dm, self.__dp = msgDump_._msgDump, msgDump_._pldDump
+
         @property
         def _message(self) -> _IFwMessage:
             if _AbsRunnable._ARBackLogEntry._FwDispInst is None:
@@ -199,7 +219,11 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             if self.__m is not None:
                 return self.__m
 
-            self.__m = _AbsRunnable._ARBackLogEntry._FwDispInst._DeserializeMsg(self.__bX, self.__uid, self.__dm, pldDump_=self.__dp, bCustomPL_=self.__bC, customDesCB_=self.__cdcb)
+            _fwDisp = _AbsRunnable._ARBackLogEntry._FwDispInst
+            if self.__rk is not None:
+                self.__m = self.__dm._GetMessage(self.__rk, _fwDisp._DeserializeMsg, self.__bX, self.__uid, bCustomPL_=self.__bC, customDesCB_=self.__cdcb)
+            else:
+                self.__m = _fwDisp._DeserializeMsg(self.__bX, self.__uid, self.__dm, pldDump_=self.__dp, bCustomPL_=self.__bC, customDesCB_=self.__cdcb)
             return self.__m
 
         @property
@@ -210,6 +234,10 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         def _sortKey(self):
             return abs(self.__uid)
 
+        @property
+        def _enqueueStamp(self):
+            return self.__tq
+
         @property
         def _callback(self):
             return self.__cb
@@ -221,6 +249,9 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             if self.__dm is None:
                 return
 
+            if self.__rk is not None:
+                self.__m = self.__dm._ReleaseRef(self.__rk)
+
             _bSerDes = False
             if self.__m is not None:
                 _msgPld = self.__m.AttachPayload(None)
@@ -242,6 +273,8 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             self.__cb   = None
             self.__dm   = None
             self.__dp   = None
+            self.__rk   = None
+            self.__tq   = None
             self.__uid  = None
             self.__cdcb = None
 
@@ -249,10 +282,12 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
     def GetMCApiMNL(cls_):
         return cls_._GetMCApiMNL()
 
-    __slots__ = [ '__a' , '__s' ,  '__xq' , '__iq' , '__md' , '__ag' , '__t' , '__utc' , '__rn' , '__tp' , '__xp' , '__xtors' , '__xc' , '__cbr' , '__ft' ]  #, '__axt' ]
+    __slots__ = [ '__a' , '__s' ,  '__xq' , '__xl' , '__xv' , '__fl' , '__iq' , '__md' , '__ag' , '__t' , '__utc' , '__rn' , '__tp' , '__xp' , '__xtors' , '__xc' , '__cbr' , '__ft' , '__rm' , '__an' ]  #, '__axt' ]
 
     __FwDispRbl = None
 
+    __MAX_FREE_BACKLOG_SIZE = 256
+
     __XR_XCP_DW = _FwTDbEngine.GetText(_EFwTextID.eMisc_XML_RUNNER_XCP_MSG_DuplicateWriter)
 
     def __init__( self
@@ -270,12 +305,17 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         self.__md    = None
         self.__rn    = None
         self.__ft    = None
+        self.__rm    = _RblMetrics()
         self.__tp    = None
         self.__xc    = None
         self.__xp    = None
         self.__xq    = None
+        self.__xl    = None
+        self.__xv    = None
+        self.__fl    = None
         self.__cbr   = None
         self.__utc   = None
+        self.__an    = None
         self.__xtors = None
 
         _AbsFwXUnit.__init__(self)
@@ -726,7 +766,7 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
     def _agentName(self) -> str:
         return self._runnableName
 
-    def _PushMessage(self, msg_: _IFwMessage, msgDump_: bytes, pldDump_=None, bCustomPL_=None, customDesCB_=None, callback_: _FwCallable =None) -> _EExecutionCmdID:
+    def _PushMessage(self, msg_: _IFwMessage, msgDump_: Union[bytes, _FwSharedDump], pldDump_=None, bCustomPL_=None, customDesCB_=None, callback_: _FwCallable =None) -> _EExecutionCmdID:
         _bAbort = False
         if self._isInvalid or self._isInLcCeaseMode:
             _bAbort = True
@@ -739,17 +779,80 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         if _bAbort:
             return _EExecutionCmdID.Abort()
 
-        _bl = _AbsRunnable._ARBackLogEntry(msg_.isXcoMsg, msg_.uniqueID, msgDump_, pldDump_=pldDump_, bCustomPL_=bCustomPL_, customDesCB_=customDesCB_, callback_=callback_)
-        if not self.__xq.PushNowait(_bl):
+        _xl = self.__xl
+        _pr = 0 if _xl is None else _xl._GetPriority(msg_)
+        _tq = _MsgTracer._Now() if msg_.isXcoMsg and _MsgTracer._IsEnabled() else None
+        _bl = self.__CreateBacklogEntry(msg_.isXcoMsg, msg_.uniqueID, msgDump_, pldDump_=pldDump_, bCustomPL_=bCustomPL_, customDesCB_=customDesCB_, callback_=callback_, rcvKey_=self.__taskID, enqNS_=_tq)
+
+        if _pr > 0:
+            _bPushed = _xl.PushNowait(_pr, _bl)
+            if _bPushed:
+                self.__xq.NotifyBlockingQueue()
+        elif (_xl is not None) and (_xl.qsize > 0) and _xl.isFull:
+            _bPushed = False
+        else:
+            _bPushed = self.__xq.PushNowait(_bl)
+
+        if not _bPushed:
             _bl.CleanUp()
             if self.isRunning:
-                if self.__xq.qsize == self.__xq.capacity:
-                    logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_AbsRunnable_TID_002).format(self.__taskID, msg_.uniqueID))
+                if _pr > 0:
+                    if _xl.isFull:
+                        logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_AbsRunnable_TID_008).format(self.__taskID, self.__xq.capacity, msg_.uniqueID, _pr))
+                elif (self.__xq.qsize + self.__xlSize) >= self.__xq.capacity:
+                    logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_AbsRunnable_TID_002).format(self.__taskID, self.__xq.capacity, msg_.uniqueID))
             res = _EExecutionCmdID.NOK()
         else:
             res = _EExecutionCmdID.OK()
         return res
 
+    def _PushMessages(self, lstPushArgs_ : list, callback_: _FwCallable =None) -> list:
+        res = [False] * len(lstPushArgs_)
+        if self._isInvalid or self._isInLcCeaseMode:
+            return res
+        if not self.isRunning:
+            if not (self.isStopping and self._GetTaskApiContext().isTeardown):
+                return res
+
+        _tid   = self.__taskID
+        _tq    = _MsgTracer._Now() if _MsgTracer._IsEnabled() else None
+        _ctor  = _AbsRunnable._ARBackLogEntry if self.__fl is None else self.__CreateBacklogEntry
+        _lstBL = [ _ctor(_mm.isXcoMsg, _mm.uniqueID, _dmp, pldDump_=_pld, bCustomPL_=_bCPL, customDesCB_=_cb, callback_=callback_, rcvKey_=_tid, enqNS_=_tq) for _mm, _dmp, _pld, _bCPL, _cb in lstPushArgs_ ]
+        _numBL = len(_lstBL)
+
+        _xl    = self.__xl
+        _lstPr = None if _xl is None else [ _xl._GetPriority(_aa[0]) for _aa in lstPushArgs_ ]
+
+        if not (_lstPr and any(_lstPr)):
+            _numP = self.__PushBulkEntries(_lstBL)
+        else:
+            _numP, _bPrio = 0, False
+            while _numP < _numBL:
+                _bHP = _lstPr[_numP] > 0
+                _jj  = _numP + 1
+                while (_jj < _numBL) and ((_lstPr[_jj] > 0) == _bHP):
+                    _jj += 1
+
+                if _bHP:
+                    _nn    = _xl.PushManyNowait([ (_lstPr[_kk], _lstBL[_kk]) for _kk in range(_numP, _jj) ])
+                    _bPrio = _bPrio or (_nn > 0)
+                else:
+                    _nn = self.__PushBulkEntries(_lstBL[_numP:_jj])
+
+                _numP += _nn
+                if _numP < _jj:
+                    break
+
+            if _bPrio:
+                self.__xq.NotifyBlockingQueue()
+
+        for _ii in range(_numP):
+            res[_ii] = True
+        for _ii in range(_numP, _numBL):
+            _lstBL[_ii].CleanUp()
+        _lstBL.clear()
+        return res
+
     @property
     def isAborting(self):
         return self._isAborting
@@ -841,6 +944,10 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
     def _rblTask(self):
         return self.__ft
 
+    @property
+    def _rblMetrics(self) -> _RblMetrics:
+        return self.__rm
+
     @property
     def _dtaskName(self):
         res = self.taskBadge
@@ -911,6 +1018,11 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         with _myMtx:
             if self.__cbr is not None:
                 self.__cbr.CleanUp()
+            if self.__xl is not None:
+                self.__xl.CleanUp()
+            if self.__fl is not None:
+                while self.__fl:
+                    self.__fl.pop().CleanUp()
             if self.__xc is not None:
                 self.__xc.CleanUp()
             if self.__xtors is not None:
@@ -931,17 +1043,38 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             self.__md    = None
             self.__rn    = None
             self.__ft    = None
+            self.__rm    = None
             self.__tp    = None
             self.__xc    = None
             self.__xp    = None
             self.__xq    = None
+            self.__xl    = None
+            self.__xv    = None
+            self.__fl    = None
             self.__cbr   = None
             self.__utc   = None
+            self.__an    = None
             self.__xtors = None
 
         if not _bFlagSet:
             _myMtx.CleanUp()
 
+    def _GetRblQueueSizes(self) -> Tuple[int, int]:
+        _xq, _iq = self.__xq, self.__iq
+        return (0 if _xq is None else _xq.qsize + self.__xlSize), (0 if _iq is None else _iq.qsize)
+
+    def _GetTaskMetrics(self) -> Union[TaskMetrics, None]:
+        _rm, _t = self.__rm, self.__t
+        if (_rm is None) or (_t is None):
+            return None
+
+        _an = self.__UpdateAliasName()
+        if _an is None:
+            _an = type(self).__name__.lstrip(_CommonDefines._CHAR_SIGN_UNDERSCORE)
+
+        _xqs, _iqs = self._GetRblQueueSizes()
+        return _rm._Snapshot(self._taskUID, self._dtaskName, _an, _t.isFwRunnable, _xqs, _iqs)
+
     def _IncEuRNumber(self):
         if self.__ft is None: return
         self.__ft._IncEuRNumber()
@@ -1000,13 +1133,22 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         else:
             self.__UpdateRunnableName()
             self.__xc._UpdateUniqueName(self._runnableName)
+            self.__UpdateAliasName()
         if not self.__t.isXTaskRunnable:
             self.__xc._SetStartArgs(*tuple(self.__tp.args), **self.__tp.kwargs)
 
     def _RblSetTaskProfile(self, fwtPrf_ : _AbsFwProfile):
         if fwtPrf_ is None:
+            if self.__xl is not None:
+                self.__xl.CleanUp()
+            if self.__fl is not None:
+                while self.__fl:
+                    self.__fl.pop().CleanUp()
             self.__iq = None
             self.__xq = None
+            self.__xl = None
+            self.__xv = None
+            self.__fl = None
             self.__tp = None
             return
 
@@ -1040,8 +1182,17 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         self.__xq = _extQueue
         self.__tp = fwtPrf_
 
+        if _extQueue is not None:
+            _uta = self._utAgent
+            _xtp = None if _uta is None else _uta.taskProfile
+            self.__xl = _FwPriorityLane(_extQueue, prioLabels_=None if _xtp is None else _xtp.externalQueuePriorityLabels)
+            if (_xtp is not None) and _xtp.isExternalQueueFastDelivery:
+                self.__xv = XMessage(None)
+                self.__fl = _PyDeque()
+
         self.__UpdateRunnableName()
         self.__xc._UpdateUniqueName(self._runnableName)
+        self.__UpdateAliasName()
 
     def _RblSetStopSyncSem(self, semStop_ : _BinarySemaphore):
         if self._isInvalid:
@@ -1172,6 +1323,36 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
         return _AbsRunnable.__FwDispRbl._DispatchMessage(msg_)
 
+    def _SendMessages(self, msgs_ : list) -> list:
+        res = [False] * len(msgs_)
+        if _ssshare._WarnOnDisabledSubsysMsg():
+            return res
+        if self._isInvalid or self._isInLcCeaseMode or self.isAborting or not self.isStarted:
+            return res
+
+        for _mm in msgs_:
+            if (_mm is None) or not _mm.isValid:
+                return res
+
+            _hdr = _mm.header
+            if not (_hdr.typeID.isTIntraProcess and (_hdr.channelID.isChInterTask or _hdr.channelID.isChIntraTask)):
+                vlogif._LogOEC(True, _EFwErrorCode.VFE_00986)
+                return res
+            if _hdr.isInternalMsg:
+                vlogif._LogOEC(True, _EFwErrorCode.VFE_00987)
+                return res
+
+        _actx = self._GetTaskApiContext()
+        if not (self.isRunning or (self.isStopping and _actx.isTeardown)):
+            return res
+
+        if not self.isProvidingExternalQueue:
+            if _FwSubsysCoding.IsSenderExternalQueueSupportMandatory():
+                vlogif._LogOEC(True, _EFwErrorCode.VFE_00988)
+                return res
+
+        return _AbsRunnable.__FwDispRbl._DispatchMessages(msgs_)
+
     def _TriggerQueueProc(self, bExtQueue_ : bool) -> int:
         if _ssshare._WarnOnDisabledSubsysMsg():
             return -1
@@ -1209,9 +1390,11 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         self._RblSetTaskAContext(_ETaskApiContextID.eProcExtQueue if bExtQueue_ else _ETaskApiContextID.eProcIntQueue)
 
         _blNum = self.__xq.qsize
-        if _blNum < 1:
+        _xlNum = self.__xlSize
+        if (_blNum + _xlNum) < 1:
             self._RblSetTaskAContext(_actx)
             return 0
+        self.__rm._UpdateQueueSize(_blNum + _xlNum, True)
 
         _ii, _lstBL = _blNum, []
         while _ii > 0:
@@ -1222,19 +1405,22 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             _ii -= 1
 
         _blNum = len(_lstBL)
-        if _blNum < 1:
+        if (_blNum < 1) and (self.__xlSize < 1):
             self._RblSetTaskAContext(_actx)
             return 0
 
-        _lstBL = sorted(_lstBL, key=lambda _bl: _bl._sortKey)
+        _bTrc = _MsgTracer._IsEnabled()
 
         res   = 0
         _xres = _EExecutionCmdID.Continue()
         _xtor = self.__xtors._GetApiExecutor(_ERblApiFuncTag.eRFTProcessExternalMsg)
+        _xv   = self.__xv
 
         _eXPh = self._GetTaskXPhase()
 
-        for _bl in _lstBL:
+        for _bl in self.__IterExtBacklog(_lstBL):
+            _tD = _MsgTracer._Now() if _bTrc else None
+
             _xres = _EExecutionCmdID.MapExecState2ExecCmdID(self)
 
             if not _xres.isContinue:
@@ -1246,18 +1432,25 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
             _msg2 = _msg
             if _msg.isXcoMsg:
-                _msg2 = XMessage(_msg)
+                _msg2 = XMessage(_msg) if _xv is None else _xv._Rebind(_msg)
 
+            _tH = None if _tD is None else _MsgTracer._Now()
             _xtor.SetExecutorParams(param1_=_msg2, param2_=_bl._callback)
             _xres = self.__EvaluateExecResult(executor_=_xtor, bCheckBefore_=False)
 
             res += 1
 
+            if _tH is not None:
+                _MsgTracer._Record(_msg, self.__taskID, _bl._enqueueStamp, _tD, _tH, _MsgTracer._Now())
+
             if _msg.isXcoMsg:
-                _msg2._Detach()
+                if _xv is None:
+                    _msg2._Detach()
+                else:
+                    _xv._Rebind(None)
 
-        for _bl in _lstBL:
-            _bl.CleanUp()
+        self.__ReleaseBacklog(_lstBL)
+        self.__rm._AddProcessedMsgs(res, True)
 
         self._RblSetTaskAContext(_actx)
 
@@ -1453,6 +1646,15 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             res = self.__ft.ceaseTLBState
         return res
 
+    def __UpdateAliasName(self) -> Union[str, None]:
+        if self.__an is None:
+            _utc = self.__utc
+            _uta = None if _utc is None else _utc._utAgent
+            _xt  = None if _uta is None else _uta._xtInst
+            if _xt is not None:
+                self.__an = _xt.aliasName
+        return self.__an
+
     def __UpdateRunnableName(self) -> str:
         res = self._dtaskName
         if res is None:
@@ -1654,11 +1856,18 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         return _xres
 
     def __ExecuteRun(self) -> _EExecutionCmdID:
-        if self.__xp.isIncludingCustomManagedExternalQueue:
-            return self.__ExecuteCustomManagedExtQueue()
-        if self.__xp.isIncludingAutoManagedExternalQueue:
-            return self.__ExecuteAutoManagedExtQueue(bCombinedManaged_=False)
+        _rm = self.__rm
+        _rm._StartRunPhase()
+        try:
+            if self.__xp.isIncludingCustomManagedExternalQueue:
+                return self.__ExecuteCustomManagedExtQueue()
+            if self.__xp.isIncludingAutoManagedExternalQueue:
+                return self.__ExecuteAutoManagedExtQueue(bCombinedManaged_=False)
+            return self.__ExecuteRunCycles(_rm)
+        finally:
+            _rm._StopRunPhase()
 
+    def __ExecuteRunCycles(self, rm_ : _RblMetrics) -> _EExecutionCmdID:
         _bInclRunXtbl                        = self.__xp.isIncludingRunExecutable
         _bInclAutoManagedExtQueueByRunXtbl   = self.__xp.isIncludingAutoManagedExternalQueue_By_RunExecutable
         _bInclAutoManagedIntQueueByRunXtbl   = self.__xp.isIncludingAutoManagedInternalQueue_By_RunExecutable
@@ -1666,6 +1875,10 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
         _xres       = _EExecutionCmdID.Continue()
         _runCycleMS = self.__xc.runPhaseFreqMS
+        _rcSched    = None
+
+        if (_runCycleMS > 0) and self.__xc.runPhaseSchedulingPolicy.isFixedRate:
+            _rcSched = _RunCycleScheduler._CreateScheduler(_runCycleMS, self.__xc.runPhaseMaxProcTimeMS, self.__xc.runPhaseSchedulingPolicy, self.__taskID)
 
         _bBreak = False
         while True:
@@ -1674,6 +1887,7 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             if not _xres.isContinue:
                 break
 
+            _tS = _PyPerfCounterNS()
             try:
                 if self._isInvalid:
                     return _EExecutionCmdID.Abort()
@@ -1726,6 +1940,8 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
                 _xres = self.__HandleException(_xcp, bCaughtByApiExecutor_=False)
 
             finally:
+                rm_._AddIteration(_PyPerfCounterNS() - _tS)
+
                 if not _xres.isContinue:
                     _bBreak = True
                 elif _runCycleMS == 0:
@@ -1734,10 +1950,17 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
                         self._SetTaskState(_TaskState._EState.eProcessingStopped)
                     _bBreak = True
                 else:
-                    _TaskUtil.SleepMS(_runCycleMS)
+                    _tS = _PyPerfCounterNS()
+                    if _rcSched is not None:
+                        _rcSched._WaitForNextCycle()
+                    else:
+                        _TaskUtil.SleepMS(_runCycleMS)
+                    rm_._AddBlocked(_PyPerfCounterNS() - _tS)
 
             continue
 
+        if _rcSched is not None:
+            _rcSched.CleanUp()
         return _xres
 
     def __ExecuteCustomManagedExtQueue(self):
@@ -1755,6 +1978,53 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
         return _xres
 
+    @property
+    def __xlSize(self) -> int:
+        _xl = self.__xl
+        return 0 if _xl is None else _xl.qsize
+
+    def __IterExtBacklog(self, lstBL_ : list):
+        _xl, _nBL, _ii = self.__xl, len(lstBL_), 0
+        while True:
+            _bl = None if _xl is None else _xl.PopNowait()
+            if _bl is not None:
+                lstBL_.append(_bl)
+            elif _ii < _nBL:
+                _bl  = lstBL_[_ii]
+                _ii += 1
+            else:
+                break
+            yield _bl
+
+    def __PushBulkEntries(self, lstBL_ : list) -> int:
+        _num = len(lstBL_)
+        _xl  = self.__xl
+        if (_xl is not None) and (_xl.qsize > 0):
+            _room = _xl.sharedRoom
+            if _room is not None:
+                _num = min(_num, _room)
+        return 0 if _num < 1 else self.__xq.PushManyNowait(lstBL_ if _num == len(lstBL_) else lstBL_[:_num])
+
+    def __CreateBacklogEntry(self, bXMsg_ : bool, msgUID_ : int, msgDump_ : Union[bytes, _FwSharedDump], pldDump_ =None, bCustomPL_ =None, customDesCB_ =None, callback_ : _FwCallable =None, rcvKey_ =None, enqNS_ : int =None):
+        _fl = self.__fl
+        if _fl:
+            try:
+                res = _fl.pop()
+            except IndexError:
+                res = None
+            if res is not None:
+                res._Reinit(bXMsg_, msgUID_, msgDump_, pldDump_=pldDump_, bCustomPL_=bCustomPL_, customDesCB_=customDesCB_, callback_=callback_, rcvKey_=rcvKey_, enqNS_=enqNS_)
+                return res
+        return _AbsRunnable._ARBackLogEntry(bXMsg_, msgUID_, msgDump_, pldDump_=pldDump_, bCustomPL_=bCustomPL_, customDesCB_=customDesCB_, callback_=callback_, rcvKey_=rcvKey_, enqNS_=enqNS_)
+
+    def __ReleaseBacklog(self, lstBL_ : list):
+        _fl = self.__fl
+        for _bl in lstBL_:
+            _bl.CleanUp()
+            if (_fl is not None) and (len(_fl) < _AbsRunnable.__MAX_FREE_BACKLOG_SIZE):
+                _bl.ResetCleanupFlag()
+                _fl.append(_bl)
+
     def __ExecuteAutoManagedExtQueue(self, bCombinedManaged_ : bool =False) -> _EExecutionCmdID:
         if not bCombinedManaged_:
             if not self.__xq.isBlockingOnQueueSize:
@@ -1771,9 +2041,11 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         self._RblSetTaskAContext(_ETaskApiContextID.eProcExtQueue)
 
         _blNum = self.__xq.qsize
-        if _blNum < 1:
+        _xlNum = self.__xlSize
+        if (_blNum + _xlNum) < 1:
             self._RblSetTaskAContext(_actx)
             return _EExecutionCmdID.Continue()
+        self.__rm._UpdateQueueSize(_blNum + _xlNum, True)
 
         _ii, _lstBL = _blNum, []
         while _ii > 0:
@@ -1784,19 +2056,23 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             _ii -= 1
 
         _blNum = len(_lstBL)
-        if _blNum < 1:
+        if (_blNum < 1) and (self.__xlSize < 1):
             self._RblSetTaskAContext(_actx)
             return _EExecutionCmdID.Continue()
 
-        _lstBL = sorted(_lstBL, key=lambda _bl: _bl._sortKey)
+        _bTrc = _MsgTracer._IsEnabled()
 
         _bIncludingAutoManagedInternalQueue_By_AutoManagedExternalQueue   = self.__xp.isIncludingAutoManagedInternalQueue_By_AutoManagedExternalQueue
         _bIncludingCustomManagedInternalQueue_By_AutoManagedExternalQueue = self.__xp.isIncludingCustomManagedInternalQueue_By_AutoManagedExternalQueue
 
+        _nP   = 0
         _xres = _EExecutionCmdID.Continue()
         _xtor = self.__xtors._GetApiExecutor(_ERblApiFuncTag.eRFTProcessExternalMsg)
+        _xv   = self.__xv
+
+        for _bl in self.__IterExtBacklog(_lstBL):
+            _tD = _MsgTracer._Now() if _bTrc else None
 
-        for _bl in _lstBL:
             self.__ClearCurUserError()
 
             if _bIncludingCustomManagedInternalQueue_By_AutoManagedExternalQueue:
@@ -1817,16 +2093,24 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
             _msg2 = _msg
             if _msg.isXcoMsg:
-                _msg2 = XMessage(_msg)
+                _msg2 = XMessage(_msg) if _xv is None else _xv._Rebind(_msg)
 
+            _tH = None if _tD is None else _MsgTracer._Now()
             _xtor.SetExecutorParams(param1_=_msg2, param2_=_bl._callback)
             _xres = self.__EvaluateExecResult(executor_=_xtor, bCheckBefore_=False)
+            _nP  += 1
+
+            if _tH is not None:
+                _MsgTracer._Record(_msg, self.__taskID, _bl._enqueueStamp, _tD, _tH, _MsgTracer._Now())
 
             if _msg.isXcoMsg:
-                _msg2._Detach()
+                if _xv is None:
+                    _msg2._Detach()
+                else:
+                    _xv._Rebind(None)
 
-        for _bl in _lstBL:
-            _bl.CleanUp()
+        self.__ReleaseBacklog(_lstBL)
+        self.__rm._AddProcessedMsgs(_nP, True)
 
         self._RblSetTaskAContext(_actx)
         return _xres
@@ -1835,22 +2119,29 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         _actx = self._GetTaskApiContext()
         self._RblSetTaskAContext(_ETaskApiContextID.eProcExtQueue)
 
+        _rm         = self.__rm
         _runCycleMS = self.__xc.runPhaseFreqMS
+        _xlPending  = None if self.__xl is None else self.__xl.HasPending
 
         _bl = None
         while True:
             _xres = _EExecutionCmdID.MapExecState2ExecCmdID(self)
+            if _xres.isContinue and (_bl is None) and self._PcIsMonitoringLcModeChange():
+                _xres = self.__EvaluateExecResult(xres_=True, bCheckBefore_=True, bSkipErrProc_=True)
             if not _xres.isContinue:
                 self._RblSetTaskAContext(_actx)
                 return _xres
 
-            if _bl is not None:
+            if (_bl is not None) or (self.__xlSize > 0):
                 break
-            _bl = self.__xq.PopBlockingQueue(sleepTimeMS_=_runCycleMS)
+            _tS = _PyPerfCounterNS()
+            _bl = self.__xq.PopBlockingQueue(sleepTimeMS_=_runCycleMS, pendingCB_=_xlPending)
+            _rm._AddBlocked(_PyPerfCounterNS() - _tS)
 
-        _lstBL = [_bl]
+        _lstBL = [] if _bl is None else [_bl]
         _blNum = self.__xq.qsize
         _ii    = _blNum
+        _rm._UpdateQueueSize(_blNum + len(_lstBL) + self.__xlSize, True)
         while _ii > 0:
             _bl = self.__xq.PopNowait()
             if _bl is None:
@@ -1858,15 +2149,25 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
             _lstBL.append(_bl)
             _ii -= 1
 
-        _lstBL = sorted(_lstBL, key=lambda _bl: _bl._sortKey)
+        _bTrc = _MsgTracer._IsEnabled()
 
         _bIncludingAutoManagedInternalQueue_By_AutoManagedExternalQueue   = self.__xp.isIncludingAutoManagedInternalQueue_By_AutoManagedExternalQueue
         _bIncludingCustomManagedInternalQueue_By_AutoManagedExternalQueue = self.__xp.isIncludingCustomManagedInternalQueue_By_AutoManagedExternalQueue
 
+        _nP   = 0
         _xres = _EExecutionCmdID.Continue()
         _xtor = self.__xtors._GetApiExecutor(_ERblApiFuncTag.eRFTProcessExternalMsg)
+        _xv   = self.__xv
+
+        _tS = None
+        for _bl in self.__IterExtBacklog(_lstBL):
+            _tD = _MsgTracer._Now() if _bTrc else None
+
+            _tE = _PyPerfCounterNS()
+            if _tS is not None:
+                _rm._AddIteration(_tE - _tS)
+            _tS = _tE
 
-        for _bl in _lstBL:
             self._IncEuRNumber()
             self.__ClearCurUserError()
 
@@ -1889,16 +2190,27 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
             _msg2 = _msg
             if _msg.isXcoMsg:
-                _msg2 = XMessage(_msg)
+                _msg2 = XMessage(_msg) if _xv is None else _xv._Rebind(_msg)
 
+            _tH = None if _tD is None else _MsgTracer._Now()
             _xtor.SetExecutorParams(param1_=_msg2, param2_=_bl._callback)
             _xres = self.__EvaluateExecResult(executor_=_xtor, bCheckBefore_=False)
+            _nP  += 1
+
+            if _tH is not None:
+                _MsgTracer._Record(_msg, self.__taskID, _bl._enqueueStamp, _tD, _tH, _MsgTracer._Now())
 
             if _msg.isXcoMsg:
-                _msg2._Detach()
+                if _xv is None:
+                    _msg2._Detach()
+                else:
+                    _xv._Rebind(None)
 
-        for _bl in _lstBL:
-            _bl.CleanUp()
+        if _tS is not None:
+            _rm._AddIteration(_PyPerfCounterNS() - _tS)
+
+        self.__ReleaseBacklog(_lstBL)
+        _rm._AddProcessedMsgs(_nP, True)
 
         self._RblSetTaskAContext(_actx)
         return _xres
@@ -1932,7 +2244,9 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         if _blNum < 1:
             self._RblSetTaskAContext(_actx)
             return _EExecutionCmdID.Continue()
+        self.__rm._UpdateQueueSize(_blNum, False)
 
+        _nP   = 0
         _xres = _EExecutionCmdID.MapExecState2ExecCmdID(self)
         _xtor = self.__xtors._GetApiExecutor(_ERblApiFuncTag.eRFTProcessInternalMsg)
 
@@ -1949,10 +2263,12 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
             _xtor.SetExecutorParams(param1_=_msg2, param2_=_bl._callback)
             _xres = self.__EvaluateExecResult(executor_=_xtor, bCheckBefore_=False)
+            _nP  += 1
 
             if _msg.isXcoMsg:
                 _msg2._Detach()
             _msg.CleanUp()
+        self.__rm._AddProcessedMsgs(_nP, False)
 
         self._RblSetTaskAContext(_actx)
         return _xres
@@ -2320,13 +2636,14 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
         if _bCP:
             self.__ag.prepareCeasing()
         else:
+            _lcg = self._lcCeaseTLB._changeCount
             while True:
                 _ctlb = self._lcCeaseTLB
                 if _ctlb is None:
                     return
 
                 _ctlb.IncrementCeaseAliveCounter()
-                _TaskUtil.SleepMS(20)
+                _lcg = _ctlb._WaitForChange(_lcg, 20)
 
                 _ctlb = self._lcCeaseTLB
                 if _ctlb is None:
@@ -2353,6 +2670,10 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
         _bRCIter = self.__ag.isProvidingRunCeaseIteration
 
+        _lcg  = self._lcCeaseTLB._changeCount
+        _ccNS = self._xcard.cyclicCeaseTimespanMS * 1000000
+        _dlNS = _PyPerfCounterNS() + _ccNS
+
         _bPreShutdownPassed = False
         while True:
             if not self._lcCeaseTLB.isCeasing:
@@ -2360,13 +2681,16 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
 
             self._lcCeaseTLB.IncrementCeaseAliveCounter()
 
-            _TaskUtil.SleepMS(self._xcard.cyclicCeaseTimespanMS)
+            _lcg = self._lcCeaseTLB._WaitForChange(_lcg, (_dlNS - _PyPerfCounterNS()) / 1000000)
 
             if self._isInvalid:
                 break
 
-            if _bRCIter:
-                self.__ag.runCeaseIteration()
+            _nowNS = _PyPerfCounterNS()
+            if _nowNS >= _dlNS:
+                _dlNS = _nowNS + _ccNS
+                if _bRCIter:
+                    self.__ag.runCeaseIteration()
 
             if not self._lcCeaseTLB.isCeasing:
                 self._lcCeaseTLB.UpdateCeaseState(True)
@@ -2399,13 +2723,14 @@ class _AbsRunnable(_IDispAgent, _PcErrHandler, _AbsFwXUnit):
                 return
             self._lcCeaseTLB.UpdateCeaseState(True)
 
+        _lcg = self._lcCeaseTLB._changeCount
         while True:
             if (not self._lcCeaseTLB.isCoordinatedShutdownRunning) or self._lcCeaseTLB.isCoordinatedShutdownGateOpened:
                 break
 
             self._lcCeaseTLB.IncrementCeaseAliveCounter()
 
-            _TaskUtil.SleepMS(self._xcard.cyclicCeaseTimespanMS)
+            _lcg = self._lcCeaseTLB._WaitForChange(_lcg, self._xcard.cyclicCeaseTimespanMS)
 
             if self._isInvalid:
                 break
@@ -0,0 +1,98 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : rblmetrics.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+from bisect import bisect_right    as _PyBisectRight
+from time   import perf_counter_ns as _PyPerfCounterNS
+
+from xcofdk.fwcom import TaskMetrics
+
+class _RblMetrics:
+    __slots__ = [ '__ni' , '__ti' , '__mi' , '__h' , '__ib' , '__tb' , '__nx' , '__nn' , '__hx' , '__hn' , '__nr' , '__ts' , '__te' ]
+
+    __NS_PER_MS   = 1000000
+    _HIST_BOUNDS_NS = ( 100000, 1000000, 10000000, 100000000, 1000000000 )
+
+    def __init__(self):
+        self.__h  = [0] * (len(_RblMetrics._HIST_BOUNDS_NS) + 1)
+        self.__hn = 0
+        self.__hx = 0
+        self.__ib = 0
+        self.__mi = 0
+        self.__ni = 0
+        self.__nn = 0
+        self.__nr = 0
+        self.__nx = 0
+        self.__tb = 0
+        self.__te = None
+        self.__ti = 0
+        self.__ts = None
+
+    @staticmethod
+    def _Now() -> int:
+        return _PyPerfCounterNS()
+
+    def _StartRunPhase(self):
+        self.__ts = _PyPerfCounterNS()
+        self.__te = None
+
+    def _StopRunPhase(self):
+        if self.__ts is not None:
+            self.__te = _PyPerfCounterNS()
+
+    def _AddIteration(self, ns_ : int):
+        ns_ -= self.__ib
+        self.__ib = 0
+        if ns_ < 0:
+            ns_ = 0
+
+        self.__ni += 1
+        self.__ti += ns_
+        if ns_ > self.__mi:
+            self.__mi = ns_
+        self.__h[_PyBisectRight(_RblMetrics._HIST_BOUNDS_NS, ns_)] += 1
+
+    def _AddBlocked(self, ns_ : int, bInIteration_ =False):
+        self.__tb += ns_
+        if bInIteration_:
+            self.__ib += ns_
+
+    def _AddProcessedMsgs(self, num_ : int, bExtQueue_ : bool):
+        if bExtQueue_:
+            self.__nx += num_
+        else:
+            self.__nn += num_
+
+    def _UpdateQueueSize(self, qsize_ : int, bExtQueue_ : bool):
+        if bExtQueue_:
+            if qsize_ > self.__hx:
+                self.__hx = qsize_
+        elif qsize_ > self.__hn:
+            self.__hn = qsize_
+
+    def _AddDispatchRetries(self, num_ : int):
+        self.__nr += num_
+
+    def _Snapshot(self, taskUID_ : int, taskName_ : str, aliasName_ : str, bFws_ : bool, xqSize_ : int, iqSize_ : int) -> TaskMetrics:
+        _ns   = _RblMetrics.__NS_PER_MS
+        _nMsg = self.__nx + self.__nn
+
+        _mps = 0.0
+        _ts  = self.__ts
+        if _ts is not None:
+            _te = self.__te
+            if _te is None:
+                _te = _PyPerfCounterNS()
+            if _te > _ts:
+                _mps = round(_nMsg * 1000000000 / (_te - _ts), 3)
+
+        return TaskMetrics( taskUID_, taskName_, aliasName_, bFws_
+                          , self.__ni, self.__ti / _ns, self.__mi / _ns, tuple(self.__h)
+                          , self.__tb / _ns
+                          , xqSize_, max(xqSize_, self.__hx), iqSize_, max(iqSize_, self.__hn)
+                          , _nMsg, _mps, self.__nr)
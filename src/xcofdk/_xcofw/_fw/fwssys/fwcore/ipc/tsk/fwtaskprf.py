@@ -7,6 +7,8 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
+from typing import Union
+
 from _fwadapter                          import rlogif
 from _fw.fwssys.fwcore.base.strutil      import _StrUtil
 from _fw.fwssys.fwcore.base.util         import _Util
@@ -17,6 +19,7 @@ from _fw.fwssys.fwcore.ipc.tsk.taskutil  import _TaskUtil
 from _fw.fwssys.fwcore.ipc.tsk.taskutil  import _ETaskResFlag
 from _fw.fwssys.fwcore.ipc.tsk.taskutil  import _ETaskRightFlag
 from _fw.fwssys.fwcore.ipc.tsk.taskutil  import _PyThread
+from _fw.fwssys.fwmsg.disp.fwlightqueue  import _FwLightQueue
 from _fw.fwssys.fwmsg.disp.fwqueue       import _FwQueue
 from _fw.fwssys.fwerrh.fwerrorcodes      import _EFwErrorCode
 
@@ -226,7 +229,7 @@ class _FwTaskProfile(_AbsFwProfile):
         return self._GetProfileAttr(_FwTaskProfile.__ATTR_KEY_INT_QUEUE)
 
     @property
-    def externalQueue(self) -> _FwQueue:
+    def externalQueue(self) -> Union[_FwQueue, _FwLightQueue]:
         return self._GetProfileAttr(_FwTaskProfile.__ATTR_KEY_EXT_QUEUE)
 
     @property
@@ -540,8 +543,11 @@ class _FwTaskProfile(_AbsFwProfile):
                 _xqSize = _FwQueue.GetFiniteQueueDefaultSize()
             _bOnSizeBlockingXQ = not (rbl_.isProvidingAutoManagedExternalQueue and rbl_.isProvidingRunExecutable)
 
+            _bLightXQ, _bSPXQ = False, False
             if rbl_._rblType.isXTaskRunnable:
-                _bAttrOnSizeBlockingXQ = rbl_._utAgent.taskProfile.isExternalQueueBlocking
+                _xtPrf = rbl_._utAgent.taskProfile
+                _bAttrOnSizeBlockingXQ = _xtPrf.isExternalQueueBlocking
+                _bLightXQ, _bSPXQ      = _xtPrf.isExternalQueueLockLight, _xtPrf.isExternalQueueSingleProducer
             else:
                 _bAttrOnSizeBlockingXQ = self._GetProfileAttr(_FwTaskProfile._ATTR_KEY_ON_SIZE_BLOCKING_XQUEUE, ignoreStatus_=True)
             if _bAttrOnSizeBlockingXQ is not None:
@@ -551,7 +557,9 @@ class _FwTaskProfile(_AbsFwProfile):
                     return False
 
             if self.externalQueue is None:
-                if not _bOnSizeBlockingXQ:
+                if _bLightXQ:
+                    _extQueue = _FwLightQueue.CreateInstance(maxSize_=_xqSize, bBlockingOnSize_=_bOnSizeBlockingXQ, bSingleProducer_=_bSPXQ)
+                elif not _bOnSizeBlockingXQ:
                     _extQueue = _FwQueue.CreateInstance(maxSize_=_xqSize)
                 else:
                     _extQueue = _FwQueue.CreateInstanceBlockingOnSize(maxSize_=_xqSize)
@@ -34,6 +34,7 @@ from _fw.fwssys.fwcore.ipc.tsk.fwthreadprf   import _FwThreadProfile
 from _fw.fwssys.fwcore.ipc.tsk.taskbadge     import _TaskBadge
 from _fw.fwssys.fwcore.ipc.tsk.fwtaskerror   import _FwTaskError
 from _fw.fwssys.fwcore.ipc.tsk.fwtaskerror   import _TaskErrorExtended
+from _fw.fwssys.fwcore.ipc.tsk.rcsched       import _RunCycleScheduler
 from _fw.fwssys.fwcore.ipc.tsk.taskstate     import _TaskState
 from _fw.fwssys.fwcore.ipc.tsk.taskutil      import _TaskUtil
 from _fw.fwssys.fwcore.ipc.tsk.taskutil      import _ETaskType
@@ -1001,6 +1002,42 @@ class _FwThread(_AbsFwTask):
 
         return _fwDisp._DispatchMessage(msg_)
 
+    def _SendMessages(self, msgs_ : list) -> list:
+        res = [False] * len(msgs_)
+        if _ssshare._WarnOnDisabledSubsysMsg():
+            return res
+        if _FwSubsysCoding.IsSenderExternalQueueSupportMandatory():
+            vlogif._LogOEC(True, _EFwErrorCode.VFE_00989)
+            return res
+
+        _fwDisp = _FwThread.__FwDispRbl
+        if _fwDisp is None:
+            _fwDisp = _AbsFwService._GetFwsInstance(_EFwsID.eFwsDisp)
+            if _fwDisp is None:
+                return res
+            _FwThread.__FwDispRbl = _fwDisp
+
+        if self._isInvalid or self._isInLcCeaseMode or self.isAborting or not self.isStarted:
+            return res
+
+        for _mm in msgs_:
+            if (_mm is None) or not _mm.isValid:
+                return res
+
+            _hdr = _mm.header
+            if not (_hdr.typeID.isTIntraProcess and (_hdr.channelID.isChInterTask or _hdr.channelID.isChIntraTask)):
+                vlogif._LogOEC(True, _EFwErrorCode.VFE_00990)
+                return res
+            if _hdr.isInternalMsg:
+                vlogif._LogOEC(True, _EFwErrorCode.VFE_00991)
+                return res
+
+        _actx = self._GetTaskApiContext()
+        if not (self.isRunning or (self.isStopping and _actx.isTeardown)):
+            return res
+
+        return _fwDisp._DispatchMessages(msgs_)
+
     @property
     def __isCeaseCapable(self):
         return (self.lcDynamicTLB is not None) and not self.lcDynamicTLB.isDummyTLB
@@ -1089,6 +1126,7 @@ class _FwThread(_AbsFwTask):
                     _tnid = self.dHThrd.native_id
                 self.taskBadge._UpdateRuntimeIDs(threadUID_=_tuid, threadNID_=_tnid)
 
+        _TaskUtil._BindCurPyThread(self)
         self._CheckSetTaskState(_TaskState._EState.eRunning)
 
         _bXT = self.taskBadge.isDrivingXTask
@@ -1128,6 +1166,8 @@ class _FwThread(_AbsFwTask):
         if _srg is not None:
             _srg.ReleaseAcquiredSyncResources(self.dtaskUID)
 
+        _TaskUtil._UnbindCurPyThread()
+
     def __SyncStart(self):
         self._CheckSetTaskState(_TaskState._EState.eRunning)
 
@@ -1232,6 +1272,10 @@ class _FwThread(_AbsFwTask):
         _utc        = None if self.__utr is None else self.__utr._utaskConn
         _xres       = _EExecutionCmdID.Continue()
         _runCycleMS = self.xCard.runPhaseFreqMS
+        _rcSched    = None
+
+        if (_runCycleMS > 0) and self.xCard.runPhaseSchedulingPolicy.isFixedRate:
+            _rcSched = _RunCycleScheduler._CreateScheduler(_runCycleMS, self.xCard.runPhaseMaxProcTimeMS, self.xCard.runPhaseSchedulingPolicy, self.dtaskName)
 
         _bBreak = False
         while True:
@@ -1272,9 +1316,13 @@ class _FwThread(_AbsFwTask):
                     if self.isRunning:
                         self._CheckSetTaskState(_TaskState._EState.eProcessingStopped)
                     _bBreak = True
+                elif _rcSched is not None:
+                    _rcSched._WaitForNextCycle()
                 else:
                     _TaskUtil.SleepMS(_runCycleMS)
 
+        if _rcSched is not None:
+            _rcSched.CleanUp()
         return _xres
 
     def __EvaluateExecResult( self
@@ -1615,6 +1663,7 @@ class _FwThread(_AbsFwTask):
             return
 
         if self._lcCeaseTLB.isLcShutdownEnabled:
+            _lcg = self._lcCeaseTLB._changeCount
             while True:
                 _ctlb = self._lcCeaseTLB
 
@@ -1622,7 +1671,7 @@ class _FwThread(_AbsFwTask):
                     return
 
                 _ctlb.IncrementCeaseAliveCounter()
-                _TaskUtil.SleepMS(20)
+                _lcg = _ctlb._WaitForChange(_lcg, 20)
 
                 _ctlb = self._lcCeaseTLB
                 if _ctlb is None:
@@ -1647,6 +1696,8 @@ class _FwThread(_AbsFwTask):
 
         self._lcCeaseTLB.HopToNextCeaseState(bEnding_=self.isAborting)
 
+        _lcg = self._lcCeaseTLB._changeCount
+
         _bPreShutdownPassed = False
         while True:
             if not self._lcCeaseTLB.isCeasing:
@@ -1654,7 +1705,7 @@ class _FwThread(_AbsFwTask):
 
             self._lcCeaseTLB.IncrementCeaseAliveCounter()
 
-            _TaskUtil.SleepMS(self.xCard.cyclicCeaseTimespanMS)
+            _lcg = self._lcCeaseTLB._WaitForChange(_lcg, self.xCard.cyclicCeaseTimespanMS)
 
             if self._isInvalid:
                 break
@@ -1687,13 +1738,14 @@ class _FwThread(_AbsFwTask):
                 return
             self._lcCeaseTLB.UpdateCeaseState(True)
 
+        _lcg = self._lcCeaseTLB._changeCount
         while True:
             if (not self._lcCeaseTLB.isCoordinatedShutdownRunning) or self._lcCeaseTLB.isCoordinatedShutdownGateOpened:
                 break
 
             self._lcCeaseTLB.IncrementCeaseAliveCounter()
 
-            _TaskUtil.SleepMS(self.xCard.cyclicCeaseTimespanMS)
+            _lcg = self._lcCeaseTLB._WaitForChange(_lcg, self.xCard.cyclicCeaseTimespanMS)
             if self._isInvalid:
                 break
 
@@ -0,0 +1,123 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : rcsched.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+from time import monotonic_ns as _PyMonotonicNS
+
+from xcofdk.fwcom import ERunPhaseSchedulingPolicy
+
+from _fw.fwssys.fwcore.logging           import logif
+from _fw.fwssys.fwcore.ipc.tsk.taskutil  import _TaskUtil
+from _fw.fwssys.fwcore.types.aobject     import _AbsSlotsObject
+from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
+
+from _fw.fwtdb.fwtdbengine import _EFwTextID
+
+class _RunCycleScheduler(_AbsSlotsObject):
+    __slots__ = [ '__p' , '__mp' , '__d' , '__t0' , '__bC' , '__nc' , '__no' , '__nm' , '__un' ]
+
+    __NS_PER_MS               = 1000000
+    __MAX_CATCH_UP_CYCLES     = 10
+    __OVERRUN_REPORT_INTERVAL = 100
+
+    def __init__(self, runCycleMS_ : int, maxProcTimeMS_ : int, schedPolicy_ : ERunPhaseSchedulingPolicy, uniqueName_ : str):
+        super().__init__()
+        self.__p  = None
+        self.__d  = None
+        self.__t0 = None
+        self.__bC = None
+        self.__mp = None
+        self.__nc = 0
+        self.__nm = 0
+        self.__no = 0
+        self.__un = None
+
+        if not (isinstance(runCycleMS_, int) and (runCycleMS_ > 0)):
+            return
+        if not (isinstance(schedPolicy_, ERunPhaseSchedulingPolicy) and schedPolicy_.isFixedRate):
+            return
+
+        if not (isinstance(maxProcTimeMS_, int) and (maxProcTimeMS_ > 0)):
+            maxProcTimeMS_ = runCycleMS_
+
+        self.__p  = runCycleMS_ * _RunCycleScheduler.__NS_PER_MS
+        self.__t0 = _PyMonotonicNS()
+        self.__d  = self.__t0 + self.__p
+        self.__bC = schedPolicy_ == ERunPhaseSchedulingPolicy.FIXED_RATE_CATCH_UP
+        self.__mp = maxProcTimeMS_ * _RunCycleScheduler.__NS_PER_MS
+        self.__un = uniqueName_
+
+    @staticmethod
+    def _CreateScheduler(runCycleMS_ : int, maxProcTimeMS_ : int, schedPolicy_ : ERunPhaseSchedulingPolicy, uniqueName_ : str):
+        res = _RunCycleScheduler(runCycleMS_, maxProcTimeMS_, schedPolicy_, uniqueName_)
+        if res.__p is None:
+            res.CleanUp()
+            res = None
+        return res
+
+    @property
+    def _numRunCycles(self) -> int:
+        return self.__nc
+
+    @property
+    def _numOverruns(self) -> int:
+        return self.__no
+
+    @property
+    def _numMissedDeadlines(self) -> int:
+        return self.__nm
+
+    def _WaitForNextCycle(self):
+        _p = self.__p
+        if _p is None:
+            return
+
+        _now = _PyMonotonicNS()
+        _pt  = _now - self.__t0
+        self.__nc += 1
+
+        if _pt > self.__mp:
+            self.__no += 1
+            if (self.__no % _RunCycleScheduler.__OVERRUN_REPORT_INTERVAL) == 1:
+                logif._LogWarningTID( _EFwTextID.eLogMsg_AbsRunnable_TID_007, self.__un, self.__mp // _RunCycleScheduler.__NS_PER_MS
+                                    , _pt / _RunCycleScheduler.__NS_PER_MS, self.__no, self.__nm, self.__nc)
+
+        _d = self.__d
+        if _now <= _d:
+            _RunCycleScheduler.__SleepNS(_d - _now)
+            self.__d  = _d + _p
+            self.__t0 = _d
+            return
+
+        _nm = (_now - _d) // _p
+        if self.__bC and (_nm < _RunCycleScheduler.__MAX_CATCH_UP_CYCLES):
+            self.__d  = _d + _p
+            self.__t0 = _now
+            return
+
+        self.__nm += _nm + 1
+        _d += (_nm + 1) * _p
+        _RunCycleScheduler.__SleepNS(_d - _now)
+        self.__d  = _d + _p
+        self.__t0 = _d
+
+    def _ToString(self):
+        return _CommonDefines._STR_EMPTY
+
+    def _CleanUp(self):
+        self.__p  = None
+        self.__d  = None
+        self.__t0 = None
+        self.__bC = None
+        self.__mp = None
+        self.__un = None
+
+    @staticmethod
+    def __SleepNS(ns_ : int):
+        if ns_ >= _RunCycleScheduler.__NS_PER_MS:
+            _TaskUtil.SleepMS(ns_ / _RunCycleScheduler.__NS_PER_MS)
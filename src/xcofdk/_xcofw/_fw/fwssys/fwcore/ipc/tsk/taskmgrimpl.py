@@ -13,6 +13,7 @@ from typing      import Tuple
 from typing      import Union
 
 from xcofdk.fwcom     import EExecutionCmdID
+from xcofdk.fwcom     import TaskMetrics
 from xcofdk.fwapi.xmt import IXTask
 
 from _fw.fwssys.assys                      import fwsubsysshare as _ssshare
@@ -597,11 +598,35 @@ class _TaskMgrImpl(_TaskManager, _LcProxyClient, _ITMgrImpl, _ITTMgr):
         _lstXT, _lstUnj = self.__GetXTasks(bRunningOnly_=bRunningOnly_, bJoinableOnly_=bJoinableOnly_, bUID_=bUID_, lstUIDs_=lstUIDs_)
         return _lstXT, _lstUnj
 
+    @override
+    def _GetTaskMetrics(self, lstUIDs_ : list =None) -> List[TaskMetrics]:
+        res = []
+        if self.__isInvalid:
+            return res
+
+        with self.__md:
+            for _kk, _te in self.__tt.items():
+                if (lstUIDs_ is not None) and (_kk not in lstUIDs_):
+                    continue
+                if _te.teTaskBadge is None:
+                    continue
+
+                _rbl = _te.teTaskInst._dxUnit
+                if isinstance(_rbl, _AbsRunnable) and not _rbl._isInvalid:
+                    _tm = _rbl._GetTaskMetrics()
+                    if _tm is not None:
+                        res.append(_tm)
+        return res
+
     @override
     def _GetProxyInfoReplacementData(self):
         if self.__isInvalid:
             return None, None
 
+        _te = self.__GetBoundTableEntry()
+        if _te is not None:
+            return _te.teTaskName, _te.teIsXTaskEntry
+
         with self.__md:
             _curHT = _TaskUtil.GetCurPyThread()
             _tuid  = _TaskUtil.GetPyThreadUID(_curHT)
@@ -902,31 +927,37 @@ class _TaskMgrImpl(_TaskManager, _LcProxyClient, _ITMgrImpl, _ITTMgr):
             self._PcNotifyLcFailure(_cc, _frc, atask_=curTask_)
 
     def __GetCurTaskBadge(self, bAutoEncl_ =False):
-        _te = None
-        with self.__md:
-            _curHT = _TaskUtil.GetCurPyThread()
+        _te = self.__GetBoundTableEntry()
+        if _te is not None:
+            pass
+        else:
+            with self.__md:
+                _curHT = _TaskUtil.GetCurPyThread()
 
-            _te = self.__GetTableEntry(hthrd_=_curHT, bDoWarn_=True)
-            if _te is None:
-                if not bAutoEncl_:
-                    pass
-                else:
-                    _tuid = _TaskUtil.GetPyThreadUID(_curHT)
+                _te = self.__GetTableEntry(hthrd_=_curHT, bDoWarn_=True)
+                if _te is None:
+                    if not bAutoEncl_:
+                        pass
+                    else:
+                        _tuid = _TaskUtil.GetPyThreadUID(_curHT)
 
-                    if not _AutoEnclosedThreadsBag.IsProcessingCurPyThread(curPyThrd_=_curHT):
-                        _AutoEnclosedThreadsBag._AddPyThread(_curHT)
-                        _fthrd = self.__EncloseCurThread(bAEnclosed_=True, bSkipCheck_=True)
-                        _AutoEnclosedThreadsBag._RemovePyThread(_curHT)
+                        if not _AutoEnclosedThreadsBag.IsProcessingCurPyThread(curPyThrd_=_curHT):
+                            _AutoEnclosedThreadsBag._AddPyThread(_curHT)
+                            _fthrd = self.__EncloseCurThread(bAEnclosed_=True, bSkipCheck_=True)
+                            _AutoEnclosedThreadsBag._RemovePyThread(_curHT)
 
-                        if _fthrd is None:
-                            _errMsg = 'TMgr failed to auto-enclose current thread {}:{}.'.format(_curHT.name, _tuid)
-                            vlogif._LogOEC(True, _EFwErrorCode.VFE_00283)
+                            if _fthrd is None:
+                                _errMsg = 'TMgr failed to auto-enclose current thread {}:{}.'.format(_curHT.name, _tuid)
+                                vlogif._LogOEC(True, _EFwErrorCode.VFE_00283)
 
-                            if not self._PcIsTaskMgrFailed():
-                                _myFE = logif._CreateLogImplErrorEC(_EFwErrorCode.FE_00030, _errMsg)
-                                self._PcNotifyLcFailure(_ELcCompID.eTMgr, _myFE)
-                        else:
-                            _te = self.__GetTableEntry(taskID_=_fthrd.dtaskUID)
+                                if not self._PcIsTaskMgrFailed():
+                                    _myFE = logif._CreateLogImplErrorEC(_EFwErrorCode.FE_00030, _errMsg)
+                                    self._PcNotifyLcFailure(_ELcCompID.eTMgr, _myFE)
+                            else:
+                                _te = self.__GetTableEntry(taskID_=_fthrd.dtaskUID)
+
+            if _te is not None:
+                _TaskUtil._BindCurPyThread(_te.teTaskInst)
 
         res    = None
         _tinst = None
@@ -953,7 +984,25 @@ class _TaskMgrImpl(_TaskManager, _LcProxyClient, _ITMgrImpl, _ITTMgr):
         return res, _tinst
 
     def __GetCurTableEntry(self, bDoWarn_ =False):
-        return self.__GetTableEntry(hthrd_=_TaskUtil.GetCurPyThread(), bDoWarn_=bDoWarn_)
+        res = self.__GetBoundTableEntry()
+        if res is None:
+            res = self.__GetTableEntry(hthrd_=_TaskUtil.GetCurPyThread(), bDoWarn_=bDoWarn_)
+            if res is not None:
+                _TaskUtil._BindCurPyThread(res.teTaskInst)
+        return res
+
+    def __GetBoundTableEntry(self) -> Union[_TaskEntry, None]:
+        _ti = _TaskUtil.GetCurPyThreadBinding()
+        if _ti is None:
+            return None
+
+        # lock-free lookup, the binding of the current thread is valid as
+        # long as the task table still maps the bound task to its entry
+        _tt = self.__tt
+        res = None if _tt is None else _tt.get(_ti.dtaskUID, None)
+        if (res is not None) and (res.teTaskInst is not _ti):
+            res = None
+        return res
 
     def __GetTableEntry(self, taskID_ : Union[_EMessagePeer, int] =None, hthrd_ : _PyThread =None, bDoWarn_=True) -> Union[_TaskEntry, None]:
         res = None
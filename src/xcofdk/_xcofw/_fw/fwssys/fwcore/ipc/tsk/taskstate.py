@@ -7,8 +7,9 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
-from enum import auto
-from enum import unique
+from enum      import auto
+from enum      import unique
+from threading import Condition as _PyCondition
 
 from _fw.fwssys.fwcore.logging            import vlogif
 from _fw.fwssys.fwcore.base.util          import _Util
@@ -108,6 +109,9 @@ class _TaskState(_AbsSlotsObject):
 
     __slots__ = [ '__t' , '__ai' , '__ma' , '__bM' , '__bA' ]
 
+    __tc = _PyCondition()
+    __tg = 0
+
     def __init__(self, taskInst_, eStateID_ : _FwIntEnum, mtx_ =None):
         self.__t  = None
         self.__ai = None
@@ -229,6 +233,18 @@ class _TaskState(_AbsSlotsObject):
             _curSt, _bAlive = self.__GetState()
             return _curSt.isFailedByXCmdReturn
 
+    @staticmethod
+    def _GetTerminationCount() -> int:
+        return _TaskState.__tg
+
+    @staticmethod
+    def _WaitForTermination(lastCount_ : int, timeoutMS_ : int) -> int:
+        _tc = _TaskState.__tc
+        with _tc:
+            if _TaskState.__tg == lastCount_:
+                _tc.wait(timeout=timeoutMS_/1000)
+            return _TaskState.__tg
+
     def _ToString(self):
         if self.__isInvalid:
             return _CommonDefines._STR_EMPTY
@@ -315,8 +331,12 @@ class _TaskState(_AbsSlotsObject):
             self.__bM = False
 
     def __UpdateState(self, newState_ : _FwIntEnum):
+        _bT = newState_.isTerminated and not _TaskState._EState(self.__ai.value).isTerminated
         self.__ai.SetValue(newState_)
 
+        if _bT:
+            _TaskState.__NotifyTermination()
+
         if not _TaskUtil.IsNativeThreadIdSupported():
             pass
         elif newState_ != _TaskState._EState.eRunning:
@@ -328,3 +348,10 @@ class _TaskState(_AbsSlotsObject):
             _nid = None if _t is None else _t.native_id
             if _nid is not None:
                 _b._UpdateRuntimeIDs(threadNID_=_nid)
+
+    @staticmethod
+    def __NotifyTermination():
+        _tc = _TaskState.__tc
+        with _tc:
+            _TaskState.__tg += 1
+            _tc.notify_all()
@@ -544,6 +544,7 @@ class _TaskUtil:
     __nextFwTaskID    = None
     __nextAEnclTaskID = None
     __MAIN_PYTHREAD   = None
+    __CUR_TASK_TLS    = threading.local()
 
     @staticmethod
     def IsNativeThreadIdSupported():
@@ -654,6 +655,18 @@ class _TaskUtil:
     def GetCurPyThreadUID():
         return _TaskUtil.GetPyThreadUID(_TaskUtil.GetCurPyThread())
 
+    @staticmethod
+    def GetCurPyThreadBinding():
+        return getattr(_TaskUtil.__CUR_TASK_TLS, 'task', None)
+
+    @staticmethod
+    def _BindCurPyThread(task_):
+        _TaskUtil.__CUR_TASK_TLS.task = task_
+
+    @staticmethod
+    def _UnbindCurPyThread():
+        _TaskUtil.__CUR_TASK_TLS.task = None
+
     @staticmethod
     def GetCurPyThreadRuntimeID():
         if _TaskUtil.IsNativeThreadIdSupported():
@@ -9,6 +9,8 @@
 
 from typing import Union
 
+from xcofdk.fwcom import ERunPhaseSchedulingPolicy
+
 from _fw.fwssys.fwcore.logging           import vlogif
 from _fw.fwssys.fwcore.base.gtimeout     import _Timeout
 from _fw.fwssys.fwcore.types.aobject     import _AbsSlotsObject
@@ -16,7 +18,7 @@ from _fw.fwssys.fwcore.types.commontypes import _EDepInjCmd
 from _fw.fwssys.fwerrh.fwerrorcodes      import _EFwErrorCode
 
 class _TaskXCard(_AbsSlotsObject):
-    __slots__ = [ '__a' , '__k' , '__bR' , '__un' , '__cf' , '__mp' , '__rf' , '__bS' , '__bP' , '__rmp' , '__rmp2' ]
+    __slots__ = [ '__a' , '__k' , '__bR' , '__un' , '__cf' , '__mp' , '__rf' , '__bS' , '__bP' , '__rmp' , '__rmp2' , '__sp' ]
 
     __bDEFAULT_STRICT_TIMING                = False
     __bDEFAULT_LC_FAILURE_REPORT_PERMISSION = True
@@ -38,6 +40,7 @@ class _TaskXCard(_AbsSlotsObject):
                 , bStrictTiming_  : bool                           =None
                 , bFRPermission_  : bool                           =None
                 , bLcMonitor_     : bool                           =None
+                , runPhaseSP_     : ERunPhaseSchedulingPolicy      =None
                 , xtPrfExt_       =None
                 , cloneBy_        =None):
         super().__init__()
@@ -52,6 +55,7 @@ class _TaskXCard(_AbsSlotsObject):
         self.__bP   = None
         self.__rmp  = None
         self.__rmp2 = None
+        self.__sp   = None
 
         if not (isinstance(uniqueName_, str) and len(uniqueName_)):
             uniqueName_ = type(self).__name__
@@ -75,6 +79,7 @@ class _TaskXCard(_AbsSlotsObject):
                 self.__un   = str(cloneBy_.__un)
                 self.__rmp  = cloneBy_.__rmp
                 self.__rmp2 = cloneBy_.__rmp2
+                self.__sp   = cloneBy_.__sp
                 return
 
         if bLcMonitor_:
@@ -95,6 +100,8 @@ class _TaskXCard(_AbsSlotsObject):
                 runPhaseFreqMS_ = _xtp.runPhaseFrequencyMS
             if runPhaseMPTMS_ is None:
                 runPhaseMPTMS_ = _xtp.runPhaseMaxProcessingTimeMS
+            if runPhaseSP_ is None:
+                runPhaseSP_ = _xtp.runPhaseSchedulingPolicy
 
         _lstBoolParams = [ bStrictTiming_ , bFRPermission_ ]
         for _ee in _lstBoolParams:
@@ -146,6 +153,11 @@ class _TaskXCard(_AbsSlotsObject):
         else:
             self.__cf = _TaskXCard.__DEFAULT_CEASE_CYCLE_TIMESPAN_MS
 
+        if isinstance(runPhaseSP_, ERunPhaseSchedulingPolicy):
+            self.__sp = runPhaseSP_
+        else:
+            self.__sp = ERunPhaseSchedulingPolicy.FIXED_DELAY
+
         if bStrictTiming_ is not None:
             self.__bS = bStrictTiming_
         else:
@@ -237,6 +249,10 @@ class _TaskXCard(_AbsSlotsObject):
             self.__mp = _tout.toMSec
             _tout.CleanUp()
 
+    @property
+    def runPhaseSchedulingPolicy(self) -> ERunPhaseSchedulingPolicy:
+        return self.__sp
+
     @property
     def cyclicCeaseTimespanMS(self) -> int:
         return self.__cf
@@ -323,6 +339,7 @@ class _TaskXCard(_AbsSlotsObject):
         res += '  {:<46s} : {:<s}\n'.format('isLcFailureReportPermissionEnabled'             , str(self.isLcFailureReportPermissionEnabled))
         res += '  {:<46s} : {:<s}\n'.format('runPhaseFrequencyMS'                            , str(self.runPhaseFreqMS))
         res += '  {:<46s} : {:<s}\n'.format('runPhaseMaxProcessingTimeMS'                    , str(self.runPhaseMaxProcTimeMS))
+        res += '  {:<46s} : {:<s}\n'.format('runPhaseSchedulingPolicy'                       , str(None if self.__sp is None else self.__sp.name))
         res += '  {:<46s} : {:<s}\n'.format('cyclicCeaseTimespanMS'                          , str(self.cyclicCeaseTimespanMS))
         res += '  {:<46s} : {:<s}\n'.format('revisedCyclicMaxProcTimespanMS'                 , str(self._revisedCyclicMaxProcTimespanMS))
         res += '  {:<46s} : {:<s}\n'.format('revisedCyclicTotalProcessingTimespanMS'         , str(self._revisedCyclicTotalProcTimespanMS))
@@ -345,6 +362,7 @@ class _TaskXCard(_AbsSlotsObject):
         self.__bP   = None
         self.__rmp  = None
         self.__rmp2 = None
+        self.__sp   = None
 
     @property
     def __isInvalid(self):
@@ -9,6 +9,7 @@
 
 from enum import auto
 from enum import unique
+from time import monotonic_ns as _PyMonotonicNS
 
 from _fw.fwssys.assys.ifs.tiflcmgr          import _TILcManager
 from _fw.fwssys.fwcore.logging.logif        import _CreateLogImplErrorEC
@@ -29,6 +30,7 @@ from _fw.fwssys.fwcore.lc.ifs.iflcguard     import _ILcGuard
 from _fw.fwssys.fwcore.lc.ifs.iflcstate     import _ILcState
 from _fw.fwssys.fwcore.lc.lcstate           import _LcState
 from _fw.fwssys.fwcore.lc.lcmn.lcmonimpl    import _LcMonitorImpl
+from _fw.fwssys.fwcore.lc.lcmn.lcmontlb     import _LcCeaseTLB
 from _fw.fwssys.fwcore.lc.lcmn.lcsdc        import _LcSDCoordinator
 from _fw.fwssys.fwcore.types.aobject        import _AbsSlotsObject
 from _fw.fwssys.fwcore.types.commontypes    import _FwIntEnum
@@ -667,12 +669,21 @@ class _LcGuard(_ILcGuard):
     def __MonitorShutdownCoordinationByMR(self, bCheckForShutdownGate_ : bool):
         _lcm, _md = self.__m, self.__md
 
+        _CHECK_TIMESPAN_NS = 20 * 1000000
+
+        _tNextCheck = _PyMonotonicNS() + _CHECK_TIMESPAN_NS
         while True:
+            _lcg = _LcCeaseTLB._GetCeaseChangeCount()
             _bGO = _lcm.isCoordinatedShutdownGateOpened if bCheckForShutdownGate_ else _lcm.isCoordinatedPreShutdownGateOpened
             if _bGO:
                 break
 
-            _TaskUtil.SleepMS(20)
+            _LcCeaseTLB._WaitForCeaseChange(_lcg, (_tNextCheck - _PyMonotonicNS()) / 1000000)
+
+            _tNow = _PyMonotonicNS()
+            if _tNow < _tNextCheck:
+                continue
+            _tNextCheck = _tNow + _CHECK_TIMESPAN_NS
 
             _aliveCtrPrv   = _md.aliveCounter
             _bWasAAlarmOff = not _md.isAliveAlarmOn
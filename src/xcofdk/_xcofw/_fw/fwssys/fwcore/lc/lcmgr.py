@@ -7,13 +7,16 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
-from enum      import IntEnum
-from threading import RLock as _PyRLock
-from typing    import List
-from typing    import Tuple
-from typing    import Union
+from enum                       import IntEnum
+from multiprocessing.connection import wait         as _PyMPWait
+from threading                  import RLock        as _PyRLock
+from time                       import monotonic_ns as _PyMonotonicNS
+from typing                     import List
+from typing                     import Tuple
+from typing                     import Union
 
 from xcofdk.fwcom     import LcFailure
+from xcofdk.fwcom     import TaskMetrics
 from xcofdk.fwapi     import IRCTask
 from xcofdk.fwapi     import IRCCommTask
 from xcofdk.fwcom     import EXmsgPredefinedID
@@ -34,6 +37,7 @@ from _fw.fwssys.fwcore.ipc.tsk.afwtask        import _AbsFwTask
 from _fw.fwssys.fwcore.ipc.tsk.taskdefs       import _EFwsID
 from _fw.fwssys.fwcore.ipc.tsk.taskmgr        import _TaskMgr
 from _fw.fwssys.fwcore.ipc.tsk.taskmgr        import _TTaskMgr
+from _fw.fwssys.fwcore.ipc.tsk.taskstate      import _TaskState
 from _fw.fwssys.fwcore.ipc.tsk.taskutil       import _TaskUtil
 from _fw.fwssys.fwcore.lc.lcdefines           import _ELcScope
 from _fw.fwssys.fwcore.lc.lcdefines           import _ELcCompID
@@ -287,6 +291,23 @@ class _LcManager(_FwApiConnector, _TILcManager):
                     res = LcFailure(str(_frcv), _frcv.errorMessage, _frcv.errorCode)
             return res
 
+    @override
+    def _GetTaskMetrics(self, tasks_: Union[int, List[int], None] =None) -> List[TaskMetrics]:
+        if (_LcManager.__sgltn is None) or (self.__ts is None) or (self.__mi is None):
+            return []
+        if not self.__ts.isIPC:
+            return []
+
+        _lstUIDs = None
+        if tasks_ is not None:
+            _lstUIDs = [tasks_] if isinstance(tasks_, int) else tasks_
+            if not isinstance(_lstUIDs, list) or not all((isinstance(_id, int) and not isinstance(_id, bool) and (_id > 0)) for _id in _lstUIDs):
+                logif._LogErrorEC(_EFwErrorCode.UE_00284, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcManager_TID_079).format(str(tasks_)))
+                return []
+
+        _tskMgr = _TTaskMgr()
+        return [] if _tskMgr is None else _tskMgr._GetTaskMetrics(lstUIDs_=_lstUIDs)
+
     @override
     def _GetXTask(self, xtUID_ : int =0) -> Union[IXTask, None]:
         if not self.__ts.isIPC:
@@ -908,7 +929,6 @@ class _LcManager(_FwApiConnector, _TILcManager):
         logif._LogInfo(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcManager_TID_011))
         try:
             self.__xh._AddExecutionState(_ELcXState.eJoinPhase, self)
-            _TaskUtil.SleepMS(200)
             self.__gi._GJoin()
 
             self.__xh._AddExecutionState(_ELcXState.eJoinPassed, self)
@@ -1363,11 +1383,13 @@ class _LcManager(_FwApiConnector, _TILcManager):
                     return _numJ, None
                 _lstXU = _lstXT
 
-        _numXU       = len(_lstXU)
-        _timeSpanMS  = 100
-        _totalTimeMS = 0
+        _numXU      = len(_lstXU)
+        _timeSpanMS = 100
+        _lstRdySN   = set()
+        _termCount  = _TaskState._GetTerminationCount() if bTasks_ else None
 
         _MAX_TIME_MS = 0 if (timeout_ is None) else timeout_.toMSec
+        _tEndNS      = None if (_MAX_TIME_MS <= 0) else _PyMonotonicNS() + _MAX_TIME_MS * 1000000
 
         _bXcp = False
 
@@ -1376,10 +1398,7 @@ class _LcManager(_FwApiConnector, _TILcManager):
                 break
 
             try:
-                _TaskUtil.SleepMS(_timeSpanMS)
-
                 _bBreak = False
-                _totalTimeMS += _timeSpanMS
 
                 if not bTasks_:
                     _lstXU = [_xu for _xu in _lstXU if (_xu._isAttachedToFW and not _xu._isTerminated)]
@@ -1388,8 +1407,6 @@ class _LcManager(_FwApiConnector, _TILcManager):
 
                 if len(_lstXU) < 1:
                     _bBreak = True
-                elif (_MAX_TIME_MS > 0) and (_totalTimeMS >= _MAX_TIME_MS):
-                    _bBreak = True
                 elif (self.__ts is None) or (self.__mi is None):
                     _bBreak = True
                 elif self.__mi.isLcShutdownEnabled:
@@ -1399,6 +1416,17 @@ class _LcManager(_FwApiConnector, _TILcManager):
                         _bBreak = self.__sdh._isStopRequestSubmitted
                 if _bBreak:
                     break
+
+                _waitMS = _timeSpanMS
+                if _tEndNS is not None:
+                    _waitMS = min(_waitMS, (_tEndNS - _PyMonotonicNS()) // 1000000)
+                    if _waitMS <= 0:
+                        break
+
+                if bTasks_:
+                    _termCount = _TaskState._WaitForTermination(_termCount, _waitMS)
+                else:
+                    _LcManager.__WaitForProcesses(_lstXU, _lstRdySN, _waitMS)
             except KeyboardInterrupt:
                 _bXcp = True
                 _midPart = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcManager_TID_069).format(_midPart)
@@ -1417,6 +1445,18 @@ class _LcManager(_FwApiConnector, _TILcManager):
         _numJ = _numXU-len(_lstXU)
         return _numJ, _lstUnj
 
+    @staticmethod
+    def __WaitForProcesses(lstXP_ : list, rdySentinels_ : set, timeoutMS_ : int):
+        _lstSN = [ _xp._xprocessSentinel for _xp in lstXP_ ]
+        _lstSN = [ _sn for _sn in _lstSN if _sn is not None ]
+        rdySentinels_.intersection_update(_lstSN)
+
+        _lstSN = [ _sn for _sn in _lstSN if _sn not in rdySentinels_ ]
+        if len(_lstSN) < 1:
+            _TaskUtil.SleepMS(timeoutMS_)
+        else:
+            rdySentinels_.update(_PyMPWait(_lstSN, timeout=timeoutMS_/1000))
+
     def __TerminateProcesses(self, procs_: Union[int, List[int], None] =None) -> int:
         if (_LcManager.__sgltn is None) or (self.__ts is None) or (self.__mi is None):
             return 0
@@ -7,7 +7,11 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
-from enum import unique
+from collections import deque        as _PyDeque
+from enum        import unique
+from heapq       import heappop      as _PyHeapPop
+from heapq       import heappush     as _PyHeapPush
+from time        import monotonic_ns as _PyMonotonicNS
 
 from _fw.fwssys.fwcore.logging.logif     import _LogKPI
 from _fw.fwssys.fwcore.logging.logif     import _LogWarning
@@ -243,7 +247,7 @@ class _LcMonitorImpl(_LcXStateDriver):
         def IsLcMonBitFlagSet(eLcMonBitMask_: _FwIntFlag, eLcMonBitFlag_):
             return _EBitMask.IsEnumBitFlagSet(eLcMonBitMask_, eLcMonBitFlag_)
 
-    __slots__ = [ '__gc' , '__ma' , '__md' , '__tt' , '__mt' , '__m' , '__cr' , '__bM' , '__ts' , '__xh' ]
+    __slots__ = [ '__gc' , '__ma' , '__md' , '__tt' , '__mt' , '__m' , '__cr' , '__bM' , '__ts' , '__xh' , '__dq' , '__dh' , '__ti' , '__tp' , '__cs' , '__nc' ]
 
     __theLcMon = None
 
@@ -252,15 +256,22 @@ class _LcMonitorImpl(_LcXStateDriver):
     __PER_SHUTDOWN_PHASE_WAIT_TIMESPAN_MS     = 10 * 1000
     __PER_SHUTDOWN_REQUEST_WAIT_TIMESPAN_MS   = 1 * 1000
     __PER_SHUTDOWN_PHASE_FWC_WAIT_TIMESPAN_MS = 1 * 1000
+    __TLB_FULL_SWEEP_CYCLES                   = 100
 
     def __init__(self, ppass_ : int, xhist_ : _LcXStateHistory):
         self.__m  = None
         self.__bM = None
         self.__cr = None
+        self.__cs = None
+        self.__dh = None
+        self.__dq = None
         self.__gc = None
         self.__ma = None
         self.__mt = None
         self.__md = None
+        self.__nc = None
+        self.__ti = None
+        self.__tp = None
         self.__ts = None
         self.__tt = None
         self.__xh = None
@@ -284,6 +295,12 @@ class _LcMonitorImpl(_LcXStateDriver):
         self.__md = _Mutex()
         self.__tt = dict()
         self.__xh = xhist_
+        self.__cs = _TlbSummary()
+        self.__dh = []
+        self.__dq = _PyDeque()
+        self.__nc = 0
+        self.__ti = dict()
+        self.__tp = dict()
 
         _LcCeaseTLB._SetLcMonitorImpl(self)
         _LcDynamicTLB._SetLcMonitorImpl(self)
@@ -409,8 +426,10 @@ class _LcMonitorImpl(_LcXStateDriver):
         if self.__isInvalid:
             return
         with self.__ma:
-            if (self.__cr is None) or self.__cr != eShutdownRequest_:
-                self.__cr = eShutdownRequest_
+            if (self.__cr is not None) and self.__cr == eShutdownRequest_:
+                return
+            self.__cr = eShutdownRequest_
+        self.__NotifyCeaseChange()
 
     def _StopCoordinatedShutdown(self, bDueToUnexpectedError_ =False):
         if self.__isInvalid:
@@ -421,6 +440,7 @@ class _LcMonitorImpl(_LcXStateDriver):
                 self.__m = _LcMonitorImpl._ELcMonStateFlag.RemoveLcMonBitFlag(self.__m, _bm)
                 if not bDueToUnexpectedError_:
                     self.__xh._AddExecutionState(_ELcXState.eShutdownPassed, self)
+        self.__NotifyCeaseChange()
 
     def _OpenCoordinatedGate(self, bfLcMonState_):
         if self.__isInvalid:
@@ -434,6 +454,7 @@ class _LcMonitorImpl(_LcXStateDriver):
         with self.__ma:
             if not _LcMonitorImpl._ELcMonStateFlag.IsLcMonBitFlagSet(self.__m, bfLcMonState_):
                 self.__m = _LcMonitorImpl._ELcMonStateFlag.AddLcMonBitFlag(self.__m, bfLcMonState_)
+        self.__NotifyCeaseChange()
 
     def _EnableCoordinatedShutdown(self, bManagedByMR_ : bool =None):
         if self.__isInvalid:
@@ -469,6 +490,7 @@ class _LcMonitorImpl(_LcXStateDriver):
                 else:
                     _errMsg = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcMonitorImpl_TID_001)
                     _LogKPI(_errMsg)
+        self.__NotifyCeaseChange()
 
     def _GetAliveCounter(self):
         if self.__isInvalid:
@@ -493,49 +515,24 @@ class _LcMonitorImpl(_LcXStateDriver):
         if _LcMonitorImpl._ELcMonStateFlag.IsCoordinatedShutdownMode(self.__m):
             return
 
-        _lsaReportStr = ''
-        _curSum = None if tlbSum_ is None else _TlbSummary()
         with self.__md:
-            _lstRemoved       = []
-            _lstXtTaskCleanUp = []
-            for _kk in self.__tt.keys():
-                _tlb = self.__tt[_kk]
-                if not (_tlb.isValid and not _tlb.isCleanedUp):
-                    _lstRemoved.append(_kk)
-                    continue
-
-                if _tlb.lcStaticTLB.taskBadge.isFwMain:
-                    continue
-
-                _bXtTask = _tlb.lcStaticTLB.isXTaskTLB
-
-                if _tlb.isTerminatedAfterStart:
-                    if _bXtTask:
-                        _ti = _tlb._taskInstance
-                        if (_ti is not None) and _ti.isValid:
-                            _lstXtTaskCleanUp.append(_ti)
-                    continue
-
-                _lsaReportStr = _tlb._UpdateTLB(False, lsaReportStr_=_lsaReportStr)
+            self.__nc += 1
+            if self.__nc >= _LcMonitorImpl.__TLB_FULL_SWEEP_CYCLES:
+                self.__nc = 0
+                self.__dq.extend(self.__tt.keys())
 
-                if _curSum is None:
-                    pass
-                else:
-                    _curSum.numTasks = 1 + _curSum.numTasks
-                    if _bXtTask:
-                        _curSum.numXTasks = 1 + _curSum.numXTasks
+            _tNow       = _PyMonotonicNS()
+            _lstRemoved = []
 
-                    if _tlb.lcDynamicTLB.isRunning:
-                        _curSum.numRunningTasks = 1 + _curSum.numRunningTasks
-                        if _bXtTask:
-                            _curSum.numRunningXTasks = 1 + _curSum.numRunningXTasks
+            self.__ProcessTLBChanges(_tNow, _lstRemoved)
+            _lsaReportStr     = self.__ProcessDueTLBs(_tNow, '')
+            _lstXtTaskCleanUp = self.__GetXtTaskCleanUpList()
 
             if (_lsaReportStr is not None) and (len(_lsaReportStr) < 1):
                 _lsaReportStr = None
 
             if tlbSum_ is not None:
-                if _curSum is not None:
-                    tlbSum_._Update(_curSum)
+                tlbSum_._Update(self.__cs)
                 tlbSum_.lifeSignAlarmReport = _lsaReportStr
 
             for _kk in _lstRemoved:
@@ -552,11 +549,11 @@ class _LcMonitorImpl(_LcXStateDriver):
         _WAIT_WNG_TIMESPAN_MS    = 2 * _LcMonitorImpl.GetPerShutdownRequestWaitTimespanMS()
         _SINGLE_WAIT_TIMESPAN_MS = _LcMonitorImpl.GetPerSingleStepWaitTimespanMS()
         _TOTAL_WAIT_TIMESPAN_MS  = _LcMonitorImpl.GetPerShutdownPhaseTotalWaitTimespanMS()
-        _MAX_WAIT_NUM            = _TOTAL_WAIT_TIMESPAN_MS // _SINGLE_WAIT_TIMESPAN_MS
 
         _bByMR = self._isCoordinatedShutdownManagedByMR
 
-        _numWait    = 0
+        _tNextWng   = _PyMonotonicNS()
+        _tDeadline  = _tNextWng + _TOTAL_WAIT_TIMESPAN_MS * 1000000
         _tidFW      = []
         _tidXT      = []
         _tidIgnore  = []
@@ -565,6 +562,7 @@ class _LcMonitorImpl(_LcXStateDriver):
 
         _bContinue = True
         while _bContinue:
+            _lcg       = _LcCeaseTLB._GetCeaseChangeCount()
             _bContinue = self.isCoordinatedShutdownRunning
             if not _bContinue:
                 break
@@ -603,7 +601,8 @@ class _LcMonitorImpl(_LcXStateDriver):
             if not _bContinue:
                 pass
             elif len(_tunWaiting) > 0:
-                if _numWait >= _MAX_WAIT_NUM:
+                _tNow = _PyMonotonicNS()
+                if _tNow >= _tDeadline:
                     _wngMsg = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcMonitorImpl_TID_003).format(len(_tunWaiting))
                     vlogif._LogUrgentWarning(_wngMsg)
                     for _tid in _tidWaiting:
@@ -613,16 +612,15 @@ class _LcMonitorImpl(_LcXStateDriver):
                                 _vv.lcCeaseTLB.UpdateCeaseState(True)
                     break
 
-                if ((_numWait * _SINGLE_WAIT_TIMESPAN_MS) % _WAIT_WNG_TIMESPAN_MS) == 0:
+                if _tNow >= _tNextWng:
+                    _tNextWng += _WAIT_WNG_TIMESPAN_MS * 1000000
                     _wngMsg = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcMonitorImpl_TID_004).format(len(_tunWaiting))
                     if vlogif._IsReleaseModeEnabled():
                         _LogWarning(_wngMsg)
 
                 if _bByMR:
                     self._mainTLB.lcCeaseTLB.IncrementCeaseAliveCounter()
-                _TaskUtil.SleepMS(_SINGLE_WAIT_TIMESPAN_MS)
-
-                _numWait += 1
+                _LcCeaseTLB._WaitForCeaseChange(_lcg, min(_SINGLE_WAIT_TIMESPAN_MS, (_tDeadline - _tNow) // 1000000 + 1))
                 continue
             break
 
@@ -640,14 +638,14 @@ class _LcMonitorImpl(_LcXStateDriver):
                 if len(_lstXuTLBs) == 0:
                     _lstXuTLBs = None
                 elif bRSorted_:
-                    _lstXuTLBs = sorted(_lstXuTLBs, key=lambda t: t.stopWatch.startTimeTicksUS, reverse=True)
+                    _lstXuTLBs = sorted(_lstXuTLBs, key=lambda t: t.startTicksNS, reverse=True)
 
                 for _tid in _tidFW:
                     _lstFwTLBs.append(self.__tt[_tid])
                 if len(_lstFwTLBs) == 0:
                     _lstFwTLBs = None
                 elif bRSorted_:
-                    _lstFwTLBs = sorted(_lstFwTLBs, key=lambda t: t.stopWatch.startTimeTicksUS, reverse=True)
+                    _lstFwTLBs = sorted(_lstFwTLBs, key=lambda t: t.startTicksNS, reverse=True)
 
                 if _lstFwTLBs is not None:
                     _lstFwCTLBs = [_tt.lcCeaseTLB for _tt in _lstFwTLBs]
@@ -679,10 +677,16 @@ class _LcMonitorImpl(_LcXStateDriver):
                     vlogif._LogOEC(True, _EFwErrorCode.VFE_00418)
                 else:
                     self.__tt[_tid] = res
+                    self.__dq.append(_tid)
                     if res.lcStaticTLB.taskBadge.isFwMain:
                         self.__mt = res
         return res
 
+    def _PublishTLBChange(self, tskID_ : int):
+        _dq = self.__dq
+        if _dq is not None:
+            _dq.append(tskID_)
+
     def _CreateCeaseTLB(self, tskID_ : int, md_: _Mutex, bEnding_: bool) -> _LcCeaseTLB:
         if self.__isInvalid:
             return None
@@ -707,7 +711,9 @@ class _LcMonitorImpl(_LcXStateDriver):
                         vlogif._LogOEC(True, _EFwErrorCode.VFE_00419)
                     else:
                         _tlb._SetCeaseTLB(res)
-            return res
+        if res is not None:
+            _LcCeaseTLB._NotifyCeaseChange()
+        return res
 
     def _GetCurrentTLB(self) -> _LcTLB:
         if self.__isInvalid:
@@ -751,6 +757,10 @@ class _LcMonitorImpl(_LcXStateDriver):
             if _vv.isValid:
                 _vv.CleanUp()
         self.__tt.clear()
+        self.__dq.clear()
+        self.__dh.clear()
+        self.__ti.clear()
+        self.__tp.clear()
 
         self.__ma.CleanUp()
         self.__md.CleanUp()
@@ -758,9 +768,15 @@ class _LcMonitorImpl(_LcXStateDriver):
         self.__m  = None
         self.__bM = None
         self.__cr = None
+        self.__cs = None
+        self.__dh = None
+        self.__dq = None
         self.__ma = None
         self.__mt = None
         self.__md = None
+        self.__nc = None
+        self.__ti = None
+        self.__tp = None
         self.__ts = None
         self.__tt = None
         self.__xh = None
@@ -796,3 +812,103 @@ class _LcMonitorImpl(_LcXStateDriver):
             _bm = _LcMonitorImpl._ELcMonStateFlag.ebfCoordSDRunning
             if not _LcMonitorImpl._ELcMonStateFlag.IsLcMonBitFlagSet(self.__m, _bm):
                 self.__m = _LcMonitorImpl._ELcMonStateFlag.AddLcMonBitFlag(self.__m, _bm)
+
+    def __ProcessTLBChanges(self, tNowNS_ : int, lstRemoved_ : list):
+        _dq, _tt, _ti, _cs = self.__dq, self.__tt, self.__ti, self.__cs
+
+        _setTID = set()
+        while len(_dq) > 0:
+            _setTID.add(_dq.popleft())
+
+        for _tid in _setTID:
+            _tlb = _tt.get(_tid, None)
+            if (_tlb is None) or not (_tlb.isValid and not _tlb.isCleanedUp):
+                self.__UncountTLB(_tid)
+                self.__tp.pop(_tid, None)
+                if _tlb is not None:
+                    lstRemoved_.append(_tid)
+                continue
+
+            if _tlb.lcStaticTLB.taskBadge.isFwMain:
+                continue
+
+            if _tlb.isTerminatedAfterStart:
+                self.__UncountTLB(_tid)
+                if _tlb.lcStaticTLB.isXTaskTLB:
+                    self.__tp[_tid] = None
+                continue
+
+            _ee = _ti.get(_tid, None)
+            if _ee is None:
+                _bXt = _tlb.lcStaticTLB.isXTaskTLB
+                _ee  = _ti[_tid] = [ _bXt, False, 0, _tlb.lcStaticTLB.xCard._revisedPerLcMonCycleTotalProcTimespanMS ]
+                _cs.numTasks = 1 + _cs.numTasks
+                if _bXt:
+                    _cs.numXTasks = 1 + _cs.numXTasks
+
+            _bRun = _tlb.lcDynamicTLB.isRunning
+            if _ee[1] == _bRun:
+                continue
+
+            _ee[1]  = _bRun
+            _ee[2] += 1
+            _inc    = 1 if _bRun else -1
+            _cs.numRunningTasks = _inc + _cs.numRunningTasks
+            if _ee[0]:
+                _cs.numRunningXTasks = _inc + _cs.numRunningXTasks
+            if _bRun and (_ee[3] > 0):
+                _PyHeapPush(self.__dh, (tNowNS_ + _ee[3] * 1000000, _tid, _ee[2]))
+
+    def __ProcessDueTLBs(self, tNowNS_ : int, lsaReportStr_ : str) -> str:
+        _dh, _tt, _ti = self.__dh, self.__tt, self.__ti
+
+        while (len(_dh) > 0) and (_dh[0][0] <= tNowNS_):
+            _, _tid, _gen = _PyHeapPop(_dh)
+
+            _ee = _ti.get(_tid, None)
+            if (_ee is None) or (_ee[2] != _gen) or not _ee[1]:
+                continue
+            _tlb = _tt.get(_tid, None)
+            if _tlb is None:
+                continue
+
+            lsaReportStr_ = _tlb._UpdateTLB(False, lsaReportStr_=lsaReportStr_)
+            _PyHeapPush(_dh, (tNowNS_ + _ee[3] * 1000000, _tid, _gen))
+        return lsaReportStr_
+
+    def __GetXtTaskCleanUpList(self) -> list:
+        res = []
+        if len(self.__tp) < 1:
+            return res
+
+        for _tid in list(self.__tp.keys()):
+            _tlb = self.__tt.get(_tid, None)
+            _ti  = None if _tlb is None else _tlb._taskInstance
+            if (_ti is None) or not _ti.isValid:
+                self.__tp.pop(_tid)
+                continue
+            res.append(_ti)
+        return res
+
+    def __UncountTLB(self, tskID_ : int):
+        _ee = self.__ti.pop(tskID_, None)
+        if _ee is None:
+            return
+
+        _cs = self.__cs
+        _cs.numTasks = _cs.numTasks - 1
+        if _ee[0]:
+            _cs.numXTasks = _cs.numXTasks - 1
+        if _ee[1]:
+            _cs.numRunningTasks = _cs.numRunningTasks - 1
+            if _ee[0]:
+                _cs.numRunningXTasks = _cs.numRunningXTasks - 1
+
+    def __NotifyCeaseChange(self):
+        _md = self.__md
+        if _md is not None:
+            with _md:
+                _lstCTLBs = [ _tlb.lcCeaseTLB for _tlb in self.__tt.values() if _tlb.lcCeaseTLB is not None ]
+            for _ctlb in _lstCTLBs:
+                _ctlb._NotifyChange()
+        _LcCeaseTLB._NotifyCeaseChange()
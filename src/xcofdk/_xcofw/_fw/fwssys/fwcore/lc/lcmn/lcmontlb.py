@@ -7,11 +7,13 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
-from enum import unique
+from enum      import unique
+from threading import Condition    as _PyCondition
+from time      import monotonic_ns as _PyMonotonicNS
 
 from _fw.fwssys.fwcore.logging             import vlogif
-from _fw.fwssys.fwcore.base.timeutil       import _StopWatch
 from _fw.fwssys.fwcore.base.timeutil       import _PyDateTime
+from _fw.fwssys.fwcore.base.timeutil       import _TimeUtil
 from _fw.fwssys.fwcore.ipc.sync.mutex      import _Mutex
 from _fw.fwssys.fwcore.ipc.tsk.taskxcard   import _TaskXCard
 from _fw.fwssys.fwcore.ipc.tsk.taskbadge   import _TaskBadge
@@ -255,7 +257,7 @@ class _LcDynamicTLB(_AbsSlotsObject):
         super().__init__()
         self.__bC  = False
         self.__st  = None
-        self.__ut  = _PyDateTime.now()
+        self.__ut  = _PyMonotonicNS()
         self.__tst = lcStatTLB_
         self.__xph = None
         self.__xrn = None
@@ -310,6 +312,10 @@ class _LcDynamicTLB(_AbsSlotsObject):
 
     @property
     def updateTime(self) -> _PyDateTime:
+        return _TimeUtil.MonotonicTicksNS2DateTime(self.__ut)
+
+    @property
+    def updateTicksNS(self) -> int:
         return self.__ut
 
     @property
@@ -327,7 +333,9 @@ class _LcDynamicTLB(_AbsSlotsObject):
         if self.isCleanedUp or self.isLcShutdownEnabled:
             pass
         else:
+            _bPublish = bCleanedUp_ is not None
             if tskState_ is not None:
+                _bPublish = _bPublish or (tskState_ != self.__st)
                 self.__st = tskState_
             if euRNumber_ is not None:
                 self.__xrn = euRNumber_
@@ -335,7 +343,10 @@ class _LcDynamicTLB(_AbsSlotsObject):
                 self.__xph = xphaseID_
             if bCleanedUp_ is not None:
                 self.__bC = bCleanedUp_
-            self.__ut = _PyDateTime.now()
+            self.__ut = _PyMonotonicNS()
+
+            if _bPublish:
+                _LcDynamicTLB.__sgltn._PublishTLBChange(self.__tst.taskBadge.dtaskUID)
 
     def _CreateCeaseTLB(self, md_: _Mutex, bEnding_: bool):
         if self.isCleanedUp:
@@ -392,14 +403,18 @@ class _LcDynamicTLB(_AbsSlotsObject):
         return (_LcDynamicTLB.__sgltn is None) or (self.__tst is None)
 
 class _LcCeaseTLB(_AbsSlotsObject):
-    __slots__ = [ '__ut' , '__tst' , '__md' , '__cst' , '__cac' , '__cgf' ]
+    __slots__ = [ '__ut' , '__tst' , '__md' , '__cst' , '__cac' , '__cgf' , '__cv' , '__cg' ]
 
     __sgltn = None
+    __cc    = _PyCondition()
+    __ccg   = 0
 
     def __init__(self, lcStatTLB_: _LcStaticTLB, md_ : _Mutex, bEnding_ : bool):
         super().__init__()
         self.__md  = md_
-        self.__ut  = _PyDateTime.now()
+        self.__ut  = _PyMonotonicNS()
+        self.__cv  = _PyCondition()
+        self.__cg  = 0
         self.__cac = 0
         self.__cgf = _ELcCeaseGateFlag.ebfNone
         self.__cst = _ELcCeaseTLBState.eEndingCease if bEnding_ else _ELcCeaseTLBState.eRFTPrepareCeasing
@@ -469,6 +484,10 @@ class _LcCeaseTLB(_AbsSlotsObject):
 
     @property
     def updateTime(self) -> _PyDateTime:
+        return _TimeUtil.MonotonicTicksNS2DateTime(self.__ut)
+
+    @property
+    def updateTicksNS(self) -> int:
         return self.__ut
 
     def HopToNextCeaseState(self, bEnding_ =False):
@@ -480,20 +499,25 @@ class _LcCeaseTLB(_AbsSlotsObject):
                         self.__cst = _ELcCeaseTLBState.eDeceased
                     else:
                         self.__cst = _ELcCeaseTLBState(self.__cst.value+1)
+            self._NotifyChange()
+            _LcCeaseTLB._NotifyCeaseChange()
 
     def UpdateCeaseState(self, bEnding_ : bool):
         if not self.__isInvalid:
             with self.__md:
-                self.__ut = _PyDateTime.now()
+                self.__ut = _PyMonotonicNS()
                 if bEnding_:
                     self.__cst = _ELcCeaseTLBState.eEndingCease
+            if bEnding_:
+                self._NotifyChange()
+                _LcCeaseTLB._NotifyCeaseChange()
 
     def IncrementCeaseAliveCounter(self) -> int:
         if self.__isInvalid:
             res = None
         else:
             with self.__md:
-                self.__ut  = _PyDateTime.now()
+                self.__ut  = _PyMonotonicNS()
                 self.__cac += 1
                 res = self.__cac
         return res
@@ -502,6 +526,46 @@ class _LcCeaseTLB(_AbsSlotsObject):
     def _SetLcMonitorImpl(lcMonImpl_):
         _LcCeaseTLB.__sgltn = lcMonImpl_
 
+    @staticmethod
+    def _GetCeaseChangeCount() -> int:
+        return _LcCeaseTLB.__ccg
+
+    @staticmethod
+    def _WaitForCeaseChange(lastCount_ : int, timeoutMS_ : int) -> int:
+        _cc = _LcCeaseTLB.__cc
+        with _cc:
+            if (_LcCeaseTLB.__ccg == lastCount_) and (timeoutMS_ > 0):
+                _cc.wait(timeout=timeoutMS_/1000)
+            return _LcCeaseTLB.__ccg
+
+    @staticmethod
+    def _NotifyCeaseChange():
+        _cc = _LcCeaseTLB.__cc
+        with _cc:
+            _LcCeaseTLB.__ccg += 1
+            _cc.notify_all()
+
+    @property
+    def _changeCount(self) -> int:
+        return self.__cg
+
+    def _WaitForChange(self, lastCount_ : int, timeoutMS_ : int) -> int:
+        _cv = self.__cv
+        if _cv is None:
+            return None
+        with _cv:
+            if (self.__cg == lastCount_) and (timeoutMS_ > 0):
+                _cv.wait(timeout=timeoutMS_/1000)
+            return self.__cg
+
+    def _NotifyChange(self):
+        _cv = self.__cv
+        if _cv is None:
+            return
+        with _cv:
+            self.__cg += 1
+            _cv.notify_all()
+
     @property
     def _isCeasingGateOpened(self):
         if self.__isInvalid:
@@ -549,6 +613,7 @@ class _LcCeaseTLB(_AbsSlotsObject):
             if not _ELcCeaseGateFlag.IsCeasingGateSet(self.__cgf):
                 self.__cgf = _ELcCeaseGateFlag.AddLcCeaseGateFlag(self.__cgf, _ELcCeaseGateFlag.ebfCeasingGate)
             self.__md.Give()
+            self._NotifyChange()
 
     def _OpenPreShutdownGate(self, timeout_ =None):
         if self.__isInvalid:
@@ -562,6 +627,7 @@ class _LcCeaseTLB(_AbsSlotsObject):
             if not _ELcCeaseGateFlag.IsPreShutdownGateSet(self.__cgf):
                 self.__cgf = _ELcCeaseGateFlag.AddLcCeaseGateFlag(self.__cgf, _ELcCeaseGateFlag.ebfPreShutdownGate)
             self.__md.Give()
+            self._NotifyChange()
 
     def _OpenShutdownGate(self, timeout_ =None):
         if self.__isInvalid:
@@ -575,6 +641,7 @@ class _LcCeaseTLB(_AbsSlotsObject):
             if not _ELcCeaseGateFlag.IsShutdownGateSet(self.__cgf):
                 self.__cgf = _ELcCeaseGateFlag.AddLcCeaseGateFlag(self.__cgf, _ELcCeaseGateFlag.ebfShutdownGate)
             self.__md.Give()
+            self._NotifyChange()
 
     def _ToString(self):
         if self.__isInvalid:
@@ -587,9 +654,12 @@ class _LcCeaseTLB(_AbsSlotsObject):
             return
 
         self.__md.CleanUp()
+        self._NotifyChange()
 
         self.__ut  = None
         self.__md  = None
+        self.__cv  = None
+        self.__cg  = None
         self.__cac = None
         self.__cgf = None
         self.__cst = None
@@ -600,7 +670,7 @@ class _LcCeaseTLB(_AbsSlotsObject):
         return (_LcCeaseTLB.__sgltn is None) or (self.__tst is None)
 
 class _LcTLB(_AbsSlotsObject):
-    __slots__ = [ '__i' , '__sw' , '__td' , '__tc' , '__as']
+    __slots__ = [ '__i' , '__ts' , '__tr' , '__td' , '__tc' , '__as']
 
     __LSAT = 2
 
@@ -608,7 +678,8 @@ class _LcTLB(_AbsSlotsObject):
         self.__i  = None
         self.__tc = None
         self.__td = None
-        self.__sw = None
+        self.__tr = None
+        self.__ts = None
         super().__init__()
 
         _st = _LcStaticTLB(tskBadg_, xcard_, bUTask_)
@@ -619,7 +690,8 @@ class _LcTLB(_AbsSlotsObject):
         self.__i  = tskInst_
         self.__td = _LcDynamicTLB(_st)
         self.__as = _TlbAlarmStatus()
-        self.__sw = _StopWatch()
+        self.__ts = _PyMonotonicNS()
+        self.__tr = self.__ts
 
     def __str__(self):
         return self.ToString()
@@ -665,23 +737,19 @@ class _LcTLB(_AbsSlotsObject):
         return self.__tc
 
     @property
-    def stopWatch(self) -> _StopWatch:
-        return self.__sw
+    def startTicksNS(self) -> int:
+        return self.__ts
 
     @property
     def updateTime(self) -> _PyDateTime:
-        if self.__isInvalid:
-            _tlb = None
-        else:
-            _tlb = self.__td if self.__tc is None else self.__tc
-        return None if _tlb is None else _tlb.updateTime
+        return _TimeUtil.MonotonicTicksNS2DateTime(self.__updateTicksNS)
 
     @property
     def elapsedTimeSinceLastUpdate(self) -> int:
-        _ut = self.updateTime
+        _ut = self.__updateTicksNS
         if _ut is None:
             return None
-        return (_PyDateTime.now() - _ut).microseconds // 1000
+        return max(0, _PyMonotonicNS() - _ut) // _TimeUtil.TICKS_PER_MSECOND
 
     @property
     def _taskInstance(self):
@@ -708,8 +776,9 @@ class _LcTLB(_AbsSlotsObject):
         if _tpTS < 1:
             return lsaReportStr_
 
-        _elapsedTS = self.__sw.StopRelative(usTimeTicksStop_=None)
-        _diffTS    = _elapsedTS.totalMS - _tpTS
+        _tNow, _tRef = _PyMonotonicNS(), self.__tr
+        self.__tr    = _tNow
+        _diffTS      = (_tNow - _tRef) // _TimeUtil.TICKS_PER_MSECOND - _tpTS
         _lsaCtr    = self.__as.lsAlarmCounter
 
         if _diffTS > _LcTLB.__LSAT:
@@ -726,7 +795,7 @@ class _LcTLB(_AbsSlotsObject):
         return _FwTDbEngine.GetText(_EFwTextID.eLcTLB_ToString_004).format(self.lcStaticTLB.taskBadge.dtaskName)
 
     def _CleanUp(self):
-        if self.__sw is None:
+        if self.__ts is None:
             return
 
         if self.__tc is not None:
@@ -738,18 +807,24 @@ class _LcTLB(_AbsSlotsObject):
                 _st.CleanUp()
         if self.__as is not None:
             self.__as.CleanUp()
-        if self.__sw is not None:
-            self.__sw.CleanUp()
 
         self.__i  = None
         self.__as = None
-        self.__sw = None
         self.__tc = None
         self.__td = None
+        self.__tr = None
+        self.__ts = None
+
+    @property
+    def __updateTicksNS(self) -> int:
+        if self.__isInvalid:
+            return None
+        _tlb = self.__td if self.__tc is None else self.__tc
+        return _tlb.updateTicksNS
 
     @property
     def __isInvalid(self):
-        return self.__sw is None
+        return self.__ts is None
 
 class _LcDummyDynamicTLB(_LcDynamicTLB):
     __slots__ = []
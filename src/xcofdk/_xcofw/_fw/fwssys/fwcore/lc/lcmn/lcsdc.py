@@ -7,10 +7,12 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
+from time import monotonic_ns as _PyMonotonicNS
+
 from _fw.fwssys.fwcore.logging            import vlogif
 from _fw.fwssys.fwcore.base.gtimeout      import _Timeout
-from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _TaskUtil
 from _fw.fwssys.fwcore.lc.lcmn.lcmontlb   import _ELcCeaseGateFlag
+from _fw.fwssys.fwcore.lc.lcmn.lcmontlb   import _LcCeaseTLB
 from _fw.fwssys.fwcore.lc.lcmn.lcmontlb   import _ELcCeaseTLBState
 from _fw.fwssys.fwcore.lc.lcmn.lcmonimpl  import _LcMonitorImpl
 from _fw.fwssys.fwerrh.fwerrorcodes       import _EFwErrorCode
@@ -51,30 +53,7 @@ class _LcSDCoordinator:
             _lcm._StopCoordinatedShutdown(bDueToUnexpectedError_=True)
             return
 
-        _SINGLE_WAIT_TIMESPAN_MS = _LcMonitorImpl.GetPerSingleStepWaitTimespanMS()
-        _MAX_WAIT_NUM            = _LcMonitorImpl.GetPerShutdownRequestWaitTimespanMS() // _SINGLE_WAIT_TIMESPAN_MS
-
-        _numWait = 0
-        _curSDR = None
-
-        while True:
-            _numWait += 1
-
-            if not _lcm.isCoordinatedShutdownRunning:
-                break
-
-            _curSDR = _lcm.curShutdownRequest
-            if (_curSDR is not None) and _curSDR.isPreShutdown:
-                break
-
-            if self.__bM:
-                _lcm._mainTLB.lcCeaseTLB.IncrementCeaseAliveCounter()
-            _TaskUtil.SleepMS(_SINGLE_WAIT_TIMESPAN_MS)
-
-            if _numWait >= _MAX_WAIT_NUM:
-                break
-            continue
-
+        _curSDR = self.__WaitForShutdownRequest(True)
         if (_curSDR is None) or not _curSDR.isPreShutdown:
             if vlogif._IsReleaseModeEnabled():
                 vlogif._XLogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcSDC_TID_001))
@@ -85,39 +64,58 @@ class _LcSDCoordinator:
         _lcm._OpenCoordinatedGate(_LcMonitorImpl._ELcMonStateFlag.ebfPreShutdownGate)
 
     def _ExecuteCoordinatedShutdownGate(self):
+        _lcm    = self.__m
+        _curSDR = self.__WaitForShutdownRequest(False)
+        if (_curSDR is None) or not _curSDR.isShutdown:
+            if vlogif._IsReleaseModeEnabled():
+                vlogif._XLogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcSDC_TID_002))
+        if _lcm.isCoordinatedShutdownRunning:
+            self.__CoordinateCeasingGateXT(_ELcCeaseGateFlag.ebfShutdownGate)
+        if _lcm.isCoordinatedShutdownRunning:
+            self.__CoordinateCeasingGateFW(_ELcCeaseGateFlag.ebfShutdownGate)
+        _lcm._OpenCoordinatedGate(_LcMonitorImpl._ELcMonStateFlag.ebfShutdownGate)
+
+    def __WaitForShutdownRequest(self, bPreShutdown_ : bool):
         _lcm = self.__m
-        _SINGLE_WAIT_TIMESPAN_MS = _LcMonitorImpl.GetPerSingleStepWaitTimespanMS()
-        _MAX_WAIT_NUM            = _LcMonitorImpl.GetPerShutdownRequestWaitTimespanMS() // _SINGLE_WAIT_TIMESPAN_MS
 
-        _numWait, _curSDR = 0, None
+        _SINGLE_WAIT_TIMESPAN_MS = _LcMonitorImpl.GetPerSingleStepWaitTimespanMS()
+        _tDeadline = _PyMonotonicNS() + _LcMonitorImpl.GetPerShutdownRequestWaitTimespanMS() * 1000000
 
+        res = None
         while True:
-            _numWait += 1
+            _lcg = _LcCeaseTLB._GetCeaseChangeCount()
 
             if not _lcm.isCoordinatedShutdownRunning:
                 break
 
-            _curSDR = _lcm.curShutdownRequest
-            if (_curSDR is not None) and _curSDR.isShutdown:
-                break
+            res = _lcm.curShutdownRequest
+            if res is not None:
+                if res.isPreShutdown if bPreShutdown_ else res.isShutdown:
+                    break
 
             if self.__bM:
-                if (_lcm._mainTLB is not None) and (_lcm._mainTLB.lcCeaseTLB is not None):
-                    _lcm._mainTLB.lcCeaseTLB.IncrementCeaseAliveCounter()
-            _TaskUtil.SleepMS(_SINGLE_WAIT_TIMESPAN_MS)
+                _mtlb = _lcm._mainTLB
+                if (_mtlb is not None) and (_mtlb.lcCeaseTLB is not None):
+                    _mtlb.lcCeaseTLB.IncrementCeaseAliveCounter()
 
-            if _numWait >= _MAX_WAIT_NUM:
+            _remMS = (_tDeadline - _PyMonotonicNS()) // 1000000
+            if _remMS <= 0:
                 break
-            continue
+            _LcCeaseTLB._WaitForCeaseChange(_lcg, min(_SINGLE_WAIT_TIMESPAN_MS, _remMS))
+        return res
 
-        if (_curSDR is None) or not _curSDR.isShutdown:
-            if vlogif._IsReleaseModeEnabled():
-                vlogif._XLogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_LcSDC_TID_002))
-        if _lcm.isCoordinatedShutdownRunning:
-            self.__CoordinateCeasingGateXT(_ELcCeaseGateFlag.ebfShutdownGate)
-        if _lcm.isCoordinatedShutdownRunning:
-            self.__CoordinateCeasingGateFW(_ELcCeaseGateFlag.ebfShutdownGate)
-        _lcm._OpenCoordinatedGate(_LcMonitorImpl._ELcMonStateFlag.ebfShutdownGate)
+    @staticmethod
+    def __WaitForGatePassed(ctlb_ : _LcCeaseTLB, cstate_, timeoutMS_ : int):
+        _tDeadline = _PyMonotonicNS() + timeoutMS_ * 1000000
+        while True:
+            _lcg = ctlb_._changeCount
+            if (_lcg is None) or (ctlb_.ceaseState != cstate_):
+                break
+
+            _remMS = (_tDeadline - _PyMonotonicNS()) // 1000000
+            if _remMS <= 0:
+                break
+            ctlb_._WaitForChange(_lcg, _remMS)
 
     @property
     def __logPrefix(self):
@@ -145,6 +143,7 @@ class _LcSDCoordinator:
         while _lcm.isCoordinatedShutdownRunning:
             if _ii < _NUM:
                 _ctlb = _lstCTLBs[_ii]
+                _cst  = _ctlb.ceaseState
                 _ii += 1
 
                 if eCeaseFlag_.isCeasingGate:
@@ -157,7 +156,7 @@ class _LcSDCoordinator:
                 if self.__bM:
                     _lcm._mainTLB.lcCeaseTLB.IncrementCeaseAliveCounter()
 
-                _TaskUtil.SleepMS(_SINGLE_WAIT_TIMESPAN_MS)
+                _LcSDCoordinator.__WaitForGatePassed(_ctlb, _cst, _SINGLE_WAIT_TIMESPAN_MS)
                 continue
 
             break
@@ -192,6 +191,7 @@ class _LcSDCoordinator:
         while _lcm.isCoordinatedShutdownRunning:
             if _ii < _NUM:
                 _ctlb = _lstCTLBs[_ii]
+                _cst  = _ctlb.ceaseState
                 _ii += 1
 
                 if eCeaseFlag_.isCeasingGate:
@@ -204,7 +204,7 @@ class _LcSDCoordinator:
                 if self.__bM:
                     _lcm._mainTLB.lcCeaseTLB.IncrementCeaseAliveCounter()
 
-                _TaskUtil.SleepMS(_SINGLE_WAIT_TIMESPAN_MS)
+                _LcSDCoordinator.__WaitForGatePassed(_ctlb, _cst, _SINGLE_WAIT_TIMESPAN_MS)
                 continue
 
             break
@@ -36,6 +36,9 @@ class _AbsLogMgr:
                , logifOpOption_ =None):
         pass
 
+    def _IsLogLevelEnabled(self, logType_ : _ELogType) -> bool:
+        pass
+
     def _GetCurrentXTaskError(self):
         pass
 
@@ -43,6 +43,13 @@ def _IsUserExceptionModeEnabled() -> bool:
     _lm = _AbsLogMgr.GetInstance()
     return (_lm is not None) and _lm.isUserExceptionModeEnabled
 
+def _IsLogLevelEnabled(logType_ : _ELogType) -> bool:
+    _lm = _AbsLogMgr.GetInstance()
+    if _lm is None:
+        return vlogif._IsLogLevelEnabled(logType_)
+    else:
+        return _lm._IsLogLevelEnabled(logType_)
+
 def _PrintException(anyXcp_):
     _lm = _AbsLogMgr.GetInstance()
     if _lm is None:
@@ -69,6 +76,9 @@ def _XLogTrace(msg_):
         vlogif._XLogTrace(msg_)
     else:
         _lm._AddLog(_ELogType.XTRC, msg_=msg_)
+def _XLogTraceTID(fwTxtID_ : _EFwTextID, *fmtArgs_):
+    if _IsLogLevelEnabled(_ELogType.XTRC):
+        _XLogTrace(_GetDeferredText(fwTxtID_, fmtArgs_))
 
 def _XLogDebug(msg_):
     _lm = _AbsLogMgr.GetInstance()
@@ -76,6 +86,9 @@ def _XLogDebug(msg_):
         vlogif._XLogDebug(msg_)
     else:
         _lm._AddLog(_ELogType.XDBG, msg_=msg_)
+def _XLogDebugTID(fwTxtID_ : _EFwTextID, *fmtArgs_):
+    if _IsLogLevelEnabled(_ELogType.XDBG):
+        _XLogDebug(_GetDeferredText(fwTxtID_, fmtArgs_))
 
 def _LogInfo(msg_):
     _lm = _AbsLogMgr.GetInstance()
@@ -83,6 +96,9 @@ def _LogInfo(msg_):
         vlogif._LogInfo(msg_)
     else:
         _lm._AddLog(_ELogType.INF, msg_=msg_)
+def _LogInfoTID(fwTxtID_ : _EFwTextID, *fmtArgs_):
+    if _IsLogLevelEnabled(_ELogType.INF):
+        _LogInfo(_GetDeferredText(fwTxtID_, fmtArgs_))
 def _XLogInfo(msg_, bAC_ =False):
     _lm = _AbsLogMgr.GetInstance()
     if _lm is None:
@@ -97,6 +113,9 @@ def _LogKPI(msg_):
         vlogif._LogKPI(msg_)
     else:
         _lm._AddLog(_ELogType.KPI, msg_=msg_)
+def _LogKPITID(fwTxtID_ : _EFwTextID, *fmtArgs_):
+    if _IsLogLevelEnabled(_ELogType.KPI):
+        _LogKPI(_GetDeferredText(fwTxtID_, fmtArgs_))
 
 def _LogUrgentWarning(msg_):
     _lm = _AbsLogMgr.GetInstance()
@@ -110,6 +129,9 @@ def _LogWarning(msg_):
         vlogif._LogWarning(msg_)
     else:
         _lm._AddLog(_ELogType.WNG, msg_=msg_)
+def _LogWarningTID(fwTxtID_ : _EFwTextID, *fmtArgs_):
+    if _IsLogLevelEnabled(_ELogType.WNG):
+        _LogWarning(_GetDeferredText(fwTxtID_, fmtArgs_))
 def _XLogUrgentWarning(msg_):
     _lm = _AbsLogMgr.GetInstance()
     if _lm is None:
@@ -130,6 +152,8 @@ def _LogErrorEC(errCode_, msg_ =None):
         vlogif._LogErrorEC(errCode_, msg_)
     else:
         _lm._AddLog(_ELogType.ERR, msg_=msg_, errCode_=errCode_)
+def _LogErrorECTID(errCode_, fwTxtID_ : _EFwTextID, *fmtArgs_):
+    _LogErrorEC(errCode_, _GetDeferredText(fwTxtID_, fmtArgs_) if _IsLogLevelEnabled(_ELogType.ERR) else None)
 def _XLogErrorEC(errCode_, msg_ =None, bECSM_ =False):
     _lm = _AbsLogMgr.GetInstance()
     if _lm is None:
@@ -334,3 +358,8 @@ def _SetSysExceptionErrorEC(errCode_, msg_, sysOpXcp_, xcpTraceback_):
     if _lm is not None:
         _lm._AddLog(_ELogType.FTL_SOX, msg_=msg_, errCode_=errCode_, sysOpXcp_=sysOpXcp_, xcpTraceback_=xcpTraceback_, logifOpOption_=_ELogifOperationOption.eSetErrorOnly)
 
+def _GetDeferredText(fwTxtID_ : _EFwTextID, fmtArgs_ : tuple) -> str:
+    res = _FwTDbEngine.GetText(fwTxtID_)
+    if (res is None) or (len(fmtArgs_) < 1):
+        return res
+    return res.format(*[ _FwTDbEngine.GetText(_aa) if isinstance(_aa, _EFwTextID) else _aa for _aa in fmtArgs_ ])
@@ -224,6 +224,11 @@ class _LogMgr(_FwErrhRP, _AbsLogMgr):
             res = None
         return res
 
+    def _IsLogLevelEnabled(self, logType_ : _ELogType) -> bool:
+        if self.__d is None:
+            return False
+        return _LogUtil.GetEnabledLogTypeGroup(logType_, self.__GetLogLevel(logType_)) is not None
+
     def _GetCurrentXTaskError(self):
         if self.__d is None:
             return None
@@ -224,6 +224,9 @@ def _IsFwExceptionModeEnabled():
 def _IsReleaseModeEnabled():
     return _VLoggingImpl._IsReleaseModeEnabled()
 
+def _IsLogLevelEnabled(logType_ : _ELogType) -> bool:
+    return _VLoggingImpl._IsLogLevelEnabled(logType_)
+
 def _LogNewline():
     pass
 
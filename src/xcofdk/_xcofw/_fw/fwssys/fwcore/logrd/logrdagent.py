@@ -65,14 +65,18 @@ class _LogRDAgent:
 
         if self.__isA:
             _a.append(lrec_)
-        else:
-            if self.__s is not None:
-                self.__s._AddLR(lrec_)
-            elif self.__cs is not None:
-                self.__cs.Flush(lrec_)
-            lrec_._CleanUp()
+            self.__l.release()
+            return
+
+        _s, _cs = self.__s, self.__cs
         self.__l.release()
 
+        if _s is not None:
+            _s._AddLR(lrec_)
+        elif _cs is not None:
+            _cs.Flush(lrec_)
+        lrec_._CleanUp()
+
     @staticmethod
     def _GetInstance():
         res = _LogRDAgent.__sgltn
@@ -7,9 +7,12 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
+from typing import List
+
 from _fw.fwssys.fwcore.logrd.logrecord           import _LogRecord
 from _fw.fwssys.fwcore.logrd.rdsinks.logsinkbase import _LogSinkBase
 from _fw.fwssys.fwcore.types.commontypes         import override
+from _fw.fwssys.fwcore.types.commontypes         import _CommonDefines
 
 class _ConsoleSink(_LogSinkBase):
     __slots__ = [ '__bH' ]
@@ -33,6 +36,21 @@ class _ConsoleSink(_LogSinkBase):
             pass
         return True
 
+    @override
+    def _FlushLRs(self, batch_ : List[_LogRecord]) -> int:
+        _bH = self.__bH
+        _ll = []
+        for _rr in batch_:
+            _msg = _rr._recToStr
+            if _bH and _rr._recColor.isColor:
+                _msg = _LogSinkBase._ColorText(_msg, _rr._recColor)
+            _ll.append(_msg)
+        try:
+            print(_CommonDefines._CHAR_SIGN_LF.join(_ll))
+        except AttributeError as _xcp:
+            pass
+        return len(batch_)
+
     @override
     def _CleanUp(self):
         if not self.isValidSink:
@@ -8,16 +8,20 @@
 # ------------------------------------------------------------------------------
 
 import logging
+from   typing import List
+
+from xcofdk.fwcom.fwdefs import ELogRDOverflowPolicy
 
 from _fw.fwssys.fwcore.logrd.logrecord           import _LogRecord
 from _fw.fwssys.fwcore.logrd.rdsinks.logsinkbase import _LogSinkBase
 from _fw.fwssys.fwcore.types.commontypes         import override
+from _fw.fwssys.fwcore.types.commontypes         import _CommonDefines
 
 class _FileSink(_LogSinkBase):
     __slots__ = [ '__l' ]
 
-    def __init__(self, pyLogger_ : logging.Logger):
-        super().__init__()
+    def __init__(self, pyLogger_ : logging.Logger, overflowPolicy_ : ELogRDOverflowPolicy =None):
+        super().__init__(overflowPolicy_=overflowPolicy_)
         self.__l = pyLogger_
 
     @_LogSinkBase.isValidSink.getter
@@ -31,6 +35,33 @@ class _FileSink(_LogSinkBase):
         self.__l.info(logRec_._recToStr)
         return True
 
+    @override
+    def _FlushLRs(self, batch_ : List[_LogRecord]) -> int:
+        if not self.isValidSink:
+            return 0
+
+        _hh = [ _h for _h in self.__l.handlers if isinstance(_h, logging.StreamHandler) ]
+        if len(_hh) != 1:
+            return super()._FlushLRs(batch_)
+
+        _h  = _hh[0]
+        _LF = _CommonDefines._CHAR_SIGN_LF
+        _ll = [ _rr._recToStr for _rr in batch_ ]
+        _ll = [ (_ss if _ss.endswith(_LF) else _ss + _LF) for _ss in _ll ]
+
+        _h.acquire()
+        try:
+            _st = _h.stream
+            if _st is None:
+                return super()._FlushLRs(batch_)
+            _st.writelines(_ll)
+            _st.flush()
+        except (OSError, ValueError):
+            return 0
+        finally:
+            _h.release()
+        return len(batch_)
+
     @override
     def _CleanUp(self):
         if not self.isValidSink:
@@ -8,20 +8,36 @@
 # ------------------------------------------------------------------------------
 
 from collections import deque
+from threading   import Event as _PyEvent
+from threading   import Lock  as _PyLock
 from typing      import List
 from typing      import Union
 
+from xcofdk.fwcom.fwdefs import ELogRDOverflowPolicy
+
 from _fw.fwssys.fwcore.logrd.logrecord import _ELRType
 from _fw.fwssys.fwcore.logrd.logrecord import _EColorCode
 from _fw.fwssys.fwcore.logrd.logrecord import _LogRecord
 
 class _LogSinkBase:
-    __slots__ = [ '__c' , '__d' ]
+    __slots__ = [ '__c' , '__d' , '__op' , '__sc' , '__dc' , '__fl' , '__ev' ]
+
+    __BATCH_SIZE        = 256
+    __SAMPLE_RATE       = 10
+    __BLOCK_SLICE_SEC   = 0.1
+    __BLOCK_TIMEOUT_SEC = 1.0
 
-    def __init__(self, capacity_ : int =1000):
+    def __init__(self, capacity_ : int =1000, overflowPolicy_ : ELogRDOverflowPolicy =None):
         super().__init__()
-        self.__c = capacity_
-        self.__d = deque([], maxlen=capacity_)
+        if not isinstance(overflowPolicy_, ELogRDOverflowPolicy):
+            overflowPolicy_ = ELogRDOverflowPolicy.DROP_OLDEST
+        self.__c  = capacity_
+        self.__d  = deque([], maxlen=capacity_)
+        self.__op = overflowPolicy_
+        self.__sc = 0
+        self.__dc = 0
+        self.__fl = _PyLock()
+        self.__ev = _PyEvent() if overflowPolicy_ == ELogRDOverflowPolicy.BLOCK else None
 
     @property
     def isValidSink(self) -> bool:
@@ -39,32 +55,70 @@ class _LogSinkBase:
     def capacity(self) -> int:
         return self.__c
 
-    def AddLR(self, logRec_ : _LogRecord):
-        if self.__isInvalid:
+    @property
+    def overflowPolicy(self) -> ELogRDOverflowPolicy:
+        return self.__op
+
+    @property
+    def backlogSize(self) -> int:
+        _d = self.__d
+        return 0 if _d is None else len(_d)
+
+    @property
+    def droppedCount(self) -> int:
+        return self.__dc
+
+    def AddLR(self, logRec_ : _LogRecord, bCopy_ =True, bBlocking_ =False):
+        _d = self.__d
+        if _d is None:
             return
-        self.__d.append(_LogRecord(logRec_._recToStr, color_=logRec_._recColor, logType_=logRec_._recType))
+
+        _c = self.__c
+        if len(_d) >= _c:
+            _op = self.__op
+            _ev = self.__ev
+            if _op == ELogRDOverflowPolicy.SAMPLE:
+                if not logRec_._recType.isError:
+                    self.__sc += 1
+                    if (self.__sc % _LogSinkBase.__SAMPLE_RATE) != 0:
+                        return
+            elif bBlocking_ and (_ev is not None):
+                _ns = int(_LogSinkBase.__BLOCK_TIMEOUT_SEC / _LogSinkBase.__BLOCK_SLICE_SEC)
+                for _ in range(_ns):
+                    _ev.clear()
+                    if (len(_d) < _c) or self.__isInvalid:
+                        break
+                    _ev.wait(_LogSinkBase.__BLOCK_SLICE_SEC)
+                if self.__isInvalid:
+                    return
+
+            if len(_d) >= _c:
+                self.__dc += 1
+
+        if bCopy_:
+            logRec_ = _LogRecord(logRec_._recToStr, color_=logRec_._recColor, logType_=logRec_._recType)
+        _d.append(logRec_)
 
     def Flush(self, backlog_: Union[_LogRecord, List[_LogRecord], None] =None) -> _ELRType:
         res = _ELRType.LR_FREE
         if self.__isInvalid:
             return res
 
-        if backlog_ is None:
-            backlog_ = self.__GetBacklog()
-        if isinstance(backlog_, list):
-            _CNT = len(backlog_)
-            for _ii in range(_CNT):
-                _rr = backlog_[_ii]
-                if _rr._recType.isError:
-                    res = _rr._recType
-                if not self._FlushLR(_rr):
-                    self.__d = deque(backlog_[_ii:], maxlen=self.__c)
-                    break
-                _ii += 1
-        else:
-            self._FlushLR(backlog_)
-            if backlog_._recType.isError:
-                res = backlog_._recType
+        with self.__fl:
+            if backlog_ is None:
+                return self.__Drain()
+
+            if isinstance(backlog_, list):
+                for _rr in backlog_:
+                    if _rr._recType.isError:
+                        res = _rr._recType
+                _nf = self._FlushLRs(backlog_)
+                if _nf < len(backlog_):
+                    self.__Requeue(backlog_[_nf:])
+            else:
+                self._FlushLR(backlog_)
+                if backlog_._recType.isError:
+                    res = backlog_._recType
         return res
 
     @staticmethod
@@ -86,18 +140,59 @@ class _LogSinkBase:
     def _FlushLR(self, logrec_: _LogRecord) -> bool:
         return False
 
+    def _FlushLRs(self, batch_ : List[_LogRecord]) -> int:
+        res = 0
+        for _rr in batch_:
+            if not self._FlushLR(_rr):
+                break
+            res += 1
+        return res
+
     def _CleanUp(self):
         if self.__isInvalid:
             return
         self.__d.clear()
-        self.__d = None
-        self.__c = None
+        if self.__ev is not None:
+            self.__ev.set()
+        self.__d  = None
 
     @property
     def __isInvalid(self) -> bool:
         return self.__d is None
 
-    def __GetBacklog(self) -> List[_LogRecord]:
-        res = list(self.__d)
-        self.__d.clear()
+    def __Drain(self) -> _ELRType:
+        res = _ELRType.LR_FREE
+        _d  = self.__d
+        _ev = self.__ev
+        _pl = _d.popleft
+
+        while True:
+            _n = min(len(_d), _LogSinkBase.__BATCH_SIZE)
+            if _n < 1:
+                break
+
+            _bb = [_pl() for _ in range(_n)]
+            for _rr in _bb:
+                if _rr._recType.isError:
+                    res = _rr._recType
+
+            _nf = self._FlushLRs(_bb)
+            if _ev is not None:
+                _ev.set()
+            if _nf < _n:
+                self.__Requeue(_bb[_nf:])
+                break
         return res
+
+    def __Requeue(self, lstLR_ : List[_LogRecord]):
+        _d = self.__d
+        if _d is None:
+            return
+        _room = self.__c - len(_d)
+        if len(lstLR_) > _room:
+            self.__dc += len(lstLR_) - max(_room, 0)
+        if _room < 1:
+            return
+        if len(lstLR_) > _room:
+            lstLR_ = lstLR_[-_room:]
+        _d.extendleft(reversed(lstLR_))
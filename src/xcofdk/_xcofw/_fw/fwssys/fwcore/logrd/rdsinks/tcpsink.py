@@ -7,8 +7,11 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
+from typing import List
 from typing import Union
 
+from xcofdk.fwcom.fwdefs import ELogRDOverflowPolicy
+
 from _fw.fwssys.fwcore.logrd.logrecord           import _LogRecord
 from _fw.fwssys.fwcore.logrd.rdsinks.logsinkbase import _LogSinkBase
 from _fw.fwssys.fwcore.ipc.net.tcpsocket         import _TCPSocket
@@ -17,8 +20,8 @@ from _fw.fwssys.fwcore.types.commontypes         import override
 class _TCPSink(_LogSinkBase):
     __slots__ = [ '__s' , '__t' ]
 
-    def __init__(self, terminator_ : Union[str, None] =None):
-        super().__init__()
+    def __init__(self, terminator_ : Union[str, None] =None, overflowPolicy_ : ELogRDOverflowPolicy =None):
+        super().__init__(overflowPolicy_=overflowPolicy_)
         self.__s = None
         self.__t = terminator_
 
@@ -38,6 +41,16 @@ class _TCPSink(_LogSinkBase):
             self.__s = None
         return res
 
+    @override
+    def _FlushLRs(self, batch_ : List[_LogRecord]) -> int:
+        if not self.isActiveSink:
+            return 0
+        if not self.__s._SendAll([ _rr._recToStr for _rr in batch_ ], terminator_=self.__t):
+            self.__s._Close()
+            self.__s = None
+            return 0
+        return len(batch_)
+
     @override
     def _CleanUp(self):
         if not self.isValidSink:
@@ -0,0 +1,171 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : oobserdes.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+import pickle as _PyPickle
+from   io     import BytesIO      as _PyBytesIO
+from   pickle import PickleBuffer as _PyPickleBuffer
+from   typing import List
+from   typing import Tuple
+from   typing import Union
+
+class _OobDump(bytes):
+    def __new__(cls, inband_ : Union[bytes, bytearray, memoryview], oobBufs_ : list):
+        res = super().__new__(cls, inband_)
+        res.__b = oobBufs_
+        res.__t = False
+        return res
+
+    @property
+    def _numBuffers(self) -> int:
+        return len(self.__b)
+
+    @staticmethod
+    def _Wrap(inband_ : bytes, like_ : bytes) -> bytes:
+        if not isinstance(like_, _OobDump):
+            return inband_
+        return _OobDump(inband_, like_.__b)
+
+    @staticmethod
+    def _GetBuffers(dump_ : Union[bytes, memoryview]) -> Union[List, None]:
+        _bS = False
+        if isinstance(dump_, memoryview):
+            try:
+                dump_ = dump_.obj
+            except ValueError:
+                return None
+            _bS = True
+        if not isinstance(dump_, _OobDump):
+            return None
+        return dump_.__Take(_bS)
+
+    def __Take(self, bShared_ : bool) -> list:
+        if bShared_ or self.__t:
+            return [ bytearray(_bb) if isinstance(_bb, bytearray) else _bb for _bb in self.__b ]
+        self.__t = True
+        return self.__b
+
+class _OobPickler(_PyPickle.Pickler):
+    def __init__(self, file_, oobBufs_ : list, bSnapshot_ : bool):
+        super().__init__(file_, protocol=5)
+        self.__b = oobBufs_
+        self.__m = dict()
+        self.__s = bSnapshot_
+
+    def persistent_id(self, obj_):
+        _t = type(obj_)
+        if _t is bytes:
+            if len(obj_) < _OobSerDes._OOB_MIN_SIZE:
+                return None
+            _ec, _bb = _OobSerDes._OOB_BYTES, obj_
+        elif _t is bytearray:
+            if len(obj_) < _OobSerDes._OOB_MIN_SIZE:
+                return None
+            _ec, _bb = _OobSerDes._OOB_BYTEARRAY, obj_
+        elif _t is memoryview:
+            if not obj_.c_contiguous:
+                return None
+            _ec, _bb = _OobSerDes._OOB_MEMVIEW, obj_
+        elif _t is _PyPickleBuffer:
+            try:
+                _bb = obj_.raw()
+            except BufferError:
+                return None
+            if _bb.nbytes < _OobSerDes._OOB_MIN_SIZE:
+                return None
+            _ec = _OobSerDes._OOB_PBUFFER
+        else:
+            return None
+
+        res = self.__m.get(id(obj_), None)
+        if res is not None:
+            return res
+
+        if _ec == _OobSerDes._OOB_BYTES:
+            pass
+        elif not self.__s:
+            _bb = memoryview(_bb).cast('B')
+        elif _ec == _OobSerDes._OOB_BYTEARRAY:
+            _bb = bytearray(_bb)
+        elif isinstance(_bb.obj, bytes):
+            _bb = _bb.cast('B')
+        elif _bb.readonly:
+            _bb = bytes(_bb)
+        else:
+            _bb = bytearray(_bb)
+
+        res = (len(self.__b), _ec)
+        self.__b.append(_bb)
+        self.__m[id(obj_)] = res
+        return res
+
+class _OobUnpickler(_PyPickle.Unpickler):
+    def __init__(self, file_, oobBufs_ : list):
+        super().__init__(file_)
+        self.__b = oobBufs_
+
+    def persistent_load(self, pid_):
+        _idx, _ec = pid_
+        res = self.__b[_idx]
+        if _ec == _OobSerDes._OOB_BYTES:
+            if type(res) is not bytes:
+                res = bytes(res)
+        elif _ec == _OobSerDes._OOB_BYTEARRAY:
+            if type(res) is not bytearray:
+                res = bytearray(res)
+        elif _ec == _OobSerDes._OOB_MEMVIEW:
+            if type(res) is not memoryview:
+                res = memoryview(res)
+        return res
+
+class _OobSerDes:
+    __slots__ = []
+
+    _OOB_MIN_SIZE  = 0x10000
+    _OOB_BYTES     = 0
+    _OOB_BYTEARRAY = 1
+    _OOB_MEMVIEW   = 2
+    _OOB_PBUFFER   = 3
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def _HasOobCandidate(vals_) -> bool:
+        for _vv in vals_:
+            _t = type(_vv)
+            if (_t is bytes) or (_t is bytearray):
+                if len(_vv) >= _OobSerDes._OOB_MIN_SIZE:
+                    return True
+            elif _t is memoryview:
+                return True
+            elif (_t is _PyPickleBuffer) or hasattr(_t, '__array_interface__'):
+                return True
+        return False
+
+    @staticmethod
+    def _Dumps(obj_, bSnapshot_ =True) -> Tuple[bytes, list]:
+        _bufs = []
+        _f    = _PyBytesIO()
+        _OobPickler(_f, _bufs, bSnapshot_).dump(obj_)
+        return _f.getvalue(), _bufs
+
+    @staticmethod
+    def _DumpsOob(obj_) -> bytes:
+        _inb, _bufs = _OobSerDes._Dumps(obj_, bSnapshot_=True)
+        return _inb if len(_bufs) < 1 else _OobDump(_inb, _bufs)
+
+    @staticmethod
+    def _Loads(inband_ : Union[bytes, memoryview], oobBufs_ : Union[List, None] =None):
+        if not oobBufs_:
+            return _PyPickle.loads(inband_)
+        return _OobUnpickler(_PyBytesIO(inband_), oobBufs_).load()
+
+    @staticmethod
+    def _LoadsOob(dump_ : Union[bytes, memoryview]):
+        return _OobSerDes._Loads(dump_, oobBufs_=_OobDump._GetBuffers(dump_))
@@ -17,6 +17,7 @@ from _fw.fwssys.fwcore.logging           import logif
 from _fw.fwssys.fwcore.base.fsutil       import _FSUtil
 from _fw.fwssys.fwcore.types.aobject     import _AbsObject
 from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
+from _fw.fwssys.fwcore.types.oobserdes   import _OobSerDes
 
 from _fw.fwssys.fwerrh.fwerrorcodes import _EFwErrorCode
 
@@ -59,7 +60,7 @@ class SerDes(_AbsObject):
         return res
 
     @staticmethod
-    def SerializeObject(obj_, bTreatAsUserError_ =False, bAllowNone_ =False) -> Union[bytes, None]:
+    def SerializeObject(obj_, bTreatAsUserError_ =False, bAllowNone_ =False, bOob_ =False) -> Union[bytes, None]:
         res = None
         if obj_ is None:
             if not bAllowNone_:
@@ -67,7 +68,10 @@ class SerDes(_AbsObject):
                 return res
 
         try:
-            res = _PyPickle.dumps(obj_, SerDes.__ppVersion.value)
+            if bOob_:
+                res = _OobSerDes._DumpsOob(obj_)
+            else:
+                res = _PyPickle.dumps(obj_, SerDes.__ppVersion.value)
         except (_PyPickle.PickleError, Exception) as _xcp:
             _msg = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_SerDes_TID_003).format(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_SerDes_TID_002), _xcp)
             if bTreatAsUserError_:
@@ -77,14 +81,17 @@ class SerDes(_AbsObject):
         return res
 
     @staticmethod
-    def DeserializeData(data_ : bytes, bTreatAsUserError_ =False):
+    def DeserializeData(data_ : Union[bytes, memoryview], bTreatAsUserError_ =False, oobBufs_ : list =None):
         res = None
-        if not isinstance(data_, bytes):
+        if not isinstance(data_, (bytes, memoryview)):
             rlogif._LogOEC(True, _EFwErrorCode.FE_00434)
             return res
 
         try:
-            res = _PyPickle.loads(data_)
+            if oobBufs_ is None:
+                res = _OobSerDes._LoadsOob(data_)
+            else:
+                res = _OobSerDes._Loads(data_, oobBufs_=oobBufs_)
         except (_PyPickle.PickleError, Exception) as _xcp:
             _msg = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_SerDes_TID_004).format(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_SerDes_TID_002), _xcp)
             if bTreatAsUserError_:
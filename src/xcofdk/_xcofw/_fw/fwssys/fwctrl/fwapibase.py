@@ -13,6 +13,8 @@ from   typing import Tuple
 from   typing import Union
 
 from xcofdk.fwcom import LcFailure
+from xcofdk.fwcom import TaskMetrics
+from xcofdk.fwcom import MessageLatency
 
 from _fw.fwssys.fwcore.logging          import logif
 from _fw.fwssys.fwcore.logging          import vlogif
@@ -20,6 +22,7 @@ from _fw.fwssys.fwcore.base.timeutil    import _TimeUtil
 from _fw.fwssys.fwcore.lc.lcmgr         import _LcManager
 from _fw.fwssys.fwcore.swpfm.sysinfo    import _SystemInfo
 from _fw.fwssys.fwctrl.fwapiconnap      import _FwApiConnectorAP
+from _fw.fwssys.fwmsg.disp.msgtracer    import _MsgTracer
 from _fw.fwssys.fwerrh.fwerrorcodes     import _EFwErrorCode
 from _fwa.fwrtecfg.fwrteconfig          import _FwRteConfig
 from _fwa.fwversion                     import _FwVersion
@@ -43,6 +46,14 @@ class _FwApiBase:
     def FwApiIsXTaskRunning(xtUID_ : int) -> bool:
         return _FwApiConnectorAP._APIsXTaskRunning(xtUID_)
 
+    @staticmethod
+    def FwApiGetTaskMetrics(tasks_: Union[int, List[int], None] =None) -> List[TaskMetrics]:
+        return _FwApiConnectorAP._APGetTaskMetrics(tasks_)
+
+    @staticmethod
+    def FwApiGetMessageLatencies() -> List[MessageLatency]:
+        return _MsgTracer._GetLatencies()
+
     @staticmethod
     def FwApiIsFTPythonVersion() -> bool:
         return _SystemInfo._IsPyVersionSupportedOfficialFTPython()
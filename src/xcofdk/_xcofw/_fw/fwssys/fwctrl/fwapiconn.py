@@ -13,6 +13,7 @@ from typing    import Tuple
 from typing    import Union
 
 from xcofdk.fwcom     import LcFailure
+from xcofdk.fwcom     import TaskMetrics
 from xcofdk.fwapi     import IRCTask
 from xcofdk.fwapi     import IRCCommTask
 from xcofdk.fwapi.xmt import IXTask
@@ -52,6 +53,11 @@ class _FwApiConnector(_IFwApiConn):
             return False
         return self._IsXTaskRunning(xtUID_)
 
+    def _FwCNGetTaskMetrics(self, tasks_: Union[int, List[int], None] =None) -> List[TaskMetrics]:
+        if not self._FwCNIsFwApiAvailable():
+            return []
+        return self._GetTaskMetrics(tasks_)
+
     def _FwCNGetLcFailure(self) -> Union[LcFailure, None]:
         if not self._FwCNIsFwApiAvailable():
             return _LcFailure._GetLcFailure()
@@ -13,6 +13,7 @@ from typing    import Tuple
 from typing    import Union
 
 from xcofdk.fwcom               import LcFailure
+from xcofdk.fwcom               import TaskMetrics
 from xcofdk.fwapi               import IRCTask
 from xcofdk.fwapi               import IRCCommTask
 from xcofdk.fwapi.apiif.ifxtask import IXTask
@@ -48,6 +49,10 @@ class _FwApiConnectorAP:
     def _APIsXTaskRunning(xtUID_ : int) -> bool:
         return False if _FwApiConnectorAP.__IsFwApiDisconnected() else _FwApiConnectorAP.__theFwCN._FwCNIsXTaskRunning(xtUID_)
 
+    @staticmethod
+    def _APGetTaskMetrics(tasks_: Union[int, List[int], None] =None) -> List[TaskMetrics]:
+        return [] if _FwApiConnectorAP.__IsFwApiDisconnected() else _FwApiConnectorAP.__theFwCN._FwCNGetTaskMetrics(tasks_)
+
     @staticmethod
     def _APGetLcFailure() -> Union[LcFailure, None]:
         return _LcFailure._GetLcFailure() if _FwApiConnectorAP.__IsFwApiDisconnected() else _FwApiConnectorAP.__theFwCN._FwCNGetLcFailure()
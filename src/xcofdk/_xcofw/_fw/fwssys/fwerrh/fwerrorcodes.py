@@ -659,6 +659,12 @@ class _EFwErrorCode(IntEnum):
     VFE_00983  = 6618 + __FE_OFFSET
     VFE_00984  = 6619 + __FE_OFFSET
     VFE_00985  = 6620 + __FE_OFFSET
+    VFE_00986  = 6621 + __FE_OFFSET
+    VFE_00987  = 6622 + __FE_OFFSET
+    VFE_00988  = 6623 + __FE_OFFSET
+    VFE_00989  = 6624 + __FE_OFFSET
+    VFE_00990  = 6625 + __FE_OFFSET
+    VFE_00991  = 6626 + __FE_OFFSET
 
     VUE_00002  = 8002
     VUE_00003  = 8003
@@ -1167,6 +1173,27 @@ class _EFwErrorCode(IntEnum):
     UE_00266  = 20266
     UE_00267  = 20267
     UE_00268  = 20268
+    UE_00269  = 20269
+    UE_00270  = 20270
+    UE_00271  = 20271
+    UE_00272  = 20272
+    UE_00273  = 20273
+    UE_00274  = 20274
+    UE_00275  = 20275
+    UE_00276  = 20276
+    UE_00277  = 20277
+    UE_00278  = 20278
+    UE_00279  = 20279
+    UE_00280  = 20280
+    UE_00281  = 20281
+    UE_00282  = 20282
+    UE_00283  = 20283
+    UE_00284  = 20284
+    UE_00285  = 20285
+    UE_00286  = 20286
+    UE_00287  = 20287
+    UE_00288  = 20288
+    UE_00289  = 20289
 
     @property
     def toStr(self):
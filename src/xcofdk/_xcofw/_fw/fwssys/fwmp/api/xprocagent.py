@@ -97,6 +97,13 @@ class _XProcessAgent(_IXProcAgent):
     def _xprocessPID(self) -> int:
         return self.__pid
 
+    @_IXProcAgent._xprocessSentinel.getter
+    def _xprocessSentinel(self) -> Union[int, None]:
+        if self.__isInvalid:
+            return None
+        with self.__l:
+            return None if (self.__tst is not None) or (self.__xpc is None) else self.__xpc._processSentinel
+
     @_IXProcAgent._xprocessAliasName.getter
     def _xprocessAliasName(self):
         return self.__pan
@@ -105,6 +112,13 @@ class _XProcessAgent(_IXProcAgent):
     def _xprocessName(self) -> str:
         return self.__pn
 
+    @override
+    def _OpenWaitable(self) -> Union[int, None]:
+        if self.__isInvalid:
+            return None
+        with self.__l:
+            return None if (self.__tst is not None) or (self.__xpc is None) else self.__xpc._OpenWaitable()
+
     @override
     def _OnPTerminated(self, tst_ : _EPState, xc_ : int, sd_ : Any):
         with self.__l:
@@ -0,0 +1,299 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : xprocchannelimpl.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+import pickle as _PyPickle
+from   pickle    import PickleError
+from   enum      import IntEnum
+from   os        import getpid as _PyGetPID
+from   threading import RLock  as _PyRLock
+from   typing    import Tuple
+from   typing    import Union
+
+from xcofdk.fwcom import EXmsgPredefinedID
+from xcofdk.fwapi import ITask
+
+from _fw.fwssys.assys                     import fwsubsysshare as _ssshare
+from _fw.fwssys.fwcore.logging            import logif
+from _fw.fwssys.fwctrl.fwapiconnap        import _FwApiConnectorAP
+from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _TaskUtil
+from _fw.fwssys.fwcore.types.commontypes  import _CommonDefines
+from _fw.fwssys.fwmp.xprocessconn         import _XProcessConn
+from _fw.fwssys.fwmp.xshmring             import _XShmRing
+from _fw.fwssys.fwmsg.apiimpl.xmsgmgrimpl import _XMsgMgrImpl
+from _fw.fwssys.fwerrh.fwerrorcodes       import _EFwErrorCode
+
+from _fw.fwtdb.fwtdbengine import _EFwTextID
+from _fw.fwtdb.fwtdbengine import _FwTDbEngine
+
+class _XProcessChannelImpl:
+    __slots__ = [ '__l' , '__lr' , '__an' , '__pid' , '__c2p' , '__p2c' , '__rx' , '__sxt' , '__rxt' , '__nr' , '__nd' ]
+
+    __cnt                   = 0
+    __MIN_CAPACITY          = 0x1000
+    __MAX_CAPACITY          = 0x40000000
+    __DEFAULT_CAPACITY      = 0x100000
+    __MAX_DELIVERY_ATTEMPTS = 100
+
+    def __init__(self, capacity_ : int =None, rxTask_ : Union[ITask, int] =None, aliasn_ : str =None):
+        self.__l   = None
+        self.__lr  = None
+        self.__an  = None
+        self.__nd  = None
+        self.__nr  = None
+        self.__rx  = None
+        self.__c2p = None
+        self.__p2c = None
+        self.__pid = None
+        self.__rxt = None
+        self.__sxt = None
+
+        if _ssshare._WarnOnDisabledSubsysMP(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_MP):
+            return
+        if not _ssshare._IsRteStarted():
+            logif._LogUrgentWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessChannel_TID_005))
+            return
+        if not _XProcessConn._IsAvailable():
+            return
+
+        if aliasn_ is not None:
+            if not _TaskUtil.IsValidAliasName(aliasn_):
+                logif._LogErrorEC(_EFwErrorCode.UE_00248, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessConn_TID_013).format(str(aliasn_)))
+                return
+            aliasn_ = aliasn_.strip()
+        else:
+            aliasn_ = _FwTDbEngine.GetText(_EFwTextID.eMisc_TNPrefix_ProcessChannel)
+
+        if aliasn_.endswith(_CommonDefines._CHAR_SIGN_UNDERSCORE):
+            _XProcessChannelImpl.__cnt += 1
+            aliasn_ += str(_XProcessChannelImpl.__cnt)
+
+        if capacity_ is None:
+            capacity_ = _XProcessChannelImpl.__DEFAULT_CAPACITY
+        if isinstance(capacity_, bool) or not (isinstance(capacity_, int) and (_XProcessChannelImpl.__MIN_CAPACITY <= capacity_ <= _XProcessChannelImpl.__MAX_CAPACITY)):
+            logif._LogErrorEC(_EFwErrorCode.UE_00279, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessChannel_TID_001).format(str(capacity_)))
+            return
+
+        _sxt = _FwApiConnectorAP._APGetCurXTask()
+        _rxt = _sxt
+        if rxTask_ is not None:
+            _rxt = None
+            _rxID = rxTask_.taskUID if isinstance(rxTask_, ITask) else rxTask_
+            if isinstance(_rxID, int) and not isinstance(_rxID, bool) and (_rxID > 0):
+                _rxt = _FwApiConnectorAP._APGetXTask(_rxID)
+        if (_rxt is None) or _rxt.isDetachedFromFW or not _rxt.taskProfile.isExternalQueueEnabled:
+            logif._LogErrorEC(_EFwErrorCode.UE_00280, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessChannel_TID_002).format(aliasn_, str(rxTask_)))
+            return
+        if _sxt is None:
+            _sxt = _rxt
+
+        _c2p, _p2c = None, None
+        try:
+            _c2p = _XShmRing(capacity_=capacity_)
+            _p2c = _XShmRing(capacity_=capacity_)
+        except (OSError, ValueError, Exception) as _xcp:
+            if _c2p is not None:
+                _c2p._Close()
+            logif._LogErrorEC(_EFwErrorCode.UE_00283, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessChannel_TID_006).format(aliasn_, _xcp))
+            return
+
+        self.__l   = _PyRLock()
+        self.__lr  = _PyRLock()
+        self.__an  = aliasn_
+        self.__nd  = 0
+        self.__nr  = 0
+        self.__rx  = _rxt.taskUID
+        self.__c2p = _c2p
+        self.__p2c = _p2c
+        self.__pid = _PyGetPID()
+        self.__rxt = _rxt
+        self.__sxt = _sxt
+
+        _XProcessConn._AddProcessChannel(self)
+
+    def __str__(self) -> str:
+        return self._ToString()
+
+    def __reduce__(self):
+        return _XProcessChannelImpl._Attach, (self.__an, self.__pid, self.__rx, self.__c2p, self.__p2c)
+
+    @staticmethod
+    def _Attach(aliasn_ : str, pid_ : int, rxUID_ : int, c2p_ : _XShmRing, p2c_ : _XShmRing):
+        res = _XProcessChannelImpl.__new__(_XProcessChannelImpl)
+        res.__l   = _PyRLock()
+        res.__lr  = _PyRLock()
+        res.__an  = aliasn_
+        res.__nd  = 0
+        res.__nr  = 0
+        res.__rx  = rxUID_
+        res.__c2p = c2p_
+        res.__p2c = p2c_
+        res.__pid = pid_
+        res.__rxt = None
+        res.__sxt = None
+        return res
+
+    @property
+    def _isValid(self) -> bool:
+        return self.__l is not None
+
+    @property
+    def _isClosed(self) -> bool:
+        _r = self.__c2p
+        return (_r is None) or _r._isClosed
+
+    @property
+    def _isParentSide(self) -> bool:
+        return (self.__pid is not None) and (self.__pid == _PyGetPID())
+
+    @property
+    def _aliasName(self) -> Union[str, None]:
+        return self.__an
+
+    @property
+    def _capacity(self) -> int:
+        _r = self.__c2p
+        return 0 if _r is None else _r._capacity
+
+    @property
+    def _rxTaskUID(self) -> Union[int, None]:
+        return self.__rx
+
+    def _SendMessage(self, lblID_ : Union[IntEnum, int], clrID_ : Union[IntEnum, int] =EXmsgPredefinedID.DontCare, payload_ : dict =None, maxWTime_ : Union[int, float, None] =0) -> bool:
+        if not self._isValid:
+            return False
+
+        _bP = self._isParentSide
+        _r  = self.__p2c if _bP else self.__c2p
+        if (_r is None) or _r._isClosed:
+            return False
+        if (payload_ is not None) and not isinstance(payload_, dict):
+            return False
+
+        try:
+            _rec = _PyPickle.dumps((lblID_, clrID_, payload_))
+        except (PickleError, Exception) as _xcp:
+            if _bP:
+                logif._LogErrorEC(_EFwErrorCode.UE_00281, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessChannel_TID_003).format(self.__an, _xcp))
+            return False
+
+        if len(_rec) > _r._maxRecordSize:
+            if _bP:
+                logif._LogErrorEC(_EFwErrorCode.UE_00282, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessChannel_TID_004).format(len(_rec), _r._maxRecordSize, self.__an))
+            return False
+
+        _tmo = _XProcessChannelImpl.__ToSec(maxWTime_)
+        with self.__l:
+            if _tmo == 0:
+                res = _r._Write(_rec)
+            else:
+                res = _r._WriteWait(_rec, _tmo)
+        return res is True
+
+    def _ReceiveMessage(self, maxWTime_ : Union[int, float, None] =None) -> Union[Tuple[Union[IntEnum, int], Union[IntEnum, int], Union[dict, None]], None]:
+        if not self._isValid:
+            return None
+        if self._isParentSide:
+            return None
+
+        _r = self.__p2c
+        if _r is None:
+            return None
+
+        _tmo = _XProcessChannelImpl.__ToSec(maxWTime_)
+        with self.__lr:
+            _rec = _r._Read() if _tmo == 0 else _r._ReadWait(_tmo)
+        if _rec is None:
+            return None
+
+        try:
+            res = _PyPickle.loads(_rec)
+        except (PickleError, Exception):
+            res = None
+        return res
+
+    def _DeliverPending(self, maxNum_ : int) -> int:
+        res = 0
+
+        with self.__lr:
+            _sxt, _rxt = self.__sxt, self.__rxt
+            if (_sxt is None) or (self.__c2p is None):
+                return res
+
+            if not (_rxt.isRunning or _rxt.isStopping or _rxt.isCanceling):
+                if _rxt.isTerminated or _rxt.isDetachedFromFW:
+                    self._Close()
+                return res
+
+            _c2p = self.__c2p
+            while res < maxNum_:
+                _rec = _c2p._Peek()
+                if _rec is None:
+                    break
+
+                try:
+                    _lbl, _clr, _pld = _PyPickle.loads(_rec)
+                except (PickleError, Exception):
+                    _c2p._Discard()
+                    continue
+
+                _uid = _XMsgMgrImpl._SendXMsgByProxy(_sxt, self.__rx, _lbl, _clr, _pld)
+                if _uid > 0:
+                    _c2p._Discard()
+                    self.__nr = 0
+                    res += 1
+                    continue
+                if _uid < 0:
+                    _c2p._Discard()
+                    self.__nd += 1
+                    self.__nr  = 0
+                    logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessChannel_TID_008).format(self.__an, self.__rx, self.__nd))
+                    continue
+
+                self.__nr += 1
+                if self.__nr < _XProcessChannelImpl.__MAX_DELIVERY_ATTEMPTS:
+                    break
+
+                _c2p._Discard()
+                self.__nd += 1
+                logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessChannel_TID_007).format(self.__an, self.__nr, self.__rx, self.__nd))
+                self.__nr = 0
+        return res
+
+    def _Close(self):
+        if not self._isValid:
+            return
+
+        if self._isParentSide:
+            with self.__lr:
+                with self.__l:
+                    self.__CloseRings()
+        else:
+            with self.__l:
+                self.__CloseRings()
+
+    def _ToString(self):
+        if not self._isValid:
+            return type(self).__name__
+        return _FwTDbEngine.GetText(_EFwTextID.eXProcessChannel_ToString_001).format(self.__an, self._capacity, self.__rx, self._isClosed)
+
+    def __CloseRings(self):
+        if self.__c2p is not None:
+            self.__c2p._Close()
+        if self.__p2c is not None:
+            self.__p2c._Close()
+        self.__rxt = None
+        self.__sxt = None
+
+    @staticmethod
+    def __ToSec(maxWTime_ : Union[int, float, None]) -> Union[float, None]:
+        if maxWTime_ is None:
+            return None
+        if isinstance(maxWTime_, bool) or not isinstance(maxWTime_, (int, float)) or (maxWTime_ <= 0):
+            return 0
+        return maxWTime_/1000 if isinstance(maxWTime_, int) else float(maxWTime_)
@@ -0,0 +1,583 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : xprocpoolimpl.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+import pickle as _PyPickle
+from   pickle          import PickleError
+from   multiprocessing import Queue        as _PyMPQueue
+from   multiprocessing import RawArray     as _PyMPRawArray
+from   multiprocessing.connection import wait as _PyMPWait
+from   os              import cpu_count    as _PyCpuCount
+from   queue           import Empty        as _PyQueueEmpty
+from   threading       import Event        as _PyEvent
+from   threading       import RLock        as _PyRLock
+from   time            import monotonic_ns as _PyMonotonicNS
+from   typing          import Any
+from   typing          import List
+from   typing          import Union
+
+from xcofdk.fwapi.xmp.xprocessxcp import PTException
+from xcofdk.fwapi.xmp.xprocessxcp import PTWrappedException
+
+from _fw.fwssys.assys                    import fwsubsysshare as _ssshare
+from _fw.fwssys.fwcore.logging           import logif
+from _fw.fwssys.fwcore.base.gtimeout     import _Timeout
+from _fw.fwssys.fwcore.base.sigcheck     import _CallableSignature
+from _fw.fwssys.fwcore.ipc.tsk.taskutil  import _TaskUtil
+from _fw.fwssys.fwcore.types.aobject     import _AbsSlotsObject
+from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
+from _fw.fwssys.fwmp.api.xprocagent      import _XProcessAgent
+from _fw.fwssys.fwmp.fwrte.fwrtedefs     import _ERteTXErrorID
+from _fw.fwssys.fwmp.fwrte.fwrtetmgr     import _FwRteToken
+from _fw.fwssys.fwmp.fwrte.fwrtetmgr     import _FwRteTokenMgr as _RteTMgr
+from _fw.fwssys.fwmp.fwrte.rteexception  import _RteException
+from _fw.fwssys.fwmp.xprocessconn        import _XProcessConn
+from _fw.fwssys.fwmp.xprocpoolwkr        import _XProcessPoolWorker
+from _fw.fwssys.fwerrh.fwerrorcodes      import _EFwErrorCode
+
+from _fw.fwtdb.fwtdbengine import _EFwTextID
+from _fw.fwtdb.fwtdbengine import _FwTDbEngine
+
+class _XProcessPoolJobImpl(_AbsSlotsObject):
+    __slots__ = [ '__p' , '__id' , '__ei' , '__sd' , '__xcp' , '__e' ]
+
+    def __init__(self, pool_, jid_ : int):
+        super().__init__()
+        self.__e   = _PyEvent()
+        self.__p   = pool_
+        self.__id  = jid_
+        self.__ei  = None
+        self.__sd  = None
+        self.__xcp = None
+
+    @property
+    def _jobID(self) -> int:
+        return self.__id
+
+    @property
+    def _isPending(self) -> bool:
+        return self.__ei is None
+
+    @property
+    def _isDone(self) -> bool:
+        return (self.__ei is not None) and self.__ei.isSuccess
+
+    @property
+    def _isFailed(self) -> bool:
+        return (self.__ei is not None) and not self.__ei.isSuccess
+
+    @property
+    def _jobSuppliedData(self) -> Any:
+        return self.__sd
+
+    @property
+    def _jobException(self) -> Union[PTException, PTWrappedException, None]:
+        return self.__xcp
+
+    def _Join(self, maxWTime_: Union[int, float] =None) -> bool:
+        if self.__ei is not None:
+            return True
+        _pool = self.__p
+        if _pool is None:
+            return False
+        return _pool._WaitForJob(self, maxWTime_=maxWTime_)
+
+    def _WaitForResult(self, timeoutSec_ : float) -> bool:
+        return self.__e.wait(timeoutSec_)
+
+    def _SetResult(self, errID_ : int, dmpXD_ : Union[bytes, None]):
+        if self.__ei is not None:
+            return
+
+        _xd = None
+        if dmpXD_ is not None:
+            try:
+                _xd = _PyPickle.loads(dmpXD_)
+            except (PickleError, Exception):
+                _xd    = None
+                errID_ = _ERteTXErrorID.eUnexpectedTokenPayload.value
+
+        try:
+            _ei = _ERteTXErrorID(errID_)
+        except ValueError:
+            _ei = _ERteTXErrorID.eUnexpectedTokenPayload
+
+        if _ei.isSuccess:
+            self.__sd = _xd
+        elif isinstance(_xd, _RteException):
+            self.__xcp = PTWrappedException(_xd) if isinstance(_xd.reason, str) else PTException(_xd)
+
+        self.__ei = _ei
+        self.__p  = None
+        self.__e.set()
+
+    def _ToString(self):
+        return _CommonDefines._STR_EMPTY
+
+    def _CleanUp(self):
+        self.__p = None
+
+class _XProcessPoolImpl(_AbsSlotsObject):
+    __slots__ = [ '__l' , '__lc' , '__an' , '__wan' , '__ja' , '__rq' , '__aj' , '__wl' , '__wk' , '__pj' , '__nj' , '__bS' , '__bSD' ]
+
+    __cnt              = 0
+    __COLLECT_SLICE_MS = 50
+
+    def __init__(self, numWorkers_ : int =None, aliasn_ : str =None, maxSDSize_ : int =None):
+        self.__l   = None
+        self.__lc  = None
+        self.__aj  = None
+        self.__an  = None
+        self.__ja  = None
+        self.__nj  = None
+        self.__pj  = None
+        self.__rq  = None
+        self.__wk  = None
+        self.__wl  = None
+        self.__bS  = None
+        self.__bSD = None
+        self.__wan = None
+        super().__init__()
+
+        if _ssshare._WarnOnDisabledSubsysMP(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_MP):
+            return
+        if not _ssshare._IsRteStarted():
+            logif._LogUrgentWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPool_TID_004))
+            return
+        if not _XProcessConn._IsAvailable():
+            return
+
+        if numWorkers_ is None:
+            numWorkers_ = _PyCpuCount()
+            if numWorkers_ is None:
+                numWorkers_ = 1
+        if isinstance(numWorkers_, bool) or not (isinstance(numWorkers_, int) and (numWorkers_ > 0)):
+            logif._LogErrorEC(_EFwErrorCode.UE_00276, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPool_TID_001).format(str(numWorkers_)))
+            return
+
+        if aliasn_ is not None:
+            if not _TaskUtil.IsValidAliasName(aliasn_):
+                logif._LogErrorEC(_EFwErrorCode.UE_00248, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessConn_TID_013).format(str(aliasn_)))
+                return
+            aliasn_ = aliasn_.strip()
+        else:
+            aliasn_ = _FwTDbEngine.GetText(_EFwTextID.eMisc_TNPrefix_ProcessPool)
+
+        if aliasn_.endswith(_CommonDefines._CHAR_SIGN_UNDERSCORE):
+            _XProcessPoolImpl.__cnt += 1
+            aliasn_ += str(_XProcessPoolImpl.__cnt)
+
+        maxSDSize_, _errMsg = _RteTMgr.CheckSuppliedDataSize(maxSDSize_)
+        if _errMsg is not None:
+            logif._LogErrorEC(_EFwErrorCode.UE_00252, _errMsg)
+            return
+
+        _tg     = _FwRteToken._GetTokenGuide()
+        _maxXPS = 0 if _tg is None else _tg._maxXcpPayloadSize
+
+        _rq  = _PyMPQueue()
+        _aj  = _PyMPRawArray('q', numWorkers_)
+        _wan = aliasn_ + _CommonDefines._CHAR_SIGN_UNDERSCORE
+
+        _wl, _wk = [], []
+        for _ii in range(numWorkers_):
+            _wkr = _XProcessPoolWorker(_PyMPQueue(), _rq, maxSDSize_, _maxXPS, _aj, _ii)
+            _xpa = _XProcessAgent(_wkr._RunWorker, aliasn_=_wan)
+            if _xpa._xprocessAliasName is None:
+                for _ww in _wl:
+                    _ww._DetachFromFW()
+                for _ww in _wk + [_wkr]:
+                    _XProcessPoolImpl.__CloseQueue(_ww._jobQueue)
+                _XProcessPoolImpl.__CloseQueue(_rq)
+                return
+            _wl.append(_xpa)
+            _wk.append(_wkr)
+
+        self.__l   = _PyRLock()
+        self.__lc  = _PyRLock()
+        self.__aj  = _aj
+        self.__an  = aliasn_
+        self.__ja  = { _wkr : dict() for _wkr in _wk }
+        self.__nj  = 0
+        self.__pj  = dict()
+        self.__rq  = _rq
+        self.__wk  = _wk
+        self.__wl  = _wl
+        self.__bS  = False
+        self.__bSD = False
+        self.__wan = _wan
+
+        _XProcessConn._AddProcessPool(self)
+
+    def __str__(self) -> str:
+        return self._ToString()
+
+    @property
+    def _isValid(self) -> bool:
+        return not self.__isInvalid
+
+    @property
+    def _isStarted(self) -> bool:
+        return (not self.__isInvalid) and self.__bS
+
+    @property
+    def _isShutdown(self) -> bool:
+        return (not self.__isInvalid) and self.__bSD
+
+    @property
+    def _aliasName(self) -> Union[str, None]:
+        return self.__an
+
+    @property
+    def _numWorkers(self) -> int:
+        return 0 if self.__isInvalid else len(self.__wl)
+
+    @property
+    def _workerPIDs(self) -> List[int]:
+        if self.__isInvalid:
+            return []
+        return [ _xpa._xprocessPID for _xpa in self.__wl if _xpa._xprocessPID is not None ]
+
+    @property
+    def _numPendingJobs(self) -> int:
+        if self.__isInvalid:
+            return 0
+        with self.__l:
+            return len(self.__pj)
+
+    def _Start(self) -> bool:
+        if self.__isInvalid:
+            return False
+
+        with self.__l:
+            if self.__bS or self.__bSD:
+                return False
+
+            res = True
+            for _xpa in self.__wl:
+                if not _xpa._Start():
+                    res = False
+            self.__bS = res
+        return res
+
+    def _Submit(self, target_, *args_, **kwargs_) -> Union[_XProcessPoolJobImpl, None]:
+        if self.__isInvalid:
+            return None
+
+        if not (self.__bS and not self.__bSD):
+            logif._LogErrorEC(_EFwErrorCode.UE_00277, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPool_TID_002).format(self.__an))
+            return None
+        if not _CallableSignature.IsSignatureMatchingXProcessTargetCallback(target_):
+            return None
+
+        try:
+            _dmpJob = _PyPickle.dumps((target_, args_, kwargs_))
+        except (PickleError, Exception) as _xcp:
+            logif._LogErrorEC(_EFwErrorCode.UE_00278, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPool_TID_003).format(self.__an, str(_xcp)))
+            return None
+
+        with self.__l:
+            if self.__bSD:
+                logif._LogErrorEC(_EFwErrorCode.UE_00277, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPool_TID_002).format(self.__an))
+                return None
+
+            self.__nj += 1
+            res = _XProcessPoolJobImpl(self, self.__nj)
+            self.__pj[res._jobID] = res
+            self.__DispatchJob(res._jobID, _dmpJob)
+        return res
+
+    def _WaitForJob(self, job_ : _XProcessPoolJobImpl, maxWTime_: Union[int, float] =None) -> bool:
+        if self.__isInvalid:
+            return not job_._isPending
+
+        _tEndNS = self.__GetEndTime(maxWTime_)
+        if _tEndNS is False:
+            return False
+
+        _SLICE_SEC = _XProcessPoolImpl.__COLLECT_SLICE_MS / 1000
+        while job_._isPending:
+            _waitSec = _SLICE_SEC
+            if _tEndNS is not None:
+                _waitSec = min(_waitSec, (_tEndNS - _PyMonotonicNS()) / 1000000000)
+                if _waitSec <= 0:
+                    break
+
+            _lc = self.__lc
+            if _lc is None:
+                break
+            if _lc.acquire(blocking=False):
+                try:
+                    self.__CollectResults(_waitSec)
+                finally:
+                    _lc.release()
+            else:
+                job_._WaitForResult(_waitSec)
+        return not job_._isPending
+
+    def _Shutdown(self, maxWTime_: Union[int, float] =None) -> bool:
+        if self.__isInvalid:
+            return False
+
+        _tEndNS = self.__GetEndTime(maxWTime_)
+        if _tEndNS is False:
+            return False
+
+        self._RequestShutdown()
+        if not self.__bS:
+            return True
+
+        _SLICE_SEC = _XProcessPoolImpl.__COLLECT_SLICE_MS / 1000
+        while True:
+            with self.__lc:
+                self.__CollectResults(0)
+            if not any(_xpa._isAttachedToFW and not _xpa._isTerminated for _xpa in self.__wl):
+                break
+
+            _waitSec = _SLICE_SEC
+            if _tEndNS is not None:
+                _waitSec = min(_waitSec, (_tEndNS - _PyMonotonicNS()) / 1000000000)
+                if _waitSec <= 0:
+                    return False
+
+            with self.__lc:
+                self.__CollectResults(_waitSec)
+
+        with self.__lc:
+            self.__CollectResults(0)
+            self.__FailPendingJobs()
+            self.__CloseQueues()
+        return True
+
+    def _RequestShutdown(self):
+        if self.__isInvalid:
+            return
+
+        with self.__l:
+            if self.__bSD:
+                return
+            self.__bSD = True
+
+            if self.__bS and (self.__rq is not None):
+                for _wkr in self.__wk:
+                    _wkr._jobQueue.put(None)
+            else:
+                for _xpa in self.__wl:
+                    _xpa._DetachFromFW()
+
+    def _Terminate(self):
+        if self.__isInvalid:
+            return
+
+        with self.__l:
+            self.__bSD = True
+        for _xpa in self.__wl:
+            _xpa._Terminate()
+
+        with self.__lc:
+            self.__FailPendingJobs()
+            self.__CloseQueues()
+
+    def _ToString(self):
+        if self.__isInvalid:
+            return _CommonDefines._STR_EMPTY
+        return _FwTDbEngine.GetText(_EFwTextID.eXProcessPool_ToString_001).format(self.__an, len(self.__wl), self.__bS, self.__bSD, self._numPendingJobs)
+
+    def _CleanUp(self):
+        if self.__isInvalid:
+            return
+
+        self.__CloseQueues()
+
+        self.__l   = None
+        self.__lc  = None
+        self.__aj  = None
+        self.__ja  = None
+        self.__nj  = None
+        self.__pj  = None
+        self.__rq  = None
+        self.__wk  = None
+        self.__wl  = None
+        self.__bS  = None
+        self.__bSD = None
+        self.__wan = None
+
+    @property
+    def __isInvalid(self) -> bool:
+        return self.__wl is None
+
+    def __CollectResults(self, waitSec_ : float):
+        _rq = self.__rq
+        if _rq is None:
+            return
+
+        try:
+            _res = _rq.get(timeout=waitSec_) if waitSec_ > 0 else _rq.get_nowait()
+        except _PyQueueEmpty:
+            _res = None
+        except (OSError, ValueError, EOFError):
+            return
+
+        if _res is not None:
+            self.__ProcessResults(_rq, _res)
+        if not self.__bS:
+            return
+
+        self.__CheckWorkers(_rq)
+        if (_res is None) and not any(_xpa._isRunning for _xpa in self.__wl):
+            self.__FailPendingJobs()
+
+    def __ProcessResults(self, rq_ : _PyMPQueue, res_):
+        while res_ is not None:
+            _jid, _errID, _dmpXD = res_
+            with self.__l:
+                _job = self.__pj.pop(_jid, None)
+                for _mapJ in self.__ja.values():
+                    if _mapJ.pop(_jid, None) is not None:
+                        break
+            if _job is not None:
+                _job._SetResult(_errID, _dmpXD)
+
+            try:
+                res_ = rq_.get_nowait()
+            except (_PyQueueEmpty, OSError, ValueError, EOFError):
+                res_ = None
+
+    def __CheckWorkers(self, rq_ : _PyMPQueue):
+        with self.__l:
+            _lstW = list(zip(self.__wl, self.__wk))
+
+        _mapSN = dict()
+        for _xpa, _wkr in _lstW:
+            _sn = _xpa._xprocessSentinel
+            if _sn is not None:
+                _mapSN[_sn] = (_xpa, _wkr)
+
+        _lstDead = [ _ww for _ww in _lstW if _ww[0]._xprocessSentinel is None ]
+        if len(_mapSN) > 0:
+            try:
+                _lstDead += [ _mapSN[_sn] for _sn in _PyMPWait(list(_mapSN.keys()), timeout=0) ]
+            except (OSError, ValueError):
+                pass
+        if len(_lstDead) < 1:
+            return
+
+        for _xpa, _wkr in _lstDead:
+            try:
+                self.__ProcessResults(rq_, rq_.get_nowait())
+            except (_PyQueueEmpty, OSError, ValueError, EOFError):
+                pass
+
+            # a worker stores the ID of a dequeued job before executing it, and
+            # its negation once the result is posted. So, a job handed to the
+            # worker but not stored was never started and can be resubmitted.
+            _wi  = _wkr._workerIndex
+            _jid = abs(self.__aj[_wi])
+            self.__aj[_wi] = 0
+
+            _job = None
+            with self.__l:
+                _mapJ = self.__ja.get(_wkr, None)
+                if (_mapJ is not None) and (_mapJ.pop(_jid, None) is not None):
+                    _job = self.__pj.pop(_jid, None)
+            if _job is not None:
+                logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPool_TID_005).format(_xpa._xprocessPID, self.__an, _jid))
+                _job._SetResult(_ERteTXErrorID.eOtherXcpByChildProcess.value, None)
+            self.__RespawnWorker(_xpa, _wkr)
+
+    def __RespawnWorker(self, xpa_ : _XProcessAgent, wkr_ : _XProcessPoolWorker):
+        with self.__l:
+            if self.__bSD or (xpa_ not in self.__wl):
+                return
+
+        _wkr = wkr_._CreateReplacement(_PyMPQueue())
+        _xpa = _XProcessAgent(_wkr._RunWorker, aliasn_=self.__wan)
+        if _xpa._xprocessAliasName is None:
+            _xpa = None
+        elif not _xpa._Start():
+            _xpa._DetachFromFW()
+            _xpa = None
+
+        with self.__l:
+            if xpa_ not in self.__wl:
+                if _xpa is not None:
+                    _xpa._Terminate()
+                _XProcessPoolImpl.__CloseQueue(_wkr._jobQueue)
+                return
+
+            _idx = self.__wl.index(xpa_)
+            if _xpa is not None:
+                self.__wl[_idx] = _xpa
+                self.__wk[_idx] = _wkr
+                self.__ja[_wkr] = dict()
+            else:
+                self.__wl.pop(_idx)
+                self.__wk.pop(_idx)
+            _numW = len(self.__wl)
+
+            _mapJ = self.__ja.pop(wkr_, dict())
+            for _jid, _dmpJob in _mapJ.items():
+                if _jid in self.__pj:
+                    self.__DispatchJob(_jid, _dmpJob)
+
+        _XProcessPoolImpl.__CloseQueue(wkr_._jobQueue)
+        if _xpa is None:
+            _XProcessPoolImpl.__CloseQueue(_wkr._jobQueue)
+            logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPool_TID_006).format(self.__an, _numW))
+
+    def __DispatchJob(self, jid_ : int, dmpJob_ : bytes) -> bool:
+        if (self.__rq is None) or (len(self.__wk) < 1):
+            return False
+
+        _wkr = min(self.__wk, key=lambda _ww: len(self.__ja[_ww]))
+        self.__ja[_wkr][jid_] = dmpJob_
+        _wkr._jobQueue.put((jid_, dmpJob_))
+        return True
+
+    def __FailPendingJobs(self):
+        with self.__l:
+            _lstJobs = list(self.__pj.values())
+            self.__pj.clear()
+            for _mapJ in self.__ja.values():
+                _mapJ.clear()
+
+        for _job in _lstJobs:
+            _job._SetResult(_ERteTXErrorID.eDetachedFromFW.value, None)
+
+    def __CloseQueues(self):
+        with self.__l:
+            _rq = self.__rq
+            self.__rq = None
+            _lstJQ = [] if _rq is None else [ _wkr._jobQueue for _wkr in self.__wk ]
+        for _jq in _lstJQ:
+            _XProcessPoolImpl.__CloseQueue(_jq)
+        if _rq is not None:
+            _XProcessPoolImpl.__CloseQueue(_rq)
+
+    @staticmethod
+    def __GetEndTime(maxWTime_: Union[int, float, None]) -> Union[int, None, bool]:
+        if maxWTime_ is None:
+            return None
+
+        _tout = _Timeout.TimespanToTimeout(maxWTime_)
+        if _tout is None:
+            return False
+
+        res = None
+        if not _tout.isInfiniteTimeout:
+            res = _PyMonotonicNS() + _tout.toNSec
+        _tout.CleanUp()
+        return res
+
+    @staticmethod
+    def __CloseQueue(q_ : _PyMPQueue):
+        try:
+            q_.cancel_join_thread()
+            q_.close()
+        except (OSError, ValueError, AttributeError):
+            pass
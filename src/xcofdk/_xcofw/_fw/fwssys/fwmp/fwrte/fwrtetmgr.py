@@ -10,7 +10,9 @@
 import pickle as _PyPickle
 from   pickle   import PickleError
 from   datetime import datetime as _PyDateTime
+from   os       import close  as _PyClose
 from   os       import getpid as _PyGetPID
+from   struct   import Struct as _PyStruct
 from   typing   import Any
 from   typing   import Tuple
 from   typing   import Union
@@ -20,6 +22,7 @@ from xcofdk.fwcom import EXmpPredefinedID
 
 from _fw.fwssys.fwcore.types.commontypes import override
 from _fw.fwssys.fwcore.types.commontypes import _EDepInjCmd
+from _fw.fwssys.fwcore.types.oobserdes   import _OobSerDes
 from _fw.fwssys.fwmp.fwrte.fwrtedefs     import _ERteTXErrorID
 from _fw.fwssys.fwmp.fwrte.fwrtedatax    import _ChildProcExitData
 from _fw.fwssys.fwmp.fwrte.rteexception  import _RteException
@@ -119,6 +122,10 @@ class _RteTokenGuide:
         return res
 
 class _FwRteToken(_PySHM):
+    __OOB_MAGIC = 0xB5
+    __OOB_HDR   = _PyStruct('<BIQ')
+    __OOB_LEN   = _PyStruct('<Q')
+
     def __init__(self, name=None, create=False, size=0):
         super().__init__(name=name, create=create, size=size)
 
@@ -141,6 +148,8 @@ class _FwRteToken(_PySHM):
     def _Close(self):
         try:
             super().close()
+        except BufferError:
+            self.__CloseFD()
         except (Exception, BaseException) as _xcp:
             pass
 
@@ -171,6 +180,16 @@ class _FwRteToken(_PySHM):
         except (Exception, BaseException) as _xcp:
             pass
 
+    def __CloseFD(self):
+        _fd = getattr(self, '_fd', -1)
+        if _fd < 0:
+            return
+        try:
+            _PyClose(_fd)
+        except OSError:
+            pass
+        self._fd = -1
+
     def __WriteClose(self, tknPld_ : _ChildProcExitData, tg_ : _RteTokenGuide, maxSDSize_ : int) -> Union[_RteTSException, None]:
         _WRITE_ERR_ID = _ERteTXErrorID.eWriteRteToken
 
@@ -187,8 +206,8 @@ class _FwRteToken(_PySHM):
         _dmpPldLen = 0
 
         try:
-            _dmpPld = _PyPickle.dumps(tknPld_)
-            _dmpPldLen = len(_dmpPld)
+            _dmpPld    = _FwRteToken.__DumpPayload(tknPld_)
+            _dmpPldLen = sum([_pp.nbytes if isinstance(_pp, memoryview) else len(_pp) for _pp in _dmpPld])
             if (_dmpPldLen > maxSDSize_) or (_dmpPldLen > _CAPC):
                 if _dmpPldLen > maxSDSize_:
                     _msg = _msgPrfx + _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteException_TID_015).format(_dmpPldLen, maxSDSize_)
@@ -202,7 +221,8 @@ class _FwRteToken(_PySHM):
                     _dmpPld = _rteXcp._Serialize()
                 if _dmpPld is None:
                     _dmpPld = tg_._processFailurePayload
-                _dmpPldLen = len(_dmpPld)
+                _dmpPld    = [_dmpPld]
+                _dmpPldLen = len(_dmpPld[0])
         except (PickleError, Exception) as _xcp:
             _msg    = _msgPrfx + _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteException_TID_005)
             _dmpPld = None
@@ -212,7 +232,8 @@ class _FwRteToken(_PySHM):
                 _dmpPld = _rteXcp._Serialize()
             if _dmpPld is None:
                 _dmpPld = tg_._processFailurePayload
-            _dmpPldLen = len(_dmpPld)
+            _dmpPld    = [_dmpPld]
+            _dmpPldLen = len(_dmpPld[0])
 
         _hdr = _RteTokenHeader(tg_._headerOffset+_dmpPldLen)
         try:
@@ -235,16 +256,19 @@ class _FwRteToken(_PySHM):
             self._Close()
             return _rteXcp
 
-        _dmpToken    = _dmpHdr + _dmpPld
-        _dmpTokenLen = len(_dmpToken)
+        _dmpTokenLen = len(_dmpHdr) + _dmpPldLen
         try:
-            self.buf[0:_dmpTokenLen] = _dmpToken
+            _ofs = len(_dmpHdr)
+            for _pp in _dmpPld:
+                _len = _pp.nbytes if isinstance(_pp, memoryview) else len(_pp)
+                self.buf[_ofs:_ofs+_len] = _pp
+                _ofs += _len
+            self.buf[0:len(_dmpHdr)] = _dmpHdr
         except (IndexError, Exception) as _xcp:
             _msg    = _msgPrfx + _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteException_TID_008).format(_dmpTokenLen)
             _rteXcp = _RteTSException(msg_=_msg, code_=_WRITE_ERR_ID.value, xcp_=_xcp)
 
         self._Close()
-        del _dmpToken
         del _dmpHdr
         del _dmpPld
         return _rteXcp
@@ -282,8 +306,8 @@ class _FwRteToken(_PySHM):
 
         _pld = None
         try:
-            _pldDump = bytes(_buf[_hdrLen:_hdrLen + _pldLen])
-            _pld = _PyPickle.loads(_pldDump)
+            _pldDump = _buf[_hdrLen:_hdrLen + _pldLen]
+            _pld = _FwRteToken.__LoadPayload(_pldDump)
             del _pldDump
         except (IndexError, PickleError, Exception) as _xcp:
             _msg = _msgPrfx + _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteException_TID_013).format(_bufLen, _hdrLen, _pldLen)
@@ -293,6 +317,39 @@ class _FwRteToken(_PySHM):
         self._CloseUnlink()
         return _pld
 
+    @staticmethod
+    def __DumpPayload(tknPld_ : _ChildProcExitData) -> list:
+        _inb, _bufs = _OobSerDes._Dumps(tknPld_, bSnapshot_=False)
+        if len(_bufs) < 1:
+            return [_inb]
+
+        _lens = [_bb.nbytes if isinstance(_bb, memoryview) else len(_bb) for _bb in _bufs]
+        _fhdr = _FwRteToken.__OOB_HDR.pack(_FwRteToken.__OOB_MAGIC, len(_bufs), len(_inb))
+        _fhdr += b''.join([_FwRteToken.__OOB_LEN.pack(_ll) for _ll in _lens])
+        return [_fhdr, _inb] + _bufs
+
+    @staticmethod
+    def __LoadPayload(pldDump_ : memoryview) -> Any:
+        if pldDump_[0] != _FwRteToken.__OOB_MAGIC:
+            return _PyPickle.loads(pldDump_)
+
+        _, _num, _inbLen = _FwRteToken.__OOB_HDR.unpack_from(pldDump_)
+        _ofs  = _FwRteToken.__OOB_HDR.size
+        _lens = []
+        for _ii in range(_num):
+            _lens.append(_FwRteToken.__OOB_LEN.unpack_from(pldDump_, _ofs)[0])
+            _ofs += _FwRteToken.__OOB_LEN.size
+
+        _inb  = pldDump_[_ofs:_ofs+_inbLen]
+        _ofs += _inbLen
+        _bufs = []
+        for _ll in _lens:
+            _bufs.append(pldDump_[_ofs:_ofs+_ll])
+            _ofs += _ll
+        if _ofs > len(pldDump_):
+            raise IndexError()
+        return _OobSerDes._Loads(_inb, oobBufs_=_bufs)
+
 class _FwRteTokenMgr:
     __slots__ = []
 
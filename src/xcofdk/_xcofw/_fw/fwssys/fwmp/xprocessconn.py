@@ -7,6 +7,8 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
+import os as _PyOS
+
 from signal          import SIGTERM
 from typing          import Tuple
 from typing          import Union
@@ -22,6 +24,7 @@ from _fw.fwssys.fwcore.base.sigcheck     import _CallableSignature
 from _fw.fwssys.fwcore.base.gtimeout     import _Timeout
 from _fw.fwssys.fwcore.ipc.sync.mutex    import _Mutex
 from _fw.fwssys.fwcore.ipc.tsk.taskutil  import _TaskUtil
+from _fw.fwssys.fwcore.swpfm.sysinfo     import _SystemInfo
 from _fw.fwssys.fwcore.types.commontypes import override
 from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
 from _fw.fwssys.fwcore.types.commontypes import _EDepInjCmd
@@ -164,6 +167,15 @@ class _XProcessConn(_IXProcConn):
     def _processPID(self) -> int:
         return None if self.__isInvalid or (self.__h is None) else self.__h.pid
 
+    @property
+    def _processSentinel(self) -> Union[int, None]:
+        if self.__isInvalid or (self.__h is None):
+            return None
+        try:
+            return self.__h.sentinel
+        except (ValueError, AttributeError):
+            return None
+
     @property
     def _processName(self) -> str:
         return None if self.__isInvalid else self.__n
@@ -179,6 +191,28 @@ class _XProcessConn(_IXProcConn):
             res = 0
         return res
 
+    def _OpenWaitable(self) -> Union[int, None]:
+        if self.__isInvalid:
+            return None
+
+        _mtx = self.__ma
+        if _mtx is None:
+            return None
+
+        with _mtx:
+            _hproc = self.__h
+            if (_hproc is None) or (_hproc.pid is None):
+                return None
+
+            try:
+                if _SystemInfo._IsPlatformLinux() and _SystemInfo._IsPythonVersionCompatible(3, 9):
+                    return _PyOS.pidfd_open(_hproc.pid)
+                if _SystemInfo._IsPlatformWindows():
+                    return None
+                return _PyOS.dup(_hproc.sentinel)
+            except (OSError, ValueError, AttributeError):
+                return None
+
     def _GetPState(self) -> Union[_EPState, None]:
         if self.__isInvalid:
             return None
@@ -355,6 +389,18 @@ class _XProcessConn(_IXProcConn):
     def _IsAvailable():
         return not _XProcessConn.__IsUnAvailable()
 
+    @staticmethod
+    def _AddProcessPool(xpool_) -> bool:
+        if not _XProcessConn.__IsPMISet():
+            return False
+        return _XProcessConn.__pmi._AddProcessPool(xpool_)
+
+    @staticmethod
+    def _AddProcessChannel(xchnl_) -> bool:
+        if not _XProcessConn.__IsPMISet():
+            return False
+        return _XProcessConn.__pmi._AddProcessChannel(xchnl_)
+
     @staticmethod
     def _ClsDepInjection(dinjCmd_ : _EDepInjCmd, ak_, pmi_ : _IFwsProcMgr):
         return _XProcessConn.__SetPMI(dinjCmd_, ak_, pmi_)
@@ -0,0 +1,115 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : xprocpoolwkr.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+import pickle as _PyPickle
+from   pickle import PickleError
+from   os     import getpid as _PyGetPID
+from   typing import Tuple
+
+from _fw.fwssys.fwmp.fwrte.fwrtedefs    import _ERteTXErrorID
+from _fw.fwssys.fwmp.fwrte.rteexception import _RteTSException
+
+from _fw.fwtdb.fwtdbengine import _EFwTextID
+from _fw.fwtdb.fwtdbengine import _FwTDbEngine
+
+class _XProcessPoolWorker:
+    __slots__ = [ '__jq' , '__rq' , '__m' , '__x' , '__aj' , '__wi' ]
+
+    def __init__(self, jobQ_, resQ_, maxSDSize_ : int, maxXPS_ : int, activeJobs_, wkrIdx_ : int):
+        self.__m  = maxSDSize_
+        self.__x  = maxXPS_
+        self.__aj = activeJobs_
+        self.__jq = jobQ_
+        self.__rq = resQ_
+        self.__wi = wkrIdx_
+
+    @property
+    def _workerIndex(self) -> int:
+        return self.__wi
+
+    @property
+    def _jobQueue(self):
+        return self.__jq
+
+    def _CreateReplacement(self, jobQ_):
+        return _XProcessPoolWorker(jobQ_, self.__rq, self.__m, self.__x, self.__aj, self.__wi)
+
+    def _RunWorker(self):
+        _jq, _rq, _aj, _wi = self.__jq, self.__rq, self.__aj, self.__wi
+
+        while True:
+            _job = _jq.get()
+            if _job is None:
+                break
+
+            _jid, _dmpJob = _job
+            _aj[_wi] = _jid
+            _errID, _dmpXD = self.__ExecuteJob(_jid, _dmpJob)
+            _rq.put((_jid, _errID.value, _dmpXD))
+            _aj[_wi] = -_jid
+
+        _rq.close()
+        _rq.join_thread()
+        return None
+
+    def __ExecuteJob(self, jid_ : int, dmpJob_ : bytes) -> Tuple[_ERteTXErrorID, bytes]:
+        _DISALLOWED_TYPES = (_RteTSException,)
+
+        _xd  = None
+        _bXT = (self.__x is not None) and (self.__x > 0)
+
+        try:
+            _tgt, _args, _kwargs = _PyPickle.loads(dmpJob_)
+
+            _xd = _tgt(*_args, **_kwargs)
+            if isinstance(_xd, _DISALLOWED_TYPES):
+                _errID = _ERteTXErrorID.eDisallowedSuppliedDataType
+                if _bXT:
+                    _msg = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPoolWorker_TID_002).format(jid_, _PyGetPID(), str(_xd))
+                    _xd  = _RteTSException(msg_=_msg, code_=_errID.value, maxXPS_=self.__x)
+                else:
+                    _xd = None
+            else:
+                _errID = _ERteTXErrorID.eSuccess
+        except SystemExit as _xcp:
+            _errID = _ERteTXErrorID.eSysExitXcpByChildProcess
+            _xd    = self.__CreateXcp(jid_, _errID, _xcp) if _bXT else None
+        except BaseException as _xcp:
+            _errID = _ERteTXErrorID.eDisallowedXcpDataType if isinstance(_xcp, _DISALLOWED_TYPES) else _ERteTXErrorID.eOtherXcpByChildProcess
+            _xd    = self.__CreateXcp(jid_, _errID, _xcp) if _bXT else None
+
+        return self.__Serialize(_errID, _xd)
+
+    def __CreateXcp(self, jid_ : int, errID_ : _ERteTXErrorID, xcp_ : BaseException) -> _RteTSException:
+        _msg = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XProcessPoolWorker_TID_001).format(type(xcp_).__name__, jid_, _PyGetPID())
+        return _RteTSException(msg_=_msg, code_=errID_.value, xcp_=xcp_, maxXPS_=self.__x)
+
+    def __Serialize(self, errID_ : _ERteTXErrorID, xd_) -> Tuple[_ERteTXErrorID, bytes]:
+        _WRITE_ERR_ID = _ERteTXErrorID.eWriteRteToken
+
+        _msgPrfx = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteException_TID_009).format(_PyGetPID())
+        _rteXcp  = None
+
+        try:
+            res = _PyPickle.dumps(xd_)
+            if len(res) > self.__m:
+                _msg    = _msgPrfx + _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteException_TID_015).format(len(res), self.__m)
+                _rteXcp = _RteTSException(msg_=_msg, code_=_WRITE_ERR_ID.value, maxXPS_=self.__x)
+        except (PickleError, Exception) as _xcp:
+            _msg    = _msgPrfx + _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteException_TID_005)
+            _rteXcp = _RteTSException(msg_=_msg, code_=_WRITE_ERR_ID.value, xcp_=_xcp, maxXPS_=self.__x)
+
+        if _rteXcp is not None:
+            errID_ = _WRITE_ERR_ID
+            res    = None
+            if (self.__x is not None) and (self.__x > 0):
+                res = _rteXcp._Serialize()
+            if res is None:
+                res = _PyPickle.dumps(None)
+        return errID_, res
@@ -0,0 +1,212 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : xshmring.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+from multiprocessing.shared_memory import SharedMemory as _PySHM
+from struct                        import Struct       as _PyStruct
+from time                          import monotonic    as _PyMonotonic
+from time                          import sleep        as _PySleep
+from typing                        import Union
+
+class _XShmRing:
+    __slots__ = [ '__shm' , '__c' , '__bO' ]
+
+    __HDR_SIZE   = 0x40
+    __WPOS_OFS   = 0x00
+    __RPOS_OFS   = 0x08
+    __CAPC_OFS   = 0x10
+    __FLAG_OFS   = 0x18
+    __MIN_BO_SEC = 0.0001
+    __MAX_BO_SEC = 0.002
+
+    __POS = _PyStruct('<Q')
+    __LEN = _PyStruct('<I')
+
+    def __init__(self, capacity_ : int =None, shmName_ : str =None):
+        self.__c   = None
+        self.__bO  = None
+        self.__shm = None
+
+        if shmName_ is None:
+            _shm = _PySHM(create=True, size=_XShmRing.__HDR_SIZE+capacity_)
+            _XShmRing.__POS.pack_into(_shm.buf, _XShmRing.__WPOS_OFS, 0)
+            _XShmRing.__POS.pack_into(_shm.buf, _XShmRing.__RPOS_OFS, 0)
+            _XShmRing.__POS.pack_into(_shm.buf, _XShmRing.__CAPC_OFS, capacity_)
+            _XShmRing.__POS.pack_into(_shm.buf, _XShmRing.__FLAG_OFS, 0)
+            self.__bO = True
+        else:
+            _shm = _PySHM(name=shmName_)
+            capacity_, = _XShmRing.__POS.unpack_from(_shm.buf, _XShmRing.__CAPC_OFS)
+            self.__bO  = False
+
+        self.__c   = capacity_
+        self.__shm = _shm
+
+    def __reduce__(self):
+        return _XShmRing, (None, None if self.__shm is None else self.__shm.name)
+
+    @property
+    def _isClosed(self) -> bool:
+        _shm = self.__shm
+        if _shm is None:
+            return True
+        _f, = _XShmRing.__POS.unpack_from(_shm.buf, _XShmRing.__FLAG_OFS)
+        return _f != 0
+
+    @property
+    def _capacity(self) -> int:
+        return self.__c
+
+    @property
+    def _maxRecordSize(self) -> int:
+        return self.__c - _XShmRing.__LEN.size
+
+    @property
+    def _numPendingBytes(self) -> int:
+        _buf = None if self.__shm is None else self.__shm.buf
+        if _buf is None:
+            return 0
+        _w, = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__WPOS_OFS)
+        _r, = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__RPOS_OFS)
+        return _w - _r
+
+    def _Write(self, rec_ : bytes) -> Union[bool, None]:
+        _shm = self.__shm
+        if _shm is None:
+            return None
+
+        _n   = len(rec_)
+        _req = _XShmRing.__LEN.size + _n
+        if _req > self.__c:
+            return None
+
+        _buf = _shm.buf
+        _w,  = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__WPOS_OFS)
+        _r,  = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__RPOS_OFS)
+        if (self.__c - (_w - _r)) < _req:
+            return False
+
+        self.__Put(_buf, _w, _XShmRing.__LEN.pack(_n))
+        self.__Put(_buf, _w+_XShmRing.__LEN.size, rec_)
+        _XShmRing.__POS.pack_into(_buf, _XShmRing.__WPOS_OFS, _w+_req)
+        return True
+
+    def _Read(self) -> Union[bytes, None]:
+        _shm = self.__shm
+        if _shm is None:
+            return None
+
+        _buf = _shm.buf
+        _w,  = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__WPOS_OFS)
+        _r,  = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__RPOS_OFS)
+        if _w == _r:
+            return None
+
+        _n,  = _XShmRing.__LEN.unpack(self.__Get(_buf, _r, _XShmRing.__LEN.size))
+        res  = self.__Get(_buf, _r+_XShmRing.__LEN.size, _n)
+        _XShmRing.__POS.pack_into(_buf, _XShmRing.__RPOS_OFS, _r+_XShmRing.__LEN.size+_n)
+        return res
+
+    def _Peek(self) -> Union[bytes, None]:
+        _shm = self.__shm
+        if _shm is None:
+            return None
+
+        _buf = _shm.buf
+        _w,  = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__WPOS_OFS)
+        _r,  = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__RPOS_OFS)
+        if _w == _r:
+            return None
+
+        _n, = _XShmRing.__LEN.unpack(self.__Get(_buf, _r, _XShmRing.__LEN.size))
+        return self.__Get(_buf, _r+_XShmRing.__LEN.size, _n)
+
+    def _Discard(self) -> bool:
+        _shm = self.__shm
+        if _shm is None:
+            return False
+
+        _buf = _shm.buf
+        _w,  = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__WPOS_OFS)
+        _r,  = _XShmRing.__POS.unpack_from(_buf, _XShmRing.__RPOS_OFS)
+        if _w == _r:
+            return False
+
+        _n, = _XShmRing.__LEN.unpack(self.__Get(_buf, _r, _XShmRing.__LEN.size))
+        _XShmRing.__POS.pack_into(_buf, _XShmRing.__RPOS_OFS, _r+_XShmRing.__LEN.size+_n)
+        return True
+
+    def _WriteWait(self, rec_ : bytes, timeoutSec_ : Union[float, None]) -> Union[bool, None]:
+        res = self._Write(rec_)
+        if res is not False:
+            return res
+
+        _bo  = _XShmRing.__MIN_BO_SEC
+        _end = None if timeoutSec_ is None else _PyMonotonic() + timeoutSec_
+        while res is False:
+            if (_end is not None) and (_PyMonotonic() >= _end):
+                break
+            if self._isClosed:
+                res = None
+                break
+            _PySleep(_bo)
+            _bo = min(2*_bo, _XShmRing.__MAX_BO_SEC)
+            res = self._Write(rec_)
+        return res
+
+    def _ReadWait(self, timeoutSec_ : Union[float, None]) -> Union[bytes, None]:
+        res = self._Read()
+        if res is not None:
+            return res
+
+        _bo  = _XShmRing.__MIN_BO_SEC
+        _end = None if timeoutSec_ is None else _PyMonotonic() + timeoutSec_
+        while res is None:
+            if (_end is not None) and (_PyMonotonic() >= _end):
+                break
+            if self._isClosed:
+                break
+            _PySleep(_bo)
+            _bo = min(2*_bo, _XShmRing.__MAX_BO_SEC)
+            res = self._Read()
+        return res
+
+    def _Close(self):
+        _shm = self.__shm
+        if _shm is None:
+            return
+
+        self.__shm = None
+        try:
+            if self.__bO:
+                _XShmRing.__POS.pack_into(_shm.buf, _XShmRing.__FLAG_OFS, 1)
+            _shm.close()
+            if self.__bO:
+                _shm.unlink()
+        except (OSError, BufferError, Exception):
+            pass
+
+    def __Put(self, buf_, pos_ : int, data_ : bytes):
+        _H   = _XShmRing.__HDR_SIZE
+        _n   = len(data_)
+        _ofs = pos_ % self.__c
+        _n1  = min(_n, self.__c - _ofs)
+
+        buf_[_H+_ofs:_H+_ofs+_n1] = data_[:_n1]
+        if _n1 < _n:
+            buf_[_H:_H+_n-_n1] = data_[_n1:]
+
+    def __Get(self, buf_, pos_ : int, n_ : int) -> bytes:
+        _H   = _XShmRing.__HDR_SIZE
+        _ofs = pos_ % self.__c
+        _n1  = min(n_, self.__c - _ofs)
+
+        res = bytes(buf_[_H+_ofs:_H+_ofs+_n1])
+        if _n1 < n_:
+            res += bytes(buf_[_H:_H+n_-_n1])
+        return res
@@ -28,7 +28,7 @@ from _fw.fwtdb.fwtdbengine import _EFwTextID
 from _fw.fwtdb.fwtdbengine import _FwTDbEngine
 
 class _XMsgHeaderImpl(_IFwMessageHeader):
-    __slots__ = [ '__h' ]
+    __slots__ = [ '__h' , '__ts' , '__pr' ]
 
     def __init__( self
                 , clusterID_  : Union[IntEnum, int]
@@ -36,10 +36,20 @@ class _XMsgHeaderImpl(_IFwMessageHeader):
                 , receiverID_ : Union[IntEnum, int]
                 , senderID_   : int
                 , bInternal_    =False
-                , cloneBy_      =None):
+                , cloneBy_      =None
+                , fwMHdr_       =None):
         super().__init__()
 
-        self.__h = None
+        self.__h  = None
+        self.__pr = 0
+        self.__ts = None
+
+        if fwMHdr_ is not None:
+            if not (isinstance(fwMHdr_, _FwMessageHeader) and fwMHdr_.isValid):
+                self.CleanUp()
+            else:
+                self.__h = fwMHdr_
+            return
 
         if cloneBy_ is not None:
             if not (isinstance(cloneBy_, _XMsgHeaderImpl) and cloneBy_.isValid):
@@ -49,7 +59,9 @@ class _XMsgHeaderImpl(_IFwMessageHeader):
                 if _fwMHdr is None:
                     self.CleanUp()
                 else:
-                    self.__h = _fwMHdr
+                    self.__h  = _fwMHdr
+                    self.__pr = cloneBy_.__pr
+                    self.__ts = cloneBy_.__ts
             return
 
         if not isinstance(senderID_, int):
@@ -105,6 +117,24 @@ class _XMsgHeaderImpl(_IFwMessageHeader):
     def isValid(self) -> bool:
         return (self.__h is not None) and self.__h.isValid
 
+    @property
+    def _fwHeader(self) -> _FwMessageHeader:
+        return self.__h
+
+    @property
+    def _traceStamp(self) -> Union[int, None]:
+        return self.__ts
+
+    def _SetTraceStamp(self, stampNS_ : Union[int, None]):
+        self.__ts = stampNS_
+
+    @property
+    def _priority(self) -> int:
+        return self.__pr
+
+    def _SetPriority(self, prio_ : int):
+        self.__pr = int(prio_)
+
     @property
     def isXcoMsgHeader(self) -> bool:
         return True
@@ -181,7 +211,9 @@ class _XMsgHeaderImpl(_IFwMessageHeader):
     def _CleanUp(self):
         if self.__h is not None:
             self.__h.CleanUp()
-            self.__h = None
+            self.__h  = None
+            self.__pr = 0
+            self.__ts = None
             super()._CleanUp()
 
     @property
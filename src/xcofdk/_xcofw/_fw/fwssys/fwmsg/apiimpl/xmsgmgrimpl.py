@@ -9,9 +9,12 @@
 
 from enum      import IntEnum
 from threading import RLock as _PyRLock
+from time      import monotonic_ns as _PyMonotonicNS
 from typing    import Union
 
 from xcofdk.fwcom      import EXmsgPredefinedID
+from xcofdk.fwcom      import EXmsgPriority
+from xcofdk.fwcom      import EXmsgPayloadCodec
 from xcofdk.fwapi      import IPayload
 from xcofdk.fwapi      import IRCTask
 from xcofdk.fwapi.xmsg import XPayload
@@ -24,6 +27,8 @@ from _fw.fwssys.fwctrl.fwapiconnap        import _FwApiConnectorAP
 from _fw.fwssys.fwcore.ipc.tsk.taskutil   import _TaskUtil
 from _fw.fwssys.fwmsg.apiimpl.xmsghdrimpl import _XMsgHeaderImpl
 from _fw.fwssys.fwmsg.apiimpl.xmsgimpl    import _XMsgImpl
+from _fw.fwssys.fwmsg.apiimpl.xmsgserdes  import _EXMsgPldCodecID
+from _fw.fwssys.fwmsg.apiimpl.xmsgserdes  import _XMsgSerDes
 from _fw.fwssys.fwmsg.msg                 import _SubsysMsgUtil
 from _fw.fwssys.fwmsg.msg.fwmessage       import _FwMessage
 from _fw.fwssys.fwmsg.disp.dispregistry   import _MessageClusterMap
@@ -39,6 +44,8 @@ class _XMsgMgrImpl:
 
     __ma = _PyRLock()
 
+    __BATCH_ENTRY_DEFAULTS = (None, EXmsgPredefinedID.DontCare)
+
     def __init__(self):
         pass
 
@@ -46,12 +53,15 @@ class _XMsgMgrImpl:
     def _SendXMsg( rcvID_   : Union[IXTask, IntEnum, int]
                  , lblID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
                  , clrID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                 , payload_ : Union[IPayload, dict] =None) -> int:
+                 , payload_ : Union[IPayload, dict] =None
+                 , prio_    : EXmsgPriority         =None) -> int:
         if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
             return 0
+        if not _XMsgMgrImpl.__CheckPriority(prio_):
+            return 0
 
         if isinstance(rcvID_, EXmsgPredefinedID) and rcvID_==EXmsgPredefinedID.Broadcast:
-            return _XMsgMgrImpl._BroadcastXMsg(lblID_, clrID_, payload_)
+            return _XMsgMgrImpl._BroadcastXMsg(lblID_, clrID_, payload_, prio_=prio_)
         if isinstance(rcvID_, IRCTask):
             rcvID_ = rcvID_.taskUID
 
@@ -62,6 +72,8 @@ class _XMsgMgrImpl:
         if _msg is None:
             pass
         else:
+            if prio_ is not None:
+                _msg.header._SetPriority(prio_)
             res = _msg.uniqueID
             _bSent = _UserTask._SendXMsg(_sndXT, _msg)
             if not _bSent:
@@ -74,9 +86,12 @@ class _XMsgMgrImpl:
     @staticmethod
     def _BroadcastXMsg( lblID_   : Union[IntEnum, int]
                       , clrID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                      , payload_ : Union[IPayload, dict] =None) -> int:
+                      , payload_ : Union[IPayload, dict] =None
+                      , prio_    : EXmsgPriority         =None) -> int:
         if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
             return 0
+        if not _XMsgMgrImpl.__CheckPriority(prio_):
+            return 0
 
         res    = 0
         _msg   = None
@@ -85,6 +100,8 @@ class _XMsgMgrImpl:
         if _msg is None:
             pass
         else:
+            if prio_ is not None:
+                _msg.header._SetPriority(prio_)
             res = _msg.uniqueID
             _bSent = _UserTask._SendXMsg(_sndXT, _msg)
             if not _bSent:
@@ -94,6 +111,65 @@ class _XMsgMgrImpl:
             _msg.CleanUp()
         return res
 
+    @staticmethod
+    def _SendXMsgByProxy( sndXT_   : IXTask
+                        , rcvID_   : int
+                        , lblID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
+                        , clrID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
+                        , payload_ : Union[IPayload, dict] =None) -> int:
+        if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
+            return 0
+        if (sndXT_ is None) or sndXT_.isDetachedFromFW:
+            return 0
+
+        res    = 0
+        _msg   = None
+        _sndXT = None
+        _msg, _sndXT = _XMsgMgrImpl.__ProcMsgRequest(sndXT_, lblID_, clrID_, rcvID_, payload_=payload_, bInternal_=False, bBroadcast_=False, bProxy_=True)
+        if _msg is None:
+            res = -1
+        else:
+            res = _msg.uniqueID
+            if not _UserTask._SendXMsg(_sndXT, _msg):
+                res = 0
+            _msg.CleanUp()
+        return res
+
+    @staticmethod
+    def _SendXMsgs(msgs_ : Union[list, tuple]) -> list:
+        return _XMsgMgrImpl.__ProcBatchSendRequest(msgs_, bBroadcast_=False)
+
+    @staticmethod
+    def _BroadcastXMsgs(msgs_ : Union[list, tuple]) -> list:
+        return _XMsgMgrImpl.__ProcBatchSendRequest(msgs_, bBroadcast_=True)
+
+    @staticmethod
+    def _RegisterPayloadCodec(pldType_ : type, codec_ : EXmsgPayloadCodec) -> bool:
+        if not isinstance(codec_, EXmsgPayloadCodec):
+            return False
+
+        _cid = None
+        if codec_ == EXmsgPayloadCodec.Pickle:
+            _cid = _EXMsgPldCodecID.ePickle
+        elif codec_ == EXmsgPayloadCodec.PickleOob:
+            _cid = _EXMsgPldCodecID.ePickleOob
+        elif codec_ == EXmsgPayloadCodec.Compact:
+            _cid = _EXMsgPldCodecID.eFlatDict
+        return _XMsgSerDes._RegisterPayloadCodec(pldType_, _cid)
+
+    @staticmethod
+    def _GetFailedBatchResult(msgs_ : Union[list, tuple]) -> list:
+        return [0] * len(msgs_) if isinstance(msgs_, (list, tuple)) else []
+
+    @staticmethod
+    def __CheckPriority(prio_ : EXmsgPriority) -> bool:
+        if (prio_ is None) or isinstance(prio_, EXmsgPriority):
+            return True
+
+        _midPart = _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_013
+        logif._LogErrorECTID(_EFwErrorCode.UE_00287, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_038, _midPart, type(prio_).__name__)
+        return False
+
     @staticmethod
     def __GetNextUniqueNr():
         return _FwMessage._GetNextUniqueNr()
@@ -105,30 +181,117 @@ class _XMsgMgrImpl:
                          , payload_    : Union[IPayload, dict]  =None
                          , bInternal_                              =False
                          , bBroadcast_                             =False):
-        _failedTuple = None, None
+        _sndXT = _XMsgMgrImpl.__ProcSender(bInternal_=bInternal_)
+        if _sndXT is None:
+            return None, None
+        return _XMsgMgrImpl.__ProcMsgRequest(_sndXT, lblID_, clrID_, rcvID_, payload_=payload_, bInternal_=bInternal_, bBroadcast_=bBroadcast_)
 
+    @staticmethod
+    def __ProcBatchSendRequest(msgs_ : Union[list, tuple], bBroadcast_ : bool) -> list:
+        _midPart = _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_013
+
+        if not isinstance(msgs_, (list, tuple)):
+            logif._LogErrorECTID(_EFwErrorCode.UE_00270, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_036, _midPart, type(msgs_).__name__)
+            return []
+
+        res = _XMsgMgrImpl._GetFailedBatchResult(msgs_)
+        if len(res) < 1:
+            return res
+        if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
+            return res
+
+        _sndXT = _XMsgMgrImpl.__ProcSender()
+        if _sndXT is None:
+            return res
+
+        _minLen  = 1 if bBroadcast_ else 2
+        _maxLen  = _minLen + len(_XMsgMgrImpl.__BATCH_ENTRY_DEFAULTS)
+        _lstIdx  = []
+        _lstMsg  = []
+        _rcvMap  = dict()
+
+        for _ii, _ee in enumerate(msgs_):
+            if not (isinstance(_ee, tuple) and (_minLen <= len(_ee) <= _maxLen)):
+                logif._LogErrorECTID(_EFwErrorCode.UE_00271, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_037, _midPart, _ii, _minLen, _maxLen, _ee)
+                continue
+
+            _ee = _ee + _XMsgMgrImpl.__BATCH_ENTRY_DEFAULTS[len(_ee)-_minLen:]
+            if bBroadcast_:
+                _rcvID = 0
+                _lblID, _pld, _clrID = _ee
+            else:
+                _rcvID, _lblID, _pld, _clrID = _ee
+
+            _bBC = bBroadcast_ or (isinstance(_rcvID, EXmsgPredefinedID) and _rcvID==EXmsgPredefinedID.Broadcast)
+            if _bBC:
+                _rcvID = 0
+            elif isinstance(_rcvID, IRCTask):
+                _rcvID = _rcvID.taskUID
+
+            _msg, _ = _XMsgMgrImpl.__ProcMsgRequest(_sndXT, _lblID, _clrID, _rcvID, payload_=_pld, bInternal_=False, bBroadcast_=_bBC, rcvCache_=_rcvMap)
+            if _msg is not None:
+                _lstIdx.append(_ii)
+                _lstMsg.append(_msg)
+        _rcvMap.clear()
+
+        if len(_lstMsg) < 1:
+            return res
+
+        _lstSent = _UserTask._SendXMsgs(_sndXT, _lstMsg)
+        for _jj, _msg in enumerate(_lstMsg):
+            _bSent = None if _lstSent is None else _lstSent[_jj]
+            if _bSent:
+                res[_lstIdx[_jj]] = _msg.uniqueID
+            elif (_bSent is not None) and _sndXT.isRunning and (_sndXT.currentError is None):
+                if _msg.header.isBroadcastMsg:
+                    logif._LogErrorECTID(_EFwErrorCode.UE_00273, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_035, _msg.header)
+                else:
+                    logif._LogErrorECTID(_EFwErrorCode.UE_00272, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_034, _msg.header)
+            _msg.CleanUp()
+
+        _lstIdx.clear()
+        _lstMsg.clear()
+        return res
+
+    @staticmethod
+    def __ProcSender(bInternal_ =False) -> Union[IXTask, None]:
         _bLRTE = False
         _bLRTE = _bLRTE or not _FwApiConnectorAP._APIsFwApiConnected()
         _bLRTE = _bLRTE or not _FwApiConnectorAP._APIsLcErrorFree()
         _bLRTE = _bLRTE or _FwApiConnectorAP._APIsLcShutdownEnabled()
         if _bLRTE:
-            return _failedTuple
+            return None
 
         if bInternal_ and (not _FwSubsysCoding.IsInternalQueueSupportEnabled()):
-            return _failedTuple
-
-        _midPart = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_013)
+            return None
 
-        _rcvXT = None
-        _sndXT = _FwApiConnectorAP._APGetCurXTask()
-        if _sndXT is None:
-            logif._LogErrorEC(_EFwErrorCode.UE_00194, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_014).format(_midPart))
-            return _failedTuple
-        elif not _sndXT.taskProfile.isExternalQueueEnabled:
+        res = _FwApiConnectorAP._APGetCurXTask()
+        if res is None:
+            _midPart = _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_013
+            logif._LogErrorECTID(_EFwErrorCode.UE_00194, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_014, _midPart)
+        elif not res.taskProfile.isExternalQueueEnabled:
             if _FwSubsysCoding.IsSenderExternalQueueSupportMandatory():
-                logif._LogErrorEC(_EFwErrorCode.UE_00236, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_002).format(_midPart))
-                return _failedTuple
+                _midPart = _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_013
+                logif._LogErrorECTID(_EFwErrorCode.UE_00236, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_002, _midPart)
+                res = None
+        return res
 
+    @staticmethod
+    def __ProcMsgRequest( sndXT_     : IXTask
+                        , lblID_     : Union[IntEnum, int]
+                        , clrID_     : Union[IntEnum, int]
+                        , rcvID_     : Union[IXTask, IntEnum, int]
+                        , payload_   : Union[IPayload, dict] =None
+                        , bInternal_                         =False
+                        , bBroadcast_                        =False
+                        , rcvCache_  : dict                  =None
+                        , bProxy_                            =False):
+        _failedTuple = None, None
+
+        _midPart = _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_013
+
+        _rcvXT = None
+        _sndXT = sndXT_
         _sndID = _sndXT.taskUID
         _rcvID = rcvID_
 
@@ -139,19 +302,32 @@ class _XMsgMgrImpl:
 
         if _bDontCareRcv:
             if not _FwSubsysCoding.IsAnonymousAddressingEnabled():
-                logif._LogErrorEC(_EFwErrorCode.UE_00195, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_028).format(_midPart, _SubsysMsgUtil.StringizeID(_rcvID)))
+                logif._LogErrorECTID(_EFwErrorCode.UE_00195, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_028, _midPart, _SubsysMsgUtil.StringizeID(_rcvID))
                 return _failedTuple
 
             if _bDontCareLbl and _bDontCareClr:
-                logif._LogErrorEC(_EFwErrorCode.UE_00196, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_029).format(_midPart, _SubsysMsgUtil.StringizeID(lblID_), _SubsysMsgUtil.StringizeID(clrID_), EXmsgPredefinedID.MinUserDefinedID.value))
+                logif._LogErrorECTID(_EFwErrorCode.UE_00196, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_029, _midPart, _SubsysMsgUtil.StringizeID(lblID_), _SubsysMsgUtil.StringizeID(clrID_), EXmsgPredefinedID.MinUserDefinedID.value)
                 return _failedTuple
 
+        _rcvKey = None
+        if (rcvCache_ is not None) and not (bInternal_ or bBroadcast_ or _bDontCareRcv):
+            if isinstance(rcvID_, IXTask):
+                _rcvKey = id(rcvID_)
+            elif isinstance(rcvID_, int):
+                _rcvKey = type(rcvID_), rcvID_
+
+            if _rcvKey is not None:
+                _rcvID = rcvCache_.get(_rcvKey, None)
+                if _rcvID is not None:
+                    return _XMsgMgrImpl.__CreateXMsg(_sndXT, _midPart, lblID_, clrID_, _rcvID, payload_, _bDontCareLbl, _bDontCareClr, bInternal_, bBroadcast_)
+                _rcvID = rcvID_
+
         if not (bInternal_ or bBroadcast_):
             if isinstance(_rcvID, IntEnum):
                 if _bPreDefRcv and (_rcvID == EXmsgPredefinedID.MainTask):
                     _rcvID = _FwSubsysShare._GetMainXTask()
                     if _rcvID is None:
-                        logif._LogErrorEC(_EFwErrorCode.UE_00197, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_032).format(_midPart))
+                        logif._LogErrorECTID(_EFwErrorCode.UE_00197, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_032, _midPart)
                         return _failedTuple
                 else:
                     _rcvID = _rcvID.value
@@ -161,24 +337,24 @@ class _XMsgMgrImpl:
 
         if _bXTaskRcv:
             if _rcvID.isDetachedFromFW or (_rcvID.taskUID is None):
-                logif._LogErrorEC(_EFwErrorCode.UE_00198, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_019).format(_midPart, rcvID_))
+                logif._LogErrorECTID(_EFwErrorCode.UE_00198, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_019, _midPart, rcvID_)
                 return _failedTuple
             _rcvXT = _rcvID
             _rcvID = _rcvID.taskUID
         elif not _bIntRcv:
-            logif._LogErrorEC(_EFwErrorCode.UE_00199, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_016).format(_midPart, type(rcvID_).__name__))
+            logif._LogErrorECTID(_EFwErrorCode.UE_00199, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_016, _midPart, type(rcvID_).__name__)
             return _failedTuple
         elif _rcvID == 0:
             _rcvID = _sndID
 
-        if (_rcvID==_sndID) and not (bInternal_ or bBroadcast_):
+        if (_rcvID==_sndID) and not (bInternal_ or bBroadcast_ or bProxy_):
             if not _FwSubsysCoding.IsSelfExternalMessagingEnabled():
-                logif._LogErrorEC(_EFwErrorCode.UE_00200, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_031).format(_midPart, _sndID))
+                logif._LogErrorECTID(_EFwErrorCode.UE_00200, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_031, _midPart, _sndID)
                 return _failedTuple
 
         if bInternal_:
             if not _sndXT.taskProfile.isInternalQueueEnabled:
-                logif._LogErrorEC(_EFwErrorCode.UE_00201, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_015).format(_midPart, _sndID))
+                logif._LogErrorECTID(_EFwErrorCode.UE_00201, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_015, _midPart, _sndID)
                 return _failedTuple
             _rcvID = _sndID
             _rcvXT = _sndXT
@@ -195,61 +371,72 @@ class _XMsgMgrImpl:
                     pass
                 else:
                     if not _TaskUtil.IsValidUserTaskID(_rcvID):
-                        logif._LogErrorEC(_EFwErrorCode.UE_00202, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_017).format(_midPart, rcvID_))
+                        logif._LogErrorECTID(_EFwErrorCode.UE_00202, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_017, _midPart, rcvID_)
                         return _failedTuple
                     _rcvXT = _FwApiConnectorAP._APGetXTask(_rcvID)
 
                 if _rcvXT is None:
-                    logif._LogErrorEC(_EFwErrorCode.UE_00203, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_018).format(_midPart, rcvID_))
+                    logif._LogErrorECTID(_EFwErrorCode.UE_00203, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_018, _midPart, rcvID_)
                     return _failedTuple
                 if not (_rcvXT.isRunning or _rcvXT.isStopping or _rcvXT.isCanceling):
-                    logif._LogErrorEC(_EFwErrorCode.UE_00205, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_020).format(_midPart, rcvID_))
+                    logif._LogErrorECTID(_EFwErrorCode.UE_00205, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_020, _midPart, rcvID_)
                     return _failedTuple
                 if not _rcvXT.taskProfile.isExternalQueueEnabled:
-                    logif._LogErrorEC(_EFwErrorCode.UE_00206, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_021).format(_midPart, rcvID_))
+                    logif._LogErrorECTID(_EFwErrorCode.UE_00206, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_021, _midPart, rcvID_)
                     return _failedTuple
 
                 _rcvID = _rcvXT.taskUID
 
-        _arg1 = _SubsysMsgUtil.StringizeID(lblID_)
-        _arg2 = _SubsysMsgUtil.StringizeID(clrID_)
-        _arg3 = _SubsysMsgUtil.StringizeID(_sndID)
-        _arg4 = _SubsysMsgUtil.StringizeID(_rcvID)
-        if not _XMsgMgrImpl.__CheckSendRequest(lblID_, clrID_, _bDontCareLbl, _bDontCareClr, bBroadcast_=bBroadcast_):
+                if _rcvKey is not None:
+                    rcvCache_[_rcvKey] = _rcvID
+
+        return _XMsgMgrImpl.__CreateXMsg(_sndXT, _midPart, lblID_, clrID_, _rcvID, payload_, _bDontCareLbl, _bDontCareClr, bInternal_, bBroadcast_)
+
+    @staticmethod
+    def __CreateXMsg(sndXT_ : IXTask, midPart_ : _EFwTextID, lblID_, clrID_, rcvID_, payload_, bDontCareLbl_ : bool, bDontCareClr_ : bool, bInternal_ : bool, bBroadcast_ : bool):
+        _failedTuple = None, None
+
+        _midPart = midPart_
+        _sndID   = sndXT_.taskUID
+        _rcvID   = rcvID_
+        _minID   = EXmsgPredefinedID.MinUserDefinedID.value
+
+        if not _XMsgMgrImpl.__CheckSendRequest(lblID_, clrID_, bDontCareLbl_, bDontCareClr_, bBroadcast_=bBroadcast_):
+            _args = _XMsgMgrImpl.__StringizeIDs(lblID_, clrID_, _sndID, _rcvID)
             if bBroadcast_:
-                logif._LogErrorEC(_EFwErrorCode.UE_00207, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_027).format(_midPart, _arg1, _arg2, _arg3, _arg4, EXmsgPredefinedID.MinUserDefinedID.value))
+                logif._LogErrorECTID(_EFwErrorCode.UE_00207, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_027, _midPart, *_args, _minID)
             else:
-                logif._LogErrorEC(_EFwErrorCode.UE_00208, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_022).format(_midPart, _arg1, _arg2, _arg3, _arg4, EXmsgPredefinedID.MinUserDefinedID.value))
+                logif._LogErrorECTID(_EFwErrorCode.UE_00208, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_022, _midPart, *_args, _minID)
             return _failedTuple
 
         _pld = payload_
         if _pld is not None:
             if not isinstance(_pld, (XPayload, dict)):
                 if not isinstance(_pld, IPayload):
-                    logif._LogErrorEC(_EFwErrorCode.UE_00155, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_023).format(_midPart, IPayload.__name__, dict.__name__, type(payload_).__name__, _arg1, _arg2, _arg3, _arg4, EXmsgPredefinedID.MinUserDefinedID.value))
+                    logif._LogErrorECTID(_EFwErrorCode.UE_00155, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_023, _midPart, IPayload.__name__, dict.__name__, type(payload_).__name__, *_XMsgMgrImpl.__StringizeIDs(lblID_, clrID_, _sndID, _rcvID), _minID)
                     return _failedTuple
 
                 if _pld.isCustomMarshalingRequired:
                     if not _FwSubsysCoding.IsCustomPayloadSerDesEnabled():
-                        logif._LogErrorEC(_EFwErrorCode.UE_00156, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_033).format(_midPart))
+                        logif._LogErrorECTID(_EFwErrorCode.UE_00156, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_033, _midPart)
                         return _failedTuple
 
                 _bCustomPLD = True
             elif isinstance(_pld, XPayload):
                 if not _pld.isValidPayload:
-                    logif._LogErrorEC(_EFwErrorCode.UE_00157, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_026).format(_midPart, _arg1, _arg2, _arg3, _arg4, EXmsgPredefinedID.MinUserDefinedID.value))
+                    logif._LogErrorECTID(_EFwErrorCode.UE_00157, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_026, _midPart, *_XMsgMgrImpl.__StringizeIDs(lblID_, clrID_, _sndID, _rcvID), _minID)
                     return _failedTuple
                 if _pld.numParameters < 1:
                     _pld = None
-                    logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_024).format(_midPart, _arg1, _arg2, _arg3, _arg4, EXmsgPredefinedID.MinUserDefinedID.value))
+                    logif._LogWarningTID(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_024, _midPart, *_XMsgMgrImpl.__StringizeIDs(lblID_, clrID_, _sndID, _rcvID), _minID)
             elif len(_pld) < 1:
                 _pld = None
-                logif._LogWarning(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_024).format(_midPart, _arg1, _arg2, _arg3, _arg4, EXmsgPredefinedID.MinUserDefinedID.value))
+                logif._LogWarningTID(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_024, _midPart, *_XMsgMgrImpl.__StringizeIDs(lblID_, clrID_, _sndID, _rcvID), _minID)
             else:
                 _pld = XPayload(containerInitializer_=payload_)
                 if not (_pld.isValidPayload and _pld.numParameters==len(payload_)):
                     _pld.DetachContainer()
-                    logif._LogErrorEC(_EFwErrorCode.UE_00158, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_030).format(_midPart, XPayload.__name__, len(payload_), _arg1, _arg2, _arg3, _arg4, EXmsgPredefinedID.MinUserDefinedID.value))
+                    logif._LogErrorECTID(_EFwErrorCode.UE_00158, _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_030, _midPart, XPayload.__name__, len(payload_), *_XMsgMgrImpl.__StringizeIDs(lblID_, clrID_, _sndID, _rcvID), _minID)
                     return _failedTuple
 
         _hdr = _XMsgHeaderImpl(clrID_, lblID_, _rcvID, _sndID, bInternal_=bInternal_)
@@ -258,6 +445,8 @@ class _XMsgMgrImpl:
                 _pld.DetachContainer()
             _hdr.CleanUp()
             return _failedTuple
+        if _ssshare._IsMsgLatencyTracingEnabled():
+            _hdr._SetTraceStamp(_PyMonotonicNS())
         res = _XMsgImpl(uid_=_XMsgMgrImpl.__GetNextUniqueNr(), header_=_hdr, payld_=_pld)
         if not res.isValid:
             if (_pld is not None) and not isinstance(payload_, IPayload):
@@ -265,7 +454,11 @@ class _XMsgMgrImpl:
             _hdr.CleanUp()
             res.CleanUp()
             return _failedTuple
-        return res, _sndXT
+        return res, sndXT_
+
+    @staticmethod
+    def __StringizeIDs(lblID_, clrID_, sndID_, rcvID_) -> tuple:
+        return _SubsysMsgUtil.StringizeID(lblID_), _SubsysMsgUtil.StringizeID(clrID_), _SubsysMsgUtil.StringizeID(sndID_), _SubsysMsgUtil.StringizeID(rcvID_)
 
     @staticmethod
     def __CheckSendRequest( lblID_  : Union[IntEnum, int], clrID_  : Union[IntEnum, int], bDontCareLbl_, bDontCareClr_, bBroadcast_ =False):
@@ -0,0 +1,267 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : xmsgserdes.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+import marshal as _PyMarshal
+import struct  as _PyStruct
+from   enum      import IntEnum
+from   enum      import unique
+from   threading import Lock as _PyLock
+from   typing    import Union
+
+from xcofdk.fwapi               import IPayload
+from xcofdk.fwapi.xmsg.xpayload import XPayload
+
+from _fw.fwssys.assys                     import fwsubsysshare as _ssshare
+from _fw.fwssys.fwcore.logging            import logif
+from _fw.fwssys.fwcore.types.serdes       import SerDes
+from _fw.fwssys.fwcore.types.oobserdes    import _OobDump
+from _fw.fwssys.fwcore.types.oobserdes    import _OobSerDes
+from _fw.fwssys.fwmsg.msg                 import _EMessageType
+from _fw.fwssys.fwmsg.msg                 import _EMessageChannel
+from _fw.fwssys.fwmsg.msg                 import _EMessageCluster
+from _fw.fwssys.fwmsg.msg                 import _EMessageLabel
+from _fw.fwssys.fwmsg.msg                 import _EMessagePeer
+from _fw.fwssys.fwmsg.msg                 import _FwMessageHeader
+from _fw.fwssys.fwmsg.apiimpl.xmsgimpl    import _XMsgImpl
+from _fw.fwssys.fwmsg.apiimpl.xmsghdrimpl import _XMsgHeaderImpl
+from _fw.fwssys.fwerrh.fwerrorcodes       import _EFwErrorCode
+
+from _fw.fwtdb.fwtdbengine import _EFwTextID
+from _fw.fwtdb.fwtdbengine import _FwTDbEngine
+
+@unique
+class _EXMsgPldCodecID(IntEnum):
+    eNone      = 0
+    ePickle    = 1
+    eFlatDict  = 2
+    ePickleOob = 3
+
+class _XMsgSerDes:
+    __slots__ = []
+
+    __lck       = _PyLock()
+    __pldCodecs = { XPayload : _EXMsgPldCodecID.eFlatDict }
+    __DEF_CODEC = { XPayload : _EXMsgPldCodecID.eFlatDict }
+
+    __MAGIC     = 0x01
+    __HDR       = _PyStruct.Struct('<BBBhhqqqqqB')
+    __HDR_SIZE  = __HDR.size
+    __STAMP     = _PyStruct.Struct('<q')
+    __PRIO      = _PyStruct.Struct('<B')
+    __FLAT_KEYS = frozenset([str, int])
+    __FLAT_VALS = frozenset([type(None), bool, int, float, complex, str, bytes])
+
+    __MAP_TYPE    = { _ee.value : _ee for _ee in _EMessageType }
+    __MAP_CHANNEL = { _ee.value : _ee for _ee in _EMessageChannel }
+    __MAP_CLUSTER = { _ee.value : _ee for _ee in _EMessageCluster }
+    __MAP_LABEL   = { _ee.value : _ee for _ee in _EMessageLabel }
+    __MAP_PEER    = { _ee.value : _ee for _ee in _EMessagePeer }
+
+    __bfEnumCluster  = (0x01 << 0)
+    __bfEnumLabel    = (0x01 << 1)
+    __bfEnumSender   = (0x01 << 2)
+    __bfEnumReceiver = (0x01 << 3)
+    __bfTraceStamp   = (0x01 << 4)
+    __bfPriority     = (0x01 << 5)
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def _IsCompactSerDesEnabled() -> bool:
+        return _ssshare._IsCompactMsgSerDesEnabled()
+
+    @staticmethod
+    def _GetPayloadCodec(payloadType_ : type) -> Union[_EXMsgPldCodecID, None]:
+        return _XMsgSerDes.__pldCodecs.get(payloadType_, None)
+
+    @staticmethod
+    def _RegisterPayloadCodec(payloadType_ : type, codecID_ : Union[_EXMsgPldCodecID, None]) -> bool:
+        if not (isinstance(payloadType_, type) and issubclass(payloadType_, IPayload)):
+            return False
+        if codecID_ is None:
+            pass
+        elif not isinstance(codecID_, _EXMsgPldCodecID) or (codecID_ == _EXMsgPldCodecID.eNone):
+            return False
+        elif (codecID_ == _EXMsgPldCodecID.eFlatDict) and (payloadType_ is not XPayload):
+            return False
+
+        with _XMsgSerDes.__lck:
+            if codecID_ is None:
+                codecID_ = _XMsgSerDes.__DEF_CODEC.get(payloadType_, None)
+            _pcs = dict(_XMsgSerDes.__pldCodecs)
+            if codecID_ is None:
+                _pcs.pop(payloadType_, None)
+            else:
+                _pcs[payloadType_] = codecID_
+            _XMsgSerDes.__pldCodecs = _pcs
+        return True
+
+    @staticmethod
+    def _IsCompactDump(dump_ : Union[bytes, memoryview]) -> bool:
+        return (len(dump_) >= _XMsgSerDes.__HDR_SIZE) and (dump_[0] == _XMsgSerDes.__MAGIC)
+
+    @staticmethod
+    def _SerializeXMsg(msg_ : _XMsgImpl) -> Union[bytes, None]:
+        if _XMsgSerDes._IsCompactSerDesEnabled():
+            res = _XMsgSerDes.__SerializeCompact(msg_)
+            if res is not None:
+                return res
+        _pld = msg_.payload
+        return SerDes.SerializeObject(msg_, bTreatAsUserError_=True, bOob_=_XMsgSerDes.__IsOobPayload(_pld, _XMsgSerDes._GetPayloadCodec(type(_pld))))
+
+    @staticmethod
+    def _DeserializeXMsg(dump_ : Union[bytes, memoryview]) -> Union[_XMsgImpl, None]:
+        if not _XMsgSerDes._IsCompactDump(dump_):
+            return SerDes.DeserializeData(dump_, bTreatAsUserError_=True)
+
+        try:
+            res = _XMsgSerDes.__DeserializeCompact(dump_)
+        except (_PyStruct.error, KeyError, ValueError, EOFError, TypeError) as _xcp:
+            res  = None
+            _msg = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_SerDes_TID_004).format(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_SerDes_TID_002), _xcp)
+            logif._LogErrorEC(_EFwErrorCode.UE_00269, _msg)
+        return res
+
+    @staticmethod
+    def __SerializeCompact(msg_ : _XMsgImpl) -> Union[bytes, None]:
+        if not (isinstance(msg_, _XMsgImpl) and msg_.isValid):
+            return None
+
+        _fwh = msg_.header._fwHeader
+        _cid, _lid, _sid, _rid = _fwh.clusterID, _fwh.labelID, _fwh.senderID, _fwh.receiverID
+
+        _km = 0
+        _tc = type(_cid)
+        if _tc is _EMessageCluster:
+            _km |= _XMsgSerDes.__bfEnumCluster
+        elif _tc is not int:
+            return None
+        _tc = type(_lid)
+        if _tc is _EMessageLabel:
+            _km |= _XMsgSerDes.__bfEnumLabel
+        elif _tc is not int:
+            return None
+        _tc = type(_sid)
+        if _tc is _EMessagePeer:
+            _km |= _XMsgSerDes.__bfEnumSender
+        elif _tc is not int:
+            return None
+        _tc = type(_rid)
+        if _tc is _EMessagePeer:
+            _km |= _XMsgSerDes.__bfEnumReceiver
+        elif _tc is not int:
+            return None
+
+        _ts = msg_.header._traceStamp
+        if _ts is not None:
+            _km |= _XMsgSerDes.__bfTraceStamp
+        _pr = msg_.header._priority
+        if _pr:
+            _km |= _XMsgSerDes.__bfPriority
+
+        _pld    = msg_.payload
+        _pldID  = _EXMsgPldCodecID.eNone
+        _pldDmp = None
+        if _pld is not None:
+            _pcID  = _XMsgSerDes._GetPayloadCodec(type(_pld))
+            _bOob  = _XMsgSerDes.__IsOobPayload(_pld, _pcID)
+            _pldID = _EXMsgPldCodecID.ePickle
+            if (_pcID == _EXMsgPldCodecID.eFlatDict) and not _bOob:
+                _pldDmp = _XMsgSerDes.__EncodeFlatDict(_pld.payloadContainer)
+                if _pldDmp is not None:
+                    _pldID = _EXMsgPldCodecID.eFlatDict
+            if _pldDmp is None:
+                _pldDmp = SerDes.SerializeObject(_pld, bTreatAsUserError_=True, bOob_=_bOob)
+                if _pldDmp is None:
+                    return None
+
+        try:
+            res = _XMsgSerDes.__HDR.pack( _XMsgSerDes.__MAGIC, _km, _fwh._fwMsgBitMask.value, _fwh.typeID.value, _fwh.channelID.value
+                                        , msg_.uniqueID, _cid, _lid, _sid, _rid, _pldID.value)
+            if _ts is not None:
+                res += _XMsgSerDes.__STAMP.pack(_ts)
+            if _pr:
+                res += _XMsgSerDes.__PRIO.pack(_pr)
+        except _PyStruct.error:
+            return None
+        if _pldDmp is not None:
+            res = _OobDump._Wrap(res + _pldDmp, _pldDmp)
+        return res
+
+    @staticmethod
+    def __DeserializeCompact(dump_ : Union[bytes, memoryview]) -> Union[_XMsgImpl, None]:
+        _, _km, _bm, _tid, _chid, _uid, _cid, _lid, _sid, _rid, _pldID = _XMsgSerDes.__HDR.unpack_from(dump_)
+
+        if _km & _XMsgSerDes.__bfEnumCluster:  _cid = _XMsgSerDes.__MAP_CLUSTER[_cid]
+        if _km & _XMsgSerDes.__bfEnumLabel:    _lid = _XMsgSerDes.__MAP_LABEL[_lid]
+        if _km & _XMsgSerDes.__bfEnumSender:   _sid = _XMsgSerDes.__MAP_PEER[_sid]
+        if _km & _XMsgSerDes.__bfEnumReceiver: _rid = _XMsgSerDes.__MAP_PEER[_rid]
+
+        _ts  = None
+        _off = _XMsgSerDes.__HDR_SIZE
+        if _km & _XMsgSerDes.__bfTraceStamp:
+            _ts   = _XMsgSerDes.__STAMP.unpack_from(dump_, _off)[0]
+            _off += _XMsgSerDes.__STAMP.size
+        _pr = 0
+        if _km & _XMsgSerDes.__bfPriority:
+            _pr   = _XMsgSerDes.__PRIO.unpack_from(dump_, _off)[0]
+            _off += _XMsgSerDes.__PRIO.size
+
+        _pld = None
+        if _pldID != _EXMsgPldCodecID.eNone.value:
+            _pldDmp = memoryview(dump_)[_off:]
+            if _pldID == _EXMsgPldCodecID.eFlatDict.value:
+                _pld = XPayload(containerInitializer_=_PyMarshal.loads(_pldDmp))
+            else:
+                _pld = SerDes.DeserializeData(_pldDmp, bTreatAsUserError_=True, oobBufs_=_OobDump._GetBuffers(dump_))
+                if _pld is None:
+                    return None
+
+        _fwh = _FwMessageHeader._CreateFromFields(_XMsgSerDes.__MAP_TYPE[_tid], _XMsgSerDes.__MAP_CHANNEL[_chid], _cid, _lid, _sid, _rid, _bm)
+        _hdr = _XMsgHeaderImpl(None, None, None, None, fwMHdr_=_fwh)
+        if not _hdr.isValid:
+            _fwh.CleanUp()
+            return None
+        if _ts is not None:
+            _hdr._SetTraceStamp(_ts)
+        if _pr:
+            _hdr._SetPriority(_pr)
+
+        res = _XMsgImpl(_uid, _hdr, payld_=_pld)
+        if not res.isValid:
+            _hdr.CleanUp()
+            res.CleanUp()
+            res = None
+        return res
+
+    @staticmethod
+    def __IsOobPayload(pld_ : IPayload, codecID_ : Union[_EXMsgPldCodecID, None]) -> bool:
+        if codecID_ == _EXMsgPldCodecID.ePickleOob:
+            return pld_ is not None
+        if codecID_ == _EXMsgPldCodecID.ePickle:
+            return False
+        if not isinstance(pld_, XPayload):
+            return False
+        _cont = pld_.payloadContainer
+        return isinstance(_cont, dict) and _OobSerDes._HasOobCandidate(_cont.values())
+
+    @staticmethod
+    def __EncodeFlatDict(cont_ : dict) -> Union[bytes, None]:
+        if not isinstance(cont_, dict):
+            return None
+
+        _fk, _fv = _XMsgSerDes.__FLAT_KEYS, _XMsgSerDes.__FLAT_VALS
+        for _kk, _vv in cont_.items():
+            if (type(_kk) not in _fk) or (type(_vv) not in _fv):
+                return None
+        try:
+            return _PyMarshal.dumps(cont_)
+        except ValueError:
+            return None
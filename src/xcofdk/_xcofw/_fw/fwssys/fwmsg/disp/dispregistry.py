@@ -330,11 +330,13 @@ class _DispatchRegCard(_AbsSlotsObject):
         return res
 
 class _DispatchRegistry(_AbsSlotsObject):
-    __slots__ = [ '__bT' , '__ma' , '__t' ]
+    __slots__ = [ '__bT' , '__ma' , '__t' , '__x' , '__n' ]
 
     def __init__(self, bTaskRegistry_ : bool =False):
         super().__init__()
+        self.__n  = 0
         self.__t  = None
+        self.__x  = None
         self.__bT = bTaskRegistry_
         self.__ma = _Mutex()
 
@@ -388,34 +390,24 @@ class _DispatchRegistry(_AbsSlotsObject):
             if self.__t is None:
                 return None
 
-            _atgt  = None
-            _cbtgt = None
-
-            _lstAgent    = []
-            _lstCallback = []
-            for _vv in self.__t.values():
+            _dictAgt = dict()
+            _dictCB  = dict()
+            for _vv in self.__GetCandidates(msgHdr_):
                 _dt = _vv.dispatchTarget
                 if _dt.isValid and _vv.IsMatchingMsg(msgHdr_):
                     if _dt._isCallbackDispatch:
-                        if _dt not in _lstCallback:
-                            _lstCallback.append(_dt)
-                    elif _dt not in _lstAgent:
-                        _lstAgent.append(_dt)
-            if len(_lstCallback) < 1:
-                res = _lstAgent
-            elif len(_lstAgent) < 1:
-                res = _lstCallback
+                        _dictCB.setdefault((id(_dt._dispatchAgent), id(_dt._dispatchCallback)), _dt)
+                    else:
+                        _dictAgt.setdefault(id(_dt._dispatchAgent), _dt)
+
+            if len(_dictCB) < 1:
+                res = list(_dictAgt.values())
+            elif len(_dictAgt) < 1:
+                res = list(_dictCB.values())
             else:
-                res = []
-                for _atgt in _lstAgent:
-                    _bIgnore = False
-                    for _cbtgt in _lstCallback:
-                        if _atgt._IsSameAgent(_cbtgt, bSkipPreCheck_=True):
-                            _bIgnore = True
-                            break
-                    if not _bIgnore:
-                        res.append(_atgt)
-                res.extend(_lstCallback)
+                _cbAgents = { _kk[0] for _kk in _dictCB.keys() }
+                res = [ _vv for _kk, _vv in _dictAgt.items() if _kk not in _cbAgents ]
+                res.extend(_dictCB.values())
 
             if len(res) < 1:
                 res = None
@@ -432,9 +424,11 @@ class _DispatchRegistry(_AbsSlotsObject):
                 _vv = self.__t[_kk]
                 self.__t[_kk] = None
                 del self.__t[_kk]
+                self.__UnindexRegCard(_kk, _vv)
                 _vv.CleanUp()
             if len(self.__t) < 1:
                 self.__t = None
+                self.__x = None
 
     def _ToString(self):
         if self.__isInvalid:
@@ -451,6 +445,7 @@ class _DispatchRegistry(_AbsSlotsObject):
                     _vv.CleanUp()
                 self.__t.clear()
                 self.__t = None
+                self.__x = None
 
         self.__ma.CleanUp()
         self.__ma = None
@@ -477,6 +472,7 @@ class _DispatchRegistry(_AbsSlotsObject):
 
             if drc_ is not None:
                 self.__t[_hval] = drc_
+                self.__IndexRegCard(_hval, drc_)
                 if _FwSubsysCoding.IsAutoCreateClusterEnabled():
                     _MessageClusterMap.UpdateCluster(drc_.dispatchFilter.clusterID, drc_.dispatchFilter.labelID, bAllowAsListOfLabels_=False, bIgnoreDontCare_=True)
             return True
@@ -491,9 +487,79 @@ class _DispatchRegistry(_AbsSlotsObject):
                 return False
 
             _drc = self.__t.pop(_hval)
+            self.__UnindexRegCard(_hval, _drc)
             if len(self.__t) < 1:
                 self.__t = None
+                self.__x = None
             _drc.CleanUp()
 
             drc_.CleanUp()
             return True
+
+    def __IndexRegCard(self, hval_ : int, drc_ : _DispatchRegCard):
+        if self.__x is None:
+            self.__x = dict()
+
+        _f    = drc_.dispatchFilter
+        _rkey = None if _f.isDontCareReceiver else _f.receiverID
+        _lkey = None if _f.isDontCareLabel    else _f.labelID
+
+        _dr = self.__x.get(_rkey, None)
+        if _dr is None:
+            _dr = dict()
+            self.__x[_rkey] = _dr
+        _dl = _dr.get(_lkey, None)
+        if _dl is None:
+            _dl = dict()
+            _dr[_lkey] = _dl
+
+        self.__n += 1
+        _dl[hval_] = (self.__n, drc_)
+
+    def __UnindexRegCard(self, hval_ : int, drc_ : _DispatchRegCard):
+        if self.__x is None:
+            return
+
+        _f    = drc_.dispatchFilter
+        _rkey = None if _f.isDontCareReceiver else _f.receiverID
+        _lkey = None if _f.isDontCareLabel    else _f.labelID
+
+        _dr = self.__x.get(_rkey, None)
+        if _dr is None:
+            return
+        _dl = _dr.get(_lkey, None)
+        if _dl is None:
+            return
+
+        _dl.pop(hval_, None)
+        if len(_dl) < 1:
+            del _dr[_lkey]
+            if len(_dr) < 1:
+                del self.__x[_rkey]
+
+    def __GetCandidates(self, msgHdr_ : _IFwMessageHeader):
+        if (self.__x is None) or msgHdr_.isBroadcastMsg or msgHdr_.isDontCareReceiver:
+            return self.__t.values()
+
+        _lstBkt  = []
+        _bAnyLbl = msgHdr_.isDontCareLabel
+        for _rkey in (msgHdr_.receiverID, None):
+            _dr = self.__x.get(_rkey, None)
+            if _dr is None:
+                continue
+            if _bAnyLbl:
+                _lstBkt.extend(_dr.values())
+                continue
+            for _lkey in (msgHdr_.labelID, None):
+                _dl = _dr.get(_lkey, None)
+                if _dl is not None:
+                    _lstBkt.append(_dl)
+
+        if len(_lstBkt) < 1:
+            return ()
+        if len(_lstBkt) == 1:
+            return [ _vv[1] for _vv in _lstBkt[0].values() ]
+
+        res = [ _vv for _bb in _lstBkt for _vv in _bb.values() ]
+        res.sort(key=lambda _ee: _ee[0])
+        return [ _vv[1] for _vv in res ]
@@ -0,0 +1,257 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : fwlightqueue.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+from _thread     import allocate_lock as _PyAllocateLock
+from collections import deque         as _PyDeque
+
+from _fw.fwssys.fwcore.logging           import logif
+from _fw.fwssys.fwcore.base.util         import _Util
+from _fw.fwssys.fwcore.ipc.tsk.taskutil  import _TaskUtil
+from _fw.fwssys.fwcore.types.aobject     import _AbsSlotsObject
+from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
+
+from _fw.fwssys.fwerrh.fwerrorcodes import _EFwErrorCode
+
+from _fw.fwtdb.fwtdbengine import _EFwTextID
+from _fw.fwtdb.fwtdbengine import _FwTDbEngine
+
+class _FwLightQueue(_AbsSlotsObject):
+    __slots__ = [ '__q' , '__m' , '__mp' , '__n' , '__nf' , '__nw' , '__bW' , '__bB' , '__bD' , '__bSP' ]
+
+    __BLOCKING_QUEUE_DEFAULT_WAIT_TIMEOUT_MS = 50
+
+    def __init__(self, maxSize_ : int, bBlockingOnSize_ : bool, bSingleProducer_ : bool):
+        super().__init__()
+
+        self.__m  = None
+        self.__n   = None
+        self.__q   = None
+        self.__bB  = None
+        self.__bD  = None
+        self.__bW  = None
+        self.__mp  = None
+        self.__nf  = None
+        self.__nw  = None
+        self.__bSP = None
+
+        if not (_Util.IsInstance(maxSize_, int) and _Util.CheckMinRange(maxSize_, 0)):
+            self.CleanUp()
+            return
+        if maxSize_ == 1:
+            logif._LogBadUseEC(_EFwErrorCode.FE_00454, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwQueue_TID_005))
+            self.CleanUp()
+            return
+
+        self.__m   = maxSize_
+        self.__n   = _PyAllocateLock()
+        self.__q   = _PyDeque()
+        self.__bB  = bBlockingOnSize_
+        self.__bD  = False
+        self.__bW  = False
+        self.__mp  = _PyAllocateLock()
+        self.__nf  = _PyAllocateLock()
+        self.__nw  = 0
+        self.__bSP = bSingleProducer_
+        self.__n.acquire()
+        self.__nf.acquire()
+
+    @staticmethod
+    def CreateInstance(maxSize_ =None, bBlockingOnSize_ =False, bSingleProducer_ =False):
+        if maxSize_ is None:
+            maxSize_ = 0
+        res = _FwLightQueue(maxSize_, bBlockingOnSize_, bSingleProducer_)
+        if res.__q is None:
+            res = None
+        return res
+
+    @property
+    def isFIFO(self):
+        return True
+
+    @property
+    def isEmpty(self):
+        return self.qsize == 0
+
+    @property
+    def isFull(self):
+        _q = self.__q
+        return (_q is not None) and (self.__m != 0) and (len(_q) >= self.__m)
+
+    @property
+    def isSingleProducer(self) -> bool:
+        return (self.__q is not None) and self.__bSP
+
+    @property
+    def isBlockingOnQueueSize(self) -> bool:
+        return self.__bB is True
+
+    @property
+    def isRaisingExceptionOnQueueSize(self) -> bool:
+        return False
+
+    @property
+    def hasInfiniteSize(self):
+        return (self.__m is not None) and self.__m == 0
+
+    @property
+    def hasFiniteSize(self):
+        return (self.__m is not None) and self.__m != 0
+
+    @property
+    def capacity(self):
+        return self.__m
+
+    @property
+    def qsize(self):
+        _q = self.__q
+        return 0 if _q is None else len(_q)
+
+    def Push(self, elem_):
+        res = self.PushNowait(elem_)
+        if res or not self.__bB:
+            return res
+
+        _nf = self.__nf
+        if _nf is None:
+            return False
+
+        _SLICE_SEC = _FwLightQueue.__BLOCKING_QUEUE_DEFAULT_WAIT_TIMEOUT_MS / 1000
+        while not self.__bD:
+            _mp = self.__mp
+            if _mp is None:
+                break
+            with _mp:
+                self.__nw += 1
+            try:
+                if self.isFull:
+                    _nf.acquire(timeout=_SLICE_SEC)
+            finally:
+                with _mp:
+                    self.__nw -= 1
+
+            res = self.PushNowait(elem_)
+            if res:
+                break
+        return res
+
+    def PushNowait(self, elem_):
+        _q = self.__q
+        if (_q is None) or self.__bD:
+            return False
+
+        if self.__m == 0:
+            _q.append(elem_)
+        elif self.__bSP:
+            if len(_q) >= self.__m:
+                return False
+            _q.append(elem_)
+        else:
+            with self.__mp:
+                if len(_q) >= self.__m:
+                    return False
+                _q.append(elem_)
+
+        if self.__bW:
+            self.__Notify()
+        return True
+
+    def PushManyNowait(self, elems_ : list) -> int:
+        _q = self.__q
+        if (_q is None) or self.__bD:
+            return 0
+
+        if (self.__m == 0) or self.__bSP:
+            res = self.__Extend(_q, elems_)
+        else:
+            with self.__mp:
+                res = self.__Extend(_q, elems_)
+
+        if (res > 0) and self.__bW:
+            self.__Notify()
+        return res
+
+    def Pop(self):
+        return self.PopNowait()
+
+    def PopNowait(self):
+        try:
+            res = self.__q.popleft()
+        except (IndexError, AttributeError):
+            return None
+
+        if self.__nw:
+            self.__NotifyNotFull()
+        return res
+
+    def PopBlockingQueue(self, sleepTimeMS_ =None, pendingCB_ =None):
+        res = self.PopNowait()
+        if (res is None) and not self.__bD:
+            if (sleepTimeMS_ is None) or (sleepTimeMS_ <= 0):
+                sleepTimeMS_ = _FwLightQueue.__BLOCKING_QUEUE_DEFAULT_WAIT_TIMEOUT_MS
+
+            _n = self.__n
+            if _n is None:
+                _TaskUtil.SleepMS(sleepTimeMS_)
+                return None
+
+            self.__bW = True
+            if (self.qsize == 0) and ((pendingCB_ is None) or not pendingCB_()):
+                _n.acquire(timeout=sleepTimeMS_/1000)
+            self.__bW = False
+            res = self.PopNowait()
+        return res
+
+    def NotifyBlockingQueue(self):
+        self.__Notify()
+
+    def _CleanUp(self):
+        if self.__q is None:
+            return
+
+        self.__bD = True
+        self.__Notify()
+        self.__NotifyNotFull()
+        self.__q.clear()
+
+        self.__m   = None
+        self.__n   = None
+        self.__q   = None
+        self.__bB  = None
+        self.__bW  = None
+        self.__mp  = None
+        self.__nf  = None
+        self.__bSP = None
+
+    def _ToString(self):
+        return _CommonDefines._STR_EMPTY
+
+    def __Extend(self, q_ : _PyDeque, elems_ : list) -> int:
+        res = len(elems_)
+        if self.__m != 0:
+            res = min(res, self.__m - len(q_))
+        if res < 1:
+            return 0
+        q_.extend(elems_ if res == len(elems_) else elems_[:res])
+        return res
+
+    def __Notify(self):
+        _n = self.__n
+        if _n is not None:
+            try:
+                _n.release()
+            except RuntimeError:
+                pass
+
+    def __NotifyNotFull(self):
+        _nf = self.__nf
+        if _nf is not None:
+            try:
+                _nf.release()
+            except RuntimeError:
+                pass
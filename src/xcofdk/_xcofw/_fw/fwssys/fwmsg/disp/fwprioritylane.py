@@ -0,0 +1,107 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : fwprioritylane.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+from heapq     import heappop  as _PyHeapPop
+from heapq     import heappush as _PyHeapPush
+from itertools import count    as _PyCount
+from threading import Lock     as _PyLock
+from typing    import Union
+
+from xcofdk.fwcom import EXmsgPriority
+
+from _fw.fwssys.fwcore.types.aobject     import _AbsSlotsObject
+from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
+from _fw.fwssys.fwmsg.msg                import _IFwMessage
+
+class _FwPriorityLane(_AbsSlotsObject):
+    __slots__ = [ '__h' , '__l' , '__m' , '__q' , '__lp' , '__sq' ]
+
+    def __init__(self, sharedQueue_, prioLabels_ : Union[dict, None] =None):
+        super().__init__()
+        _m = sharedQueue_.capacity
+        self.__h  = []
+        self.__l  = _PyLock()
+        self.__m  = 0 if not isinstance(_m, int) else max(0, _m)
+        self.__q  = sharedQueue_
+        self.__lp = None if not prioLabels_ else dict(prioLabels_)
+        self.__sq = _PyCount()
+
+    @property
+    def qsize(self) -> int:
+        _h = self.__h
+        return 0 if _h is None else len(_h)
+
+    @property
+    def isFull(self) -> bool:
+        return self.sharedRoom == 0
+
+    @property
+    def sharedRoom(self) -> Union[int, None]:
+        _h, _q = self.__h, self.__q
+        if (_h is None) or (_q is None):
+            return 0
+        if self.__m == 0:
+            return None
+        return max(0, self.__m - len(_h) - _q.qsize)
+
+    def HasPending(self) -> bool:
+        return bool(self.__h)
+
+    def _GetPriority(self, msg_ : _IFwMessage) -> int:
+        if not msg_.isXcoMsg:
+            return EXmsgPriority.Normal.value
+
+        _hdr = msg_.header
+        res  = _hdr._priority
+        if (not res) and (self.__lp is not None):
+            res = self.__lp.get(_hdr.labelID, 0)
+        return int(res)
+
+    def PushNowait(self, prio_ : int, elem_) -> bool:
+        with self.__l:
+            if self.isFull:
+                return False
+            _PyHeapPush(self.__h, (-prio_, next(self.__sq), elem_))
+        return True
+
+    def PushManyNowait(self, elems_ : list) -> int:
+        res = 0
+        with self.__l:
+            _h = self.__h
+            if _h is None:
+                return res
+            _room = self.sharedRoom
+            for _pr, _ee in elems_:
+                if (_room is not None) and (res >= _room):
+                    break
+                _PyHeapPush(_h, (-_pr, next(self.__sq), _ee))
+                res += 1
+        return res
+
+    def PopNowait(self):
+        if not self.__h:
+            return None
+        with self.__l:
+            _h = self.__h
+            return _PyHeapPop(_h)[2] if _h else None
+
+    def _CleanUp(self):
+        if self.__h is None:
+            return
+
+        with self.__l:
+            _lst, self.__h = self.__h, None
+        for _ee in _lst:
+            _ee[2].CleanUp()
+
+        self.__q  = None
+        self.__lp = None
+
+    def _ToString(self):
+        return _CommonDefines._STR_EMPTY
@@ -10,6 +10,8 @@
 from collections import deque as _PyDeque
 from enum        import IntFlag
 from enum        import unique
+from threading   import Condition as _PyCondition
+from threading   import Lock      as _PyLock
 
 from _fw.fwssys.fwcore.logging            import logif
 from _fw.fwssys.fwcore.logging            import vlogif
@@ -94,7 +96,7 @@ class _FwQueue(_AbsSlotsObject):
         def __init__(self):
             pass
 
-    __slots__ = [ '__q' , '__ma' , '__md' , '__mp' , '__ms' , '__s' , '__m' , '__bF' ]
+    __slots__ = [ '__q' , '__ma' , '__md' , '__mp' , '__ms' , '__s' , '__m' , '__bF' , '__cv' , '__nw' ]
 
     __theInvalidQEntry                       = __InvalidQueueEntry()
     __BLOCKING_QUEUE_DEFAULT_WAIT_TIMEOUT_MS = 50
@@ -106,10 +108,12 @@ class _FwQueue(_AbsSlotsObject):
         self.__q  = None
         self.__s  = None
         self.__bF = None
+        self.__cv = None
         self.__ma = None
         self.__md = None
         self.__mp = None
         self.__ms = None
+        self.__nw = 0
 
         _optMask = _FwQueue.EQOption.eNone
         if optFlags_ is not None:
@@ -155,6 +159,7 @@ class _FwQueue(_AbsSlotsObject):
 
         if _FwQueue.EQOption.IsQOptionFlagSet(self.__mp, _FwQueue.EQOption.eBlockOnQueueSize):
             _FwQueue.EQState.AddQState(self.__ms, _FwQueue.EQState.eEmpty)
+            self.__cv = _PyCondition(_PyLock())
         self.__s = _BinarySemaphore()
 
     @staticmethod
@@ -224,15 +229,20 @@ class _FwQueue(_AbsSlotsObject):
             return len(self.__q)
 
     def Push(self, elem_):
-        return self.__Push(elem_, True)
+        return self.__NotifyOnPush(self.__Push(elem_, True))
 
     def PushWait(self, elem_, timeout_):
         if not _Timeout.IsFiniteTimeout(timeout_):
             return False
-        return self.__Push(elem_, True, timeout_=timeout_)
+        return self.__NotifyOnPush(self.__Push(elem_, True, timeout_=timeout_))
 
     def PushNowait(self, elem_):
-        return self.__Push(elem_, False)
+        return self.__NotifyOnPush(self.__Push(elem_, False))
+
+    def PushManyNowait(self, elems_ : list) -> int:
+        res = self.__PushMany(elems_)
+        self.__NotifyOnPush(res > 0)
+        return res
 
     def Pop(self):
         return self.__Pop(True)
@@ -245,7 +255,7 @@ class _FwQueue(_AbsSlotsObject):
     def PopNowait(self):
         return self.__Pop(False)
 
-    def PopBlockingQueue(self, sleepTimeMS_ =None):
+    def PopBlockingQueue(self, sleepTimeMS_ =None, pendingCB_ =None):
         if not self.isBlockingOnQueueSize:
             vlogif._LogOEC(True, _EFwErrorCode.VFE_00529)
             return None
@@ -253,13 +263,21 @@ class _FwQueue(_AbsSlotsObject):
         if res is None:
             if (sleepTimeMS_ is None) or (sleepTimeMS_ <= 0):
                 sleepTimeMS_ = _FwQueue.__BLOCKING_QUEUE_DEFAULT_WAIT_TIMEOUT_MS
-            _TaskUtil.SleepMS(sleepTimeMS_)
+            if self.__WaitForPush(sleepTimeMS_, pendingCB_):
+                res = self.__Pop(False)
         return res
 
+    def NotifyBlockingQueue(self):
+        _cv = self.__cv
+        if _cv is not None:
+            with _cv:
+                _cv.notify_all()
+
     def _CleanUp(self):
         if self.__ms is None:
             return
         self.__PrepareCleanup()
+        self.NotifyBlockingQueue()
 
         if self.__s is not None:
             self.__s.CleanUp()
@@ -271,6 +289,7 @@ class _FwQueue(_AbsSlotsObject):
         self.__q  = None
         self.__s  = None
         self.__bF = None
+        self.__cv = None
         self.__ma = None
         self.__md = None
         self.__mp = None
@@ -279,6 +298,36 @@ class _FwQueue(_AbsSlotsObject):
     def _ToString(self):
         return _CommonDefines._STR_EMPTY
 
+    def __NotifyOnPush(self, bPushed_ : bool) -> bool:
+        _cv = self.__cv
+        if bPushed_ and (_cv is not None):
+            with _cv:
+                if self.__nw > 0:
+                    _cv.notify()
+        return bPushed_
+
+    def __WaitForPush(self, timeoutMS_ : int, pendingCB_ =None) -> bool:
+        _cv = self.__cv
+        if _cv is None:
+            _TaskUtil.SleepMS(timeoutMS_)
+            return False
+
+        with _cv:
+            _q = self.__q
+            if _q is None:
+                return False
+            if len(_q) > 0:
+                return True
+            if (pendingCB_ is not None) and pendingCB_():
+                return False
+
+            self.__nw += 1
+            try:
+                res = _cv.wait(timeoutMS_ / 1000)
+            finally:
+                self.__nw -= 1
+        return res and (self.__q is not None)
+
     def __Push(self, elem_, bBlock_ : bool, timeout_ =None):
         if bBlock_:
             if timeout_ is not None:
@@ -369,6 +418,42 @@ class _FwQueue(_AbsSlotsObject):
         self.__md.Give()
         return True
 
+    def __PushMany(self, elems_ : list) -> int:
+        if not self.__ma.TakeNowait():
+            return 0
+
+        self.__md.Take()
+        self.__ma.Give()
+
+        if _FwQueue.EQState.IsBlockingDtorState(self.__ms) or _FwQueue.EQState.IsBlockingFullState(self.__ms):
+            self.__md.Give()
+            return 0
+
+        res = len(elems_)
+        if self.__m != 0:
+            res = min(res, self.__m - len(self.__q))
+
+        if res < 1:
+            self.__md.Give()
+            if self.isRaisingExceptionOnQueueSize:
+                raise ValueError(_FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwQueue_TID_003).format(self.ToString()))
+            return 0
+
+        _lst = elems_ if res == len(elems_) else elems_[:res]
+        if self.isFIFO:
+            self.__q.extend(_lst)
+        else:
+            self.__q.extendleft(_lst)
+
+        if _FwQueue.EQState.IsBlockingEmptyState(self.__ms):
+            _FwQueue.EQState.RemoveQState(self.__ms, _FwQueue.EQState.eEmpty)
+            self.__s.Give()
+        elif self.isFull and self.isBlockingOnQueueSize:
+            _FwQueue.EQState.AddQState(self.__ms, _FwQueue.EQState.eFull)
+
+        self.__md.Give()
+        return res
+
     def __Pop(self, bBlock_ : bool, timeout_ =None):
         if bBlock_:
             if timeout_ is not None:
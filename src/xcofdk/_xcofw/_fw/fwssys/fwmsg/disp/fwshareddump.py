@@ -0,0 +1,88 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : fwshareddump.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+from threading import Lock as _PyLock
+
+from _fw.fwssys.fwcore.types.aobject     import _AbsSlotsObject
+from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
+
+class _FwSharedDump(_AbsSlotsObject):
+    __slots__ = [ '__dm' , '__mv' , '__dp' , '__mc' , '__l' ]
+
+    def __init__(self, msgDump_ : bytes, pldDump_ =None):
+        super().__init__()
+        self.__l  = _PyLock()
+        self.__dm = msgDump_
+        self.__dp = pldDump_
+        self.__mc = dict()
+        self.__mv = memoryview(msgDump_).toreadonly()
+
+    @property
+    def _msgDump(self) -> memoryview:
+        return self.__mv
+
+    @property
+    def _pldDump(self):
+        return self.__dp
+
+    @property
+    def _numReceivers(self) -> int:
+        with self.__l:
+            return 0 if self.__mc is None else len(self.__mc)
+
+    def _AddRef(self, rcvKey_):
+        with self.__l:
+            if self.__mc is None:
+                return False
+
+            _ce = self.__mc.get(rcvKey_, None)
+            if _ce is None:
+                self.__mc[rcvKey_] = [None, 1]
+            else:
+                _ce[1] += 1
+            return True
+
+    def _GetMessage(self, rcvKey_, desFunc_, bXMsg_: bool, msgUID_: int, bCustomPL_ =None, customDesCB_ =None):
+        with self.__l:
+            _ce = None if self.__mc is None else self.__mc.get(rcvKey_, None)
+            if _ce is None:
+                return None
+            if _ce[0] is not None:
+                return _ce[0]
+
+        _msg = desFunc_(bXMsg_, msgUID_, self.__mv, pldDump_=self.__dp, bCustomPL_=bCustomPL_, customDesCB_=customDesCB_)
+        if _msg is None:
+            return None
+
+        with self.__l:
+            if _ce[0] is None:
+                _ce[0] = _msg
+            return _ce[0]
+
+    def _ReleaseRef(self, rcvKey_):
+        with self.__l:
+            _ce = None if self.__mc is None else self.__mc.get(rcvKey_, None)
+            if _ce is None:
+                return None
+
+            _ce[1] -= 1
+            if _ce[1] > 0:
+                return None
+            self.__mc.pop(rcvKey_)
+            return _ce[0]
+
+    def _ToString(self):
+        return _CommonDefines._STR_EMPTY
+
+    def _CleanUp(self):
+        with self.__l:
+            if self.__mc is None:
+                return
+            self.__mc.clear()
+            self.__mc = None
@@ -0,0 +1,107 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : msgtracer.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+from bisect    import bisect_right as _PyBisectRight
+from threading import Lock         as _PyLock
+from time      import monotonic_ns as _PyMonotonicNS
+from typing    import List
+
+from xcofdk.fwcom import MessageLatency
+from xcofdk.fwcom import MessageTrace
+
+from _fw.fwssys.assys                     import fwsubsysshare as _ssshare
+from _fw.fwssys.fwcore.logging            import logif
+from _fw.fwssys.fwcore.ipc.rbl.rblmetrics import _RblMetrics
+from _fw.fwssys.fwmsg.msg                 import _IFwMessage
+from _fw.fwssys.fwerrh.fwerrorcodes       import _EFwErrorCode
+
+from _fw.fwtdb.fwtdbengine import _EFwTextID
+from _fw.fwtdb.fwtdbengine import _FwTDbEngine
+
+class _MsgTracer:
+    __slots__ = []
+
+    __lck   = _PyLock()
+    __stats = dict()
+    __bSkF  = False
+
+    __NS_PER_MS   = 1000000
+    __NUM_BUCKETS = len(_RblMetrics._HIST_BOUNDS_NS) + 1
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def _IsEnabled() -> bool:
+        return _ssshare._IsMsgLatencyTracingEnabled()
+
+    @staticmethod
+    def _Now() -> int:
+        return _PyMonotonicNS()
+
+    @staticmethod
+    def _Record(msg_ : _IFwMessage, rcvID_ : int, enqNS_ : int, deqNS_ : int, handedNS_ : int, doneNS_ : int):
+        if (enqNS_ is None) or not msg_.isXcoMsg:
+            return
+
+        _hdr = msg_.header
+        _crt = _hdr._traceStamp
+        if _crt is None:
+            return
+
+        _dD = max(0, enqNS_ - _crt)
+        _dQ = max(0, handedNS_ - enqNS_)
+        _dH = max(0, doneNS_ - handedNS_)
+        _dT = max(0, doneNS_ - _crt)
+
+        _sid, _lid = _hdr.senderID, _hdr.labelID
+        _bb, _key  = _RblMetrics._HIST_BOUNDS_NS, (_sid, rcvID_, _lid)
+
+        with _MsgTracer.__lck:
+            _ee = _MsgTracer.__stats.get(_key, None)
+            if _ee is None:
+                _nb = _MsgTracer.__NUM_BUCKETS
+                _ee = _MsgTracer.__stats[_key] = [ 0, 0, 0, 0, 0, 0, [0]*_nb, [0]*_nb, [0]*_nb, [0]*_nb ]
+
+            _ee[0] += 1
+            _ee[1] += _dD
+            _ee[2] += _dQ
+            _ee[3] += _dH
+            _ee[4] += _dT
+            if _dT > _ee[5]:
+                _ee[5] = _dT
+            _ee[6][_PyBisectRight(_bb, _dD)] += 1
+            _ee[7][_PyBisectRight(_bb, _dQ)] += 1
+            _ee[8][_PyBisectRight(_bb, _dH)] += 1
+            _ee[9][_PyBisectRight(_bb, _dT)] += 1
+
+        if _MsgTracer.__bSkF:
+            return
+        _sink = _ssshare._GetMsgTraceSink()
+        if _sink is None:
+            return
+
+        try:
+            _sink(MessageTrace(msg_.uniqueID, _sid, rcvID_, _hdr.clusterID, _lid, _crt, enqNS_, deqNS_, handedNS_, doneNS_))
+        except Exception as _xcp:
+            _MsgTracer.__bSkF = True
+            logif._LogErrorEC(_EFwErrorCode.UE_00286, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XcoMsgTracer_TID_001).format(msg_.uniqueID, _xcp))
+
+    @staticmethod
+    def _GetLatencies() -> List[MessageLatency]:
+        _ns = _MsgTracer.__NS_PER_MS
+
+        res = []
+        with _MsgTracer.__lck:
+            for (_sid, _rid, _lid), _ee in _MsgTracer.__stats.items():
+                _nn = _ee[0] * _ns
+                res.append(MessageLatency( _sid, _rid, _lid, _ee[0]
+                                         , _ee[1] / _nn, _ee[2] / _nn, _ee[3] / _nn, _ee[4] / _nn, _ee[5] / _ns
+                                         , tuple(_ee[6]), tuple(_ee[7]), tuple(_ee[8]), tuple(_ee[9])))
+        return res
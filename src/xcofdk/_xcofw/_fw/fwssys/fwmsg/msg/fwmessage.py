@@ -7,6 +7,8 @@
 # This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
 # ------------------------------------------------------------------------------
 
+from typing import Union
+
 from xcofdk.fwapi import IPayload
 
 from _fw.fwssys.assys                    import fwsubsysshare as _ssshare
@@ -77,8 +79,8 @@ class _FwMessage(_IFwMessage):
         return SerDes.SerializeObject(msgObj_)
 
     @staticmethod
-    def DeserializeFwMsg(bytes_ : bytes):
-        if not isinstance(bytes_, bytes):
+    def DeserializeFwMsg(bytes_ : Union[bytes, memoryview]):
+        if not isinstance(bytes_, (bytes, memoryview)):
             vlogif._LogOEC(True, _EFwErrorCode.VFE_00534)
             return None
 
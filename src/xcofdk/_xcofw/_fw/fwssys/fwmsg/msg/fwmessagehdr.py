@@ -313,6 +313,22 @@ class _FwMessageHeader(_IFwMessageHeader):
     def receiverID(self) -> _EMessagePeer:
         return self.__r
 
+    @property
+    def _fwMsgBitMask(self) -> _FwIntFlag:
+        return self.__bm
+
+    @staticmethod
+    def _CreateFromFields( typeID_       : _EMessageType
+                         , channelID_    : _EMessageChannel
+                         , clusterID_    : Union[_EMessageCluster, int]
+                         , labelID_      : Union[_EMessageLabel, int]
+                         , senderID_     : Union[_EMessagePeer, int]
+                         , receiverID_   : Union[_EMessagePeer, int]
+                         , fwMsgBitMask_ : int):
+        res = _FwMessageHeader(typeID_, channelID_, clusterID_, labelID_, senderID_, receiverID_, bSkipCheck_=True)
+        res.__bm = _FwMessageHeader._EFwMsgFlag(fwMsgBitMask_)
+        return res
+
     def Clone(self):
         if not self.isValid:
             return None
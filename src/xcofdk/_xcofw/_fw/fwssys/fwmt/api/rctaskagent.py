@@ -7,12 +7,14 @@
 # ------------------------------------------------------------------------------
 
 from typing import Any   as _PyAny
+from typing import List
 from typing import Union
 from enum   import IntEnum
 
 from xcofdk.fwcom              import CompoundTUID
 from xcofdk.fwcom              import EExecutionCmdID
 from xcofdk.fwcom              import EXmsgPredefinedID
+from xcofdk.fwcom              import EXmsgPriority
 from xcofdk.fwapi              import IMessage
 from xcofdk.fwapi              import ITaskError
 from xcofdk.fwapi              import IPayload
@@ -22,16 +24,17 @@ from xcofdk.fwapi.xmt          import XTask
 from xcofdk.fwapi.xmt          import XMainTask
 from xcofdk.fwapi.xmsg.xmsgmgr import XMessenger as _XMsgMgr
 
-from _fw.fwssys.assys                    import fwsubsysshare as _ssshare
-from _fw.fwssys.fwcore.logging           import vlogif
-from _fw.fwssys.fwcore.logging           import logif
-from _fw.fwssys.fwmt.xcbcase             import _XCbCase
-from _fw.fwssys.fwmt.xtaskprfext         import _XTaskPrfExt
-from _fw.fwssys.fwcore.types.commontypes import override
-from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
-from _fw.fwssys.fwerrh.fwerrorcodes      import _EFwErrorCode
-from _fw.fwssys.fwmt.utask.usertaskdefs  import _UTaskMirror
-from _fwa.fwsubsyscoding                 import _FwSubsysCoding
+from _fw.fwssys.assys                     import fwsubsysshare as _ssshare
+from _fw.fwssys.fwcore.logging            import vlogif
+from _fw.fwssys.fwcore.logging            import logif
+from _fw.fwssys.fwmt.xcbcase              import _XCbCase
+from _fw.fwssys.fwmt.xtaskprfext          import _XTaskPrfExt
+from _fw.fwssys.fwcore.types.commontypes  import override
+from _fw.fwssys.fwcore.types.commontypes  import _CommonDefines
+from _fw.fwssys.fwerrh.fwerrorcodes       import _EFwErrorCode
+from _fw.fwssys.fwmsg.apiimpl.xmsgmgrimpl import _XMsgMgrImpl
+from _fw.fwssys.fwmt.utask.usertaskdefs   import _UTaskMirror
+from _fwa.fwsubsyscoding                  import _FwSubsysCoding
 
 from _fw.fwtdb.fwtdbengine import _EFwTextID
 from _fw.fwtdb.fwtdbengine import _FwTDbEngine
@@ -205,20 +208,28 @@ class _RCTAgentBase:
                   , rxTask_        : Union[IRCCommTask, XTask, IntEnum, int]
                   , msgLabelID_    : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
                   , msgClusterID_  : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                  , msgPayload_    : Union[IPayload, dict] =None) -> int:
+                  , msgPayload_    : Union[IPayload, dict] =None
+                  , msgPriority_   : EXmsgPriority         =None) -> int:
         if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
             return 0
         if isinstance(rxTask_, IRCCommTask):
             rxTask_ = rxTask_.taskUID
-        return 0 if self.__isInvalid else _XMsgMgr.SendMessage(rxTask_, msgLabelID_=msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_)
+        return 0 if self.__isInvalid else _XMsgMgr.SendMessage(rxTask_, msgLabelID_=msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_, msgPriority_=msgPriority_)
 
     def _RcBroadcastMsg( self
                        , msgLabelID_   : Union[IntEnum, int]
                        , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                       , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                       , msgPayload_   : Union[IPayload, dict] =None
+                       , msgPriority_  : EXmsgPriority         =None) -> int:
         if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
             return 0
-        return 0 if self.__isInvalid else _XMsgMgr.BroadcastMessage(msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_)
+        return 0 if self.__isInvalid else _XMsgMgr.BroadcastMessage(msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_, msgPriority_=msgPriority_)
+
+    def _RcSendMsgs(self, msgs_ : List[tuple]) -> List[int]:
+        return _XMsgMgrImpl._GetFailedBatchResult(msgs_) if self.__isInvalid else _XMsgMgr.SendMessages(msgs_)
+
+    def _RcBroadcastMsgs(self, msgs_ : List[tuple]) -> List[int]:
+        return _XMsgMgrImpl._GetFailedBatchResult(msgs_) if self.__isInvalid else _XMsgMgr.BroadcastMessages(msgs_)
 
     def _RcTriggerExtQProc(self) -> int:
         if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
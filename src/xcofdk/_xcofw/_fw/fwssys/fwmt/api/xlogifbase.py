@@ -8,24 +8,64 @@
 # ------------------------------------------------------------------------------
 
 from _fw.fwssys.fwcore.logging            import logif
+from _fw.fwssys.fwcore.logging.logdefines import _ELogType
 from _fw.fwssys.fwcore.logging.logdefines import _LogUtil
 
+_XLOG_LEVEL_TYPES = { 'trace'   : _ELogType.XTRC
+                    , 'debug'   : _ELogType.XDBG
+                    , 'info'    : _ELogType.XINF
+                    , 'warning' : _ELogType.XWNG
+                    , 'error'   : _ELogType.XERR
+                    }
+
 def _XIsDieModeEnabled():
     return logif._IsUserDieModeEnabled()
 
 def _XIsExceptionModeEnabled():
     return logif._IsUserExceptionModeEnabled()
 
-def _XLogTrace(msg_):
+def _XIsTraceEnabled():
+    return logif._IsLogLevelEnabled(_ELogType.XTRC)
+
+def _XIsDebugEnabled():
+    return logif._IsLogLevelEnabled(_ELogType.XDBG)
+
+def _XIsInfoEnabled():
+    return logif._IsLogLevelEnabled(_ELogType.XINF)
+
+def _XIsLogLevelEnabled(logLevel_ : str):
+    if not isinstance(logLevel_, str):
+        return False
+
+    _lt = _XLOG_LEVEL_TYPES.get(logLevel_, None)
+    return False if _lt is None else logif._IsLogLevelEnabled(_lt)
+
+def _XLogTrace(msg_, fmtArgs_ : tuple =None):
+    if fmtArgs_:
+        if not logif._IsLogLevelEnabled(_ELogType.XTRC):
+            return
+        msg_ = _XFormatMsg(msg_, fmtArgs_)
     logif._XLogTrace(msg_)
 
-def _XLogDebug(msg_):
+def _XLogDebug(msg_, fmtArgs_ : tuple =None):
+    if fmtArgs_:
+        if not logif._IsLogLevelEnabled(_ELogType.XDBG):
+            return
+        msg_ = _XFormatMsg(msg_, fmtArgs_)
     logif._XLogDebug(msg_)
 
-def _XLogInfo(msg_):
+def _XLogInfo(msg_, fmtArgs_ : tuple =None):
+    if fmtArgs_:
+        if not logif._IsLogLevelEnabled(_ELogType.XINF):
+            return
+        msg_ = _XFormatMsg(msg_, fmtArgs_)
     logif._XLogInfo(msg_, bAC_=True)
 
-def _XLogWarning(msg_):
+def _XLogWarning(msg_, fmtArgs_ : tuple =None):
+    if fmtArgs_:
+        if not logif._IsLogLevelEnabled(_ELogType.XWNG):
+            return
+        msg_ = _XFormatMsg(msg_, fmtArgs_)
     logif._XLogWarning(msg_, bAC_=True)
 
 def _XLogError(msg_):
@@ -65,3 +105,6 @@ def _XSetFatalError(msg_):
     logif._SetXFatalErrorEC(None, msg_)
 def _XSetFatalErrorEC(msg_, errCode_ =None):
     logif._SetXFatalErrorEC(errCode_, msg_)
+
+def _XFormatMsg(msg_, fmtArgs_ : tuple):
+    return msg_.format(*fmtArgs_) if isinstance(msg_, str) else msg_
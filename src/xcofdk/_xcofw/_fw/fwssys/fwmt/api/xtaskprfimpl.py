@@ -9,6 +9,7 @@
 
 from typing import Union
 
+from xcofdk.fwcom     import ERunPhaseSchedulingPolicy
 from xcofdk.fwapi.xmt import ITaskProfile
 
 from _fw.fwssys.fwmt.xtaskprfbase        import _XTaskPrfBase
@@ -107,6 +108,42 @@ class _XTaskPrfImpl(ITaskProfile):
         if self.__isValid:
             self.__b._isExternalQueueBlocking = bool(bBlockingExtQueue_)
 
+    @property
+    def isExternalQueueLockLight(self) -> bool:
+        return False if self.__isInvalid else self.__b._isExternalQueueLockLight
+
+    @isExternalQueueLockLight.setter
+    def isExternalQueueLockLight(self, bLockLightExtQueue_ : bool):
+        if self.__isValid:
+            self.__b._isExternalQueueLockLight = bool(bLockLightExtQueue_)
+
+    @property
+    def isExternalQueueSingleProducer(self) -> bool:
+        return False if self.__isInvalid else self.__b._isExternalQueueSingleProducer
+
+    @isExternalQueueSingleProducer.setter
+    def isExternalQueueSingleProducer(self, bSPExtQueue_ : bool):
+        if self.__isValid:
+            self.__b._isExternalQueueSingleProducer = bool(bSPExtQueue_)
+
+    @property
+    def isExternalQueueFastDelivery(self) -> bool:
+        return False if self.__isInvalid else self.__b._isExternalQueueFastDelivery
+
+    @isExternalQueueFastDelivery.setter
+    def isExternalQueueFastDelivery(self, bFDExtQueue_ : bool):
+        if self.__isValid:
+            self.__b._isExternalQueueFastDelivery = bool(bFDExtQueue_)
+
+    @property
+    def externalQueuePriorityLabels(self) -> Union[dict, None]:
+        return None if self.__isInvalid else self.__b._externalQueuePriorityLabels
+
+    @externalQueuePriorityLabels.setter
+    def externalQueuePriorityLabels(self, prioLabels_ : Union[dict, None]):
+        if self.__isValid:
+            self.__b._externalQueuePriorityLabels = prioLabels_
+
     @staticmethod
     def GetDefaultRunPhaseFrequencyMS() -> int:
         return _XTaskPrfBase._GetDefaultRunPhaseFreqMS()
@@ -141,6 +178,15 @@ class _XTaskPrfImpl(ITaskProfile):
         if self.__isValid:
             self.__b._runPhaseMaxProcessingTimeMS = runPhaseMaxProcTimeMS_
 
+    @property
+    def runPhaseSchedulingPolicy(self) -> ERunPhaseSchedulingPolicy:
+        return ERunPhaseSchedulingPolicy.FIXED_DELAY if self.__isInvalid else self.__b._runPhaseSchedulingPolicy
+
+    @runPhaseSchedulingPolicy.setter
+    def runPhaseSchedulingPolicy(self, schedPolicy_ : ERunPhaseSchedulingPolicy):
+        if self.__isValid:
+            self.__b._runPhaseSchedulingPolicy = schedPolicy_
+
     @override
     def ToString(self) -> str:
         return None if self.__isInvalid else self.__b._ToString()
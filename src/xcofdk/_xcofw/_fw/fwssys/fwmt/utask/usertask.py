@@ -406,6 +406,32 @@ class _UserTask(_IUserTask):
                 res = None
         return res
 
+    @staticmethod
+    def _SendXMsgs(tx_ : IXTask, xmsgs_ : list) -> Union[list, None]:
+        if tx_ is None:
+            return [False] * len(xmsgs_)
+        for _mm in xmsgs_:
+            if not (isinstance(_mm, _XMsgImpl) and _mm.isValid):
+                return [False] * len(xmsgs_)
+
+        if tx_.isDetachedFromFW:
+            return None
+
+        _tsk = _TaskMgr().GetTask(tx_.taskUID)
+        _utc = None if (_tsk is None) or not _tsk.isRunning else _tsk._utConn
+
+        if _utc is None:
+            return None
+
+        res = _utc._SendXMsgs(xmsgs_)
+        if not all(res):
+            _bLRTE = False
+            _bLRTE = _bLRTE or not _FwApiConnectorAP._APIsLcErrorFree()
+            _bLRTE = _bLRTE or _FwApiConnectorAP._APIsLcShutdownEnabled()
+            if _bLRTE:
+                res = [ _bb or None for _bb in res ]
+        return res
+
     def _CPrf(self, enclHThrd_ : _PyThread =None, profileAttrs_ : dict =None):
         _utc = self.__utConn
         return None if _utc is None else _utc._CPrf(enclHThrd_=enclHThrd_, profileAttrs_=profileAttrs_)
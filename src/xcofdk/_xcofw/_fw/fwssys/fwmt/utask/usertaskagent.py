@@ -9,10 +9,12 @@
 
 from enum   import IntEnum
 from typing import Any
+from typing import List
 from typing import Union
 
 from xcofdk.fwcom     import CompoundTUID
 from xcofdk.fwcom     import EXmsgPredefinedID
+from xcofdk.fwcom     import EXmsgPriority
 from xcofdk.fwapi     import ITaskError
 from xcofdk.fwapi     import IPayload
 from xcofdk.fwapi     import ITask
@@ -178,15 +180,25 @@ class _UserTaskAgent(_IUTAgent):
                    , rxTask_       : Union[ITask, IntEnum, int]
                    , msgLabelID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
                    , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                   , msgPayload_   : Union[IPayload, dict] =None) -> int:
-        return 0 if self.__isInvalid else _XMsgMgrImpl._SendXMsg(rxTask_, lblID_=msgLabelID_, clrID_=msgClusterID_, payload_=msgPayload_)
+                   , msgPayload_   : Union[IPayload, dict] =None
+                   , msgPriority_  : EXmsgPriority         =None) -> int:
+        return 0 if self.__isInvalid else _XMsgMgrImpl._SendXMsg(rxTask_, lblID_=msgLabelID_, clrID_=msgClusterID_, payload_=msgPayload_, prio_=msgPriority_)
 
     @override
     def BroadcastMessage( self
                         , msgLabelID_   : Union[IntEnum, int]
                         , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                        , msgPayload_   : Union[IPayload, dict] =None) -> int:
-        return 0 if self.__isInvalid else _XMsgMgrImpl._BroadcastXMsg(msgLabelID_, clrID_=msgClusterID_, payload_=msgPayload_)
+                        , msgPayload_   : Union[IPayload, dict] =None
+                        , msgPriority_  : EXmsgPriority         =None) -> int:
+        return 0 if self.__isInvalid else _XMsgMgrImpl._BroadcastXMsg(msgLabelID_, clrID_=msgClusterID_, payload_=msgPayload_, prio_=msgPriority_)
+
+    @override
+    def SendMessages(self, msgs_ : List[tuple]) -> List[int]:
+        return _XMsgMgrImpl._GetFailedBatchResult(msgs_) if self.__isInvalid else _XMsgMgrImpl._SendXMsgs(msgs_)
+
+    @override
+    def BroadcastMessages(self, msgs_ : List[tuple]) -> List[int]:
+        return _XMsgMgrImpl._GetFailedBatchResult(msgs_) if self.__isInvalid else _XMsgMgrImpl._BroadcastXMsgs(msgs_)
 
     @override
     def TriggerExternalQueueProcessing(self) -> int:
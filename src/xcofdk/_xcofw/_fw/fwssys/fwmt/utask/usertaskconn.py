@@ -670,32 +670,30 @@ class _UserTaskConn(_LcProxyClient, _IUTaskConn):
         if not self._PcIsLcProxyModeNormal():
             return False
 
-        _midPart = self.__GetFormattedUTLabel()
-
         if self.__isFwTaskDisconnected:
-            logif._LogErrorEC(_EFwErrorCode.UE_00178, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_UserTaskConn_TID_030).format(_midPart))
+            logif._LogErrorEC(_EFwErrorCode.UE_00178, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_UserTaskConn_TID_030).format(self.__GetFormattedUTLabel()))
             return False
 
-        _msgOp = None
-        with self.__md:
-            _xdata = self.__xd
-            if _xdata is None:
-                vlogif._LogOEC(True, _EFwErrorCode.VFE_00024)
-                return False
-            if (_xdata.utaskXState is None) or _xdata.utaskXState.isUtAborting:
-                return False
+        _msgOp = self.__GetMsgOperator(xmsg_.isInternalMsg)
+        if _msgOp is None:
+            return False
+        return _msgOp._SendMessage(xmsg_)
 
-            _bMsgXT = _xdata.isMsgXTask
-            if not _bMsgXT:
-                if xmsg_.isInternalMsg:
-                    vlogif._LogOEC(True, _EFwErrorCode.VFE_00942)
-                    return False
-                if _FwSubsysCoding.IsSenderExternalQueueSupportMandatory():
-                    vlogif._LogOEC(True, _EFwErrorCode.VFE_00943)
-                    return False
-            _msgOp = _xdata._msgOperator
+    def _SendXMsgs(self, xmsgs_: list) -> list:
+        res = [False] * len(xmsgs_)
+        if self.__isUtDisconnected:
+            return res
+        if not self._PcIsLcProxyModeNormal():
+            return res
 
-        return _msgOp._SendMessage(xmsg_)
+        if self.__isFwTaskDisconnected:
+            logif._LogErrorEC(_EFwErrorCode.UE_00178, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_UserTaskConn_TID_030).format(self.__GetFormattedUTLabel()))
+            return res
+
+        _msgOp = self.__GetMsgOperator(False)
+        if _msgOp is None:
+            return res
+        return _msgOp._SendMessages(xmsgs_)
 
     def _TriggerQueueProcessing(self, bExtQueue_ : bool) -> int:
         if self.__isUtDisconnected:
@@ -875,6 +873,25 @@ class _UserTaskConn(_LcProxyClient, _IUTaskConn):
             res += f'[{_xtname}] '
         return res
 
+    def __GetMsgOperator(self, bInternalMsg_ : bool):
+        with self.__md:
+            _xdata = self.__xd
+            if _xdata is None:
+                vlogif._LogOEC(True, _EFwErrorCode.VFE_00024)
+                return None
+            if (_xdata.utaskXState is None) or _xdata.utaskXState.isUtAborting:
+                return None
+
+            _bMsgXT = _xdata.isMsgXTask
+            if not _bMsgXT:
+                if bInternalMsg_:
+                    vlogif._LogOEC(True, _EFwErrorCode.VFE_00942)
+                    return None
+                if _FwSubsysCoding.IsSenderExternalQueueSupportMandatory():
+                    vlogif._LogOEC(True, _EFwErrorCode.VFE_00943)
+                    return None
+            return _xdata._msgOperator
+
     def __GetFormattedUTLabel(self) -> str:
         if self.__isInvalid:
             return _CommonDefines._STR_EMPTY
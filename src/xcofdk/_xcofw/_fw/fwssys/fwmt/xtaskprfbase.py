@@ -11,6 +11,8 @@ from enum   import unique
 from enum   import IntFlag
 from typing import Union
 
+from xcofdk.fwcom     import ERunPhaseSchedulingPolicy
+from xcofdk.fwcom     import EXmsgPriority
 from xcofdk.fwapi.xmt import ITaskProfile
 
 from _fw.fwssys.assys                    import fwsubsysshare as _ssshare
@@ -37,6 +39,9 @@ class _XTaskPrfBase:
         bfPrivileged       = (0x0001 <<  8)
         bfTeardownPhase    = (0x0001 <<  9)
         bfBlockingExtQueue = (0x0001 << 10)
+        bfLightExtQueue    = (0x0001 << 11)
+        bfSPExtQueue       = (0x0001 << 12)
+        bfFDExtQueue       = (0x0001 << 13)
 
         @property
         def compactName(self) -> str:
@@ -57,7 +62,7 @@ class _XTaskPrfBase:
     __DEFAULT_CYCLIC_MPTS_MS = 50
     __DEFAULT_CYCLIC_RPTS_MS = 100
 
-    __slots__ = [ '__bm' , '__an' , '__mpt' , '__f' ]
+    __slots__ = [ '__bm' , '__an' , '__mpt' , '__f' , '__sp' , '__pl' ]
 
     def __init__(self):
         self.__bm  = _XTaskPrfBase._ETaskPrfFlag.bfNone
@@ -67,6 +72,8 @@ class _XTaskPrfBase:
         self.__f   = _XTaskPrfBase.__DEFAULT_CYCLIC_RPTS_MS
         self.__an  = None
         self.__mpt = _XTaskPrfBase.__DEFAULT_CYCLIC_MPTS_MS
+        self.__sp  = ERunPhaseSchedulingPolicy.FIXED_DELAY
+        self.__pl  = None
 
     def __str__(self):
         return self._ToString()
@@ -220,6 +227,86 @@ class _XTaskPrfBase:
             self.__bm = _XTaskPrfBase._ETaskPrfFlag.RemoveTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfBlockingExtQueue)
             self._isRunPhaseEnabled = True
 
+    @property
+    def _isExternalQueueLockLight(self) -> bool:
+        return self.__isValid and _XTaskPrfBase._ETaskPrfFlag.IsTaskPrfFlagSet(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfLightExtQueue)
+
+    @_isExternalQueueLockLight.setter
+    def _isExternalQueueLockLight(self, bLockLightExtQueue_ : bool):
+        if not self._CheckFreezeState():
+            return
+        if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
+            self._CleanUp()
+            return
+        if bLockLightExtQueue_:
+            self.__bm = _XTaskPrfBase._ETaskPrfFlag.AddTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfLightExtQueue)
+        else:
+            self.__bm = _XTaskPrfBase._ETaskPrfFlag.RemoveTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfLightExtQueue)
+            self.__bm = _XTaskPrfBase._ETaskPrfFlag.RemoveTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfSPExtQueue)
+
+    @property
+    def _isExternalQueueSingleProducer(self) -> bool:
+        return self.__isValid and _XTaskPrfBase._ETaskPrfFlag.IsTaskPrfFlagSet(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfSPExtQueue)
+
+    @_isExternalQueueSingleProducer.setter
+    def _isExternalQueueSingleProducer(self, bSPExtQueue_ : bool):
+        if not self._CheckFreezeState():
+            return
+        if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
+            self._CleanUp()
+            return
+        if bSPExtQueue_:
+            self.__bm = _XTaskPrfBase._ETaskPrfFlag.AddTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfSPExtQueue)
+            if not self._isExternalQueueLockLight:
+                self._isExternalQueueLockLight = True
+        else:
+            self.__bm = _XTaskPrfBase._ETaskPrfFlag.RemoveTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfSPExtQueue)
+
+    @property
+    def _isExternalQueueFastDelivery(self) -> bool:
+        return self.__isValid and _XTaskPrfBase._ETaskPrfFlag.IsTaskPrfFlagSet(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfFDExtQueue)
+
+    @_isExternalQueueFastDelivery.setter
+    def _isExternalQueueFastDelivery(self, bFDExtQueue_ : bool):
+        if not self._CheckFreezeState():
+            return
+        if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
+            self._CleanUp()
+            return
+        if bFDExtQueue_:
+            self.__bm = _XTaskPrfBase._ETaskPrfFlag.AddTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfFDExtQueue)
+        else:
+            self.__bm = _XTaskPrfBase._ETaskPrfFlag.RemoveTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfFDExtQueue)
+
+    @property
+    def _externalQueuePriorityLabels(self) -> Union[dict, None]:
+        return None if (self.__isInvalid or (self.__pl is None)) else dict(self.__pl)
+
+    @_externalQueuePriorityLabels.setter
+    def _externalQueuePriorityLabels(self, prioLabels_ : Union[dict, None]):
+        if not self._CheckFreezeState():
+            return
+        if _ssshare._WarnOnDisabledSubsysMsg(annexID_=_EFwTextID.eMisc_Shared_Disabled_Subsys_Msg):
+            self._CleanUp()
+            return
+        if prioLabels_ is None:
+            self.__pl = None
+            return
+
+        _bValid = isinstance(prioLabels_, dict)
+        if _bValid:
+            for _kk, _vv in prioLabels_.items():
+                if not (isinstance(_kk, int) and isinstance(_vv, EXmsgPriority)):
+                    _bValid = False
+                    break
+        if not _bValid:
+            logif._XLogErrorEC(_EFwErrorCode.UE_00288, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XTaskPrfBase_TID_015).format(str(prioLabels_)))
+            self._CleanUp()
+            return
+        self.__pl = { int(_kk) : _vv for _kk, _vv in prioLabels_.items() if _vv != EXmsgPriority.Normal }
+        if len(self.__pl) < 1:
+            self.__pl = None
+
     @property
     def _isSingleCycleRunPhase(self) -> bool:
         return self.__isValid and (self.__f == 0)
@@ -269,6 +356,20 @@ class _XTaskPrfBase:
             return
         self.__mpt = runPhaseMPTMS_
 
+    @property
+    def _runPhaseSchedulingPolicy(self) -> ERunPhaseSchedulingPolicy:
+        return self.__sp
+
+    @_runPhaseSchedulingPolicy.setter
+    def _runPhaseSchedulingPolicy(self, schedPolicy_ : ERunPhaseSchedulingPolicy):
+        if not self._CheckFreezeState():
+            return
+        if not isinstance(schedPolicy_, ERunPhaseSchedulingPolicy):
+            logif._XLogErrorEC(_EFwErrorCode.UE_00275, _FwTDbEngine.GetText(_EFwTextID.eLogMsg_XTaskPrfBase_TID_014).format(str(schedPolicy_)))
+            self._CleanUp()
+            return
+        self.__sp = schedPolicy_
+
     @staticmethod
     def _GetDefaultRunPhaseFreqMS():
         return _XTaskPrfBase.__DEFAULT_CYCLIC_RPTS_MS
@@ -297,11 +398,16 @@ class _XTaskPrfBase:
         self._isTeardownPhaseEnabled = rhs_.isTeardownPhaseEnabled
 
         if not _ssshare._IsSubsysMsgDisabled():
-            self._isExternalQueueEnabled  = rhs_.isExternalQueueEnabled
-            self._isExternalQueueBlocking = rhs_.isExternalQueueBlocking
+            self._isExternalQueueEnabled        = rhs_.isExternalQueueEnabled
+            self._isExternalQueueBlocking       = rhs_.isExternalQueueBlocking
+            self._isExternalQueueLockLight      = rhs_.isExternalQueueLockLight
+            self._isExternalQueueSingleProducer = rhs_.isExternalQueueSingleProducer
+            self._isExternalQueueFastDelivery   = rhs_.isExternalQueueFastDelivery
+            self._externalQueuePriorityLabels   = rhs_.externalQueuePriorityLabels
         self._aliasName                   = str(rhs_.aliasName)
         self._runPhaseFrequencyMS         = rhs_.runPhaseFrequencyMS
         self._runPhaseMaxProcessingTimeMS = rhs_.runPhaseMaxProcessingTimeMS
+        self._runPhaseSchedulingPolicy    = rhs_.runPhaseSchedulingPolicy
 
         if rhs_.runPhaseFrequencyMS != _XTaskPrfBase._GetDefaultRunPhaseFreqMS():
             self.__bm = _XTaskPrfBase._ETaskPrfFlag.RemoveTaskPrfFlag(self.__bm, _XTaskPrfBase._ETaskPrfFlag.bfDFreq)
@@ -344,8 +450,13 @@ class _XTaskPrfBase:
             res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_08), str(self._isInternalQueueEnabled))
             res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_09), str(self._isExternalQueueEnabled))
             res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_10), str(self._isExternalQueueBlocking))
+            res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_16), str(self._isExternalQueueLockLight))
+            res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_17), str(self._isExternalQueueSingleProducer))
+            res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_20), str(self._isExternalQueueFastDelivery))
+            res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_19), str(self._externalQueuePriorityLabels))
         res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_12), str(self._runPhaseFrequencyMS))
         res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_13), str(self._runPhaseMaxProcessingTimeMS))
+        res += _fmt.format(_FwTDbEngine.GetText(_EFwTextID.eXTaskPrfBase_ToString_18), str(None if self.__sp is None else self.__sp.name))
         return res
 
     def _SetMainXTask(self, bMainXT_ : bool):
@@ -358,6 +469,8 @@ class _XTaskPrfBase:
         self.__an  = None
         self.__bm  = None
         self.__mpt = None
+        self.__sp  = None
+        self.__pl  = None
 
     def _CheckFreezeState(self) -> bool:
         if self.__isInvalid:
@@ -394,11 +507,16 @@ class _XTaskPrfBase:
         self._isTeardownPhaseEnabled = rhs_._isTeardownPhaseEnabled
 
         if not _ssshare._IsSubsysMsgDisabled():
-            self._isExternalQueueEnabled  = rhs_._isExternalQueueEnabled
-            self._isExternalQueueBlocking = rhs_._isExternalQueueBlocking
+            self._isExternalQueueEnabled        = rhs_._isExternalQueueEnabled
+            self._isExternalQueueBlocking       = rhs_._isExternalQueueBlocking
+            self._isExternalQueueLockLight      = rhs_._isExternalQueueLockLight
+            self._isExternalQueueSingleProducer = rhs_._isExternalQueueSingleProducer
+            self._isExternalQueueFastDelivery   = rhs_._isExternalQueueFastDelivery
+            self._externalQueuePriorityLabels   = rhs_._externalQueuePriorityLabels
         self._aliasName                   = str(rhs_._aliasName)
         self._runPhaseFrequencyMS         = rhs_._runPhaseFrequencyMS
         self._runPhaseMaxProcessingTimeMS = rhs_._runPhaseMaxProcessingTimeMS
+        self._runPhaseSchedulingPolicy    = rhs_._runPhaseSchedulingPolicy
 
         if self.__isDefaultRunFreq != rhs_.__isDefaultRunFreq:
             if rhs_.__isDefaultRunFreq:
@@ -9,10 +9,13 @@
 
 import os.path
 import time
+import zlib
+from importlib import import_module as _PyImportModule
 
 from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
 
 from _fw.fwtdb.fwtextid import _EFwTextID
+from _fw.fwtdb.fwtextdef import _GetFwTextDefines
 from _fw.fwtdb.fwtextdb import _FwTextDB
 from _fw.fwtdb.fwtextdb import _ETextDBCreateStatus
 from _fw.fwtdb.fwtextdb import _TDBPrint
@@ -21,6 +24,7 @@ class _FwTDbEngine:
     __slots__ = []
 
     __txtDB      = None
+    __txtCache   = None
     __bPkgDist   = True
     __bLiveCheck = True
 
@@ -28,6 +32,7 @@ class _FwTDbEngine:
     __PDRDPN  = None
     __PDRDBwD = None
 
+    __PRECOMPILED_DB_MODULE    = 'fwtextdef__pre'
     __TICKS_PER_USECOND        = 10**3
     __DB_CREATE_TIMESTAMP      = None
     __DB_FIRST_FETCH_TIMESTAMP = None
@@ -42,6 +47,12 @@ class _FwTDbEngine:
 
     @staticmethod
     def GetText(fwTxtID_ : _EFwTextID) -> str:
+        _tc = _FwTDbEngine.__txtCache
+        if _tc is not None:
+            res = _tc.get(fwTxtID_, None)
+            if res is not None:
+                return res
+
         if _FwTDbEngine.__DB_FIRST_FETCH_TIMESTAMP is None:
             _FwTDbEngine.__DB_FIRST_FETCH_TIMESTAMP = _FwTDbEngine.__GetCurTicksUS()
 
@@ -57,6 +68,12 @@ class _FwTDbEngine:
         if not _FwTextDB._GetCreateStatus().isTDBCreated:
             return _BAD_RES
 
+        if _FwTDbEngine.__txtCache is None:
+            _FwTDbEngine.__txtCache = _FwTDbEngine.__CreateTextCache()
+            res = _FwTDbEngine.__txtCache.get(fwTxtID_, None)
+            if res is not None:
+                return res
+
         res =_FwTDbEngine.__txtDB._GetFwText(fwTxtID_)
         if (res is None) or (not _FwTDbEngine.__bPkgDist):
             if res is None:
@@ -119,9 +136,46 @@ class _FwTDbEngine:
     @staticmethod
     def _DestroyDB():
         if _FwTDbEngine.__txtDB is not None:
-            _FwTDbEngine.__txtDB = None
+            _FwTDbEngine.__txtDB    = None
+            _FwTDbEngine.__txtCache = None
             _FwTextDB._DestroyDB()
 
+    @staticmethod
+    def _GenPrecompiledDB(filePath_ : str =None) -> bool:
+        if _FwTDbEngine.GetText(_EFwTextID.eInvalidText) is None:
+            return False
+        if _FwTDbEngine.__txtCache is None:
+            return False
+
+        if filePath_ is None:
+            filePath_ = os.path.join(os.path.dirname(os.path.normpath(__file__)), _FwTDbEngine.__PRECOMPILED_DB_MODULE + '.py')
+
+        _tc  = _FwTDbEngine.__txtCache
+        _lst = [ '# #!/usr/bin/env python'
+               , '# -*- coding: utf-8 -*-'
+               , '# ' + '-'*78
+               , f'# File   : {os.path.basename(filePath_)}'
+               , '#'
+               , '# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)'
+               , '# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).'
+               , '# ' + '-'*78
+               , ''
+               , f'_FW_TEXT_DB_SIGNATURE = {_FwTDbEngine.__GetDBSignature()}'
+               , ''
+               , '_FW_TEXT_TABLE = (' ]
+        for _ee in _EFwTextID:
+            _lst.append(('      ' if _ee.value == 0 else '    , ') + repr(_tc.get(_ee, None)))
+        _lst.append(')')
+        _lst.append('')
+
+        try:
+            with open(filePath_, 'w', encoding='utf-8') as _ff:
+                _ff.write('\n'.join(_lst))
+        except OSError as _xcp:
+            _TDBPrint(f'[FwTDB] Failed to write precompiled text DB {filePath_}: {_xcp}\n')
+            return False
+        return True
+
     @staticmethod
     def _GetXcofdkRootAbsPath():
         _FwTDbEngine.__Init()
@@ -152,6 +206,55 @@ class _FwTDbEngine:
             _FwTDbEngine.__PDRDPN  = _FwTDbEngine.__HexDecode('73 7263')
             _FwTDbEngine.__PDRDBwD = 4
 
+    @staticmethod
+    def __CreateTextCache() -> dict:
+        res  = dict()
+        _tdb = _FwTDbEngine.__txtDB
+        _tbl = _FwTDbEngine.__LoadPrecompiledDB()
+
+        _bDecode = _FwTDbEngine.__bPkgDist or _FwTDbEngine.__bLiveCheck
+        for _ee in _EFwTextID:
+            if not _tdb._IsFwTextAvailable(_ee):
+                continue
+            if _tbl is not None:
+                _txt = _tbl[_ee.value]
+            else:
+                _txt = _tdb._GetFwText(_ee)
+                if (_txt is not None) and _bDecode:
+                    _txt = _FwTDbEngine.__HexDecode(_txt)
+            if _txt is not None:
+                res[_ee] = _txt
+        return res
+
+    @staticmethod
+    def __LoadPrecompiledDB():
+        try:
+            _mod = _PyImportModule(f'{__package__}.{_FwTDbEngine.__PRECOMPILED_DB_MODULE}')
+        except ImportError:
+            return None
+
+        res = getattr(_mod, '_FW_TEXT_TABLE', None)
+        if getattr(_mod, '_FW_TEXT_DB_SIGNATURE', None) != _FwTDbEngine.__GetDBSignature():
+            res = None
+        elif not (isinstance(res, tuple) and (len(res) == len(_EFwTextID))):
+            res = None
+        if res is None:
+            _TDBPrint(f'[FwTDB] Ignoring outdated precompiled text DB {_mod.__name__}.\n')
+        return res
+
+    @staticmethod
+    def __GetDBSignature() -> int:
+        res = zlib.crc32('\n'.join(f'{_ee.value}:{_ee.name}' for _ee in _EFwTextID).encode())
+
+        _bHex = _FwTDbEngine.__bPkgDist
+        for _kk, _vv in _GetFwTextDefines().items():
+            if not isinstance(_vv, str):
+                continue
+            if not _bHex:
+                _vv = _FwTDbEngine.__HexEncode(_vv)
+            res = zlib.crc32(f'\n{_kk.value}={_vv}'.encode(), res)
+        return res
+
     @staticmethod
     def __HexEncode(rawText_ : str) -> str:
         return None if not isinstance(rawText_, str) else rawText_.encode().hex(' ', 2)
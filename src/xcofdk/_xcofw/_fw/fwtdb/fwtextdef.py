@@ -31,6 +31,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eMisc_TNPrefix_XTask                           : 'XTsk_'
         , _EFwTextID.eMisc_TNPrefix_CXTask                          : 'CXTsk_'
         , _EFwTextID.eMisc_TNPrefix_Process                         : 'Prc_'
+        , _EFwTextID.eMisc_TNPrefix_ProcessPool                     : 'PPool_'
+        , _EFwTextID.eMisc_TNPrefix_ProcessChannel                  : 'PChnl_'
         , _EFwTextID.eMisc_TNPrefix_Runnable                        : 'Rbl'
 
         , _EFwTextID.eMisc_LcResultFailed                           : "FAILED"
@@ -226,6 +228,11 @@ def _GetFwTextDefines():
         , _EFwTextID.eXTaskPrfBase_ToString_13  : "runPhaseMaxProcessingTimeMS"
         , _EFwTextID.eXTaskPrfBase_ToString_14  : "isRunPhaseEnabled"
         , _EFwTextID.eXTaskPrfBase_ToString_15  : "\t{:<32} : {}\n"
+        , _EFwTextID.eXTaskPrfBase_ToString_16  : "isExternalQueueLockLight"
+        , _EFwTextID.eXTaskPrfBase_ToString_17  : "isExternalQueueSingleProducer"
+        , _EFwTextID.eXTaskPrfBase_ToString_18  : "runPhaseSchedulingPolicy"
+        , _EFwTextID.eXTaskPrfBase_ToString_19  : "externalQueuePriorityLabels"
+        , _EFwTextID.eXTaskPrfBase_ToString_20  : "isExternalQueueFastDelivery"
 
         , _EFwTextID.eXTaskPrfExt_ToString_02               : "isRcTask"
 
@@ -366,6 +373,9 @@ def _GetFwTextDefines():
         , _EFwTextID.eFwRteConfig_ToString_12              : "disable-log-redirection-console-sink"
         , _EFwTextID.eFwRteConfig_ToString_13              : "enable-log-redirection-file-sink"
         , _EFwTextID.eFwRteConfig_ToString_14              : "enable-log-redirection-tcp-sink"
+        , _EFwTextID.eFwRteConfig_ToString_15              : "enable-compact-message-serdes"
+        , _EFwTextID.eFwRteConfig_ToString_16              : "enable-message-latency-tracing"
+        , _EFwTextID.eFwRteConfig_ToString_17              : "enable-sharded-message-dispatch"
 
         , _EFwTextID.eXCbCase_XCallback_ToString_001       : "generic - "
         , _EFwTextID.eXCbCase_XCallback_ToString_002       : "\n\t[XCallback] {}{:<10} : {}"
@@ -377,6 +387,8 @@ def _GetFwTextDefines():
 
         , _EFwTextID.eXProcessAgent_ToString_001           : "Process: UID={}  aliasName={}  name={}  PID={}  exitCode={}  done={}"
         , _EFwTextID.eXProcessAgent_ToString_002           : "{} ({})"
+        , _EFwTextID.eXProcessPool_ToString_001            : "ProcessPool: aliasName={}  workers={}  started={}  shutdown={}  pendingJobs={}"
+        , _EFwTextID.eXProcessChannel_ToString_001         : "ProcessChannel: aliasName={}  capacity={}  rxTaskUID={}  closed={}"
 
         , _EFwTextID.eLcGuard_ToString_001                 : "[LcG] : state={}"
 
@@ -483,6 +495,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_XTaskPrfBase_TID_010    : "Detected configuration mismatch of task profile: runPhaseEnabled={} , externalQueueEnabled={} , blockingExternalQueue={}"
         , _EFwTextID.eLogMsg_XTaskPrfBase_TID_012    : "Blocking external queue is not supported for synchronous tasks."
         , _EFwTextID.eLogMsg_XTaskPrfBase_TID_013    : "Invalid alias name passed in : '{}'"
+        , _EFwTextID.eLogMsg_XTaskPrfBase_TID_014    : "Invalid run phase scheduling policy passed in : '{}'"
+        , _EFwTextID.eLogMsg_XTaskPrfBase_TID_015    : "Invalid mapping of message labels to priorities passed in : '{}'"
 
         , _EFwTextID.eLogMsg_XTaskPrfExt_TID_001     : "Bad/invalid task profile instance: {}"
         , _EFwTextID.eLogMsg_XTaskPrfExt_TID_002     : "Failed to assign by task profile instance: {}"
@@ -593,6 +607,7 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_LcManager_TID_076       : "[LC][LcMgr] Caught exception below while pending stop request:\n\t{}"
         , _EFwTextID.eLogMsg_LcManager_TID_077       : "[LC][LcMgr] Caught exception below while processing request to join {}:\n\t{}"
         , _EFwTextID.eLogMsg_LcManager_TID_078       : "[LC][LcMgr] Caught exception below while waiting for main task {} to terminate execution:\n\t{}"
+        , _EFwTextID.eLogMsg_LcManager_TID_079       : "Request to get task metrics requires a (list of) positive integer value(s), encountered invalid object type/value passed to: {}"
 
         , _EFwTextID.eLogMsg_LcSDC_TID_001            : "Maximum wait time for internal pre-gate expired, forcing to continue shutdown execution."
         , _EFwTextID.eLogMsg_LcSDC_TID_002            : "Maximum wait time for internal gate expired, forcing to continue shutdown execution."
@@ -729,6 +744,9 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_033       : "{}custom payload (de-)serialization is not available in this version of the software."
         , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_034       : "Send operation for message below failed for some unspecified reason:\n\t{}"
         , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_035       : "Broadcast operation for message below failed for some unspecified reason::\n\t{}"
+        , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_036       : "{}invalid type of the sequence of messages passed to batch send operation: {}"
+        , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_037       : "{}invalid batch entry at index {}, expected a tuple of {} up to {} items: {}"
+        , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_038       : "{}invalid message priority passed, expected a member of enum class EXmsgPriority, got '{}' instead."
 
         , _EFwTextID.eLogMsg_SubsysMsgUtil_TID_001       : " passed in as member of cluster {}"
         , _EFwTextID.eLogMsg_SubsysMsgUtil_TID_002       : "Invalid (list of) label ID(s){}: {}"
@@ -792,6 +810,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_AbsRunnable_TID_003    : "Task {} is currently not within its run phase, ignoring request to trigger {} queue processing."
         , _EFwTextID.eLogMsg_AbsRunnable_TID_004    : "Task {} is processing internal/external queue already, ignoring request to trigger {} queue processing."
         , _EFwTextID.eLogMsg_AbsRunnable_TID_006    : "Task {} is currently within its teardown phase, ignoring request to trigger {} queue processing."
+        , _EFwTextID.eLogMsg_AbsRunnable_TID_007    : "Task {} exceeded its max. run phase processing time of {} ms: processingTime={:.3f} ms , overruns={} , missedDeadlines={} , runCycles={}"
+        , _EFwTextID.eLogMsg_AbsRunnable_TID_008    : "Task {} has reached its max. external queue size of {} shared with its priority lane, currently unable to queue message {} of priority {}, dispatch re-try will take place (if applicable)."
 
         , _EFwTextID.eLogMsg_CallableIF_TID_004          : "Ignored passed in parameter method: {}"
         , _EFwTextID.eLogMsg_CallableIF_TID_011          : "Missing an instance of class {} to be passed to as first argument when calling, typeCallableObj: {}"
@@ -815,6 +835,7 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_Payload_TID_002             : "Key not found in message payload: {}"
 
         , _EFwTextID.eLogMsg_XcoMsgImpl_TID_001          : "Denied request to attach invalid payload object to message {}."
+        , _EFwTextID.eLogMsg_XcoMsgTracer_TID_001        : "Caught exception below while passing trace record of message {} to the message trace sink, the sink is disabled:\n\t{}"
 
         , _EFwTextID.eLogMsg_XProcessConn_TID_001   : "[XPC] Refused to create new xprocess instance due to change of MP process start method."
         , _EFwTextID.eLogMsg_XProcessConn_TID_002   : "[XPC] [Process:{}] "
@@ -864,8 +885,25 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_FwRteConfig_TID_015         : "Caught {} exception below while trying to configrue redirection TCP sink for: ip={} , port={}\n\t{}"
         , _EFwTextID.eLogMsg_FwRteConfig_TID_016         : "Encountered invalid line ending '{}' while trying to configrue redirection TCP sink for: ip={} , port={}"
         , _EFwTextID.eLogMsg_FwRteConfig_TID_017         : "Running Python interpreter {} does officially support free-threaded.\nThe framework will ignore RTE configuration request to bypass experimental free-threaded guard."
+        , _EFwTextID.eLogMsg_FwRteConfig_TID_018         : "Encountered invalid overflow policy '{}' while trying to configure redirection sink for RTE policy {}."
+        , _EFwTextID.eLogMsg_FwRteConfig_TID_019         : "Encountered invalid message trace sink of type '{}', expected a callable object or None."
+        , _EFwTextID.eLogMsg_FwRteConfig_TID_020         : "Encountered invalid number of message dispatch shards '{}', expected an integer value in range [1..{}] or None."
 
         , _EFwTextID.eLogMsg_XProcessAgent_001           : "Cannot create child process instances before start of the framework."
+        , _EFwTextID.eLogMsg_XProcessPool_TID_001        : "Encountered invalid number of workers passed in to create process pool instance: '{}'"
+        , _EFwTextID.eLogMsg_XProcessPool_TID_002        : "Refused to submit new job to process pool '{}' which is not started or shut down already."
+        , _EFwTextID.eLogMsg_XProcessPool_TID_003        : "Failed to serialize target and/or arguments of new job submitted to process pool '{}':\n\t{}"
+        , _EFwTextID.eLogMsg_XProcessPool_TID_004        : "Cannot create process pool instances before start of the framework."
+        , _EFwTextID.eLogMsg_XProcessPool_TID_005        : "Worker process {} of process pool '{}' terminated unexpectedly, failed its running job {}."
+        , _EFwTextID.eLogMsg_XProcessPool_TID_006        : "Failed to respawn terminated worker process of process pool '{}', number of workers reduced to {}."
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_001     : "Encountered invalid capacity passed in to create process channel instance: '{}'"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_002     : "Encountered invalid receiver task passed in to create process channel '{}': {}"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_003     : "Failed to serialize message to be sent via process channel '{}':\n\t{}"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_004     : "Refused to send message of size {} exceeding max. message size {} of process channel '{}'."
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_005     : "Cannot create process channel instances before start of the framework."
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_006     : "Failed to create shared memory of process channel '{}':\n\t{}"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_007     : "Dropped message received via process channel '{}' after {} failed attempts to deliver it to task {}, number of dropped messages: {}"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_008     : "Dropped message received via process channel '{}' as its delivery to task {} was rejected, number of dropped messages: {}"
 
         , _EFwTextID.eLogMsg_FwRteException_TID_001      : "<UNSPECIFIED-RTE-EXCEPTION-MESSAGE>"
         , _EFwTextID.eLogMsg_FwRteException_TID_002      : "{}\n\t  code        : {}\n\t  message     : {}"
@@ -898,6 +936,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_XProcessTarget_TID_001     : "[XPTgt] Caught {} exception while executing target callback on child process {}."
         , _EFwTextID.eLogMsg_XProcessTarget_TID_002     : "[XPTgt] Target callback on child process {} returned disallowed supplied data tyoe:\n\t{}"
         , _EFwTextID.eLogMsg_XProcessTarget_TID_003     : "[XPTgt] Caught disallowed exception while executing target callback on child process {}:\n\t"
+        , _EFwTextID.eLogMsg_XProcessPoolWorker_TID_001 : "[XPPWkr] Caught {} exception while executing job {} on worker process {}."
+        , _EFwTextID.eLogMsg_XProcessPoolWorker_TID_002 : "[XPPWkr] Job {} on worker process {} returned disallowed supplied data type:\n\t{}"
 
         , _EFwTextID.eLogMsg_XCbCase_TID_001             : "While creating an instance of class '{}', found no valid callback parameter(s) passed to the c-tor."
         , _EFwTextID.eLogMsg_XCbCase_TID_002             : "While creating an instance of class '{}', ignored passed formal parameter(s) below due to precedence of {}:\n\t{}"
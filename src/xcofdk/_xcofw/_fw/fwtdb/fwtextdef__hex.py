@@ -30,6 +30,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eMisc_TNPrefix_XTask                                        : "58 5473 6b5f"
         , _EFwTextID.eMisc_TNPrefix_CXTask                                       : "4358 5473 6b5f"
         , _EFwTextID.eMisc_TNPrefix_Process                                      : "5072 635f"
+        , _EFwTextID.eMisc_TNPrefix_ProcessPool                                  : "5050 6f6f 6c5f"
+        , _EFwTextID.eMisc_TNPrefix_ProcessChannel                               : "5043 686e 6c5f"
         , _EFwTextID.eMisc_TNPrefix_Runnable                                     : "52 626c"
         , _EFwTextID.eMisc_LcResultFailed                                        : "4641 494c 4544"
         , _EFwTextID.eMisc_LcResultSuccess                                       : "53 5543 4345 5353"
@@ -209,6 +211,11 @@ def _GetFwTextDefines():
         , _EFwTextID.eXTaskPrfBase_ToString_13                                   : "72 756e 5068 6173 654d 6178 5072 6f63 6573 7369 6e67 5469 6d65 4d53"
         , _EFwTextID.eXTaskPrfBase_ToString_14                                   : "69 7352 756e 5068 6173 6545 6e61 626c 6564"
         , _EFwTextID.eXTaskPrfBase_ToString_15                                   : "09 7b3a 3c33 327d 203a 207b 7d0a"
+        , _EFwTextID.eXTaskPrfBase_ToString_16                                   : "6973 4578 7465 726e 616c 5175 6575 654c 6f63 6b4c 6967 6874"
+        , _EFwTextID.eXTaskPrfBase_ToString_17                                   : "69 7345 7874 6572 6e61 6c51 7565 7565 5369 6e67 6c65 5072 6f64 7563 6572"
+        , _EFwTextID.eXTaskPrfBase_ToString_18                                   : "7275 6e50 6861 7365 5363 6865 6475 6c69 6e67 506f 6c69 6379"
+        , _EFwTextID.eXTaskPrfBase_ToString_19                                   : "65 7874 6572 6e61 6c51 7565 7565 5072 696f 7269 7479 4c61 6265 6c73"
+        , _EFwTextID.eXTaskPrfBase_ToString_20                                   : "69 7345 7874 6572 6e61 6c51 7565 7565 4661 7374 4465 6c69 7665 7279"
         , _EFwTextID.eXTaskPrfExt_ToString_02                                    : "6973 5263 5461 736b"
         , _EFwTextID.eLcConfig_ToString                                          : "74 6774 5363 6f70 653d 7b7d"
         , _EFwTextID.eLcManager_MsgPrefix                                        : "5b4c 435d 5b4c 634d 6772 5d20"
@@ -317,6 +324,9 @@ def _GetFwTextDefines():
         , _EFwTextID.eFwRteConfig_ToString_12                                    : "6469 7361 626c 652d 6c6f 672d 7265 6469 7265 6374 696f 6e2d 636f 6e73 6f6c 652d 7369 6e6b"
         , _EFwTextID.eFwRteConfig_ToString_13                                    : "656e 6162 6c65 2d6c 6f67 2d72 6564 6972 6563 7469 6f6e 2d66 696c 652d 7369 6e6b"
         , _EFwTextID.eFwRteConfig_ToString_14                                    : "65 6e61 626c 652d 6c6f 672d 7265 6469 7265 6374 696f 6e2d 7463 702d 7369 6e6b"
+        , _EFwTextID.eFwRteConfig_ToString_15                                    : "65 6e61 626c 652d 636f 6d70 6163 742d 6d65 7373 6167 652d 7365 7264 6573"
+        , _EFwTextID.eFwRteConfig_ToString_16                                    : "656e 6162 6c65 2d6d 6573 7361 6765 2d6c 6174 656e 6379 2d74 7261 6369 6e67"
+        , _EFwTextID.eFwRteConfig_ToString_17                                    : "65 6e61 626c 652d 7368 6172 6465 642d 6d65 7373 6167 652d 6469 7370 6174 6368"
         , _EFwTextID.eXCbCase_XCallback_ToString_001                             : "6765 6e65 7269 6320 2d20"
         , _EFwTextID.eXCbCase_XCallback_ToString_002                             : "0a 095b 5843 616c 6c62 6163 6b5d 207b 7d7b 3a3c 3130 7d20 3a20 7b7d"
         , _EFwTextID.eXCbCase_ToString_001                                       : "5b 5843 6243 6173 655d 2062 4765 6e65 7269 633d 7b7d 202c 207b 7d20 6361 6c6c 6261 636b 2873 293a 7b7d"
@@ -324,6 +334,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eFwsLogRD_ToString_001                                      : "2862 484c 3d7b 7d29"
         , _EFwTextID.eXProcessAgent_ToString_001                                 : "5072 6f63 6573 733a 2055 4944 3d7b 7d20 2061 6c69 6173 4e61 6d65 3d7b 7d20 206e 616d 653d 7b7d 2020 5049 443d 7b7d 2020 6578 6974 436f 6465 3d7b 7d20 2064 6f6e 653d 7b7d"
         , _EFwTextID.eXProcessAgent_ToString_002                                 : "7b 7d20 287b 7d29"
+        , _EFwTextID.eXProcessPool_ToString_001                                  : "5072 6f63 6573 7350 6f6f 6c3a 2061 6c69 6173 4e61 6d65 3d7b 7d20 2077 6f72 6b65 7273 3d7b 7d20 2073 7461 7274 6564 3d7b 7d20 2073 6875 7464 6f77 6e3d 7b7d 2020 7065 6e64 696e 674a 6f62 733d 7b7d"
+        , _EFwTextID.eXProcessChannel_ToString_001                               : "5072 6f63 6573 7343 6861 6e6e 656c 3a20 616c 6961 734e 616d 653d 7b7d 2020 6361 7061 6369 7479 3d7b 7d20 2072 7854 6173 6b55 4944 3d7b 7d20 2063 6c6f 7365 643d 7b7d"
         , _EFwTextID.eLcGuard_ToString_001                                       : "5b4c 6347 5d20 3a20 7374 6174 653d 7b7d"
         , _EFwTextID.eLcTLB_ToString_001                                         : "5b4c 6353 544c 425d 5b7b 7d5d"
         , _EFwTextID.eLcTLB_ToString_002                                         : "5b 4c63 4454 4c42 5d5b 7b7d 5d20 7461 736b 5374 6174 653d 7b7d"
@@ -417,6 +429,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_XTaskPrfBase_TID_010                                : "4465 7465 6374 6564 2063 6f6e 6669 6775 7261 7469 6f6e 206d 6973 6d61 7463 6820 6f66 2074 6173 6b20 7072 6f66 696c 653a 2072 756e 5068 6173 6545 6e61 626c 6564 3d7b 7d20 2c20 6578 7465 726e 616c 5175 6575 6545 6e61 626c 6564 3d7b 7d20 2c20 626c 6f63 6b69 6e67 4578 7465 726e 616c 5175 6575 653d 7b7d"
         , _EFwTextID.eLogMsg_XTaskPrfBase_TID_012                                : "42 6c6f 636b 696e 6720 6578 7465 726e 616c 2071 7565 7565 2069 7320 6e6f 7420 7375 7070 6f72 7465 6420 666f 7220 7379 6e63 6872 6f6e 6f75 7320 7461 736b 732e"
         , _EFwTextID.eLogMsg_XTaskPrfBase_TID_013                                : "49 6e76 616c 6964 2061 6c69 6173 206e 616d 6520 7061 7373 6564 2069 6e20 3a20 277b 7d27"
+        , _EFwTextID.eLogMsg_XTaskPrfBase_TID_014                                : "496e 7661 6c69 6420 7275 6e20 7068 6173 6520 7363 6865 6475 6c69 6e67 2070 6f6c 6963 7920 7061 7373 6564 2069 6e20 3a20 277b 7d27"
+        , _EFwTextID.eLogMsg_XTaskPrfBase_TID_015                                : "496e 7661 6c69 6420 6d61 7070 696e 6720 6f66 206d 6573 7361 6765 206c 6162 656c 7320 746f 2070 7269 6f72 6974 6965 7320 7061 7373 6564 2069 6e20 3a20 277b 7d27"
         , _EFwTextID.eLogMsg_XTaskPrfExt_TID_001                                 : "42 6164 2f69 6e76 616c 6964 2074 6173 6b20 7072 6f66 696c 6520 696e 7374 616e 6365 3a20 7b7d"
         , _EFwTextID.eLogMsg_XTaskPrfExt_TID_002                                 : "46 6169 6c65 6420 746f 2061 7373 6967 6e20 6279 2074 6173 6b20 7072 6f66 696c 6520 696e 7374 616e 6365 3a20 7b7d"
         , _EFwTextID.eLogMsg_FSUtil_TID_001                                      : "4469 7265 6374 6f72 7920 6578 6973 7473 2061 6c72 6561 6479 3a20 7b7d"
@@ -519,6 +533,7 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_LcManager_TID_076                                   : "5b4c 435d 5b4c 634d 6772 5d20 4361 7567 6874 2065 7863 6570 7469 6f6e 2062 656c 6f77 2077 6869 6c65 2070 656e 6469 6e67 2073 746f 7020 7265 7175 6573 743a 0a09 7b7d"
         , _EFwTextID.eLogMsg_LcManager_TID_077                                   : "5b 4c43 5d5b 4c63 4d67 725d 2043 6175 6768 7420 6578 6365 7074 696f 6e20 6265 6c6f 7720 7768 696c 6520 7072 6f63 6573 7369 6e67 2072 6571 7565 7374 2074 6f20 6a6f 696e 207b 7d3a 0a09 7b7d"
         , _EFwTextID.eLogMsg_LcManager_TID_078                                   : "5b 4c43 5d5b 4c63 4d67 725d 2043 6175 6768 7420 6578 6365 7074 696f 6e20 6265 6c6f 7720 7768 696c 6520 7761 6974 696e 6720 666f 7220 6d61 696e 2074 6173 6b20 7b7d 2074 6f20 7465 726d 696e 6174 6520 6578 6563 7574 696f 6e3a 0a09 7b7d"
+        , _EFwTextID.eLogMsg_LcManager_TID_079                                   : "52 6571 7565 7374 2074 6f20 6765 7420 7461 736b 206d 6574 7269 6373 2072 6571 7569 7265 7320 6120 286c 6973 7420 6f66 2920 706f 7369 7469 7665 2069 6e74 6567 6572 2076 616c 7565 2873 292c 2065 6e63 6f75 6e74 6572 6564 2069 6e76 616c 6964 206f 626a 6563 7420 7479 7065 2f76 616c 7565 2070 6173 7365 6420 746f 3a20 7b7d"
         , _EFwTextID.eLogMsg_LcSDC_TID_001                                       : "4d61 7869 6d75 6d20 7761 6974 2074 696d 6520 666f 7220 696e 7465 726e 616c 2070 7265 2d67 6174 6520 6578 7069 7265 642c 2066 6f72 6369 6e67 2074 6f20 636f 6e74 696e 7565 2073 6875 7464 6f77 6e20 6578 6563 7574 696f 6e2e"
         , _EFwTextID.eLogMsg_LcSDC_TID_002                                       : "4d61 7869 6d75 6d20 7761 6974 2074 696d 6520 666f 7220 696e 7465 726e 616c 2067 6174 6520 6578 7069 7265 642c 2066 6f72 6369 6e67 2074 6f20 636f 6e74 696e 7565 2073 6875 7464 6f77 6e20 6578 6563 7574 696f 6e2e"
         , _EFwTextID.eLogMsg_SSDeputyLogging_TID_001                             : "556e 6b6e 6f77 6e20 636f 6e66 6967 2065 6e74 6974 7920 7768 696c 6520 7072 6f63 6573 7369 6e67 2063 6d64 207b 7d2e"
@@ -636,6 +651,9 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_033                               : "7b 7d63 7573 746f 6d20 7061 796c 6f61 6420 2864 652d 2973 6572 6961 6c69 7a61 7469 6f6e 2069 7320 6e6f 7420 6176 6169 6c61 626c 6520 696e 2074 6869 7320 7665 7273 696f 6e20 6f66 2074 6865 2073 6f66 7477 6172 652e"
         , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_034                               : "5365 6e64 206f 7065 7261 7469 6f6e 2066 6f72 206d 6573 7361 6765 2062 656c 6f77 2066 6169 6c65 6420 666f 7220 736f 6d65 2075 6e73 7065 6369 6669 6564 2072 6561 736f 6e3a 0a09 7b7d"
         , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_035                               : "4272 6f61 6463 6173 7420 6f70 6572 6174 696f 6e20 666f 7220 6d65 7373 6167 6520 6265 6c6f 7720 6661 696c 6564 2066 6f72 2073 6f6d 6520 756e 7370 6563 6966 6965 6420 7265 6173 6f6e 3a3a 0a09 7b7d"
+        , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_036                               : "7b 7d69 6e76 616c 6964 2074 7970 6520 6f66 2074 6865 2073 6571 7565 6e63 6520 6f66 206d 6573 7361 6765 7320 7061 7373 6564 2074 6f20 6261 7463 6820 7365 6e64 206f 7065 7261 7469 6f6e 3a20 7b7d"
+        , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_037                               : "7b7d 696e 7661 6c69 6420 6261 7463 6820 656e 7472 7920 6174 2069 6e64 6578 207b 7d2c 2065 7870 6563 7465 6420 6120 7475 706c 6520 6f66 207b 7d20 7570 2074 6f20 7b7d 2069 7465 6d73 3a20 7b7d"
+        , _EFwTextID.eLogMsg_XcoMsgMgrImpl_TID_038                               : "7b 7d69 6e76 616c 6964 206d 6573 7361 6765 2070 7269 6f72 6974 7920 7061 7373 6564 2c20 6578 7065 6374 6564 2061 206d 656d 6265 7220 6f66 2065 6e75 6d20 636c 6173 7320 4558 6d73 6750 7269 6f72 6974 792c 2067 6f74 2027 7b7d 2720 696e 7374 6561 642e"
         , _EFwTextID.eLogMsg_SubsysMsgUtil_TID_001                               : "2070 6173 7365 6420 696e 2061 7320 6d65 6d62 6572 206f 6620 636c 7573 7465 7220 7b7d"
         , _EFwTextID.eLogMsg_SubsysMsgUtil_TID_002                               : "49 6e76 616c 6964 2028 6c69 7374 206f 6629 206c 6162 656c 2049 4428 7329 7b7d 3a20 7b7d"
         , _EFwTextID.eLogMsg_SubsysMsgUtil_TID_003                               : "496e 7661 6c69 6420 636c 7573 7465 7220 4944 3a20 7b7d"
@@ -692,6 +710,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_AbsRunnable_TID_003                                 : "54 6173 6b20 7b7d 2069 7320 6375 7272 656e 746c 7920 6e6f 7420 7769 7468 696e 2069 7473 2072 756e 2070 6861 7365 2c20 6967 6e6f 7269 6e67 2072 6571 7565 7374 2074 6f20 7472 6967 6765 7220 7b7d 2071 7565 7565 2070 726f 6365 7373 696e 672e"
         , _EFwTextID.eLogMsg_AbsRunnable_TID_004                                 : "54 6173 6b20 7b7d 2069 7320 7072 6f63 6573 7369 6e67 2069 6e74 6572 6e61 6c2f 6578 7465 726e 616c 2071 7565 7565 2061 6c72 6561 6479 2c20 6967 6e6f 7269 6e67 2072 6571 7565 7374 2074 6f20 7472 6967 6765 7220 7b7d 2071 7565 7565 2070 726f 6365 7373 696e 672e"
         , _EFwTextID.eLogMsg_AbsRunnable_TID_006                                 : "5461 736b 207b 7d20 6973 2063 7572 7265 6e74 6c79 2077 6974 6869 6e20 6974 7320 7465 6172 646f 776e 2070 6861 7365 2c20 6967 6e6f 7269 6e67 2072 6571 7565 7374 2074 6f20 7472 6967 6765 7220 7b7d 2071 7565 7565 2070 726f 6365 7373 696e 672e"
+        , _EFwTextID.eLogMsg_AbsRunnable_TID_007                                 : "5461 736b 207b 7d20 6578 6365 6564 6564 2069 7473 206d 6178 2e20 7275 6e20 7068 6173 6520 7072 6f63 6573 7369 6e67 2074 696d 6520 6f66 207b 7d20 6d73 3a20 7072 6f63 6573 7369 6e67 5469 6d65 3d7b 3a2e 3366 7d20 6d73 202c 206f 7665 7272 756e 733d 7b7d 202c 206d 6973 7365 6444 6561 646c 696e 6573 3d7b 7d20 2c20 7275 6e43 7963 6c65 733d 7b7d"
+        , _EFwTextID.eLogMsg_AbsRunnable_TID_008                                 : "54 6173 6b20 7b7d 2068 6173 2072 6561 6368 6564 2069 7473 206d 6178 2e20 6578 7465 726e 616c 2071 7565 7565 2073 697a 6520 6f66 207b 7d20 7368 6172 6564 2077 6974 6820 6974 7320 7072 696f 7269 7479 206c 616e 652c 2063 7572 7265 6e74 6c79 2075 6e61 626c 6520 746f 2071 7565 7565 206d 6573 7361 6765 207b 7d20 6f66 2070 7269 6f72 6974 7920 7b7d 2c20 6469 7370 6174 6368 2072 652d 7472 7920 7769 6c6c 2074 616b 6520 706c 6163 6520 2869 6620 6170 706c 6963 6162 6c65 292e"
         , _EFwTextID.eLogMsg_CallableIF_TID_004                                  : "4967 6e6f 7265 6420 7061 7373 6564 2069 6e20 7061 7261 6d65 7465 7220 6d65 7468 6f64 3a20 7b7d"
         , _EFwTextID.eLogMsg_CallableIF_TID_011                                  : "4d 6973 7369 6e67 2061 6e20 696e 7374 616e 6365 206f 6620 636c 6173 7320 7b7d 2074 6f20 6265 2070 6173 7365 6420 746f 2061 7320 6669 7273 7420 6172 6775 6d65 6e74 2077 6865 6e20 6361 6c6c 696e 672c 2074 7970 6543 616c 6c61 626c 654f 626a 3a20 7b7d"
         , _EFwTextID.eLogMsg_CallableSignature_TID_001                           : "27 7365 7475 7027"
@@ -711,6 +731,7 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_Payload_TID_001                                     : "55 6e65 7870 6563 7465 6420 6f62 6a65 6374 2074 7970 6520 277b 7d27 2070 6173 7365 6420 696e 2061 7320 7061 796c 6f61 6420 636f 6e74 6169 6e65 722e"
         , _EFwTextID.eLogMsg_Payload_TID_002                                     : "4b65 7920 6e6f 7420 666f 756e 6420 696e 206d 6573 7361 6765 2070 6179 6c6f 6164 3a20 7b7d"
         , _EFwTextID.eLogMsg_XcoMsgImpl_TID_001                                  : "4465 6e69 6564 2072 6571 7565 7374 2074 6f20 6174 7461 6368 2069 6e76 616c 6964 2070 6179 6c6f 6164 206f 626a 6563 7420 746f 206d 6573 7361 6765 207b 7d2e"
+        , _EFwTextID.eLogMsg_XcoMsgTracer_TID_001                                : "4361 7567 6874 2065 7863 6570 7469 6f6e 2062 656c 6f77 2077 6869 6c65 2070 6173 7369 6e67 2074 7261 6365 2072 6563 6f72 6420 6f66 206d 6573 7361 6765 207b 7d20 746f 2074 6865 206d 6573 7361 6765 2074 7261 6365 2073 696e 6b2c 2074 6865 2073 696e 6b20 6973 2064 6973 6162 6c65 643a 0a09 7b7d"
         , _EFwTextID.eLogMsg_XProcessConn_TID_001                                : "5b 5850 435d 2052 6566 7573 6564 2074 6f20 6372 6561 7465 206e 6577 2078 7072 6f63 6573 7320 696e 7374 616e 6365 2064 7565 2074 6f20 6368 616e 6765 206f 6620 4d50 2070 726f 6365 7373 2073 7461 7274 206d 6574 686f 642e"
         , _EFwTextID.eLogMsg_XProcessConn_TID_002                                : "5b 5850 435d 205b 5072 6f63 6573 733a 7b7d 5d20"
         , _EFwTextID.eLogMsg_XProcessConn_TID_003                                : "5b 5850 435d 2046 6169 6c65 6420 746f 2063 7265 6174 6520 5254 4520 6578 6368 616e 6765 2064 6174 612e"
@@ -756,7 +777,24 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_FwRteConfig_TID_015                                 : "43 6175 6768 7420 7b7d 2065 7863 6570 7469 6f6e 2062 656c 6f77 2077 6869 6c65 2074 7279 696e 6720 746f 2063 6f6e 6669 6772 7565 2072 6564 6972 6563 7469 6f6e 2054 4350 2073 696e 6b20 666f 723a 2069 703d 7b7d 202c 2070 6f72 743d 7b7d 0a09 7b7d"
         , _EFwTextID.eLogMsg_FwRteConfig_TID_016                                 : "456e 636f 756e 7465 7265 6420 696e 7661 6c69 6420 6c69 6e65 2065 6e64 696e 6720 277b 7d27 2077 6869 6c65 2074 7279 696e 6720 746f 2063 6f6e 6669 6772 7565 2072 6564 6972 6563 7469 6f6e 2054 4350 2073 696e 6b20 666f 723a 2069 703d 7b7d 202c 2070 6f72 743d 7b7d"
         , _EFwTextID.eLogMsg_FwRteConfig_TID_017                                 : "5275 6e6e 696e 6720 5079 7468 6f6e 2069 6e74 6572 7072 6574 6572 207b 7d20 646f 6573 206f 6666 6963 6961 6c6c 7920 7375 7070 6f72 7420 6672 6565 2d74 6872 6561 6465 642e 0a54 6865 2066 7261 6d65 776f 726b 2077 696c 6c20 6967 6e6f 7265 2052 5445 2063 6f6e 6669 6775 7261 7469 6f6e 2072 6571 7565 7374 2074 6f20 6279 7061 7373 2065 7870 6572 696d 656e 7461 6c20 6672 6565 2d74 6872 6561 6465 6420 6775 6172 642e"
+        , _EFwTextID.eLogMsg_FwRteConfig_TID_018                                 : "456e 636f 756e 7465 7265 6420 696e 7661 6c69 6420 6f76 6572 666c 6f77 2070 6f6c 6963 7920 277b 7d27 2077 6869 6c65 2074 7279 696e 6720 746f 2063 6f6e 6669 6775 7265 2072 6564 6972 6563 7469 6f6e 2073 696e 6b20 666f 7220 5254 4520 706f 6c69 6379 207b 7d2e"
+        , _EFwTextID.eLogMsg_FwRteConfig_TID_019                                 : "456e 636f 756e 7465 7265 6420 696e 7661 6c69 6420 6d65 7373 6167 6520 7472 6163 6520 7369 6e6b 206f 6620 7479 7065 2027 7b7d 272c 2065 7870 6563 7465 6420 6120 6361 6c6c 6162 6c65 206f 626a 6563 7420 6f72 204e 6f6e 652e"
+        , _EFwTextID.eLogMsg_FwRteConfig_TID_020                                 : "45 6e63 6f75 6e74 6572 6564 2069 6e76 616c 6964 206e 756d 6265 7220 6f66 206d 6573 7361 6765 2064 6973 7061 7463 6820 7368 6172 6473 2027 7b7d 272c 2065 7870 6563 7465 6420 616e 2069 6e74 6567 6572 2076 616c 7565 2069 6e20 7261 6e67 6520 5b31 2e2e 7b7d 5d20 6f72 204e 6f6e 652e"
         , _EFwTextID.eLogMsg_XProcessAgent_001                                   : "4361 6e6e 6f74 2063 7265 6174 6520 6368 696c 6420 7072 6f63 6573 7320 696e 7374 616e 6365 7320 6265 666f 7265 2073 7461 7274 206f 6620 7468 6520 6672 616d 6577 6f72 6b2e"
+        , _EFwTextID.eLogMsg_XProcessPool_TID_001                                : "45 6e63 6f75 6e74 6572 6564 2069 6e76 616c 6964 206e 756d 6265 7220 6f66 2077 6f72 6b65 7273 2070 6173 7365 6420 696e 2074 6f20 6372 6561 7465 2070 726f 6365 7373 2070 6f6f 6c20 696e 7374 616e 6365 3a20 277b 7d27"
+        , _EFwTextID.eLogMsg_XProcessPool_TID_002                                : "52 6566 7573 6564 2074 6f20 7375 626d 6974 206e 6577 206a 6f62 2074 6f20 7072 6f63 6573 7320 706f 6f6c 2027 7b7d 2720 7768 6963 6820 6973 206e 6f74 2073 7461 7274 6564 206f 7220 7368 7574 2064 6f77 6e20 616c 7265 6164 792e"
+        , _EFwTextID.eLogMsg_XProcessPool_TID_003                                : "4661 696c 6564 2074 6f20 7365 7269 616c 697a 6520 7461 7267 6574 2061 6e64 2f6f 7220 6172 6775 6d65 6e74 7320 6f66 206e 6577 206a 6f62 2073 7562 6d69 7474 6564 2074 6f20 7072 6f63 6573 7320 706f 6f6c 2027 7b7d 273a 0a09 7b7d"
+        , _EFwTextID.eLogMsg_XProcessPool_TID_004                                : "43 616e 6e6f 7420 6372 6561 7465 2070 726f 6365 7373 2070 6f6f 6c20 696e 7374 616e 6365 7320 6265 666f 7265 2073 7461 7274 206f 6620 7468 6520 6672 616d 6577 6f72 6b2e"
+        , _EFwTextID.eLogMsg_XProcessPool_TID_005                                : "576f 726b 6572 2070 726f 6365 7373 207b 7d20 6f66 2070 726f 6365 7373 2070 6f6f 6c20 277b 7d27 2074 6572 6d69 6e61 7465 6420 756e 6578 7065 6374 6564 6c79 2c20 6661 696c 6564 2069 7473 2072 756e 6e69 6e67 206a 6f62 207b 7d2e"
+        , _EFwTextID.eLogMsg_XProcessPool_TID_006                                : "4661 696c 6564 2074 6f20 7265 7370 6177 6e20 7465 726d 696e 6174 6564 2077 6f72 6b65 7220 7072 6f63 6573 7320 6f66 2070 726f 6365 7373 2070 6f6f 6c20 277b 7d27 2c20 6e75 6d62 6572 206f 6620 776f 726b 6572 7320 7265 6475 6365 6420 746f 207b 7d2e"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_001                             : "45 6e63 6f75 6e74 6572 6564 2069 6e76 616c 6964 2063 6170 6163 6974 7920 7061 7373 6564 2069 6e20 746f 2063 7265 6174 6520 7072 6f63 6573 7320 6368 616e 6e65 6c20 696e 7374 616e 6365 3a20 277b 7d27"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_002                             : "456e 636f 756e 7465 7265 6420 696e 7661 6c69 6420 7265 6365 6976 6572 2074 6173 6b20 7061 7373 6564 2069 6e20 746f 2063 7265 6174 6520 7072 6f63 6573 7320 6368 616e 6e65 6c20 277b 7d27 3a20 7b7d"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_003                             : "4661 696c 6564 2074 6f20 7365 7269 616c 697a 6520 6d65 7373 6167 6520 746f 2062 6520 7365 6e74 2076 6961 2070 726f 6365 7373 2063 6861 6e6e 656c 2027 7b7d 273a 0a09 7b7d"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_004                             : "5265 6675 7365 6420 746f 2073 656e 6420 6d65 7373 6167 6520 6f66 2073 697a 6520 7b7d 2065 7863 6565 6469 6e67 206d 6178 2e20 6d65 7373 6167 6520 7369 7a65 207b 7d20 6f66 2070 726f 6365 7373 2063 6861 6e6e 656c 2027 7b7d 272e"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_005                             : "4361 6e6e 6f74 2063 7265 6174 6520 7072 6f63 6573 7320 6368 616e 6e65 6c20 696e 7374 616e 6365 7320 6265 666f 7265 2073 7461 7274 206f 6620 7468 6520 6672 616d 6577 6f72 6b2e"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_006                             : "46 6169 6c65 6420 746f 2063 7265 6174 6520 7368 6172 6564 206d 656d 6f72 7920 6f66 2070 726f 6365 7373 2063 6861 6e6e 656c 2027 7b7d 273a 0a09 7b7d"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_007                             : "44 726f 7070 6564 206d 6573 7361 6765 2072 6563 6569 7665 6420 7669 6120 7072 6f63 6573 7320 6368 616e 6e65 6c20 277b 7d27 2061 6674 6572 207b 7d20 6661 696c 6564 2061 7474 656d 7074 7320 746f 2064 656c 6976 6572 2069 7420 746f 2074 6173 6b20 7b7d 2c20 6e75 6d62 6572 206f 6620 6472 6f70 7065 6420 6d65 7373 6167 6573 3a20 7b7d"
+        , _EFwTextID.eLogMsg_XProcessChannel_TID_008                             : "44 726f 7070 6564 206d 6573 7361 6765 2072 6563 6569 7665 6420 7669 6120 7072 6f63 6573 7320 6368 616e 6e65 6c20 277b 7d27 2061 7320 6974 7320 6465 6c69 7665 7279 2074 6f20 7461 736b 207b 7d20 7761 7320 7265 6a65 6374 6564 2c20 6e75 6d62 6572 206f 6620 6472 6f70 7065 6420 6d65 7373 6167 6573 3a20 7b7d"
         , _EFwTextID.eLogMsg_FwRteException_TID_001                              : "3c 554e 5350 4543 4946 4945 442d 5254 452d 4558 4345 5054 494f 4e2d 4d45 5353 4147 453e"
         , _EFwTextID.eLogMsg_FwRteException_TID_002                              : "7b7d 0a09 2020 636f 6465 2020 2020 2020 2020 3a20 7b7d 0a09 2020 6d65 7373 6167 6520 2020 2020 3a20 7b7d"
         , _EFwTextID.eLogMsg_FwRteException_TID_003                              : "0a09 2020 7265 6173 6f6e 2074 7970 6520 3a20 7b7d 0a09 2020 7265 6173 6f6e 2020 2020 2020 3a20 7b7d"
@@ -785,6 +823,8 @@ def _GetFwTextDefines():
         , _EFwTextID.eLogMsg_XProcessTarget_TID_001                              : "5b58 5054 6774 5d20 4361 7567 6874 207b 7d20 6578 6365 7074 696f 6e20 7768 696c 6520 6578 6563 7574 696e 6720 7461 7267 6574 2063 616c 6c62 6163 6b20 6f6e 2063 6869 6c64 2070 726f 6365 7373 207b 7d2e"
         , _EFwTextID.eLogMsg_XProcessTarget_TID_002                              : "5b 5850 5467 745d 2054 6172 6765 7420 6361 6c6c 6261 636b 206f 6e20 6368 696c 6420 7072 6f63 6573 7320 7b7d 2072 6574 7572 6e65 6420 6469 7361 6c6c 6f77 6564 2073 7570 706c 6965 6420 6461 7461 2074 796f 653a 0a09 7b7d"
         , _EFwTextID.eLogMsg_XProcessTarget_TID_003                              : "5b58 5054 6774 5d20 4361 7567 6874 2064 6973 616c 6c6f 7765 6420 6578 6365 7074 696f 6e20 7768 696c 6520 6578 6563 7574 696e 6720 7461 7267 6574 2063 616c 6c62 6163 6b20 6f6e 2063 6869 6c64 2070 726f 6365 7373 207b 7d3a 0a09"
+        , _EFwTextID.eLogMsg_XProcessPoolWorker_TID_001                          : "5b 5850 5057 6b72 5d20 4361 7567 6874 207b 7d20 6578 6365 7074 696f 6e20 7768 696c 6520 6578 6563 7574 696e 6720 6a6f 6220 7b7d 206f 6e20 776f 726b 6572 2070 726f 6365 7373 207b 7d2e"
+        , _EFwTextID.eLogMsg_XProcessPoolWorker_TID_002                          : "5b58 5050 576b 725d 204a 6f62 207b 7d20 6f6e 2077 6f72 6b65 7220 7072 6f63 6573 7320 7b7d 2072 6574 7572 6e65 6420 6469 7361 6c6c 6f77 6564 2073 7570 706c 6965 6420 6461 7461 2074 7970 653a 0a09 7b7d"
         , _EFwTextID.eLogMsg_XCbCase_TID_001                                     : "57 6869 6c65 2063 7265 6174 696e 6720 616e 2069 6e73 7461 6e63 6520 6f66 2063 6c61 7373 2027 7b7d 272c 2066 6f75 6e64 206e 6f20 7661 6c69 6420 6361 6c6c 6261 636b 2070 6172 616d 6574 6572 2873 2920 7061 7373 6564 2074 6f20 7468 6520 632d 746f 722e"
         , _EFwTextID.eLogMsg_XCbCase_TID_002                                     : "57 6869 6c65 2063 7265 6174 696e 6720 616e 2069 6e73 7461 6e63 6520 6f66 2063 6c61 7373 2027 7b7d 272c 2069 676e 6f72 6564 2070 6173 7365 6420 666f 726d 616c 2070 6172 616d 6574 6572 2873 2920 6265 6c6f 7720 6475 6520 746f 2070 7265 6365 6465 6e63 6520 6f66 207b 7d3a 0a09 7b7d"
         , _EFwTextID.eLogMsg_XCbCase_TID_003                                     : "5768 696c 6520 6372 6561 7469 6e67 2061 6e20 696e 7374 616e 6365 206f 6620 636c 6173 7320 277b 7d27 2c20 6465 7465 6374 6564 2064 6973 616c 6c6f 7765 6420 6361 6c6c 6261 636b 2066 756e 6374 696f 6e28 7329 2062 656c 6f77 2066 6f72 2061 206e 6f6e 2d6d 6573 7361 6769 6e67 2074 6173 6b3a 0a09 7b7d"
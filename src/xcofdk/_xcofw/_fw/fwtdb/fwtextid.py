@@ -33,6 +33,8 @@ class _EFwTextID(Enum):
     eMisc_TNPrefix_XTask                        = auto()
     eMisc_TNPrefix_CXTask                       = auto()
     eMisc_TNPrefix_Process                      = auto()
+    eMisc_TNPrefix_ProcessPool                  = auto()
+    eMisc_TNPrefix_ProcessChannel               = auto()
     eMisc_TNPrefix_Runnable                     = auto()
     eMisc_LcResultFailed                        = auto()
     eMisc_LcResultSuccess                       = auto()
@@ -227,6 +229,11 @@ class _EFwTextID(Enum):
     eXTaskPrfBase_ToString_13               = auto()
     eXTaskPrfBase_ToString_14               = auto()
     eXTaskPrfBase_ToString_15               = auto()
+    eXTaskPrfBase_ToString_16               = auto()
+    eXTaskPrfBase_ToString_17               = auto()
+    eXTaskPrfBase_ToString_18               = auto()
+    eXTaskPrfBase_ToString_19               = auto()
+    eXTaskPrfBase_ToString_20               = auto()
 
     eXTaskPrfExt_ToString_02                = auto()
 
@@ -367,6 +374,9 @@ class _EFwTextID(Enum):
     eFwRteConfig_ToString_12              = auto()
     eFwRteConfig_ToString_13              = auto()
     eFwRteConfig_ToString_14              = auto()
+    eFwRteConfig_ToString_15              = auto()
+    eFwRteConfig_ToString_16              = auto()
+    eFwRteConfig_ToString_17              = auto()
 
     eXCbCase_XCallback_ToString_001       = auto()
     eXCbCase_XCallback_ToString_002       = auto()
@@ -378,6 +388,8 @@ class _EFwTextID(Enum):
 
     eXProcessAgent_ToString_001           = auto()
     eXProcessAgent_ToString_002           = auto()
+    eXProcessPool_ToString_001            = auto()
+    eXProcessChannel_ToString_001         = auto()
 
     eLcGuard_ToString_001                 = auto()
 
@@ -485,6 +497,8 @@ class _EFwTextID(Enum):
     eLogMsg_XTaskPrfBase_TID_010   = auto()
     eLogMsg_XTaskPrfBase_TID_012   = auto()
     eLogMsg_XTaskPrfBase_TID_013   = auto()
+    eLogMsg_XTaskPrfBase_TID_014   = auto()
+    eLogMsg_XTaskPrfBase_TID_015   = auto()
 
     eLogMsg_XTaskPrfExt_TID_001    = auto()
     eLogMsg_XTaskPrfExt_TID_002    = auto()
@@ -595,6 +609,7 @@ class _EFwTextID(Enum):
     eLogMsg_LcManager_TID_076      = auto()
     eLogMsg_LcManager_TID_077      = auto()
     eLogMsg_LcManager_TID_078      = auto()
+    eLogMsg_LcManager_TID_079      = auto()
 
     eLogMsg_LcSDC_TID_001          = auto()
     eLogMsg_LcSDC_TID_002          = auto()
@@ -731,6 +746,9 @@ class _EFwTextID(Enum):
     eLogMsg_XcoMsgMgrImpl_TID_033        = auto()
     eLogMsg_XcoMsgMgrImpl_TID_034        = auto()
     eLogMsg_XcoMsgMgrImpl_TID_035        = auto()
+    eLogMsg_XcoMsgMgrImpl_TID_036        = auto()
+    eLogMsg_XcoMsgMgrImpl_TID_037        = auto()
+    eLogMsg_XcoMsgMgrImpl_TID_038        = auto()
 
     eLogMsg_SubsysMsgUtil_TID_001        = auto()
     eLogMsg_SubsysMsgUtil_TID_002        = auto()
@@ -794,6 +812,8 @@ class _EFwTextID(Enum):
     eLogMsg_AbsRunnable_TID_003      = auto()
     eLogMsg_AbsRunnable_TID_004      = auto()
     eLogMsg_AbsRunnable_TID_006      = auto()
+    eLogMsg_AbsRunnable_TID_007      = auto()
+    eLogMsg_AbsRunnable_TID_008      = auto()
 
     eLogMsg_CallableIF_TID_004            = auto()
     eLogMsg_CallableIF_TID_011            = auto()
@@ -817,6 +837,7 @@ class _EFwTextID(Enum):
     eLogMsg_Payload_TID_002               = auto()
 
     eLogMsg_XcoMsgImpl_TID_001            = auto()
+    eLogMsg_XcoMsgTracer_TID_001          = auto()
 
     eLogMsg_XProcessConn_TID_001     = auto()
     eLogMsg_XProcessConn_TID_002     = auto()
@@ -866,8 +887,25 @@ class _EFwTextID(Enum):
     eLogMsg_FwRteConfig_TID_015           = auto()
     eLogMsg_FwRteConfig_TID_016           = auto()
     eLogMsg_FwRteConfig_TID_017           = auto()
+    eLogMsg_FwRteConfig_TID_018           = auto()
+    eLogMsg_FwRteConfig_TID_019           = auto()
+    eLogMsg_FwRteConfig_TID_020           = auto()
 
     eLogMsg_XProcessAgent_001             = auto()
+    eLogMsg_XProcessPool_TID_001          = auto()
+    eLogMsg_XProcessPool_TID_002          = auto()
+    eLogMsg_XProcessPool_TID_003          = auto()
+    eLogMsg_XProcessPool_TID_004          = auto()
+    eLogMsg_XProcessPool_TID_005          = auto()
+    eLogMsg_XProcessPool_TID_006          = auto()
+    eLogMsg_XProcessChannel_TID_001       = auto()
+    eLogMsg_XProcessChannel_TID_002       = auto()
+    eLogMsg_XProcessChannel_TID_003       = auto()
+    eLogMsg_XProcessChannel_TID_004       = auto()
+    eLogMsg_XProcessChannel_TID_005       = auto()
+    eLogMsg_XProcessChannel_TID_006       = auto()
+    eLogMsg_XProcessChannel_TID_007       = auto()
+    eLogMsg_XProcessChannel_TID_008       = auto()
 
     eLogMsg_FwRteException_TID_001        = auto()
     eLogMsg_FwRteException_TID_002        = auto()
@@ -900,6 +938,8 @@ class _EFwTextID(Enum):
     eLogMsg_XProcessTarget_TID_001        = auto()
     eLogMsg_XProcessTarget_TID_002        = auto()
     eLogMsg_XProcessTarget_TID_003        = auto()
+    eLogMsg_XProcessPoolWorker_TID_001    = auto()
+    eLogMsg_XProcessPoolWorker_TID_002    = auto()
 
     eLogMsg_XCbCase_TID_001               = auto()
     eLogMsg_XCbCase_TID_002               = auto()
@@ -10,11 +10,13 @@
 import logging
 from   enum      import unique
 from   threading import RLock as _PyRLock
+from   typing    import Callable
 from   typing    import List
 from   typing    import Union
 
 from xcofdk.fwcom.fwdefs import ERtePolicyID
 from xcofdk.fwcom.fwdefs import ELineEnding
+from xcofdk.fwcom.fwdefs import ELogRDOverflowPolicy
 
 from _fw.fwssys.fwcore.logging           import logif
 from _fw.fwssys.fwcore.base.fsutil       import _FSUtil
@@ -49,6 +51,12 @@ class _EFwRtePolicyID(_ERtePolicyBase):
     bfEnableLogRDFileSink         = (0x00001 << ERtePolicyID.eEnableLogRDFileSink )
     bfEnableLogRDTcpSink          = (0x00001 << ERtePolicyID.eEnableLogRDTcpSink)
 
+    bfEnableCompactMsgSerDes      = (0x00001 << ERtePolicyID.eEnableCompactMessageSerDes)
+
+    bfEnableMsgLatencyTracing     = (0x00001 << ERtePolicyID.eEnableMessageLatencyTracing)
+
+    bfEnableShardedMsgDispatch    = (0x00001 << ERtePolicyID.eEnableShardedMessageDispatch)
+
     @staticmethod
     def _FromFwRtePolicyID(policyID_ : ERtePolicyID):
         if not isinstance(policyID_, ERtePolicyID):
@@ -67,12 +75,13 @@ class _RDFileHandler(logging.FileHandler):
         logging.FileHandler.emit(self, record_)
 
 class _RDSinkConfig:
-    __slots__ = [ '__bF' , '__fp' , '__fm' , '__pl' , '__ip' , '__pt' , '__le' ]
+    __slots__ = [ '__bF' , '__fp' , '__fm' , '__pl' , '__ip' , '__pt' , '__le' , '__op' ]
 
     def __init__( self
                 , bFileSink_ : bool
                 , filePath_  : str =None, fileMode_ : str =None, pyLogger_   : logging.Logger =None
-                , ip_        : str =None, port_     : int =None, lineEnding_ : str            =None):
+                , ip_        : str =None, port_     : int =None, lineEnding_ : str            =None
+                , overflowPolicy_ : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST):
         self.__bF = bFileSink_
         self.__fp = filePath_
         self.__fm = fileMode_
@@ -80,6 +89,7 @@ class _RDSinkConfig:
         self.__pt = port_
         self.__ip = ip_
         self.__le = lineEnding_
+        self.__op = overflowPolicy_
 
     @property
     def isTcpSinkConfig(self) -> bool:
@@ -113,11 +123,18 @@ class _RDSinkConfig:
     def lineEnding(self) -> str:
         return self.__le
 
+    @property
+    def overflowPolicy(self) -> ELogRDOverflowPolicy:
+        return self.__op
+
 class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
-    __slots__ = [ '__l' , '__bm' , '__bF' , '__fc' , '__tc', '__m' ]
+    __slots__ = [ '__l' , '__bm' , '__bF' , '__fc' , '__tc', '__m' , '__ms' , '__ns' ]
 
     __sgltn = None
 
+    __MAX_NUM_DISP_SHARDS     = 64
+    __DEFAULT_NUM_DISP_SHARDS = 4
+
     def __init__(self):
         self.__l  = _PyRLock()
         self.__m  = None
@@ -125,6 +142,8 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
         self.__bm = _EFwRtePolicyID.bfEnableAutoStopByDefault
         self.__fc = None
         self.__tc = None
+        self.__ms = None
+        self.__ns = 0
         _AbsSlotsObject.__init__(self)
         _IFwRteConfig.__init__(self)
 
@@ -181,6 +200,18 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
     def _isLogRDTcpSinkEnabled(self) -> bool:
         return self.__IsRtePolicySet(ERtePolicyID.eEnableLogRDTcpSink)
 
+    @_IFwRteConfig._isCompactMessageSerDesEnabled.getter
+    def _isCompactMessageSerDesEnabled(self) -> bool:
+        return self.__IsRtePolicySet(ERtePolicyID.eEnableCompactMessageSerDes)
+
+    @_IFwRteConfig._isMessageLatencyTracingEnabled.getter
+    def _isMessageLatencyTracingEnabled(self) -> bool:
+        return self.__IsRtePolicySet(ERtePolicyID.eEnableMessageLatencyTracing)
+
+    @_IFwRteConfig._isShardedMessageDispatchEnabled.getter
+    def _isShardedMessageDispatchEnabled(self) -> bool:
+        return self.__IsRtePolicySet(ERtePolicyID.eEnableShardedMessageDispatch)
+
     @property
     def _isFrozen(self) -> bool:
         if not self.__IsValid():
@@ -208,6 +239,14 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
     def _rdFileSinkConfig(self) -> Union[_RDSinkConfig, None]:
         return self.__fc
 
+    @property
+    def _msgTraceSink(self) -> Union[Callable, None]:
+        return self.__ms
+
+    @property
+    def _numMsgDispatchShards(self) -> int:
+        return self.__ns if self._isShardedMessageDispatchEnabled else 0
+
     @staticmethod
     def _GetInstance(bFreeze_ =False):
         res = _FwRteConfig.__sgltn
@@ -218,13 +257,17 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
         return res
 
     @staticmethod
-    def _ConfigureRtePolicy( rtePolicy_          : Union[ERtePolicyID, List[ERtePolicyID]]
-                           , rdFileSinkPath_     : Union[str, None] =None
-                           , rdFileSinkEncoding_ : Union[str, None] =_CommonDefines._STR_ENCODING_UTF8
-                           , rdFileSinkAppend_   : bool             =False
-                           , rdTcpSinkIpAddr_    : str              =None
-                           , rdTcpSinkPort_      : int              =None
-                           , rdTcpSinkLineEnding_: ELineEnding      =ELineEnding.NOLE ) -> _IFwRteConfig:
+    def _ConfigureRtePolicy( rtePolicy_                : Union[ERtePolicyID, List[ERtePolicyID]]
+                           , rdFileSinkPath_           : Union[str, None]     =None
+                           , rdFileSinkEncoding_       : Union[str, None]     =_CommonDefines._STR_ENCODING_UTF8
+                           , rdFileSinkAppend_         : bool                 =False
+                           , rdTcpSinkIpAddr_          : str                  =None
+                           , rdTcpSinkPort_            : int                  =None
+                           , rdTcpSinkLineEnding_      : ELineEnding          =ELineEnding.NOLE
+                           , rdFileSinkOverflowPolicy_ : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST
+                           , rdTcpSinkOverflowPolicy_  : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST
+                           , msgTraceSink_             : Union[Callable, None] =None
+                           , numDispatchShards_        : Union[int, None]      =None) -> _IFwRteConfig:
         res = _FwRteConfig._GetInstance()
         if res._isFrozen:
             if isinstance(rtePolicy_, ERtePolicyID) or (isinstance(rtePolicy_, list) and len(rtePolicy_)):
@@ -266,6 +309,24 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
                     pass
                 elif _pp == ERtePolicyID.eDisableLogRDConsoleSink:
                     pass
+                elif _pp == ERtePolicyID.eEnableCompactMessageSerDes:
+                    pass
+                elif _pp == ERtePolicyID.eEnableMessageLatencyTracing:
+                    if msgTraceSink_ is not None:
+                        if not callable(msgTraceSink_):
+                            res.__m = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteConfig_TID_019).format(type(msgTraceSink_).__name__)
+                            logif._XLogErrorEC(_EFwErrorCode.UE_00285, res.__m)
+                        else:
+                            res.__ms = msgTraceSink_
+                elif _pp == ERtePolicyID.eEnableShardedMessageDispatch:
+                    _maxNS = _FwRteConfig.__MAX_NUM_DISP_SHARDS
+                    if numDispatchShards_ is None:
+                        res.__ns = _FwRteConfig.__DEFAULT_NUM_DISP_SHARDS
+                    elif isinstance(numDispatchShards_, bool) or not isinstance(numDispatchShards_, int) or not (0 < numDispatchShards_ <= _maxNS):
+                        res.__m = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteConfig_TID_020).format(str(numDispatchShards_), _maxNS)
+                        logif._XLogErrorEC(_EFwErrorCode.UE_00289, res.__m)
+                    else:
+                        res.__ns = numDispatchShards_
                 elif (_pp == ERtePolicyID.eEnableLogRDFileSink) or (_pp == ERtePolicyID.eEnableLogRDTcpSink):
                     res = _FwRteConfig._ConfigureRDSink( _pp
                                                        , rdFileSinkPath_=rdFileSinkPath_
@@ -273,7 +334,9 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
                                                        , rdFileSinkAppend_=rdFileSinkAppend_
                                                        , rdTcpSinkIpAddr_=rdTcpSinkIpAddr_
                                                        , rdTcpSinkPort_=rdTcpSinkPort_
-                                                       , rdTcpSinkLineEnding_=rdTcpSinkLineEnding_)
+                                                       , rdTcpSinkLineEnding_=rdTcpSinkLineEnding_
+                                                       , rdFileSinkOverflowPolicy_=rdFileSinkOverflowPolicy_
+                                                       , rdTcpSinkOverflowPolicy_=rdTcpSinkOverflowPolicy_)
                 else:
                     res.__m = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteConfig_TID_006).format(str(_pp))
                     logif._XLogErrorEC(_EFwErrorCode.UE_00213, res.__m)
@@ -338,13 +401,15 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
         return res
 
     @staticmethod
-    def _ConfigureRDSink( rtePolicy_          : ERtePolicyID
-                        , rdFileSinkPath_     : Union[str, None] =None
-                        , rdFileSinkEncoding_ : Union[str, None] =_CommonDefines._STR_ENCODING_UTF8
-                        , rdFileSinkAppend_   : bool             =False
-                        , rdTcpSinkIpAddr_    : str              =None
-                        , rdTcpSinkPort_      : int              =None
-                        , rdTcpSinkLineEnding_: ELineEnding      =ELineEnding.NOLE ) -> _IFwRteConfig:
+    def _ConfigureRDSink( rtePolicy_                : ERtePolicyID
+                        , rdFileSinkPath_           : Union[str, None]     =None
+                        , rdFileSinkEncoding_       : Union[str, None]     =_CommonDefines._STR_ENCODING_UTF8
+                        , rdFileSinkAppend_         : bool                 =False
+                        , rdTcpSinkIpAddr_          : str                  =None
+                        , rdTcpSinkPort_            : int                  =None
+                        , rdTcpSinkLineEnding_      : ELineEnding          =ELineEnding.NOLE
+                        , rdFileSinkOverflowPolicy_ : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST
+                        , rdTcpSinkOverflowPolicy_  : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST) -> _IFwRteConfig:
         res = _FwRteConfig._GetInstance()
         if res._isFrozen:
             return res
@@ -359,6 +424,11 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
         elif (rtePolicy_ == ERtePolicyID.eEnableLogRDTcpSink) and (res.__tc is not None):
             _ec     = _EFwErrorCode.UE_00263
             res.__m = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteConfig_TID_011)
+        else:
+            _op = rdFileSinkOverflowPolicy_ if rtePolicy_ == ERtePolicyID.eEnableLogRDFileSink else rdTcpSinkOverflowPolicy_
+            if not isinstance(_op, ELogRDOverflowPolicy):
+                _ec     = _EFwErrorCode.UE_00274
+                res.__m = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteConfig_TID_018).format(str(_op), rtePolicy_.name)
 
         if res.__m is not None:
             logif._XLogErrorEC(_ec, res.__m)
@@ -376,7 +446,7 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
                 _fh.setLevel(logging.INFO)
                 _fh.setFormatter(_fmt)
                 _pylog.addHandler(_fh)
-                res.__fc = _RDSinkConfig(True, filePath_=_fp, fileMode_=_fm, pyLogger_=_pylog)
+                res.__fc = _RDSinkConfig(True, filePath_=_fp, fileMode_=_fm, pyLogger_=_pylog, overflowPolicy_=rdFileSinkOverflowPolicy_)
             except (FileNotFoundError, Exception) as _xcp:
                 res.__m = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteConfig_TID_014).format(type(_xcp).__name__, _xcp)
                 logif._XLogErrorEC(_EFwErrorCode.UE_00264, res.__m)
@@ -400,7 +470,8 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
                     res.__m = _FwTDbEngine.GetText(_EFwTextID.eLogMsg_FwRteConfig_TID_015).format(type(_xcp).__name__, rdTcpSinkIpAddr_, rdTcpSinkPort_, _xcp)
                     logif._XLogErrorEC(_EFwErrorCode.UE_00265, res.__m)
                 else:
-                    res.__tc = _RDSinkConfig(False, ip_=rdTcpSinkIpAddr_, port_=rdTcpSinkPort_, lineEnding_=_FwRteConfig._EncodeLineEnding(rdTcpSinkLineEnding_))
+                    res.__tc = _RDSinkConfig( False, ip_=rdTcpSinkIpAddr_, port_=rdTcpSinkPort_, lineEnding_=_FwRteConfig._EncodeLineEnding(rdTcpSinkLineEnding_)
+                                            , overflowPolicy_=rdTcpSinkOverflowPolicy_)
         return res
 
     def _ToString(self):
@@ -424,6 +495,9 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
             res += _FMT.format(_FwTDbEngine.GetText(_EFwTextID.eFwRteConfig_ToString_12) , str(self._isLogRDConsoleSinkDisabled))
             res += _FMT.format(_FwTDbEngine.GetText(_EFwTextID.eFwRteConfig_ToString_13) , str(self._isLogRDFileSinkEnabled))
             res += _FMT.format(_FwTDbEngine.GetText(_EFwTextID.eFwRteConfig_ToString_14) , str(self._isLogRDTcpSinkEnabled))
+            res += _FMT.format(_FwTDbEngine.GetText(_EFwTextID.eFwRteConfig_ToString_15) , str(self._isCompactMessageSerDesEnabled))
+            res += _FMT.format(_FwTDbEngine.GetText(_EFwTextID.eFwRteConfig_ToString_16) , str(self._isMessageLatencyTracingEnabled))
+            res += _FMT.format(_FwTDbEngine.GetText(_EFwTextID.eFwRteConfig_ToString_17) , str(self._isShardedMessageDispatchEnabled))
             if self.__m is not None:
                 res += _FwTDbEngine.GetText(_EFwTextID.eFwRteConfig_ToString_05).format(self.__m)
         return res
@@ -437,6 +511,8 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
         self.__bm = None
         self.__fc = None
         self.__tc = None
+        self.__ms = None
+        self.__ns = None
 
     @staticmethod
     def _EncodeLineEnding(rdTcpSinkLineEnding_: ELineEnding) -> Union[str, None]:
@@ -456,13 +532,14 @@ class _FwRteConfig(_AbsSlotsObject, _IFwRteConfig):
         return self.__bm is not None
 
     def __IsRtePolicySet(self, rtePolicyID_ : Union[ERtePolicyID, _EFwRtePolicyID]):
-        if not self.__IsValid():
+        _bm = self.__bm
+        if _bm is None:
             return False
 
-        with self.__l:
-            res = isinstance(rtePolicyID_, _EFwRtePolicyID)
-            if (not res) and isinstance(rtePolicyID_, ERtePolicyID):
-                res = True
-                rtePolicyID_ = _EFwRtePolicyID._FromFwRtePolicyID(rtePolicyID_)
-            res = res and _EBitMask.IsEnumBitFlagSet(self.__bm, rtePolicyID_)
-        return res
+        if isinstance(rtePolicyID_, _EFwRtePolicyID):
+            _bf = rtePolicyID_.value
+        elif isinstance(rtePolicyID_, ERtePolicyID):
+            _bf = 0x00001 << rtePolicyID_.value
+        else:
+            return False
+        return (_bm.value & _bf) != 0
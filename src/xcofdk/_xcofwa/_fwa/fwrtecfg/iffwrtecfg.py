@@ -59,3 +59,15 @@ class _IFwRteConfig:
     @property
     def _isLogRDTcpSinkEnabled(self) -> bool:
         pass
+
+    @property
+    def _isCompactMessageSerDesEnabled(self) -> bool:
+        pass
+
+    @property
+    def _isMessageLatencyTracingEnabled(self) -> bool:
+        pass
+
+    @property
+    def _isShardedMessageDispatchEnabled(self) -> bool:
+        pass
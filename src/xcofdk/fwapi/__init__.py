@@ -47,3 +47,5 @@ from .fwctrl import XFAsyncCommTask
 from .fwctrl import XFMessageDrivenTask
 from .fwctrl import GetCurTask
 from .fwctrl import XProcess
+from .fwctrl import XProcessPool
+from .fwctrl import XProcessChannel
@@ -12,12 +12,14 @@
 # Import libs / modules
 # ------------------------------------------------------------------------------
 from enum   import IntEnum
+from typing import List
 from typing import Union
 
 from .iftask      import ITask
 from .ifmessage   import IMessage
 from .ifpayload   import IPayload
 from xcofdk.fwcom import EXmsgPredefinedID
+from xcofdk.fwcom import EXmsgPriority
 
 
 # ------------------------------------------------------------------------------
@@ -39,6 +41,8 @@ class IRCTask(ITask):
         >>> IRCTask.SelfCheckSleep
         >>> IRCTask.SendMessage()
         >>> IRCTask.BroadcastMessage()
+        >>> IRCTask.SendMessages()
+        >>> IRCTask.BroadcastMessages()
     """
 
     __slots__ = []
@@ -101,7 +105,8 @@ class IRCTask(ITask):
                    , rxTask_       : Union[ITask, IntEnum, int]
                    , msgLabelID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
                    , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                   , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                   , msgPayload_   : Union[IPayload, dict] =None
+                   , msgPriority_  : EXmsgPriority         =None) -> int:
         """
         Request to submit an external message with this instance taken as
         sender.
@@ -123,6 +128,10 @@ class IRCTask(ITask):
               optional pre-/user-defined message cluster.
             - msgPayload_ :
               payload (if any) to be associated to the message to be sent.
+            - msgPriority_ :
+              optional delivery priority of the message to be sent, it
+              overrides the priority configured by the receiver task (if any)
+              for the label of the message.
 
         Returns:
         ----------
@@ -146,6 +155,7 @@ class IRCTask(ITask):
             >>> IMessage
             >>> IPayload
             >>> EXmsgPredefinedID
+            >>> EXmsgPriority
             >>> IRCTask.BroadcastMessage()
             >>> IRCCommTask.TriggerExternalQueueProcessing()
         """
@@ -155,7 +165,8 @@ class IRCTask(ITask):
     def BroadcastMessage( self
                         , msgLabelID_   : Union[IntEnum, int]
                         , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                        , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                        , msgPayload_   : Union[IPayload, dict] =None
+                        , msgPriority_  : EXmsgPriority         =None) -> int:
         """
         Request to broadcast an external message with this instance taken as
         sender.
@@ -176,6 +187,10 @@ class IRCTask(ITask):
               optional pre-/user-defined message cluster.
             - msgPayload_ :
               payload (if any) to be associated to the message to be sent.
+            - msgPriority_ :
+              optional delivery priority of the message to be sent, it
+              overrides the priority configured by the receiver task (if any)
+              for the label of the message.
 
         Returns:
         ----------
@@ -199,11 +214,84 @@ class IRCTask(ITask):
             >>> IMessage
             >>> IPayload
             >>> EXmsgPredefinedID
+            >>> EXmsgPriority
             >>> EXmsgPredefinedID.Broadcast
             >>> IRCTask.SendMessage()
             >>> IRCCommTask.TriggerExternalQueueProcessing()
         """
         pass
+
+
+    def SendMessages(self, msgs_ : List[tuple]) -> List[int]:
+        """
+        Request to submit a batch of external messages with this instance
+        taken as sender.
+
+        It works the same way as 'SendMessage()' explained above except for
+        the sender task is validated once for the whole batch, and messages
+        addressed to the same receiver are put to the external queue of that
+        receiver by one single queue operation.
+
+        Parameters:
+        -------------
+            - msgs_ :
+              list (or tuple) of message entries to be sent, each given as a
+              tuple of below form with the trailing items being optional:
+                  (rxTask_, msgLabelID_[, msgPayload_[, msgClusterID_]])
+
+        Returns:
+        ----------
+            List of integer numbers of the same length as passed in sequence
+            'msgs_', each item is either a positive integer number uniquely
+            identifying the message object sent for the respective entry, or
+            0 if sending that entry failed.
+
+        Note:
+        ------
+            - The request will be ignored by the framework if:
+                  - this instance is not the currently running task,
+                  - messaging subsystem 'xmsg' is disabled via RTE policy
+                    configuration.
+            - This API function is described in more detail by class XMessenger.
+
+        See:
+        -----
+            - class XMessenger
+            >>> IRCTask.SendMessage()
+            >>> IRCTask.BroadcastMessages()
+        """
+        pass
+
+
+    def BroadcastMessages(self, msgs_ : List[tuple]) -> List[int]:
+        """
+        Request to broadcast a batch of external messages with this instance
+        taken as sender.
+
+        It works exactly the same way as 'SendMessages()' explained above
+        except for the form of the message entries passed in, each given as a
+        tuple of below form with the trailing items being optional:
+            (msgLabelID_[, msgPayload_[, msgClusterID_]])
+
+        Parameters:
+        -------------
+            - msgs_ :
+              list (or tuple) of message entries to be broadcast.
+
+        Returns:
+        ----------
+            List of integer numbers of the same length as passed in sequence
+            'msgs_', each item is either a positive integer number uniquely
+            identifying the message object sent for the respective entry, or
+            0 if broadcasting that entry failed.
+
+        See:
+        -----
+            - class XMessenger
+            >>> IRCTask.BroadcastMessage()
+            >>> IRCTask.SendMessages()
+        """
+        pass
     # ------------------------------------------------------------------------------
     #END 7) message handling
     # ------------------------------------------------------------------------------
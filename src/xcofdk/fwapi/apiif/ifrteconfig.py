@@ -174,6 +174,39 @@ class IRteConfig:
            sink is enabled, False otherwise.
         """
         pass
+
+
+    @property
+    def isCompactMessageSerDesEnabled(self) -> bool:
+        """
+        Returns:
+        ----------
+           True if the RTE policy to enable the compact serialization format
+           for messages is enabled, False otherwise.
+        """
+        pass
+
+
+    @property
+    def isMessageLatencyTracingEnabled(self) -> bool:
+        """
+        Returns:
+        ----------
+           True if the RTE policy to enable tracing of message latencies is
+           enabled, False otherwise.
+        """
+        pass
+
+
+    @property
+    def isShardedMessageDispatchEnabled(self) -> bool:
+        """
+        Returns:
+        ----------
+           True if the RTE policy to enable sharded dispatching of messages
+           is enabled, False otherwise.
+        """
+        pass
     # ------------------------------------------------------------------------------
     #END API
     # ------------------------------------------------------------------------------
@@ -11,9 +11,12 @@
 # ------------------------------------------------------------------------------
 # Import libs / modules
 # ------------------------------------------------------------------------------
+from typing import Dict
 from typing import Union
 
 from xcofdk.fwcom import EExecutionCmdID
+from xcofdk.fwcom import ERunPhaseSchedulingPolicy
+from xcofdk.fwcom import EXmsgPriority
 
 
 # ------------------------------------------------------------------------------
@@ -474,6 +477,213 @@ class ITaskProfile:
             >>> ITaskProfile.isExternalQueueEnabled
         """
         pass
+
+
+    @property
+    def isExternalQueueLockLight(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if the external queue of a task is configured to use the
+            lock-light queue implementation of the framework, False otherwise.
+
+        Note:
+        ------
+            - The property defaults to False.
+            - A lock-light external queue is built upon atomic append/pop
+              operations of a double-ended queue plus a single lightweight
+              wake-up primitive for blocking external queues, thus it avoids
+              the locking overhead of the default queue implementation for
+              each message delivered to the task.
+            - The property has no effect if support for external queue is not
+              enabled.
+
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueEnabled
+            >>> ITaskProfile.isExternalQueueSingleProducer
+        """
+        pass
+
+
+    @isExternalQueueLockLight.setter
+    def isExternalQueueLockLight(self, vv_ : bool):
+        """
+        Setter property used to enable the lock-light implementation of the
+        external queue.
+
+        Parameters:
+        -------------
+            - vv_ :
+            True if the external queue shall use the lock-light queue
+            implementation, False otherwise.
+
+        Note:
+        ------
+            - If disabled, then the single-producer configuration of the
+              external queue is disabled, too.
+
+        See:
+        -----
+            >>> ITaskProfile.isFrozen
+            >>> ITaskProfile.isExternalQueueSingleProducer
+        """
+        pass
+
+
+    @property
+    def isExternalQueueSingleProducer(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if the lock-light external queue of a task is configured as
+            a single-producer/single-consumer (SPSC) queue, False otherwise,
+            i.e. a multiple-producer/single-consumer (MPSC) queue.
+
+        Note:
+        ------
+            - The property defaults to False.
+            - Appending to an unbounded lock-light queue is always done
+              without any lock. For a bounded one, the size check is guarded
+              by a lock unless the queue is an SPSC queue. The latter relies
+              on the producer side to own the length accounting, i.e. on all
+              messages being pushed to the queue one at a time.
+            - Messages are delivered by the framework on the thread of their
+              senders, but pushing them to the external queue of a given task
+              is always serialized by the message dispatcher. Hence, enabling
+              this property is safe regardless of the number of senders.
+
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueLockLight
+        """
+        pass
+
+
+    @isExternalQueueSingleProducer.setter
+    def isExternalQueueSingleProducer(self, vv_ : bool):
+        """
+        Setter property used to configure the lock-light external queue as an
+        SPSC queue.
+
+        Parameters:
+        -------------
+            - vv_ :
+            True if the lock-light external queue shall be an SPSC queue,
+            False otherwise.
+
+        Note:
+        ------
+            - If enabled, then the lock-light implementation of the external
+              queue is enabled (if not done already), too.
+
+        See:
+        -----
+            >>> ITaskProfile.isFrozen
+            >>> ITaskProfile.isExternalQueueLockLight
+        """
+        pass
+
+
+    @property
+    def isExternalQueueFastDelivery(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if messages delivered to the external queue of a task are
+            passed to its callback for processing external messages in fast
+            delivery mode, False otherwise.
+
+        Note:
+        ------
+            - The property defaults to False.
+            - In fast delivery mode the task reuses one single message object
+              for all messages it processes, rebinding it to the respective
+              message right before the callback is called. Also, the header
+              object of the message is created on first access only, and
+              internal queue entries are recycled by the task.
+            - Hence, the message object passed to the callback is valid for
+              the duration of that call only. A task must not keep a
+              reference to it (or to its header object) for later use. The
+              payload of the message, however, is not affected.
+            - The property has no effect if support for external queue is not
+              enabled.
+
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueEnabled
+            >>> XTask.ProcessExternalMessage()
+        """
+        pass
+
+
+    @isExternalQueueFastDelivery.setter
+    def isExternalQueueFastDelivery(self, vv_ : bool):
+        """
+        Setter property used to enable the fast delivery mode of messages
+        delivered to the external queue.
+
+        Parameters:
+        -------------
+            - vv_ :
+            True if the external queue shall use fast delivery mode, False
+            otherwise.
+
+        See:
+        -----
+            >>> ITaskProfile.isFrozen
+            >>> ITaskProfile.isExternalQueueFastDelivery
+        """
+        pass
+
+
+    @property
+    def externalQueuePriorityLabels(self) -> Union[Dict[int, EXmsgPriority], None]:
+        """
+        Returns:
+        ----------
+            A copy of the mapping of message labels to message priorities
+            applied by a task to messages delivered to its external queue, or
+            None if no such mapping is configured.
+
+        Note:
+        ------
+            - The property defaults to None, i.e. all messages are of priority
+              'EXmsgPriority.Normal' unless specified by their sender.
+            - Messages of priority 'High' or 'Urgent' bypass all messages of
+              a lower priority currently put to the external queue.
+            - A priority passed to 'SendMessage()' or 'BroadcastMessage()' by
+              the sender overrides the priority configured for the label of
+              that message.
+            - The property has no effect if support for external queue is not
+              enabled.
+
+        See:
+        -----
+            >>> EXmsgPriority
+            >>> ITaskProfile.isExternalQueueEnabled
+        """
+        pass
+
+
+    @externalQueuePriorityLabels.setter
+    def externalQueuePriorityLabels(self, vv_ : Union[Dict[int, EXmsgPriority], None]):
+        """
+        Setter property used to configure the priority of messages delivered
+        to the external queue based on their label.
+
+        Parameters:
+        -------------
+            - vv_ :
+            dictionary mapping (pre-/user-defined) message labels to the
+            message priority to be applied, or None to remove the mapping.
+
+        See:
+        -----
+            >>> ITaskProfile.isFrozen
+            >>> ITaskProfile.externalQueuePriorityLabels
+        """
+        pass
     # --------------------------------------------------------------------------
     #END 4) API queue configuration
     # --------------------------------------------------------------------------
@@ -631,6 +841,51 @@ class ITaskProfile:
             >>> ITaskProfile.isFrozen
         """
         pass
+
+
+    @property
+    def runPhaseSchedulingPolicy(self) -> ERunPhaseSchedulingPolicy:
+        """
+        Returns:
+        ----------
+            The scheduling policy used for the run phase of cyclic tasks.
+
+        Note:
+        ------
+            - It defaults to FIXED_DELAY, that is the task pauses for the
+              configured run phase frequency after each iteration.
+            - Fixed-rate policies start each iteration at an absolute deadline
+              instead, so that the cycle period is not affected by the
+              processing time of the iterations.
+            - The property has no effect for single-cycle tasks.
+
+        See:
+        -----
+            >>> ERunPhaseSchedulingPolicy
+            >>> ITaskProfile.isCyclicRunPhase
+            >>> ITaskProfile.runPhaseFrequencyMS
+            >>> ITaskProfile.runPhaseMaxProcessingTimeMS
+        """
+        pass
+
+
+    @runPhaseSchedulingPolicy.setter
+    def runPhaseSchedulingPolicy(self, vv_ : ERunPhaseSchedulingPolicy):
+        """
+        Setter property used to configure the scheduling policy of the run
+        phase of a task instance to be created.
+
+        Parameters:
+        -------------
+            - vv_ :
+              scheduling policy to be used.
+
+        See:
+        -----
+            >>> ITaskProfile.isFrozen
+            >>> ERunPhaseSchedulingPolicy
+        """
+        pass
     # --------------------------------------------------------------------------
     #END 5) API timing configuration
     # --------------------------------------------------------------------------
@@ -56,6 +56,8 @@ from .fwutil import GetLcFailure
 
 from xcofdk.fwapi            import ITask
 from xcofdk.fwapi.xmp        import XProcess
+from xcofdk.fwapi.xmp        import XProcessPool
+from xcofdk.fwapi.xmp        import XProcessChannel
 from xcofdk.fwapi.xmt.rctask import RCTask
 from xcofdk.fwapi.xmt.rctask import RCCommTask
 from xcofdk.fwapi.xmt.rctask import SyncTask
@@ -11,10 +11,13 @@
 # ------------------------------------------------------------------------------
 # Import libs / modules
 # ------------------------------------------------------------------------------
+from typing import List
 from typing import Union
 
 from xcofdk.fwcom import EXmsgPredefinedID
 from xcofdk.fwcom import LcFailure
+from xcofdk.fwcom import TaskMetrics
+from xcofdk.fwcom import MessageLatency
 from xcofdk.fwapi import ITask
 from xcofdk.fwapi import ITaskError
 
@@ -82,6 +85,62 @@ def IsTaskRunning(taskUID_ : Union[int, EXmsgPredefinedID]) -> bool:
     return _FwApiBase.FwApiIsXTaskRunning(taskUID_)
 
 
+def GetTaskMetrics(tasks_ : Union[int, List[int], None] =None) -> List[TaskMetrics]:
+    """
+    Getter for a snapshot of the runtime metrics of currently registered
+    tasks, including framework's own services.
+
+    Parameters:
+    -------------
+        - tasks_ :
+          if specified UID of a task or a list of task UIDs to be considered
+          only. Otherwise, all registered tasks are considered.
+
+    Returns:
+    ----------
+        A list of instances of TaskMetrics, one for each task considered,
+        if the framework is available. An empty list otherwise.
+
+    Note:
+    ------
+        - Metrics are collected by each task while executing its run phase.
+          The snapshot taken is not synchronized with the running tasks,
+          that is it may be (slightly) outdated by the time it is returned.
+        - The request can be made from any thread, either a task or not.
+
+    See:
+    -----
+        >>> TaskMetrics
+        >>> ITask.taskUID
+    """
+    return _FwApiBase.FwApiGetTaskMetrics(tasks_)
+
+
+def GetMessageLatencies() -> List[MessageLatency]:
+    """
+    Getter for the latency statistics of messages traced so far.
+
+    Returns:
+    ----------
+        A list of instances of MessageLatency, one for each combination of
+        sender, receiver and label of traced messages. An empty list if no
+        message has been traced.
+
+    Note:
+    ------
+        - Messages are traced only if the RTE policy to enable tracing of
+          message latencies is configured.
+        - The request can be made from any thread, either a task or not.
+
+    See:
+    -----
+        >>> MessageLatency
+        >>> ERtePolicyID.eEnableMessageLatencyTracing
+        >>> RtePolicyEnableMessageLatencyTracing()
+    """
+    return _FwApiBase.FwApiGetMessageLatencies()
+
+
 def IsFTPythonVersion() -> bool:
     """
     Returns:
@@ -19,49 +19,150 @@ from xcofdk.fwapi import ITaskError
 # ------------------------------------------------------------------------------
 # Interface
 # ------------------------------------------------------------------------------
-def LogTrace(logMsg_ : str):
+def IsTraceEnabled() -> bool:
+    """
+    Returns:
+        - True if trace messages are currently passed to the output, False
+          otherwise.
+
+    Note:
+    ------
+        - Callers can use this function to skip building expensive trace
+          messages which would be discarded anyway.
+    """
+    return xlogifbase._XIsTraceEnabled()
+
+
+def IsDebugEnabled() -> bool:
+    """
+    Returns:
+        - True if debug messages are currently passed to the output, False
+          otherwise.
+
+    See:
+    -----
+        >>> IsTraceEnabled()
+    """
+    return xlogifbase._XIsDebugEnabled()
+
+
+def IsInfoEnabled() -> bool:
+    """
+    Returns:
+        - True if info messages are currently passed to the output, False
+          otherwise.
+
+    See:
+    -----
+        >>> IsTraceEnabled()
+    """
+    return xlogifbase._XIsInfoEnabled()
+
+
+def IsLogLevelEnabled(logLevel_ : str) -> bool:
+    """
+    Returns:
+        - True if log requests of the passed in log level are currently
+          passed to the output, False otherwise.
+
+    Parameters:
+    -------------
+        - logLevel_ :
+          case-sensitive string literal of the log level to be checked,
+          valid values are the ones of the start option '--log-level':
+              'trace' | 'debug' | 'info' | 'warning' | 'error'
+
+    Note:
+    ------
+        - An invalid log level is reported as not enabled.
+
+    See:
+    -----
+        >>> IsTraceEnabled()
+        >>> fwapi.StartXcoFW()
+    """
+    return xlogifbase._XIsLogLevelEnabled(logLevel_)
+
+
+def LogTrace(logMsg_ : str, *fmtArgs_):
     """
     Logging of a trace message.
 
     Parameters:
     -------------
         - logMsg_ :
-          trace message to be logged.
+          trace message to be logged, or a format string if format arguments
+          are passed.
+        - fmtArgs_ :
+          optional positional arguments the message is formatted with, i.e.
+          'logMsg_.format(*fmtArgs_)'.
+
+    Note:
+    ------
+        - If format arguments are passed, the message is formatted only after
+          the log level check passed. So, messages which would be discarded
+          anyway cost no formatting, e.g.:
+              >>> xlogif.LogTrace('Received {} messages from {}.', count, sender)
+
+    See:
+    -----
+        >>> IsTraceEnabled()
     """
-    xlogifbase._XLogTrace(logMsg_)
+    xlogifbase._XLogTrace(logMsg_, fmtArgs_)
 
 
-def LogDebug(logMsg_ : str):
+def LogDebug(logMsg_ : str, *fmtArgs_):
     """
     Logging of a debug message.
 
     Parameters:
         - logMsg_ :
-          debug message to be logged.
+          debug message to be logged, or a format string if format arguments
+          are passed.
+        - fmtArgs_ :
+          optional positional arguments the message is formatted with.
+
+    See:
+    -----
+        >>> LogTrace()
     """
-    xlogifbase._XLogDebug(logMsg_)
+    xlogifbase._XLogDebug(logMsg_, fmtArgs_)
 
 
-def LogInfo(logMsg_ : str):
+def LogInfo(logMsg_ : str, *fmtArgs_):
     """
     Logging of an info message.
 
     Parameters:
         - logMsg_ :
-          info message to be logged.
+          info message to be logged, or a format string if format arguments
+          are passed.
+        - fmtArgs_ :
+          optional positional arguments the message is formatted with.
+
+    See:
+    -----
+        >>> LogTrace()
     """
-    xlogifbase._XLogInfo(logMsg_)
+    xlogifbase._XLogInfo(logMsg_, fmtArgs_)
 
 
-def LogWarning(logMsg_ : str):
+def LogWarning(logMsg_ : str, *fmtArgs_):
     """
     Logging of a warning message.
 
     Parameters:
         - logMsg_ :
-          warning message to be logged.
+          warning message to be logged, or a format string if format arguments
+          are passed.
+        - fmtArgs_ :
+          optional positional arguments the message is formatted with.
+
+    See:
+    -----
+        >>> LogTrace()
     """
-    xlogifbase._XLogWarning(logMsg_)
+    xlogifbase._XLogWarning(logMsg_, fmtArgs_)
 
 
 def LogError(logMsg_ : str):
@@ -27,6 +27,9 @@ from .rteconfig import RtePolicyEnableLogRDFileSink
 from .rteconfig import RtePolicyEnableForcedAutoStop
 from .rteconfig import RtePolicyDisableLogRDConsoleSink
 from .rteconfig import RtePolicyDisableSubSystemMessaging
+from .rteconfig import RtePolicyEnableCompactMessageSerDes
+from .rteconfig import RtePolicyEnableMessageLatencyTracing
+from .rteconfig import RtePolicyEnableShardedMessageDispatch
 from .rteconfig import RtePolicyDisableSubSystemMultiProcessing
 from .rteconfig import RtePolicyBypassExperimentalFreeThreadingGuard
 from .rteconfig import RtePolicyDisableExceptionTrackingOfChildProcesses
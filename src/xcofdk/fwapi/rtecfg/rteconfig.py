@@ -11,11 +11,13 @@
 # ------------------------------------------------------------------------------
 # Import libs / modules
 # ------------------------------------------------------------------------------
+from typing import Callable
 from typing import List
 from typing import Union
 
 from xcofdk.fwcom.fwdefs            import ERtePolicyID
 from xcofdk.fwcom.fwdefs            import ELineEnding
+from xcofdk.fwcom.fwdefs            import ELogRDOverflowPolicy
 from xcofdk.fwapi.apiif.ifrteconfig import IRteConfig
 
 from _fw.fwssys.fwcore.types.commontypes import _CommonDefines
@@ -50,6 +52,9 @@ class RteConfig(IRteConfig):
         >>> RtePolicyEnableForcedAutoStop()
         >>> RtePolicyDisableLogRDConsoleSink()
         >>> RtePolicyDisableSubSystemMessaging()
+        >>> RtePolicyEnableCompactMessageSerDes()
+        >>> RtePolicyEnableMessageLatencyTracing()
+        >>> RtePolicyEnableShardedMessageDispatch()
         >>> RtePolicyDisableSubSystemMultiProcessing()
         >>> RtePolicyBypassExperimentalFreeThreadingGuard()
         >>> RtePolicyDisableExceptionTrackingOfChildProcesses()
@@ -201,6 +206,39 @@ class RteConfig(IRteConfig):
             >>> RtePolicyEnableLogRDTcpSink()
         """
         return self.__i._isLogRDTcpSinkEnabled
+
+
+    @IRteConfig.isCompactMessageSerDesEnabled.getter
+    def isCompactMessageSerDesEnabled(self) -> bool:
+        """
+        See:
+        -----
+            >>> IRteConfig.isCompactMessageSerDesEnabled
+            >>> RtePolicyEnableCompactMessageSerDes()
+        """
+        return self.__i._isCompactMessageSerDesEnabled
+
+
+    @IRteConfig.isMessageLatencyTracingEnabled.getter
+    def isMessageLatencyTracingEnabled(self) -> bool:
+        """
+        See:
+        -----
+            >>> IRteConfig.isMessageLatencyTracingEnabled
+            >>> RtePolicyEnableMessageLatencyTracing()
+        """
+        return self.__i._isMessageLatencyTracingEnabled
+
+
+    @IRteConfig.isShardedMessageDispatchEnabled.getter
+    def isShardedMessageDispatchEnabled(self) -> bool:
+        """
+        See:
+        -----
+            >>> IRteConfig.isShardedMessageDispatchEnabled
+            >>> RtePolicyEnableShardedMessageDispatch()
+        """
+        return self.__i._isShardedMessageDispatchEnabled
     # ------------------------------------------------------------------------------
     #END API
     # ------------------------------------------------------------------------------
@@ -408,7 +446,10 @@ def RtePolicyDisableLogRDConsoleSink() -> IRteConfig:
     return RteConfig()
 
 
-def RtePolicyEnableLogRDFileSink(filePath_ : Union[str, None] =None, bFileModeAppend_ =False, fileEncoding_ : Union[str, None] =_CommonDefines._STR_ENCODING_UTF8) -> IRteConfig:
+def RtePolicyEnableLogRDFileSink( filePath_       : Union[str, None]     =None
+                                , bFileModeAppend_                      =False
+                                , fileEncoding_   : Union[str, None]     =_CommonDefines._STR_ENCODING_UTF8
+                                , overflowPolicy_ : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST) -> IRteConfig:
     """
     Request to enable log output to the specified file sink.
 
@@ -439,22 +480,39 @@ def RtePolicyEnableLogRDFileSink(filePath_ : Union[str, None] =None, bFileModeAp
               - if None, then system or platform default will be used,
               - the specified encoding otherwise.
           It defaults to 'utf-8'.
+        - overflowPolicy_ :
+          the policy to be applied whenever the queue of the file sink is full,
+          it defaults to DROP_OLDEST.
 
     Returns:
     ----------
         RTE configuration after the requested policy change.
 
+    Note:
+    ------
+        - Log records are written to the file in batches by the background
+          log redirection service, so that tasks submitting log output are
+          not stalled by file I/O.
+
     See:
     -----
         >>> IRteConfig.isValid
+        >>> ELogRDOverflowPolicy
         >>> ERtePolicyID.eEnableLogRDFileSink
         >>> RtePolicyConfigure()
     """
-    _FwRteConfig._ConfigureRtePolicy(ERtePolicyID.eEnableLogRDFileSink, rdFileSinkPath_=filePath_, rdFileSinkEncoding_=fileEncoding_, rdFileSinkAppend_=bFileModeAppend_)
+    _FwRteConfig._ConfigureRtePolicy( ERtePolicyID.eEnableLogRDFileSink
+                                    , rdFileSinkPath_=filePath_
+                                    , rdFileSinkEncoding_=fileEncoding_
+                                    , rdFileSinkAppend_=bFileModeAppend_
+                                    , rdFileSinkOverflowPolicy_=overflowPolicy_)
     return RteConfig()
 
 
-def RtePolicyEnableLogRDTcpSink(ipv4Addr_ : str, port_ : int, lineEnding_ : ELineEnding =ELineEnding.NOLE) -> IRteConfig:
+def RtePolicyEnableLogRDTcpSink( ipv4Addr_       : str
+                               , port_           : int
+                               , lineEnding_     : ELineEnding          =ELineEnding.NOLE
+                               , overflowPolicy_ : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST) -> IRteConfig:
     """
     Request to enable log output to the specified TCP connection sink.
 
@@ -468,6 +526,9 @@ def RtePolicyEnableLogRDTcpSink(ipv4Addr_ : str, port_ : int, lineEnding_ : ELin
         - lineEnding_ :
           the line ending to be used for sending string objects via the
           specified TCP connection, it defaults to NOLE, i.e. no line ending.
+        - overflowPolicy_ :
+          the policy to be applied whenever the queue of the TCP sink is full,
+          it defaults to DROP_OLDEST.
 
     Returns:
     ----------
@@ -485,25 +546,164 @@ def RtePolicyEnableLogRDTcpSink(ipv4Addr_ : str, port_ : int, lineEnding_ : ELin
         - A new, separate API function for redirection via secure connections
           is part of framework's PM-backlog for future featucres and will be
           announced accordingly as soon as available.
+        - Log records are sent in batches, i.e. by one send operation per
+          batch, by the background log redirection service.
 
     See:
     -----
         >>> ELineEnding
+        >>> ELogRDOverflowPolicy
         >>> IRteConfig.isValid
         >>> ERtePolicyID.eEnableLogRDTcpSink
         >>> RtePolicyConfigure()
     """
-    _FwRteConfig._ConfigureRtePolicy(ERtePolicyID.eEnableLogRDTcpSink, rdTcpSinkIpAddr_=ipv4Addr_, rdTcpSinkPort_=port_, rdTcpSinkLineEnding_=lineEnding_)
+    _FwRteConfig._ConfigureRtePolicy( ERtePolicyID.eEnableLogRDTcpSink
+                                    , rdTcpSinkIpAddr_=ipv4Addr_
+                                    , rdTcpSinkPort_=port_
+                                    , rdTcpSinkLineEnding_=lineEnding_
+                                    , rdTcpSinkOverflowPolicy_=overflowPolicy_)
+    return RteConfig()
+
+
+def RtePolicyEnableCompactMessageSerDes() -> IRteConfig:
+    """
+    Request to enable the compact serialization format for messages.
+
+    With this RTE policy enabled, the framework serializes (user) messages
+    using a fixed-layout encoding of the message header instead of pickling
+    the whole message object. Payloads of type XPayload whose parameters are
+    of primitive types only, i.e. None, bool, int, float, complex, str or
+    bytes with keys of type str or int, are encoded via Python's built-in
+    module 'marshal'. Any other payload is pickled as usual.
+
+    Returns:
+    ----------
+        RTE configuration after the requested policy change.
+
+    Note:
+    ------
+        - Messages which cannot be encoded by the compact format, e.g. those
+          using user-defined enum types for their message IDs, are silently
+          serialized the conventional way.
+        - Payloads configured to bypass marshaling or to use custom marshaling
+          are not affected by this RTE policy.
+        - The codec used for the payloads of a given payload type can be
+          selected by 'XMessenger.RegisterPayloadCodec()'.
+
+    See:
+    -----
+        >>> IRteConfig.isValid
+        >>> IRteConfig.isCompactMessageSerDesEnabled
+        >>> EXmsgPayloadCodec
+        >>> ERtePolicyID.eEnableCompactMessageSerDes
+        >>> RtePolicyConfigure()
+    """
+    _FwRteConfig._ConfigureRtePolicy(ERtePolicyID.eEnableCompactMessageSerDes)
+    return RteConfig()
+
+
+def RtePolicyEnableMessageLatencyTracing(traceSink_ : Union[Callable, None] =None) -> IRteConfig:
+    """
+    Request to enable tracing of message latencies.
+
+    With this RTE policy enabled, the framework time stamps each (user)
+    message sent to a task with an auto-managed external queue on its way
+    from the sender to the receiver, i.e. when:
+        - the message is created by the sender,
+        - the message is put to the external queue of the receiver,
+        - the message is taken from the external queue by the receiver,
+        - the message is handed over to ProcessExternalMessage() of the
+          receiver,
+        - ProcessExternalMessage() of the receiver returns.
+
+    Resulting latencies are collected per sender, receiver and label and can
+    be retrieved by fwutil.GetMessageLatencies().
+
+    Parameters:
+    -------------
+        - traceSink_ :
+          if specified, a callable object accepting a single argument of type
+          MessageTrace. It is called by the receiver for each traced message
+          after it has been processed.
+
+    Returns:
+    ----------
+        RTE configuration after the requested policy change.
+
+    Note:
+    ------
+        - The trace sink is called from within the receiver, so it should
+          return as quickly as possible. Once the trace sink raises an
+          exception, it is not called anymore.
+        - Tracing adds a few time stamps and a short locked update per
+          message, so it is supposed to be used for diagnostic purposes.
+
+    See:
+    -----
+        >>> IRteConfig.isValid
+        >>> IRteConfig.isMessageLatencyTracingEnabled
+        >>> ERtePolicyID.eEnableMessageLatencyTracing
+        >>> MessageLatency
+        >>> MessageTrace
+        >>> RtePolicyConfigure()
+    """
+    _FwRteConfig._ConfigureRtePolicy(ERtePolicyID.eEnableMessageLatencyTracing, msgTraceSink_=traceSink_)
+    return RteConfig()
+
+
+def RtePolicyEnableShardedMessageDispatch(numShards_ : Union[int, None] =None) -> IRteConfig:
+    """
+    Request to enable sharded dispatching of messages.
+
+    By default, all messages sent to tasks are routed by one single dispatcher
+    guarded by one single lock, that is a slow receiver or one with a full
+    external queue delays routing of messages to all other tasks, too.
+
+    With this RTE policy enabled, the dispatcher is partitioned into the
+    specified number of shards, each with its own lock, backlog of messages
+    pending for delivery and bookkeeping of irresponsive receivers. Each
+    receiver task is served by the shard selected by its unique ID, i.e.
+    broadcast messages (or messages with more than one receiver) are routed
+    by the shards of their receivers.
+
+    Parameters:
+    -------------
+        - numShards_ :
+          number of shards, an integer value in range [1..64]. If None is
+          passed, the framework uses 4 shards.
+
+    Returns:
+    ----------
+        RTE configuration after the requested policy change.
+
+    Note:
+    ------
+        - Messages sent by a task to the same receiver are delivered in the
+          order they were sent, regardless of the number of shards, whether
+          sent to the receiver directly or broadcasted.
+
+    See:
+    -----
+        >>> IRteConfig.isValid
+        >>> IRteConfig.isShardedMessageDispatchEnabled
+        >>> ERtePolicyID.eEnableShardedMessageDispatch
+        >>> RtePolicyConfigure()
+    """
+    _FwRteConfig._ConfigureRtePolicy(ERtePolicyID.eEnableShardedMessageDispatch, numDispatchShards_=numShards_)
     return RteConfig()
 
 
-def RtePolicyConfigure( fwRtePolicy_         : Union[ERtePolicyID, List[ERtePolicyID]]
-                      , rdFileSinkPath_      : Union[str, None] =None
-                      , rdFileSinkEncoding_  : Union[str, None] =_CommonDefines._STR_ENCODING_UTF8
-                      , rdFileSinkAppend_    : bool             =False
-                      , rdTcpSinkIpAddr_     : str              =None
-                      , rdTcpSinkPort_       : int              =None
-                      , rdTcpSinkLineEnding_ : ELineEnding      =ELineEnding.NOLE ) -> IRteConfig:
+def RtePolicyConfigure( fwRtePolicy_              : Union[ERtePolicyID, List[ERtePolicyID]]
+                      , rdFileSinkPath_           : Union[str, None]     =None
+                      , rdFileSinkEncoding_       : Union[str, None]     =_CommonDefines._STR_ENCODING_UTF8
+                      , rdFileSinkAppend_         : bool                 =False
+                      , rdTcpSinkIpAddr_          : str                  =None
+                      , rdTcpSinkPort_            : int                  =None
+                      , rdTcpSinkLineEnding_      : ELineEnding          =ELineEnding.NOLE
+                      , rdFileSinkOverflowPolicy_ : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST
+                      , rdTcpSinkOverflowPolicy_  : ELogRDOverflowPolicy =ELogRDOverflowPolicy.DROP_OLDEST
+                      , msgTraceSink_             : Union[Callable, None] =None
+                      , numDispatchShards_        : Union[int, None]      =None) -> IRteConfig:
     """
     Request to change current RTE configuration prior to start of the framework.
 
@@ -527,6 +727,14 @@ def RtePolicyConfigure( fwRtePolicy_         : Union[ERtePolicyID, List[ERtePoli
           same as 'port_' in RtePolicyEnableLogRDTcpSink() above,
         - rdTcpSinkLineEnding_ :
           same as 'lineEnding_' in RtePolicyEnableLogRDTcpSink() above,
+        - rdFileSinkOverflowPolicy_ :
+          same as 'overflowPolicy_' in RtePolicyEnableLogRDFileSink() above,
+        - rdTcpSinkOverflowPolicy_ :
+          same as 'overflowPolicy_' in RtePolicyEnableLogRDTcpSink() above,
+        - msgTraceSink_ :
+          same as 'traceSink_' in RtePolicyEnableMessageLatencyTracing() above,
+        - numDispatchShards_ :
+          same as 'numShards_' in RtePolicyEnableShardedMessageDispatch() above,
 
     Returns:
     ----------
@@ -563,5 +771,9 @@ def RtePolicyConfigure( fwRtePolicy_         : Union[ERtePolicyID, List[ERtePoli
                                     , rdFileSinkAppend_=rdFileSinkAppend_
                                     , rdTcpSinkIpAddr_=rdTcpSinkIpAddr_
                                     , rdTcpSinkPort_=rdTcpSinkPort_
-                                    , rdTcpSinkLineEnding_=rdTcpSinkLineEnding_)
+                                    , rdTcpSinkLineEnding_=rdTcpSinkLineEnding_
+                                    , rdFileSinkOverflowPolicy_=rdFileSinkOverflowPolicy_
+                                    , rdTcpSinkOverflowPolicy_=rdTcpSinkOverflowPolicy_
+                                    , msgTraceSink_=msgTraceSink_
+                                    , numDispatchShards_=numDispatchShards_)
     return RteConfig()
@@ -17,5 +17,8 @@ Package 'xcofdk.fwapi.xmp' represents the public interface of the subsystem
 # ------------------------------------------------------------------------------
 # Import libs / modules
 # ------------------------------------------------------------------------------
-from .xmputil  import XmpUtil
-from .xprocess import XProcess
+from .xmputil         import XmpUtil
+from .xprocess        import XProcess
+from .xprocesspool    import XProcessPool
+from .xprocesspool    import XProcessPoolJob
+from .xprocesschannel import XProcessChannel
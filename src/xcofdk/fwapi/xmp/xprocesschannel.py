@@ -0,0 +1,281 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : xprocesschannel.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Import libs / modules
+# ------------------------------------------------------------------------------
+from enum   import IntEnum
+from typing import Tuple
+from typing import Union
+
+from xcofdk.fwcom import EXmsgPredefinedID
+from xcofdk.fwapi import ITask
+
+from _fw.fwssys.fwmp.api.xprocchannelimpl import _XProcessChannelImpl
+
+
+# ------------------------------------------------------------------------------
+# Interface
+# ------------------------------------------------------------------------------
+class XProcessChannel:
+    """
+    This class represents a bidirectional, streaming message channel between
+    a child process and its parent process.
+
+    Instances of this class are created by the parent process, i.e. the process
+    the framework is running in, and passed to child processes as (part of) the
+    arguments of the target callback function of an instance of class XProcess
+    (or a job submitted to an instance of class XProcessPool).
+
+    Each direction of a channel is backed by a ring buffer placed in a shared
+    memory block of the configured capacity. So, while a child process is
+    running, it can stream any number of messages without the single-shot
+    size limit of its supplied data returned at exit:
+        - messages sent by the child process are delivered to the external
+          queue of the receiver task of the channel, i.e. they are received
+          by that task as ordinary messages via its callback method for
+          processing of external messages,
+        - messages sent by the parent process can be received by the child
+          process via ReceiveMessage().
+
+    A message passed to a channel consists of its label ID, cluster ID and
+    its payload (if any), with the same meaning as for messages sent via
+    XMessenger.SendMessage().
+
+    Note:
+    ------
+        - Any request to the API of this class will be (noiselessly)
+          discarded, if the subsystem of multiprocessing, i.e. 'xmp', is
+          disabled via framework's RTE configuration.
+        - Each direction of a channel is designed for a single producer and
+          a single consumer process. So, the same channel must not be passed
+          to more than one child process at a time.
+        - Messages sent by a child process are delivered to the receiver task
+          by the framework in a periodic manner, i.e. with a delay of few
+          milliseconds. The delivery period is increased up to some tens of
+          milliseconds while no messages are pending, and reset as soon as
+          messages arrive again.
+        - A message which cannot be delivered, e.g. due to a full external
+          queue of the receiver task, is kept in the ring buffer and retried
+          later. It is dropped (and reported by a warning) only if the
+          delivery attempts keep failing.
+        - Messages sent by a child process are delivered only as long as the
+          receiver task is running. Once the receiver task is terminated, the
+          channel is closed by the framework.
+        - Upon shutdown of the framework, all channels not closed yet are
+          closed by the framework.
+
+    See:
+    -----
+        - class XProcess
+        - class XProcessPool
+        - XMessenger.SendMessage()
+        >>> XProcessChannel.SendMessage()
+        >>> XProcessChannel.ReceiveMessage()
+    """
+
+
+    # --------------------------------------------------------------------------
+    # 1) c-tor / built-in
+    # --------------------------------------------------------------------------
+    def __init__(self, capacity_ : int =None, rxTask_ : Union[ITask, int] =None, aliasName_ : str =None):
+        """
+        Constructor (initializer) of instances of this class.
+
+        Parameters:
+        -------------
+            - capacity_ :
+              if specified size of the ring buffer of each direction of the
+              channel in bytes, which must be in the range [4KB..1GB].
+              Otherwise, it defaults to 1MB.
+            - rxTask_ :
+              if specified the task, or its UID, messages sent by the child
+              process will be delivered to. Otherwise, the currently running
+              task is taken as receiver task.
+            - aliasName_ :
+              if specified an arbitrary, non-empty and printable string literal
+              without spaces which optionally may have a trailing '_',
+              otherwise 'PChnl_' will be auto-assigned.
+
+              Finally, if the alias name has a trailing '_', the framework will
+              turn it to a unique alias name by appending the unique instance
+              number of the instance to be created.
+
+        Note:
+        ------
+            - An attempt to create an instance of this class before the
+              framework is started will be ignored with a user error
+              submitted accordingly.
+            - The receiver task must be configured to have an external queue.
+        """
+        self.__c = _XProcessChannelImpl(capacity_=capacity_, rxTask_=rxTask_, aliasn_=aliasName_)
+
+
+    def __str__(self):
+        """
+        Returns:
+        ----------
+            A nicely printable string representation of this instance.
+        """
+        return str(self.__c)
+    # --------------------------------------------------------------------------
+    #END 1) c-tor / built-in
+    # --------------------------------------------------------------------------
+
+
+    # --------------------------------------------------------------------------
+    # 2) API basic channel properties
+    # --------------------------------------------------------------------------
+    @property
+    def isValid(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if this instance has been successfully constructed,
+            False otherwise.
+        """
+        return self.__c._isValid
+
+
+    @property
+    def isClosed(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if this instance has been closed, False otherwise.
+
+        See:
+        -----
+            >>> XProcessChannel.Close()
+        """
+        return self.__c._isClosed
+
+
+    @property
+    def aliasName(self) -> str:
+        """
+        Returns:
+        ----------
+            (Auto-generated) alias name of this instance.
+        """
+        return self.__c._aliasName
+
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns:
+        ----------
+            Size of the ring buffer of each direction of this instance in bytes.
+        """
+        return self.__c._capacity
+
+
+    @property
+    def rxTaskUID(self) -> int:
+        """
+        Returns:
+        ----------
+            UID of the receiver task of messages sent by the child process.
+        """
+        return self.__c._rxTaskUID
+    # --------------------------------------------------------------------------
+    #END 2) API basic channel properties
+    # --------------------------------------------------------------------------
+
+
+    # --------------------------------------------------------------------------
+    # 3) API messaging
+    # --------------------------------------------------------------------------
+    def SendMessage( self
+                   , msgLabelID_   : Union[IntEnum, int]
+                   , msgClusterID_ : Union[IntEnum, int]     =EXmsgPredefinedID.DontCare
+                   , msgPayload_   : dict                    =None
+                   , maxWaitTime_  : Union[int, float, None] =0) -> bool:
+        """
+        Request to send a message to the other side of this channel.
+
+        If called by the child process, the message is delivered to the
+        receiver task of this channel. If called by the parent process, the
+        message can be received by the child process via ReceiveMessage().
+
+        Parameters:
+        -------------
+            - msgLabelID_ :
+              label ID of the message to be sent.
+            - msgClusterID_ :
+              cluster ID of the message to be sent.
+            - msgPayload_ :
+              if specified a dictionary object to be passed as payload of the
+              message.
+            - maxWaitTime_ :
+              if the ring buffer is full, the operation will wait for the
+              specified amount of time (milliseconds for integer values or
+              seconds for floating-point values) before it returns. If None it
+              will wait until either there is enough space available, or this
+              instance is closed.
+
+        Returns:
+        ----------
+            True if the message has been put to the ring buffer, False
+            otherwise.
+
+        Note:
+        ------
+            - The whole message must be serializable via Python's 'pickle'
+              module.
+            - The size of the serialized message must not exceed the capacity
+              of this instance.
+
+        See:
+        -----
+            >>> XProcessChannel.ReceiveMessage()
+        """
+        return self.__c._SendMessage(msgLabelID_, msgClusterID_, msgPayload_, maxWTime_=maxWaitTime_)
+
+
+    def ReceiveMessage(self, maxWaitTime_ : Union[int, float, None] =None) -> Union[Tuple[Union[IntEnum, int], Union[IntEnum, int], Union[dict, None]], None]:
+        """
+        Request to receive the next message sent by the parent process.
+
+        Parameters:
+        -------------
+            - maxWaitTime_ :
+              if None it will wait until either a message is available, or this
+              instance is closed. Otherwise, it will wait for the specified
+              amount of time (milliseconds for integer values or seconds for
+              floating-point values) before the operation returns.
+
+        Returns:
+        ----------
+            - None if called by the parent process,
+            - None if no message is available,
+            - the tuple (msgLabelID, msgClusterID, msgPayload) of the received
+              message otherwise.
+
+        See:
+        -----
+            >>> XProcessChannel.SendMessage()
+        """
+        return self.__c._ReceiveMessage(maxWTime_=maxWaitTime_)
+
+
+    def Close(self):
+        """
+        Request to close this instance.
+
+        When requested by the parent process, the shared memory blocks of this
+        instance are released, with messages not delivered yet being dropped.
+        """
+        self.__c._Close()
+    # --------------------------------------------------------------------------
+    #END 3) API messaging
+    # --------------------------------------------------------------------------
+#END class XProcessChannel
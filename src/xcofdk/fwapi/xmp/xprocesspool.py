@@ -0,0 +1,483 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : xprocesspool.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Import libs / modules
+# ------------------------------------------------------------------------------
+from typing import Any
+from typing import List
+from typing import Union
+
+from .xprocessxcp        import PTException
+from .xprocessxcp        import PTWrappedException
+from xcofdk.fwcom        import EXmpPredefinedID
+from xcofdk.fwcom.fwdefs import ERtePolicyID
+
+from _fw.fwssys.fwmp.api.xprocpoolimpl import _XProcessPoolImpl
+from _fw.fwssys.fwmp.api.xprocpoolimpl import _XProcessPoolJobImpl
+
+
+# ------------------------------------------------------------------------------
+# Interface
+# ------------------------------------------------------------------------------
+class XProcessPoolJob:
+    """
+    Instances of this class represent jobs submitted to a pool of child
+    processes, i.e. an instance of class XProcessPool.
+
+    They are never created by applications directly, but returned by the
+    framework upon successful submission of a new job.
+
+    See:
+    -----
+        >>> XProcessPool.Submit()
+    """
+
+
+    # --------------------------------------------------------------------------
+    # c-tor / built-in
+    # --------------------------------------------------------------------------
+    def __init__(self, jobImpl_ : _XProcessPoolJobImpl):
+        """
+        Constructor (initializer) of instances of this class.
+
+        Parameters:
+        -------------
+            - jobImpl_ :
+              framework's internal job object this instance refers to.
+        """
+        self.__j = jobImpl_
+    # --------------------------------------------------------------------------
+    #END c-tor / built-in
+    # --------------------------------------------------------------------------
+
+
+    # --------------------------------------------------------------------------
+    # API
+    # --------------------------------------------------------------------------
+    @property
+    def jobID(self) -> int:
+        """
+        Returns:
+        ----------
+            Unique (among jobs of the same pool) ID of this instance.
+        """
+        return self.__j._jobID
+
+
+    @property
+    def isPending(self) -> bool:
+        """
+        Returns:
+        ----------
+            True as long as this job is queued or being executed by one of the
+            worker processes of its pool, False otherwise.
+        """
+        return self.__j._isPending
+
+
+    @property
+    def isDone(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if this job has finished its execution without raising an
+            exception, False otherwise.
+
+        See:
+        -----
+            >>> XProcessPoolJob.isFailed
+            >>> XProcessPoolJob.processSuppliedData
+        """
+        return self.__j._isDone
+
+
+    @property
+    def isFailed(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if this job has been executed with an exception raised by its
+            target callback, or if its supplied data could not be transferred,
+            or if the worker process executing it terminated unexpectedly,
+            or if the pool was terminated before this job was executed,
+            False otherwise.
+
+        See:
+        -----
+            >>> XProcessPoolJob.isDone
+            >>> XProcessPoolJob.processException
+        """
+        return self.__j._isFailed
+
+
+    @property
+    def processSuppliedData(self) -> Any:
+        """
+        Returns:
+        ----------
+            The (application-specific) data (if any) returned by the target
+            callback function of this job if done, None otherwise.
+
+        Note:
+        ------
+            - Supplied data of jobs are subject to the same max. size limit
+              as specified for the pool this job was submitted to.
+
+        See:
+        -----
+            >>> XProcessPoolJob.isDone
+            >>> XProcess.processSuppliedData
+        """
+        return self.__j._jobSuppliedData
+
+
+    @property
+    def processException(self) -> Union[PTException, PTWrappedException, None]:
+        """
+        Returns:
+        ----------
+            - None if exception tracking of child processes is disabled via
+              RTE configuration,
+            - None if this job is not failed,
+            - the exception raised while execution of the target callback
+              function of this job otherwise.
+
+        See:
+        -----
+            - RtePolicyDisableExceptionTrackingOfChildProcesses()
+            >>> XProcessPoolJob.isFailed
+            >>> XProcess.processException
+            >>> ERtePolicyID.eDisableExceptionTrackingOfChildProcesses
+        """
+        return self.__j._jobException
+
+
+    def Join(self, maxWaitTime_: Union[int, float, None] =None) -> bool:
+        """
+        Request to join this job, thus synchronously waiting for its result.
+
+        Parameters:
+        -------------
+            - maxWaitTime_ :
+              if None it will wait forever. Otherwise, it will wait for the
+              specified amount of time (milliseconds for integer values or
+              seconds for floating-point values) before the operation returns.
+
+        Returns:
+        ----------
+            True if this job is not pending anymore, False otherwise.
+        """
+        return self.__j._Join(maxWTime_=maxWaitTime_)
+    # --------------------------------------------------------------------------
+    #END API
+    # --------------------------------------------------------------------------
+#END class XProcessPoolJob
+
+
+class XProcessPool:
+    """
+    This class represents a pool of warm child processes executing jobs, i.e.
+    callable targets along with their arguments, submitted to the pool.
+
+    Each worker process of a pool is an ordinary child process attached to the
+    framework, which is started once and then executes submitted jobs one after
+    another until the pool is shut down. Compared to starting a new instance of
+    class XProcess for each call of a target, this avoids the repeated cost of
+    creating the host process along with its RTE exchange data, which is
+    especially noticeable with the start method 'spawn' and short jobs.
+
+    Results of the execution of a job, i.e. its supplied data or exception
+    raised, are provided the same way as done for instances of class XProcess.
+
+    Note:
+    ------
+        - Any request to the API of this class will be (noiselessly)
+          discarded, if the subsystem of multiprocessing, i.e. 'xmp', is
+          disabled via framework's RTE configuration.
+        - Worker processes of a pool are considered by the framework just like
+          any other child process, e.g. they can be joined or terminated via
+          JoinProcesses() or TerminateProcesses() respectively.
+        - Note that worker processes of a pool are terminated only upon
+          shutdown of their pool. So, unless the pool has been requested to
+          shut down, a request to join its worker processes will not return
+          before its wait time (if any) elapses.
+        - Upon shutdown of the framework, pools not shut down yet are requested
+          to shut down. Their worker processes will still execute all jobs
+          queued before termination.
+
+    See:
+    -----
+        - class XProcess
+        - JoinProcesses()
+        - TerminateProcesses()
+        - RtePolicyDisableSubSystemMultiProcessing()
+        >>> ERtePolicyID.eDisableSubSystemMultiProcessing
+    """
+
+
+    # --------------------------------------------------------------------------
+    # 1) c-tor / built-in
+    # --------------------------------------------------------------------------
+    def __init__(self, numWorkers_ : int =None, aliasName_ : str =None, maxSuppliedDataSize_ : int =None):
+        """
+        Constructor (initializer) of instances of this class.
+
+        Worker processes of the pool are created, but not started yet.
+
+        Parameters:
+        -------------
+            - numWorkers_ :
+              if specified a positive integer number of worker processes of the
+              pool, otherwise the number of CPUs available.
+            - aliasName_ :
+              if specified an arbitrary, non-empty and printable string literal
+              without spaces which optionally may have a trailing '_',
+              otherwise 'PPool_' will be auto-assigned.
+
+              Finally, if the alias name has a trailing '_', the framework will
+              turn it to a unique alias name by appending the unique instance
+              number of the instance to be created. Worker processes of the pool
+              are aliased accordingly.
+            - maxSuppliedDataSize_ :
+              max. length of a byte stream representing the serialization of a
+              data object (if any) returned by the target of a job.
+
+              If specified, it must be a value larger than or equal to 4.
+
+              Otherwise, it defaults to EXmpPredefinedID.DefaultSuppliedDataMaxSize.
+
+        Note:
+        ------
+            - An attempt to create an instance of this class before the
+              framework is started will be ignored with a user error
+              submitted accordingly.
+
+        See:
+        -----
+            >>> XProcessPool.Start()
+            >>> EXmpPredefinedID.DefaultSuppliedDataMaxSize
+        """
+        self.__p = _XProcessPoolImpl(numWorkers_=numWorkers_, aliasn_=aliasName_, maxSDSize_=maxSuppliedDataSize_)
+
+
+    def __str__(self):
+        """
+        Returns:
+        ----------
+            A nicely printable string representation of this instance.
+        """
+        return str(self.__p)
+    # --------------------------------------------------------------------------
+    #END 1) c-tor / built-in
+    # --------------------------------------------------------------------------
+
+
+    # --------------------------------------------------------------------------
+    # 2) API basic pool properties
+    # --------------------------------------------------------------------------
+    @property
+    def isValid(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if this instance has been successfully constructed,
+            False otherwise.
+        """
+        return self.__p._isValid
+
+
+    @property
+    def isStarted(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if all worker processes of this instance have been started,
+            False otherwise.
+
+        See:
+        -----
+            >>> XProcessPool.Start()
+        """
+        return self.__p._isStarted
+
+
+    @property
+    def isShutdown(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if this instance has been requested to shut down or to
+            terminate, False otherwise.
+
+        See:
+        -----
+            >>> XProcessPool.Shutdown()
+            >>> XProcessPool.Terminate()
+        """
+        return self.__p._isShutdown
+
+
+    @property
+    def aliasName(self) -> str:
+        """
+        Returns:
+        ----------
+            (Auto-generated) alias name of this instance.
+
+        See:
+        -----
+            >>> XProcessPool.__init__()
+        """
+        return self.__p._aliasName
+
+
+    @property
+    def numWorkers(self) -> int:
+        """
+        Returns:
+        ----------
+            Number of worker processes of this instance.
+        """
+        return self.__p._numWorkers
+
+
+    @property
+    def workerPIDs(self) -> List[int]:
+        """
+        Returns:
+        ----------
+            List of PIDs of the worker processes of this instance which have
+            been started.
+
+        See:
+        -----
+            - JoinProcesses()
+            - TerminateProcesses()
+        """
+        return self.__p._workerPIDs
+
+
+    @property
+    def numPendingJobs(self) -> int:
+        """
+        Returns:
+        ----------
+            Number of submitted jobs of this instance still pending.
+        """
+        return self.__p._numPendingJobs
+    # --------------------------------------------------------------------------
+    #END 2) API basic pool properties
+    # --------------------------------------------------------------------------
+
+
+    # --------------------------------------------------------------------------
+    # 3) API start, submit, shutdown etc.
+    # --------------------------------------------------------------------------
+    def Start(self) -> bool:
+        """
+        Request to start this instance, i.e. all of its worker processes.
+
+        Returns:
+        ----------
+            False if this instance has been started or shut down already, or if
+            the start of any of its worker processes failed, True otherwise.
+
+        Note:
+        ------
+            - This operation is not available to applications in limited RTE
+              modes.
+
+        See:
+        -----
+            >>> XProcessPool.isStarted
+            >>> XProcessPool.Submit()
+        """
+        return self.__p._Start()
+
+
+    def Submit(self, target_, *args_, **kwargs_) -> Union[XProcessPoolJob, None]:
+        """
+        Request to submit a new job to this instance.
+
+        Parameters:
+        -------------
+            - target_ :
+              callable object to be executed by one of the worker processes of
+              this instance. It must meet the same requirements as the target
+              callback function passed to the constructor of class XProcess.
+            - args_ :
+              positional arguments (if any) to be passed to the callable target.
+            - kwargs_ :
+              keyword arguments (if any) to be passed to the callable target.
+
+        Returns:
+        ----------
+            New job object if the request succeeds, None otherwise.
+
+        Note:
+        ------
+            - The request will fail if this instance is not started or has been
+              shut down already.
+            - Both the callable target and its arguments must be serializable
+              via Python's 'pickle' module.
+
+        See:
+        -----
+            >>> XProcessPool.Start()
+            >>> XProcessPoolJob.Join()
+        """
+        _j = self.__p._Submit(target_, *args_, **kwargs_)
+        return None if _j is None else XProcessPoolJob(_j)
+
+
+    def Shutdown(self, maxWaitTime_: Union[int, float, None] =None) -> bool:
+        """
+        Request to shut down this instance.
+
+        No new jobs are accepted anymore. Worker processes will terminate after
+        all jobs queued so far have been executed.
+
+        Parameters:
+        -------------
+            - maxWaitTime_ :
+              if None it will wait forever for the termination of all worker
+              processes. Otherwise, it will wait for the specified amount of
+              time (milliseconds for integer values or seconds for
+              floating-point values) before the operation returns.
+
+        Returns:
+        ----------
+            True if all worker processes have terminated, False otherwise.
+
+        See:
+        -----
+            >>> XProcessPool.isShutdown
+            >>> XProcessPool.Terminate()
+        """
+        return self.__p._Shutdown(maxWTime_=maxWaitTime_)
+
+
+    def Terminate(self):
+        """
+        Request to terminate this instance, i.e. all of its worker processes.
+
+        All jobs still pending are set to 'failed'.
+
+        See:
+        -----
+            >>> XProcess.Terminate()
+            >>> XProcessPool.Shutdown()
+        """
+        self.__p._Terminate()
+    # --------------------------------------------------------------------------
+    #END 3) API start, submit, shutdown etc.
+    # --------------------------------------------------------------------------
+#END class XProcessPool
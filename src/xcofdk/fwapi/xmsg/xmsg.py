@@ -75,7 +75,6 @@ class XMessage(IMessage):
         if _ssshare._IsSubsysMsgDisabled():
             return
         if isinstance(xm_, _IFwMessage) and xm_.isValid:
-            self.__xhh  = XMessageHeader(xm_.header)
             self.__xmsg = xm_
 
 
@@ -108,7 +107,15 @@ class XMessage(IMessage):
         -----
             >>> IMessage.msgHeader
         """
-        return None if self.__isInvalidMsg else self.__xhh
+        if self.__isInvalidMsg:
+            return None
+
+        res = self.__xhh
+        if res is None:
+            res = self.__xhh = XMessageHeader(self.__xmsg.header)
+        elif res._h is None:
+            res._Rebind(self.__xmsg.header)
+        return res
 
 
     @IMessage.msgPayload.getter
@@ -138,8 +145,42 @@ class XMessage(IMessage):
         """
         if self.__xhh is not None:
             self.__xhh._Detach()
-            self.__xhh  = None
-            self.__xmsg = None
+            self.__xhh = None
+        self.__xmsg = None
+
+
+    def _Rebind(self, xm_ : _IFwMessage):
+        """
+        Rebind this instance to the passed in framework's internal message
+        object, or detach it from the one it currently refers to if None is
+        passed.
+
+        As opposed to _Detach(), the header object of this instance (if any)
+        is kept for reuse, it will be rebound on next access to property
+        msgHeader.
+
+        Returns:
+        ----------
+            This instance.
+
+        Note:
+        ------
+            - This protected method is designed to be used by the framework
+              only, i.e. by receiver tasks configured for fast delivery of
+              external messages.
+
+        See:
+        -----
+            - XTaskProfile.isExternalQueueFastDelivery
+        """
+        if self.__xhh is not None:
+            self.__xhh._Detach()
+        self.__xmsg = None
+        if _ssshare._IsSubsysMsgDisabled():
+            return self
+        if isinstance(xm_, _IFwMessage) and xm_.isValid:
+            self.__xmsg = xm_
+        return self
 
 
     @property
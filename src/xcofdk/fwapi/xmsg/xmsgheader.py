@@ -167,6 +167,20 @@ class XMessageHeader(IMessageHeader):
               object might have to be delivered to more than one receiver.
         """
         self._h = None
+
+
+    def _Rebind(self, hh_ : _IFwMessageHeader):
+        """
+        Rebind this instance to the passed in framework's internal message
+        header object.
+
+        Note:
+        ------
+            - This protected method is designed to be used by the framework
+              only, i.e. when reusing a message object for delivery to a
+              receiver task.
+        """
+        self._h = hh_ if isinstance(hh_, _IFwMessageHeader) and hh_.isValid else None
     # ------------------------------------------------------------------------------
     #END API
     # ------------------------------------------------------------------------------
@@ -12,9 +12,12 @@
 # Import libs / modules
 # ------------------------------------------------------------------------------
 from enum   import IntEnum
+from typing import List
 from typing import Union
 
 from xcofdk.fwcom import EXmsgPredefinedID
+from xcofdk.fwcom import EXmsgPriority
+from xcofdk.fwcom import EXmsgPayloadCodec
 from xcofdk.fwapi import ITask
 from xcofdk.fwapi import IMessage
 from xcofdk.fwapi import IPayload
@@ -55,7 +58,8 @@ class XMessenger:
     def SendMessage( rxTask_       : Union[ITask, IntEnum, int]
                    , msgLabelID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
                    , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                   , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                   , msgPayload_   : Union[IPayload, dict] =None
+                   , msgPriority_  : EXmsgPriority         =None) -> int:
         """
         Request to submit an external message with currently running task taken
         as sender.
@@ -87,6 +91,10 @@ class XMessenger:
               optional pre-/user-defined message cluster.
             - msgPayload_ :
               payload (if any) to be associated to the message to be sent.
+            - msgPriority_ :
+              optional delivery priority of the message to be sent. If passed
+              in, it overrides the priority the receiver task may have
+              configured for the message label of this message.
 
         Returns:
         ----------
@@ -99,6 +107,9 @@ class XMessenger:
               be passed to enables the senders to choose any of the addressing
               policies, i.e. direct or alias or anonymous addressing, at their
               convenient.
+            - Messages of priority above 'EXmsgPriority.Normal' bypass the
+              bulk traffic already queued up at the receiver side, they are
+              processed right after the message currently being processed.
 
         See:
         -----
@@ -108,15 +119,18 @@ class XMessenger:
             >>> IPayload
             >>> EXmsgPredefinedID.MainTask
             >>> EXmsgPredefinedID.MinUserDefinedID
+            >>> EXmsgPriority
+            >>> ITaskProfile.externalQueuePriorityLabels
             >>> XMessenger.BroadcastMessage()
         """
-        return _XMsgMgrImpl._SendXMsg(rxTask_, msgLabelID_, msgClusterID_, payload_=msgPayload_)
+        return _XMsgMgrImpl._SendXMsg(rxTask_, msgLabelID_, msgClusterID_, payload_=msgPayload_, prio_=msgPriority_)
 
 
     @staticmethod
     def BroadcastMessage( msgLabelID_   : Union[IntEnum, int]
                         , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                        , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                        , msgPayload_   : Union[IPayload, dict] =None
+                        , msgPriority_  : EXmsgPriority         =None) -> int:
         """
         Request to broadcast an external message with currently running task
         taken as sender.
@@ -140,6 +154,8 @@ class XMessenger:
               optional pre-/user-defined message cluster.
             - msgPayload_ :
               payload (if any) to be associated to the message to be sent.
+            - msgPriority_ :
+              optional delivery priority of the message to be sent.
 
         Returns:
         ----------
@@ -153,10 +169,137 @@ class XMessenger:
             >>> IMessage
             >>> IPayload
             >>> EXmsgPredefinedID.MinUserDefinedID
+            >>> EXmsgPriority
             >>> XMessenger.SendMessage()
         """
-        return _XMsgMgrImpl._BroadcastXMsg(msgLabelID_, msgClusterID_,payload_=msgPayload_)
+        return _XMsgMgrImpl._BroadcastXMsg(msgLabelID_, msgClusterID_, payload_=msgPayload_, prio_=msgPriority_)
+
+
+    @staticmethod
+    def SendMessages(msgs_ : List[tuple]) -> List[int]:
+        """
+        Request to submit a batch of external messages with currently running
+        task taken as sender.
+
+        This interface is provided for producers emitting bursts of messages,
+        e.g. telemetry data. It works the same way as 'SendMessage()' explained
+        above except for:
+            - the sender task is validated once for the whole batch,
+            - receiver tasks are resolved once per distinct receiver,
+            - messages addressed to the same receiver are put to the external
+              queue of that receiver by one single queue operation.
+
+        Parameters:
+        -------------
+            - msgs_ :
+              list (or tuple) of message entries to be sent, each given as a
+              tuple of below form with the trailing items being optional:
+                  (rxTask_, msgLabelID_[, msgPayload_[, msgClusterID_]])
+
+              with the meaning of each item is the same as the respective
+              parameter of 'SendMessage()'.
+
+        Returns:
+        ----------
+            List of integer numbers of the same length as passed in sequence
+            'msgs_', each item is either a positive integer number uniquely
+            identifying the message sent for the respective entry, or 0 if
+            sending that entry failed.
+
+        Note:
+        ------
+            - The order of messages put to the external queue of a given
+              receiver task is the same as their order in passed in sequence.
+            - A failure to send one entry does not affect the remaining ones.
+            - Receiver 'EXmsgPredefinedID.Broadcast' of an entry causes the
+              respective message to be broadcast.
+
+        See:
+        -----
+            >>> XMessenger.SendMessage()
+            >>> XMessenger.BroadcastMessages()
+        """
+        return _XMsgMgrImpl._SendXMsgs(msgs_)
+
+
+    @staticmethod
+    def BroadcastMessages(msgs_ : List[tuple]) -> List[int]:
+        """
+        Request to broadcast a batch of external messages with currently
+        running task taken as sender.
+
+        It works exactly the same way as 'SendMessages()' explained above
+        except for the form of the message entries passed in, each given as a
+        tuple of below form with the trailing items being optional:
+            (msgLabelID_[, msgPayload_[, msgClusterID_]])
+
+        Parameters:
+        -------------
+            - msgs_ :
+              list (or tuple) of message entries to be broadcast.
+
+        Returns:
+        ----------
+            List of integer numbers of the same length as passed in sequence
+            'msgs_', each item is either a positive integer number uniquely
+            identifying the message sent for the respective entry, or 0 if
+            broadcasting that entry failed.
+
+        See:
+        -----
+            >>> XMessenger.BroadcastMessage()
+            >>> XMessenger.SendMessages()
+        """
+        return _XMsgMgrImpl._BroadcastXMsgs(msgs_)
     # ------------------------------------------------------------------------------
     #END API - Messaging
     # ------------------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------------------
+    # API - Serialization
+    # ------------------------------------------------------------------------------
+    @staticmethod
+    def RegisterPayloadCodec(payloadType_ : type, payloadCodec_ : EXmsgPayloadCodec) -> bool:
+        """
+        Request to select the codec used to serialize payloads of a given
+        payload type whenever the framework serializes messages.
+
+        Parameters:
+        -------------
+            - payloadType_ :
+              class of the payload objects the codec is selected for, it must
+              be a subclass of IPayload. The selection applies to instances of
+              exactly this class, i.e. not to instances of its subclasses.
+            - payloadCodec_ :
+              codec to be used, or 'EXmsgPayloadCodec.Default' to restore the
+              selection of the framework.
+
+        Returns:
+        ----------
+            True if the request succeeded, False otherwise, i.e. if a passed in
+            parameter is invalid or if 'EXmsgPayloadCodec.Compact' is passed for
+            a payload type other than XPayload. Since the compact codec always
+            decodes to XPayload, it would lose the class of a subclass.
+
+        Note:
+        ------
+            - A codec which cannot be applied to a given payload object falls
+              back to the default selection of the framework, i.e. 'Compact'
+              is applied only if the compact message serialization is enabled
+              and the payload container is flat.
+            - Payloads configured to bypass marshaling or to use custom
+              marshaling are not affected by the selected codec.
+            - The codec used is recorded by the serialized message, so its
+              deserialization does not depend on the codec registered.
+
+        See:
+        -----
+            >>> EXmsgPayloadCodec
+            >>> RtePolicyEnableCompactMessageSerDes()
+        """
+        return _XMsgMgrImpl._RegisterPayloadCodec(payloadType_, payloadCodec_)
+    # ------------------------------------------------------------------------------
+    #END API - Serialization
+    # ------------------------------------------------------------------------------
 ##END class XMessenger
@@ -13,11 +13,13 @@
 # ------------------------------------------------------------------------------
 from enum   import IntEnum
 from typing import Any
+from typing import List
 from typing import Union
 
 from xcofdk.fwcom import CompoundTUID
 from xcofdk.fwcom import override
 from xcofdk.fwcom import EXmsgPredefinedID
+from xcofdk.fwcom import EXmsgPriority
 from xcofdk.fwapi import ITaskError
 from xcofdk.fwapi import IMessage
 from xcofdk.fwapi import IPayload
@@ -476,7 +478,8 @@ class RCTask(IRCTask):
                    , rxTask_       : Union[ITask, IntEnum, int]
                    , msgLabelID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
                    , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                   , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                   , msgPayload_   : Union[IPayload, dict] =None
+                   , msgPriority_  : EXmsgPriority         =None) -> int:
         """
         Request to submit an external message with this instance taken as
         sender.
@@ -498,6 +501,10 @@ class RCTask(IRCTask):
               optional pre-/user-defined message cluster.
             - msgPayload_ :
               payload (if any) to be associated to the message to be sent.
+            - msgPriority_ :
+              optional delivery priority of the message to be sent, it
+              overrides the priority configured by the receiver task (if any)
+              for the label of the message.
 
         Returns:
         ----------
@@ -521,17 +528,19 @@ class RCTask(IRCTask):
             >>> IMessage
             >>> IPayload
             >>> EXmsgPredefinedID
+            >>> EXmsgPriority
             >>> RCTask.BroadcastMessage()
             >>> RCCommTask.TriggerExternalQueueProcessing()
         """
-        return self.__a._RcSendMsg(rxTask_, msgLabelID_=msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_)
+        return self.__a._RcSendMsg(rxTask_, msgLabelID_=msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_, msgPriority_=msgPriority_)
 
 
     @override
     def BroadcastMessage( self
                         , msgLabelID_   : Union[IntEnum, int]
                         , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                        , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                        , msgPayload_   : Union[IPayload, dict] =None
+                        , msgPriority_  : EXmsgPriority         =None) -> int:
         """
         Request to broadcast an external message with this instance taken as
         sender.
@@ -552,6 +561,10 @@ class RCTask(IRCTask):
               optional pre-/user-defined message cluster.
             - msgPayload_ :
               payload (if any) to be associated to the message to be sent.
+            - msgPriority_ :
+              optional delivery priority of the message to be sent, it
+              overrides the priority configured by the receiver task (if any)
+              for the label of the message.
 
         Returns:
         ----------
@@ -575,11 +588,86 @@ class RCTask(IRCTask):
             >>> IMessage
             >>> IPayload
             >>> EXmsgPredefinedID
+            >>> EXmsgPriority
             >>> EXmsgPredefinedID.Broadcast
             >>> RCTask.SendMessage()
             >>> RCCommTask.TriggerExternalQueueProcessing()
         """
-        return self.__a._RcBroadcastMsg(msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_)
+        return self.__a._RcBroadcastMsg(msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_, msgPriority_=msgPriority_)
+
+
+    @override
+    def SendMessages(self, msgs_ : List[tuple]) -> List[int]:
+        """
+        Request to submit a batch of external messages with this instance
+        taken as sender.
+
+        It works the same way as 'SendMessage()' explained above except for
+        the sender task is validated once for the whole batch, and messages
+        addressed to the same receiver are put to the external queue of that
+        receiver by one single queue operation.
+
+        Parameters:
+        -------------
+            - msgs_ :
+              list (or tuple) of message entries to be sent, each given as a
+              tuple of below form with the trailing items being optional:
+                  (rxTask_, msgLabelID_[, msgPayload_[, msgClusterID_]])
+
+        Returns:
+        ----------
+            List of integer numbers of the same length as passed in sequence
+            'msgs_', each item is either a positive integer number uniquely
+            identifying the message object sent for the respective entry, or
+            0 if sending that entry failed.
+
+        Note:
+        ------
+            - The request will be ignored by the framework if:
+                  - this instance is not the currently running task,
+                  - messaging subsystem 'xmsg' is disabled via RTE policy
+                    configuration.
+            - This API function is described in more detail by class XMessenger.
+
+        See:
+        -----
+            - class XMessenger
+            >>> RCTask.SendMessage()
+            >>> RCTask.BroadcastMessages()
+        """
+        return self.__a._RcSendMsgs(msgs_)
+
+
+    @override
+    def BroadcastMessages(self, msgs_ : List[tuple]) -> List[int]:
+        """
+        Request to broadcast a batch of external messages with this instance
+        taken as sender.
+
+        It works exactly the same way as 'SendMessages()' explained above
+        except for the form of the message entries passed in, each given as a
+        tuple of below form with the trailing items being optional:
+            (msgLabelID_[, msgPayload_[, msgClusterID_]])
+
+        Parameters:
+        -------------
+            - msgs_ :
+              list (or tuple) of message entries to be broadcast.
+
+        Returns:
+        ----------
+            List of integer numbers of the same length as passed in sequence
+            'msgs_', each item is either a positive integer number uniquely
+            identifying the message object sent for the respective entry, or
+            0 if broadcasting that entry failed.
+
+        See:
+        -----
+            - class XMessenger
+            >>> RCTask.BroadcastMessage()
+            >>> RCTask.SendMessages()
+        """
+        return self.__a._RcBroadcastMsgs(msgs_)
     # ------------------------------------------------------------------------------
     #END 7) message handling
     # ------------------------------------------------------------------------------
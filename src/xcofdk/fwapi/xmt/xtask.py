@@ -13,12 +13,14 @@
 # ------------------------------------------------------------------------------
 from enum   import IntEnum
 from typing import Any
+from typing import List
 from typing import Union
 
 from xcofdk.fwcom     import CompoundTUID
 from xcofdk.fwcom     import EExecutionCmdID
 from xcofdk.fwcom     import override
 from xcofdk.fwcom     import EXmsgPredefinedID
+from xcofdk.fwcom     import EXmsgPriority
 from xcofdk.fwapi     import IMessage
 from xcofdk.fwapi     import ITaskError
 from xcofdk.fwapi     import IPayload
@@ -667,24 +669,44 @@ class XTask(IXTask):
                    , rxTask_       : Union[ITask, IntEnum, int]
                    , msgLabelID_   : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
                    , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                   , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                   , msgPayload_   : Union[IPayload, dict] =None
+                   , msgPriority_  : EXmsgPriority         =None) -> int:
         """
         See:
             >>> IXTask.SendMessage()
         """
-        return self.__a.SendMessage(rxTask_, msgLabelID_=msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_)
+        return self.__a.SendMessage(rxTask_, msgLabelID_=msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_, msgPriority_=msgPriority_)
 
 
     @override
     def BroadcastMessage( self
                         , msgLabelID_   : Union[IntEnum, int]
                         , msgClusterID_ : Union[IntEnum, int]   =EXmsgPredefinedID.DontCare
-                        , msgPayload_   : Union[IPayload, dict] =None) -> int:
+                        , msgPayload_   : Union[IPayload, dict] =None
+                        , msgPriority_  : EXmsgPriority         =None) -> int:
         """
         See:
             >>> IXTask.BroadcastMessage()
         """
-        return self.__a.BroadcastMessage(msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_)
+        return self.__a.BroadcastMessage(msgLabelID_, msgClusterID_=msgClusterID_, msgPayload_=msgPayload_, msgPriority_=msgPriority_)
+
+
+    @override
+    def SendMessages(self, msgs_ : List[tuple]) -> List[int]:
+        """
+        See:
+            >>> IXTask.SendMessages()
+        """
+        return self.__a.SendMessages(msgs_)
+
+
+    @override
+    def BroadcastMessages(self, msgs_ : List[tuple]) -> List[int]:
+        """
+        See:
+            >>> IXTask.BroadcastMessages()
+        """
+        return self.__a.BroadcastMessages(msgs_)
 
 
     @override
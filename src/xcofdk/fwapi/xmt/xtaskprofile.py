@@ -11,9 +11,12 @@
 # ------------------------------------------------------------------------------
 # Import libs / modules
 # ------------------------------------------------------------------------------
+from typing import Dict
 from typing import Union
 
 from xcofdk.fwcom     import override
+from xcofdk.fwcom     import ERunPhaseSchedulingPolicy
+from xcofdk.fwcom     import EXmsgPriority
 from xcofdk.fwapi.xmt import ITaskProfile
 
 from _fw.fwssys.fwmt.api.xtaskprfimpl import _XTaskPrfImpl
@@ -40,19 +43,24 @@ class XTaskProfile(ITaskProfile):
         >>>
         >>> # The outuput will look like as shown below:
         >>> #   [15:31:16.902 XINF] Task profile :
-        >>> #        aliasName                   : None
-        >>> #        isMainTask                  : False
-        >>> #        isSyncTask                  : False
-        >>> #        isPrivilegedTask            : False
-        >>> #        isRunPhaseEnabled           : True
-        >>> #        isSetupPhaseEnabled         : False
-        >>> #        isTeardownPhaseEnabled      : False
-        >>> #        isCyclicRunPhase            : True
-        >>> #        isInternalQueueEnabled      : False
-        >>> #        isExternalQueueEnabled      : False
-        >>> #        isExternalQueueBlocking     : False
-        >>> #        runPhaseFrequencyMS         : 100
-        >>> #        runPhaseMaxProcessingTimeMS : 50
+        >>> #        aliasName                     : None
+        >>> #        isMainTask                    : False
+        >>> #        isSyncTask                    : False
+        >>> #        isPrivilegedTask              : False
+        >>> #        isRunPhaseEnabled             : True
+        >>> #        isSetupPhaseEnabled           : False
+        >>> #        isTeardownPhaseEnabled        : False
+        >>> #        isCyclicRunPhase              : True
+        >>> #        isInternalQueueEnabled        : False
+        >>> #        isExternalQueueEnabled        : False
+        >>> #        isExternalQueueBlocking       : False
+        >>> #        isExternalQueueLockLight      : False
+        >>> #        isExternalQueueSingleProducer : False
+        >>> #        isExternalQueueFastDelivery   : False
+        >>> #        externalQueuePriorityLabels   : None
+        >>> #        runPhaseFrequencyMS           : 100
+        >>> #        runPhaseMaxProcessingTimeMS   : 50
+        >>> #        runPhaseSchedulingPolicy      : FIXED_DELAY
 
     After a task profile instance is created, its modifiable properties can be
     changed via their respective property setter if required. Doing so, that
@@ -449,6 +457,86 @@ class XTaskProfile(ITaskProfile):
             >>> ITaskProfile.isExternalQueueBlocking
         """
         self.__impl.isExternalQueueBlocking = bool(bBlockingExtQueue_)
+
+
+    @property
+    def isExternalQueueLockLight(self) -> bool:
+        """
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueLockLight
+        """
+        return self.__impl.isExternalQueueLockLight
+
+
+    @isExternalQueueLockLight.setter
+    def isExternalQueueLockLight(self, bLockLightExtQueue_ : bool):
+        """
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueLockLight
+        """
+        self.__impl.isExternalQueueLockLight = bool(bLockLightExtQueue_)
+
+
+    @property
+    def isExternalQueueSingleProducer(self) -> bool:
+        """
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueSingleProducer
+        """
+        return self.__impl.isExternalQueueSingleProducer
+
+
+    @isExternalQueueSingleProducer.setter
+    def isExternalQueueSingleProducer(self, bSPExtQueue_ : bool):
+        """
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueSingleProducer
+        """
+        self.__impl.isExternalQueueSingleProducer = bool(bSPExtQueue_)
+
+
+    @property
+    def isExternalQueueFastDelivery(self) -> bool:
+        """
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueFastDelivery
+        """
+        return self.__impl.isExternalQueueFastDelivery
+
+
+    @isExternalQueueFastDelivery.setter
+    def isExternalQueueFastDelivery(self, bFDExtQueue_ : bool):
+        """
+        See:
+        -----
+            >>> ITaskProfile.isExternalQueueFastDelivery
+        """
+        self.__impl.isExternalQueueFastDelivery = bool(bFDExtQueue_)
+
+
+    @property
+    def externalQueuePriorityLabels(self) -> Union[Dict[int, EXmsgPriority], None]:
+        """
+        See:
+        -----
+            >>> ITaskProfile.externalQueuePriorityLabels
+        """
+        return self.__impl.externalQueuePriorityLabels
+
+
+    @externalQueuePriorityLabels.setter
+    def externalQueuePriorityLabels(self, prioLabels_ : Union[Dict[int, EXmsgPriority], None]):
+        """
+        See:
+        -----
+            >>> ITaskProfile.externalQueuePriorityLabels
+        """
+        self.__impl.externalQueuePriorityLabels = prioLabels_
     # --------------------------------------------------------------------------
     #END 4) API queue configuration
     # --------------------------------------------------------------------------
@@ -560,6 +648,26 @@ class XTaskProfile(ITaskProfile):
             >>> ITaskProfile.runPhaseMaxProcessingTimeMS
         """
         self.__impl.runPhaseMaxProcessingTimeMS = runPhaseMaxProcTimeMS_
+
+
+    @property
+    def runPhaseSchedulingPolicy(self) -> ERunPhaseSchedulingPolicy:
+        """
+        See:
+        -----
+            >>> ITaskProfile.runPhaseSchedulingPolicy
+        """
+        return self.__impl.runPhaseSchedulingPolicy
+
+
+    @runPhaseSchedulingPolicy.setter
+    def runPhaseSchedulingPolicy(self, schedPolicy_ : ERunPhaseSchedulingPolicy):
+        """
+        See:
+        -----
+            >>> ITaskProfile.runPhaseSchedulingPolicy
+        """
+        self.__impl.runPhaseSchedulingPolicy = schedPolicy_
     # --------------------------------------------------------------------------
     #END 5) API timing configuration
     # --------------------------------------------------------------------------
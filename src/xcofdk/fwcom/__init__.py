@@ -21,9 +21,15 @@ data types available through below modules:
 # Interface
 # ------------------------------------------------------------------------------
 from .fwdefs   import CompoundTUID
+from .fwdefs   import TaskMetrics
 from .fwdefs   import EExecutionCmdID
 from .fwdefs   import override
 from .fwdefs   import LcFailure
+from .fwdefs   import ERunPhaseSchedulingPolicy
 from .xmpdefs  import EProcessStartMethodID
 from .xmpdefs  import EXmpPredefinedID
 from .xmsgdefs import EXmsgPredefinedID
+from .xmsgdefs import EXmsgPriority
+from .xmsgdefs import EXmsgPayloadCodec
+from .xmsgdefs import MessageLatency
+from .xmsgdefs import MessageTrace
@@ -40,6 +40,56 @@ Compound task unique ID, a tuple type with below named, immutable fields:
 """
 
 
+TaskMetrics = namedtuple( 'TaskMetrics'
+                        , [ 'taskUID' , 'taskName' , 'aliasName' , 'isFwService'
+                          , 'runPhaseIterations' , 'runPhaseTimeMS' , 'runPhaseMaxTimeMS' , 'runPhaseHistogram'
+                          , 'blockedTimeMS'
+                          , 'extQueueSize' , 'extQueueHighWaterMark' , 'intQueueSize' , 'intQueueHighWaterMark'
+                          , 'numProcessedMsgs' , 'msgsPerSecond' , 'dispatchRetries' ])
+"""
+Runtime metrics of a task, a tuple type with below named, immutable fields:
+    - taskUID :
+      unique task ID,
+    - taskName :
+      unique name of the task,
+    - aliasName :
+      alias name of the task, or the name of the framework service,
+    - isFwService:
+      True if the task is a framework service, False otherwise,
+    - runPhaseIterations :
+      number of iterations (i.e. run-cycles or processed messages) of the
+      run phase so far,
+    - runPhaseTimeMS :
+      total processing time of all iterations in milliseconds (excluding
+      the time spent blocked),
+    - runPhaseMaxTimeMS :
+      processing time of the longest iteration in milliseconds,
+    - runPhaseHistogram :
+      tuple of 6 counters, each the number of iterations with a processing
+      time within the ranges below (in milliseconds):
+          [0..0.1), [0.1..1), [1..10), [10..100), [100..1000), [1000..),
+    - blockedTimeMS :
+      total time spent blocked in milliseconds, i.e. while sleeping between
+      two run-cycles or waiting for new messages,
+    - extQueueSize :
+      current number of messages in the external queue,
+    - extQueueHighWaterMark :
+      highest number of messages found in the external queue so far,
+    - intQueueSize :
+      current number of messages in the internal queue,
+    - intQueueHighWaterMark :
+      highest number of messages found in the internal queue so far,
+    - numProcessedMsgs :
+      total number of messages processed so far,
+    - msgsPerSecond :
+      average number of messages processed per second since the run phase
+      has been entered,
+    - dispatchRetries :
+      number of retries to deliver a message to its receiver(s), applicable
+      to framework's message dispatcher only.
+"""
+
+
 @unique
 class ERtePolicyID(IntEnum):
     """
@@ -95,7 +145,27 @@ class ERtePolicyID(IntEnum):
                enables output of submitted logs to the specified file sink,
              - eEnableLogRDTcpSink :
                enables output of submitted logs to the specified TCP connection
-               sink.
+               sink,
+
+        f) addressing marshaling of messages:
+             - eEnableCompactMessageSerDes :
+               enables the compact serialization format for messages, that is
+               a fixed-layout message header combined with a 'marshal'-based
+               encoding of payloads made up of primitive values only,
+
+        g) addressing diagnostics of messaging:
+             - eEnableMessageLatencyTracing :
+               enables time stamping of (user) messages on their way from the
+               sender to the receiver, i.e. on creation, when put to and taken
+               from the external queue of the receiver and when processed by
+               the receiver. Resulting latencies are collected per sender,
+               receiver and label,
+
+        h) addressing routing of messages:
+             - eEnableShardedMessageDispatch :
+               enables partitioning of framework's message dispatcher into
+               a configurable number of shards, each with its own lock and
+               backlog, selected by receiver task.
 
     Note:
     ------
@@ -109,6 +179,7 @@ class ERtePolicyID(IntEnum):
         - subpackage xcofdk.fwapi.fwctrl
         - subpackage xcofdk.fwapi.rtecfg
         >>> ELineEnding
+        >>> ELogRDOverflowPolicy
     """
 
     # a) addressing framework control operation StartXcoFW()
@@ -130,6 +201,15 @@ class ERtePolicyID(IntEnum):
     eDisableLogRDConsoleSink = auto()
     eEnableLogRDFileSink     = auto()
     eEnableLogRDTcpSink      = auto()
+
+    # f) addressing marshaling of messages
+    eEnableCompactMessageSerDes = auto()
+
+    # g) addressing diagnostics of messaging
+    eEnableMessageLatencyTracing = auto()
+
+    # h) addressing routing of messages
+    eEnableShardedMessageDispatch = auto()
 #END class ERtePolicyID
 
 
@@ -189,6 +269,50 @@ class ELineEnding(IntEnum):
 #END class ELineEnding
 
 
+@unique
+class ELogRDOverflowPolicy(IntEnum):
+    """
+    Enum class with its members each define the policy to be applied whenever
+    the queue of a file or TCP redirection sink of log output is full.
+
+    Log records submitted by the framework are queued by the sink and written
+    in batches by the log redirection service running in the background.
+    Defined overflow policies are as follows:
+        - DROP_OLDEST
+          the oldest queued log record is dropped in favor of the new one,
+          this is the default policy.
+
+        - BLOCK
+          the submitting task is blocked until there is free space in the
+          queue or the sink is stopped. The task is blocked for at most 1
+          second though, so that a stalled sink cannot hang it. If the sink
+          could not be drained within that time, the oldest queued log record
+          is dropped.
+
+        - SAMPLE
+          only a sample of log records, i.e. one of a fixed number of them, is
+          queued as long as the queue is full. Log records of type error or
+          fatal error are always queued.
+
+    Log records which could not be written by the sink, e.g. due to a lost
+    TCP connection, are put back in front of the queue for the next attempt.
+    Since they are older than any record queued meanwhile, the oldest ones
+    of them are dropped if there is not enough free space left, regardless
+    of the policy in use. Each sink counts the log records it dropped this
+    way or due to the overflow policies DROP_OLDEST or BLOCK.
+
+    See:
+    -----
+        >>> ERtePolicyID.eEnableLogRDFileSink
+        >>> ERtePolicyID.eEnableLogRDTcpSink
+    """
+
+    DROP_OLDEST = 0
+    BLOCK       = auto()
+    SAMPLE      = auto()
+#END class ELogRDOverflowPolicy
+
+
 @unique
 class EExecutionCmdID(IntEnum):
     """
@@ -341,6 +465,59 @@ class EExecutionCmdID(IntEnum):
 #END class EExecutionCmdID
 
 
+@unique
+class ERunPhaseSchedulingPolicy(IntEnum):
+    """
+    Enum class with its members each define the scheduling policy applied to
+    the run phase of cyclic tasks.
+
+    Defined scheduling policies are as follows:
+        - FIXED_DELAY
+          after each iteration of the run phase the task pauses for the
+          configured run phase frequency. The effective cycle period is thus
+          the run phase frequency plus the processing time of the iteration.
+          This is the default policy.
+
+        - FIXED_RATE_SKIP
+          iterations of the run phase are started at absolute deadlines, i.e.
+          multiples of the configured run phase frequency. Whenever an
+          iteration overruns one or more deadlines, the missed deadlines are
+          skipped and the next iteration starts at the next upcoming one.
+
+        - FIXED_RATE_CATCH_UP
+          same as FIXED_RATE_SKIP, but missed deadlines are caught up by
+          starting the subsequent iterations without pausing until the task
+          is back in schedule.
+
+    Note:
+    ------
+        - Iterations of the run phase exceeding the configured max. processing
+          time are reported by the framework as overruns for fixed-rate
+          policies.
+
+    See:
+    -----
+        >>> ITaskProfile.runPhaseSchedulingPolicy
+        >>> ITaskProfile.runPhaseFrequencyMS
+        >>> ITaskProfile.runPhaseMaxProcessingTimeMS
+    """
+
+    FIXED_DELAY         = 0
+    FIXED_RATE_SKIP     = auto()
+    FIXED_RATE_CATCH_UP = auto()
+
+    @property
+    def isFixedRate(self) -> bool:
+        """
+        Returns:
+        ----------
+            True if this instance is one of the fixed-rate policies, False
+            otherwise.
+        """
+        return self != ERunPhaseSchedulingPolicy.FIXED_DELAY
+#END class ERunPhaseSchedulingPolicy
+
+
 class LcFailure:
     """
     Instances of this class represent each a lifecycle (LC) failure.
@@ -11,8 +11,9 @@
 # ------------------------------------------------------------------------------
 # Import libs / modules
 # ------------------------------------------------------------------------------
-from enum import unique
-from enum import IntEnum
+from collections import namedtuple
+from enum        import unique
+from enum        import IntEnum
 
 
 # ------------------------------------------------------------------------------
@@ -69,3 +70,175 @@ class EXmsgPredefinedID(IntEnum):
     Broadcast        = 2
     MinUserDefinedID = 5001
 #END class EXmsgPredefinedID
+
+
+@unique
+class EXmsgPriority(IntEnum):
+    """
+    Enum class providing the priority levels of external messages.
+
+    Each task with an external queue maintains one priority lane for the
+    levels above 'Normal' in addition to its regular (bulk) queue. Messages
+    of a higher priority are always processed before those of a lower one,
+    and messages of the same priority in the order they were sent.
+
+    The levels currently defined are as follows:
+        - Normal:
+          default level of all messages, e.g. bulk data traffic.
+
+        - High:
+          level intended for messages which must bypass bulk data traffic.
+
+        - Urgent:
+          level intended for control messages, e.g. requests to stop or to
+          re-configure the receiver task.
+
+    Note:
+    ------
+        - The priority of a message is either passed to 'SendMessage()' or
+          'BroadcastMessage()' explicitly, or selected by the receiver task
+          based on the message label.
+        - Even while the regular queue of a receiver holds thousands of
+          entries, a message of priority 'High' or 'Urgent' is processed
+          right after the message currently being processed by the receiver.
+
+    See:
+    -----
+        - class XMessenger
+        >>> ITaskProfile.externalQueuePriorityLabels
+    """
+
+    Normal = 0
+    High   = 1
+    Urgent = 2
+#END class EXmsgPriority
+
+
+@unique
+class EXmsgPayloadCodec(IntEnum):
+    """
+    Enum class providing the codecs available to serialize the payload of
+    messages of a given payload type.
+
+    The codecs currently defined are as follows:
+        - Default:
+          the framework selects the codec, i.e. payloads of type XPayload are
+          encoded as 'Compact' if possible, otherwise as 'PickleOob' if they
+          contain large buffers, otherwise as 'Pickle'. Payloads of any other
+          type are encoded as 'Pickle'.
+
+        - Pickle:
+          the payload is pickled in-band, i.e. as a single dump.
+
+        - PickleOob:
+          the payload is pickled by protocol 5 with its large buffers, e.g.
+          bytes, bytearray or numpy arrays, passed out-of-band, i.e. without
+          copying them into the dump.
+
+        - Compact:
+          applicable to payload type XPayload only, i.e. not to subclasses of
+          it, the payload container is encoded via Python's built-in module
+          'marshal' provided all of its keys and values are of primitive
+          types. The receiver gets an instance of XPayload.
+
+    Note:
+    ------
+        - The codec of a payload type is registered by
+          'XMessenger.RegisterPayloadCodec()'.
+        - 'Compact' requires the RTE policy to enable the compact message
+          serialization. Otherwise, or if a payload container is not flat,
+          the payload is encoded as if 'Default' was registered.
+
+    See:
+    -----
+        >>> XMessenger.RegisterPayloadCodec()
+        >>> ERtePolicyID.eEnableCompactMessageSerDes
+    """
+
+    Default   = 0
+    Pickle    = 1
+    PickleOob = 2
+    Compact   = 3
+#END class EXmsgPayloadCodec
+
+
+MessageLatency = namedtuple( 'MessageLatency'
+                           , [ 'senderID' , 'receiverID' , 'labelID' , 'numMessages'
+                             , 'avgDispatchMS' , 'avgQueueMS' , 'avgHandlerMS' , 'avgTotalMS' , 'maxTotalMS'
+                             , 'dispatchHistogram' , 'queueHistogram' , 'handlerHistogram' , 'totalHistogram' ])
+"""
+Latency statistics of messages delivered from a sender to a receiver with a
+given label, a tuple type with below named, immutable fields:
+    - senderID :
+      unique task ID of the sender,
+    - receiverID :
+      unique task ID of the receiver,
+    - labelID :
+      label ID of the messages,
+    - numMessages :
+      number of messages traced so far,
+    - avgDispatchMS :
+      average time in milliseconds from creation of a message until it was
+      put to the external queue of the receiver,
+    - avgQueueMS :
+      average time in milliseconds a message has been waiting in the external
+      queue of the receiver before handed over to ProcessExternalMessage(),
+    - avgHandlerMS :
+      average time in milliseconds spent by ProcessExternalMessage(),
+    - avgTotalMS :
+      average time in milliseconds from creation of a message until its
+      processing by the receiver has been completed,
+    - maxTotalMS :
+      maximum of the total time above in milliseconds,
+    - dispatchHistogram, queueHistogram, handlerHistogram, totalHistogram :
+      tuples of 6 counters each, for the respective time above, each the
+      number of messages with a latency within the ranges below (in
+      milliseconds):
+          [0..0.1), [0.1..1), [1..10), [10..100), [100..1000), [1000..).
+
+Note:
+------
+    - Latency statistics are available only if the RTE policy to enable
+      tracing of message latencies is configured.
+
+See:
+-----
+    >>> ERtePolicyID.eEnableMessageLatencyTracing
+"""
+
+
+MessageTrace = namedtuple( 'MessageTrace'
+                         , [ 'uniqueID' , 'senderID' , 'receiverID' , 'clusterID' , 'labelID'
+                           , 'createdNS' , 'enqueuedNS' , 'dequeuedNS' , 'handedNS' , 'processedNS' ])
+"""
+Trace record of a message delivered to a receiver, a tuple type with below
+named, immutable fields:
+    - uniqueID :
+      unique ID of the message,
+    - senderID :
+      unique task ID of the sender,
+    - receiverID :
+      unique task ID of the receiver,
+    - clusterID :
+      cluster ID of the message,
+    - labelID :
+      label ID of the message,
+    - createdNS :
+      time stamp of the creation of the message,
+    - enqueuedNS :
+      time stamp the message was put to the external queue of the receiver,
+    - dequeuedNS :
+      time stamp the message was taken from the external queue,
+    - handedNS :
+      time stamp the message was handed over to ProcessExternalMessage(),
+    - processedNS :
+      time stamp ProcessExternalMessage() returned.
+
+Note:
+------
+    - All time stamps are in nanoseconds as returned by time.monotonic_ns().
+
+See:
+-----
+    >>> ERtePolicyID.eEnableMessageLatencyTracing
+"""
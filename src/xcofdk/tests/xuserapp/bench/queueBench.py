@@ -0,0 +1,97 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : queueBench.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# PYTHONPATH extension
+# ------------------------------------------------------------------------------
+import os, sys
+_xcoRP = os.path.normpath(os.path.join(os.path.dirname(__file__), '../../../..'))
+if _xcoRP.endswith('/src') and os.path.exists(os.path.join(_xcoRP, 'xcofdk')) and _xcoRP not in sys.path: sys.path.extend([_xcoRP])
+try:
+    import xcofdk
+except ImportError:
+    exit(f"[{os.path.basename(__file__)}] Failed to import Python package 'xcofdk', missing installation.")
+
+
+# ------------------------------------------------------------------------------
+# Import libs / modules
+# ------------------------------------------------------------------------------
+from time import perf_counter_ns
+
+from xcofdk       import fwapi
+from xcofdk.fwcom import EExecutionCmdID
+from xcofdk.fwapi import SyncTask
+
+# framework internal queue implementations, imported for benchmarking purposes only
+from _fw.fwssys.fwmsg.disp.fwqueue      import _FwQueue
+from _fw.fwssys.fwmsg.disp.fwlightqueue import _FwLightQueue
+
+
+# ------------------------------------------------------------------------------
+# Interface
+# ------------------------------------------------------------------------------
+NUM_MESSAGES  = 100000
+QUEUE_SIZE    = _FwQueue.GetFiniteQueueDefaultSize()
+MIN_SPEEDUP   = 5.0
+
+def MeasurePerMessageCostNS(queue_, numMsg_ : int) -> float:
+    _push, _pop = queue_.PushNowait, queue_.PopNowait
+
+    _t0 = perf_counter_ns()
+    for _ii in range(numMsg_):
+        _push(_ii)
+        _pop()
+    return (perf_counter_ns() - _t0) / numMsg_
+
+def RunQueueBench(results_ : dict):
+    _queues = { 'default' : _FwQueue.CreateInstanceBlockingOnSize(maxSize_=QUEUE_SIZE)
+              , 'mpsc'    : _FwLightQueue.CreateInstance(maxSize_=QUEUE_SIZE, bBlockingOnSize_=True, bSingleProducer_=False)
+              , 'spsc'    : _FwLightQueue.CreateInstance(maxSize_=QUEUE_SIZE, bBlockingOnSize_=True, bSingleProducer_=True) }
+
+    for _kk, _qq in _queues.items():
+        MeasurePerMessageCostNS(_qq, NUM_MESSAGES // 10)
+        results_[_kk] = MeasurePerMessageCostNS(_qq, NUM_MESSAGES)
+        _qq.CleanUp()
+    return EExecutionCmdID.STOP
+
+
+# ------------------------------------------------------------------------------
+# Impl
+# ------------------------------------------------------------------------------
+def Main():
+    if not fwapi.StartXcoFW(fwStartOptions_=['--log-level', 'warning']):
+        return 71
+
+    _res  = dict()
+    _tsk  = SyncTask(RunQueueBench, aliasName_='QueueBench')
+    _tsk.Start(_res)
+
+    fwapi.StopXcoFW()
+    _bLcErrorFree = fwapi.JoinXcoFW()
+
+    if len(_res) != 3:
+        return 72
+
+    _bOK = True
+    print(f'Per-message queue cost (push + pop), {NUM_MESSAGES} messages:')
+    for _kk, _vv in _res.items():
+        _speedup = _res['default'] / _vv
+        print(f'    {_kk:<8s} : {_vv:10.1f} ns  (speedup {_speedup:6.1f}x)')
+        if _kk != 'default':
+            _bOK = _bOK and (_speedup >= MIN_SPEEDUP)
+    _bOK = _bOK and (_res['spsc'] <= _res['mpsc'])
+    return 0 if (_bOK and _bLcErrorFree) else 73
+
+
+# ------------------------------------------------------------------------------
+# Execution
+# ------------------------------------------------------------------------------
+if __name__ == "__main__":
+    exit(Main())
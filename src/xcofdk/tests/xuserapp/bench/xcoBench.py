@@ -0,0 +1,604 @@
+# #!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# File   : xcoBench.py
+#
+# Copyright(c) 2023-2025 Farzad Safa (farzad.safa@xcofdk.de)
+# This software is distributed under the MIT License (http://opensource.org/licenses/MIT).
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# PYTHONPATH extension
+# ------------------------------------------------------------------------------
+import os, sys
+_xcoRP = os.path.normpath(os.path.join(os.path.dirname(__file__), '../../../..'))
+if _xcoRP.endswith('/src') and os.path.exists(os.path.join(_xcoRP, 'xcofdk')) and _xcoRP not in sys.path: sys.path.extend([_xcoRP])
+try:
+    import xcofdk
+except ImportError:
+    exit(f"[{os.path.basename(__file__)}] Failed to import Python package 'xcofdk', missing installation.")
+
+
+# ------------------------------------------------------------------------------
+# Import libs / modules
+# ------------------------------------------------------------------------------
+import json
+import shutil
+import socket
+import subprocess
+import tempfile
+from argparse  import ArgumentParser
+from datetime  import datetime
+from statistics import median
+from threading import Event, Thread
+from time      import perf_counter_ns, sleep
+
+from xcofdk             import fwapi
+from xcofdk.fwcom       import EExecutionCmdID, EXmsgPredefinedID, EXmsgPriority
+from xcofdk.fwcom.fwdefs import ELineEnding, ELogRDOverflowPolicy
+from xcofdk.fwapi       import rtecfg, xlogif
+from xcofdk.fwapi       import SyncTask, AsyncTask, MessageDrivenTask, XProcess
+from xcofdk.fwapi.fwctrl import fwutil
+from xcofdk.fwapi.xmt   import XTask, XTaskProfile
+
+
+# ------------------------------------------------------------------------------
+# Interface
+# ------------------------------------------------------------------------------
+"""
+Benchmark suite of the framework, measuring:
+    - throughput and latency of SendMessage()/BroadcastMessage() for the
+      topologies 1->1, 1->N and N->1,
+    - throughput and latency of SendMessage() for the topology 1->1 with a
+      message-driven XTask receiver, both with fast delivery of its external
+      queue disabled ('xtask_1to1') and enabled ('xtask_1to1_fd'),
+    - throughput of SendMessages() for batches mixing high priority and
+      normal messages sent to a nearly full XTask receiver ('xtask_prio_mix'),
+      the run fails if a message accepted by the framework is lost or
+      delivered more than once,
+    - round-trip time of StartXcoFW() -> StopXcoFW()/JoinXcoFW(),
+    - start/join cost of a large number of SyncTask, AsyncTask and XProcess
+      instances,
+    - throughput of xlogif.LogInfo() for the console, file and TCP sinks,
+      the file and TCP sinks use the overflow policy BLOCK. The TCP run
+      fails if not all log records were received.
+
+Each scenario is executed by a separate Python process, as the framework can
+be started only once per process. Results are written as JSON, e.g.:
+
+    >>> python3 xcoBench.py --out bench.json
+    >>> python3 xcoBench.py --scenario msg_1to1 msg_Nto1 --repeat 5
+    >>> python3 xcoBench.py --scenario xtask_1to1 xtask_1to1_fd xtask_prio_mix
+    >>> python3 xcoBench.py --out new.json --baseline bench.json --tolerance 15
+
+With a baseline file passed, the median of each metric is compared to the
+baseline and the script exits with a non-zero code if a metric regressed by
+more than the given tolerance (in percent). Metrics whose name ends with
+'PerSec' are considered the higher the better, all other metrics ending with
+'MS' or 'US' the lower the better.
+"""
+
+BENCH_FORMAT_VERSION = 1
+
+NUM_MESSAGES    = 10000
+NUM_PEERS       = 4
+NUM_TASKS       = 1000
+NUM_PROCESSES   = 1000
+NUM_LOGS        = 20000
+SCENARIO_TIMEOUT_SEC = 900
+
+FW_START_OPTIONS = [ '--log-level', 'warning', '--suppress-start-preamble', '--disable-log-highlighting' ]
+
+LOG_BENCH_MSG = 'xcoBench log record with a typical payload size of some sixty bytes'
+LOG_SINK_WAIT_SEC = 10.0
+
+LBL_BENCH      = EXmsgPredefinedID.MinUserDefinedID.value
+LBL_BENCH_PRIO = LBL_BENCH + 1
+PRIO_BATCH_SIZE = 16
+PRIO_QUEUE_SIZE = 200   # default capacity of the external queue of a task
+PRIO_RCV_WAIT_SEC = 30
+
+
+def Percentile(sortedValues_ : list, pct_ : float):
+    if len(sortedValues_) < 1:
+        return None
+    return sortedValues_[min(len(sortedValues_)-1, int(round(pct_ / 100.0 * (len(sortedValues_) - 1))))]
+
+
+class MsgReceiver:
+    def __init__(self, numExpected_ : int):
+        self.latNS  = []
+        self.tLast  = None
+        self.numRcv = 0
+        self.numExp = numExpected_
+
+    def OnMessage(self, msg_) -> EExecutionCmdID:
+        _tNow = perf_counter_ns()
+        self.latNS.append(_tNow - msg_.msgPayload.GetParameter('t'))
+        self.tLast   = _tNow
+        self.numRcv += 1
+        return EExecutionCmdID.STOP if self.numRcv >= self.numExp else EExecutionCmdID.CONTINUE
+
+
+class BenchXTaskReceiver(XTask):
+    def __init__(self, rcv_ : MsgReceiver, bFastDelivery_ : bool):
+        _prf = XTaskProfile.CreateAsyncTaskProfile(aliasName_='BenchXRcv')
+        _prf.isExternalQueueEnabled      = True
+        _prf.isExternalQueueBlocking     = True
+        _prf.isExternalQueueFastDelivery = bFastDelivery_
+        super().__init__(taskProfile_=_prf)
+        self.__rcv = rcv_
+
+    def ProcessExternalMessage(self, xmsg_) -> EExecutionCmdID:
+        return self.__rcv.OnMessage(xmsg_)
+
+
+class MsgSender:
+    def __init__(self, numMsgs_ : int, rcvUIDs_ : list, bBroadcast_ : bool):
+        self.tFirst   = None
+        self.numSent  = 0
+        self.numRetry = 0
+        self.numMsgs  = numMsgs_
+        self.rcvUIDs  = rcvUIDs_
+        self.bBCast   = bBroadcast_
+
+    def Run(self, myTsk_) -> EExecutionCmdID:
+        self.tFirst = perf_counter_ns()
+        for _ii in range(self.numMsgs):
+            if self.bBCast:
+                self.__Send(lambda: myTsk_.BroadcastMessage(LBL_BENCH, msgPayload_={'t' : perf_counter_ns()}))
+            else:
+                for _rr in self.rcvUIDs:
+                    self.__Send(lambda: myTsk_.SendMessage(_rr, LBL_BENCH, msgPayload_={'t' : perf_counter_ns()}))
+        return EExecutionCmdID.STOP
+
+    def __Send(self, sendFunc_):
+        # back off while the receiver's external queue is full
+        for _ii in range(10000):
+            if sendFunc_() > 0:
+                self.numSent += 1
+                return
+            self.numRetry += 1
+            sleep(0.0005)
+
+
+def RunMessaging(topology_ : str, numMsgs_ : int, numPeers_ : int) -> dict:
+    _bXTask = topology_.startswith('xtask_')
+    _bBCast = topology_ == 'bcast_1toN'
+    _numRcv = 1 if _bXTask or (topology_ in ('msg_1to1', 'msg_Nto1')) else numPeers_
+    _numSnd = numPeers_ if topology_ == 'msg_Nto1' else 1
+
+    _lstR = [ MsgReceiver(numMsgs_ * _numSnd) for _ in range(_numRcv) ]
+    if _bXTask:
+        _rcvs = [ BenchXTaskReceiver(_lstR[0], topology_ == 'xtask_1to1_fd') ]
+    else:
+        _rcvs = [ MessageDrivenTask(_rr.OnMessage, aliasName_=f'BenchRcv{_ii}') for _ii, _rr in enumerate(_lstR) ]
+    for _tt in _rcvs:
+        _tt.Start()
+    _rcvUIDs = [ _tt.taskUID for _tt in _rcvs ]
+
+    _lstS = [ MsgSender(numMsgs_, _rcvUIDs, _bBCast) for _ in range(_numSnd) ]
+    _snds = [ AsyncTask(_ss.Run, aliasName_=f'BenchSnd{_ii}', bRefToCurTaskRequired_=True) for _ii, _ss in enumerate(_lstS) ]
+    for _tt in _snds:
+        _tt.Start()
+
+    fwapi.JoinTasks([ _tt.taskUID for _tt in _snds ])
+    fwapi.JoinTasks(_rcvUIDs, maxWaitTime_=SCENARIO_TIMEOUT_SEC / 2)
+
+    _latNS = sorted(_ns for _rr in _lstR for _ns in _rr.latNS)
+    _numRcvd = len(_latNS)
+    _tFirst  = min(_ss.tFirst for _ss in _lstS if _ss.tFirst is not None)
+    _tLast   = max((_rr.tLast for _rr in _lstR if _rr.tLast is not None), default=_tFirst)
+    _durNS   = max(1, _tLast - _tFirst)
+
+    return { 'numSenders'      : _numSnd
+           , 'numReceivers'    : _numRcv
+           , 'numSent'         : sum(_ss.numSent for _ss in _lstS)
+           , 'numReceived'     : _numRcvd
+           , 'numSendRetries'  : sum(_ss.numRetry for _ss in _lstS)
+           , 'durationMS'      : _durNS / 1e6
+           , 'msgsPerSec'      : _numRcvd * 1e9 / _durNS
+           , 'latencyP50US'    : None if _numRcvd < 1 else Percentile(_latNS, 50) / 1e3
+           , 'latencyP99US'    : None if _numRcvd < 1 else Percentile(_latNS, 99) / 1e3
+           , 'latencyMaxUS'    : None if _numRcvd < 1 else _latNS[-1] / 1e3 }
+
+
+class BenchXTaskPrioReceiver(XTask):
+    def __init__(self, numExpected_ : int):
+        _prf = XTaskProfile.CreateAsyncTaskProfile(aliasName_='BenchXPrioRcv')
+        _prf.isExternalQueueEnabled      = True
+        _prf.isExternalQueueBlocking     = True
+        _prf.externalQueuePriorityLabels = { LBL_BENCH_PRIO : EXmsgPriority.High }
+        super().__init__(taskProfile_=_prf)
+        self.lstSeq = []
+        self.tLast  = None
+        self.numExp = numExpected_
+
+    def ProcessExternalMessage(self, xmsg_) -> EExecutionCmdID:
+        # slow consumer, so the external queue is nearly full most of the time
+        sleep(0.0002)
+        self.lstSeq.append(xmsg_.msgPayload.GetParameter('seq'))
+        self.tLast = perf_counter_ns()
+        return EExecutionCmdID.STOP if len(self.lstSeq) >= self.numExp else EExecutionCmdID.CONTINUE
+
+
+def RunPrioMixMessaging(numMsgs_ : int) -> dict:
+    _rcv = BenchXTaskPrioReceiver(numMsgs_)
+    _rcv.Start()
+
+    _stats = { 'tFirst' : None, 'numRetry' : 0, 'accepted' : set() }
+
+    def _SendBatches(myTsk_) -> EExecutionCmdID:
+        _stats['tFirst'] = perf_counter_ns()
+        _pending = list(range(numMsgs_))
+        for _ii in range(100000):
+            if len(_pending) < 1:
+                break
+            # keep the receiver nearly full, so each batch is partly rejected,
+            # but do not flood it, as pending deliveries are dropped by the
+            # dispatcher once its retry limit is reached
+            while (len(_stats['accepted']) - len(_rcv.lstSeq)) > (PRIO_QUEUE_SIZE - PRIO_BATCH_SIZE // 2):
+                sleep(0.0001)
+
+            _batch   = _pending[:PRIO_BATCH_SIZE]
+            _pending = _pending[PRIO_BATCH_SIZE:]
+            _msgs    = [ (_rcv.taskUID, LBL_BENCH_PRIO if (_seq % 2) == 0 else LBL_BENCH, {'seq' : _seq}) for _seq in _batch ]
+
+            _lstUID   = myTsk_.SendMessages(_msgs)
+            _rejected = [ _seq for _seq, _uid in zip(_batch, _lstUID) if _uid < 1 ]
+            _stats['accepted'].update(_seq for _seq, _uid in zip(_batch, _lstUID) if _uid > 0)
+            if len(_rejected):
+                _stats['numRetry'] += len(_rejected)
+                _pending = _rejected + _pending
+                sleep(0.0005)
+        return EExecutionCmdID.STOP
+
+    _snd = AsyncTask(_SendBatches, aliasName_='BenchPrioSnd', bRefToCurTaskRequired_=True)
+    _snd.Start()
+
+    fwapi.JoinTasks([ _snd.taskUID ])
+    fwapi.JoinTasks([ _rcv.taskUID ], maxWaitTime_=PRIO_RCV_WAIT_SEC)
+
+    _lstSeq   = list(_rcv.lstSeq)
+    _numRcvd  = len(_lstSeq)
+    _numDup   = _numRcvd - len(set(_lstSeq))
+    _numLost  = len(_stats['accepted'] - set(_lstSeq))
+    _tFirst   = _stats['tFirst'] if _stats['tFirst'] is not None else perf_counter_ns()
+    _durNS    = max(1, (_rcv.tLast if _rcv.tLast is not None else _tFirst) - _tFirst)
+
+    res = { 'numSent'         : len(_stats['accepted'])
+          , 'numReceived'     : _numRcvd
+          , 'numSendRetries'  : _stats['numRetry']
+          , 'numDuplicates'   : _numDup
+          , 'numLost'         : _numLost
+          , 'durationMS'      : _durNS / 1e6
+          , 'msgsPerSec'      : _numRcvd * 1e9 / _durNS }
+    if (_numDup > 0) or (_numLost > 0):
+        res['error'] = f'{_numLost} accepted message(s) lost, {_numDup} message(s) delivered more than once'
+    return res
+
+
+def _Noop(*args_, **kwargs_) -> EExecutionCmdID:
+    return EExecutionCmdID.STOP
+
+def _ProcNoop():
+    pass
+
+def RunTaskLifecycle(kind_ : str, numInst_ : int) -> dict:
+    _t0 = perf_counter_ns()
+    if kind_ == 'tasks_sync':
+        _lst = [ SyncTask(_Noop) for _ in range(numInst_) ]
+    elif kind_ == 'tasks_async':
+        _lst = [ AsyncTask(_Noop) for _ in range(numInst_) ]
+    else:
+        _lst = [ XProcess(_ProcNoop) for _ in range(numInst_) ]
+    _t1 = perf_counter_ns()
+
+    for _ii in _lst:
+        _ii.Start()
+    _t2 = perf_counter_ns()
+
+    if kind_ == 'procs':
+        fwapi.JoinProcesses()
+    else:
+        fwapi.JoinTasks([ _ii.taskUID for _ii in _lst ])
+    _t3 = perf_counter_ns()
+
+    return { 'numInstances'     : numInst_
+           , 'createMS'         : (_t1 - _t0) / 1e6
+           , 'startMS'          : (_t2 - _t1) / 1e6
+           , 'joinMS'           : (_t3 - _t2) / 1e6
+           , 'perInstanceUS'    : (_t3 - _t0) / 1e3 / max(1, numInst_)
+           , 'instancesPerSec'  : numInst_ * 1e9 / max(1, _t3 - _t0) }
+
+
+class TcpLogDrain(Thread):
+    """
+    Client of the TCP sink of the framework, counting the bytes received.
+
+    The first log record received with the text 'probe_' passed to
+    WaitForSink() marks the sink as up, its size is taken as the size of
+    each benchmark log record. Bytes received up to and including it are not
+    counted by 'numBenchBytes'.
+    """
+    def __init__(self, port_ : int):
+        super().__init__(daemon=True)
+        self.port        = port_
+        self.numBytes    = 0
+        self.probeBytes  = None
+        self.recordSize  = None
+        self.evConnected = Event()
+        self.__probe     = None
+        self.__buf       = b''
+        self.__evProbed  = Event()
+
+    @property
+    def numBenchBytes(self) -> int:
+        return 0 if self.probeBytes is None else self.numBytes - self.probeBytes
+
+    def WaitForSink(self, probe_ : str, timeout_ : float) -> bool:
+        if not self.evConnected.wait(timeout_):
+            return False
+        self.__probe = probe_.encode()
+        xlogif.LogInfo(probe_)
+        return self.__evProbed.wait(timeout_)
+
+    def run(self):
+        _ss = None
+        for _ii in range(200):
+            try:
+                _ss = socket.create_connection(('127.0.0.1', self.port), timeout=1.0)
+                break
+            except OSError:
+                sleep(0.05)
+        if _ss is None:
+            return
+        self.evConnected.set()
+        with _ss:
+            _ss.settimeout(5.0)
+            while True:
+                try:
+                    _dd = _ss.recv(65536)
+                except OSError:
+                    break
+                if not _dd:
+                    break
+                self.numBytes += len(_dd)
+                if not self.__evProbed.is_set():
+                    self.__FindProbe(_dd)
+
+    def __FindProbe(self, data_ : bytes):
+        self.__buf += data_
+        if self.__probe is None:
+            return
+        _pos = self.__buf.find(self.__probe)
+        if _pos < 0:
+            return
+        _end = self.__buf.find(b'\n', _pos)
+        if _end < 0:
+            return
+        self.recordSize = _end + 1 - (self.__buf.rfind(b'\n', 0, _pos) + 1)
+        self.probeBytes = self.numBytes - (len(self.__buf) - (_end + 1))
+        self.__buf      = b''
+        self.__evProbed.set()
+
+def GetFreeTcpPort() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as _ss:
+        _ss.bind(('127.0.0.1', 0))
+        return _ss.getsockname()[1]
+
+def ConfigureLogSink(sink_ : str, tmpDir_ : str):
+    # sinks block instead of dropping records, so all records are written
+    if sink_ == 'log_file':
+        rtecfg.RtePolicyDisableLogRDConsoleSink()
+        rtecfg.RtePolicyEnableLogRDFileSink(os.path.join(tmpDir_, 'bench.log'), overflowPolicy_=ELogRDOverflowPolicy.BLOCK)
+        return None
+    if sink_ == 'log_tcp':
+        _port = GetFreeTcpPort()
+        rtecfg.RtePolicyDisableLogRDConsoleSink()
+        rtecfg.RtePolicyEnableLogRDTcpSink('127.0.0.1', _port, ELineEnding.LF, overflowPolicy_=ELogRDOverflowPolicy.BLOCK)
+        _drain = TcpLogDrain(_port)
+        _drain.start()
+        return _drain
+    return None
+
+def RunLogging(numLogs_ : int, tcpDrain_ : TcpLogDrain =None) -> dict:
+    _msg = LOG_BENCH_MSG
+
+    # make sure records are actually sent before the timing starts
+    if (tcpDrain_ is not None) and not tcpDrain_.WaitForSink(_msg, LOG_SINK_WAIT_SEC):
+        return { 'error' : 'TCP log sink not connected' }
+
+    _t0 = perf_counter_ns()
+    for _ii in range(numLogs_):
+        xlogif.LogInfo(_msg)
+    _t1 = perf_counter_ns()
+
+    return { 'numLogs'     : numLogs_
+           , 'submitMS'    : (_t1 - _t0) / 1e6
+           , 'logsPerSec'  : numLogs_ * 1e9 / max(1, _t1 - _t0) }
+
+
+def RunScenario(scenario_ : str, args_) -> dict:
+    _tmpDir  = tempfile.mkdtemp(prefix='xcobench_')
+    _fwOpts  = list(FW_START_OPTIONS)
+    _drain   = None
+
+    if scenario_.startswith('log_'):
+        _fwOpts[1] = 'info'
+        _drain = ConfigureLogSink(scenario_, _tmpDir)
+    if args_.dispatch_shards > 0:
+        rtecfg.RtePolicyEnableShardedMessageDispatch(args_.dispatch_shards)
+
+    _t0 = perf_counter_ns()
+    if not fwapi.StartXcoFW(fwStartOptions_=_fwOpts):
+        return { 'error' : 'failed to start the framework' }
+    _t1 = perf_counter_ns()
+
+    if scenario_ == 'fw_roundtrip':
+        res = dict()
+    elif scenario_ in ('msg_1to1', 'msg_1toN', 'msg_Nto1', 'bcast_1toN', 'xtask_1to1', 'xtask_1to1_fd'):
+        res = RunMessaging(scenario_, args_.num_msgs, args_.num_peers)
+    elif scenario_ == 'xtask_prio_mix':
+        res = RunPrioMixMessaging(args_.num_msgs)
+    elif scenario_ in ('tasks_sync', 'tasks_async'):
+        res = RunTaskLifecycle(scenario_, args_.num_tasks)
+    elif scenario_ == 'procs':
+        res = RunTaskLifecycle(scenario_, args_.num_procs)
+    else:
+        res = RunLogging(args_.num_logs, tcpDrain_=_drain)
+
+    _t2 = perf_counter_ns()
+    fwapi.StopXcoFW()
+    _bLcErrorFree = fwapi.JoinXcoFW()
+    _t3 = perf_counter_ns()
+
+    if scenario_ == 'fw_roundtrip':
+        res = { 'startMS' : (_t1 - _t0) / 1e6, 'stopJoinMS' : (_t3 - _t2) / 1e6, 'roundTripMS' : (_t3 - _t0) / 1e6 }
+    elif scenario_.startswith('log_'):
+        res['drainMS'] = (_t3 - _t2) / 1e6
+        if scenario_ == 'log_file':
+            _fp = os.path.join(_tmpDir, 'bench.log')
+            res['numBytes'] = os.path.getsize(_fp) if os.path.exists(_fp) else 0
+        elif (_drain is not None) and ('error' not in res):
+            # the sink is flushed and closed by the framework on shutdown
+            _drain.join(timeout=LOG_SINK_WAIT_SEC)
+            _numExp = args_.num_logs * _drain.recordSize
+            res['numBytes']      = _drain.numBenchBytes
+            res['expectedBytes'] = _numExp
+            if _drain.is_alive():
+                res['error'] = 'TCP log drain not finished'
+            elif res['numBytes'] < _numExp:
+                res['error'] = f'TCP log sink sent {res["numBytes"]} of {_numExp} bytes'
+    res['lcErrorFree'] = _bLcErrorFree
+
+    shutil.rmtree(_tmpDir, ignore_errors=True)
+    return res
+
+
+# ------------------------------------------------------------------------------
+# Impl
+# ------------------------------------------------------------------------------
+ALL_SCENARIOS = [ 'fw_roundtrip'
+                , 'msg_1to1', 'msg_1toN', 'msg_Nto1', 'bcast_1toN'
+                , 'xtask_1to1', 'xtask_1to1_fd', 'xtask_prio_mix'
+                , 'tasks_sync', 'tasks_async', 'procs'
+                , 'log_console', 'log_file', 'log_tcp' ]
+
+def ParseArgs():
+    _ap = ArgumentParser(description='XCOFDK benchmark suite, results are written as JSON.')
+    _ap.add_argument('--scenario', nargs='+', choices=ALL_SCENARIOS, default=ALL_SCENARIOS)
+    _ap.add_argument('--repeat', type=int, default=3)
+    _ap.add_argument('--num-msgs', type=int, default=NUM_MESSAGES)
+    _ap.add_argument('--num-peers', type=int, default=NUM_PEERS)
+    _ap.add_argument('--num-tasks', type=int, default=NUM_TASKS)
+    _ap.add_argument('--num-procs', type=int, default=NUM_PROCESSES)
+    _ap.add_argument('--num-logs', type=int, default=NUM_LOGS)
+    _ap.add_argument('--timeout', type=int, default=SCENARIO_TIMEOUT_SEC)
+    _ap.add_argument('--dispatch-shards', type=int, default=0, help='number of message dispatch shards, 0 for a single dispatcher')
+    _ap.add_argument('--out', default=None, help='path of the JSON result file, stdout if omitted')
+    _ap.add_argument('--baseline', default=None, help='path of a JSON result file to compare with')
+    _ap.add_argument('--tolerance', type=float, default=10.0, help='max. allowed regression in percent')
+    _ap.add_argument('--run-scenario', default=None, help='internal use only')
+    _ap.add_argument('--result-file', default=None, help='internal use only')
+    return _ap.parse_args()
+
+def SpawnScenario(scenario_ : str, args_) -> dict:
+    _fd, _rf = tempfile.mkstemp(prefix='xcobench_', suffix='.json')
+    os.close(_fd)
+
+    _cmd = [ sys.executable, os.path.abspath(__file__), '--run-scenario', scenario_, '--result-file', _rf
+           , '--num-msgs', str(args_.num_msgs), '--num-peers', str(args_.num_peers), '--num-tasks', str(args_.num_tasks)
+           , '--num-procs', str(args_.num_procs), '--num-logs', str(args_.num_logs), '--dispatch-shards', str(args_.dispatch_shards) ]
+    try:
+        _cp = subprocess.run(_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=args_.timeout)
+        with open(_rf, 'r') as _ff:
+            _txt = _ff.read()
+        res = json.loads(_txt) if len(_txt) else { 'error' : f'no result, exit code {_cp.returncode}: ' + _cp.stderr.decode(errors='replace')[-500:] }
+    except subprocess.TimeoutExpired:
+        res = { 'error' : f'timeout after {args_.timeout} seconds' }
+    finally:
+        os.remove(_rf)
+    return res
+
+def Summarize(runs_ : list) -> dict:
+    res = dict()
+    _ok = [ _rr for _rr in runs_ if 'error' not in _rr ]
+    for _kk in (_ok[0].keys() if len(_ok) else []):
+        _vals = [ _rr[_kk] for _rr in _ok if isinstance(_rr.get(_kk), (int, float)) and not isinstance(_rr.get(_kk), bool) ]
+        if len(_vals):
+            res[_kk] = median(_vals)
+    return res
+
+def CompareToBaseline(report_ : dict, baselineFile_ : str, tolerancePct_ : float) -> list:
+    with open(baselineFile_, 'r') as _ff:
+        _base = json.load(_ff)
+
+    res = []
+    for _sc, _cur in report_['summary'].items():
+        _ref = _base.get('summary', dict()).get(_sc, None)
+        if _ref is None:
+            continue
+        for _kk, _vv in _cur.items():
+            _rv = _ref.get(_kk, None)
+            if not isinstance(_rv, (int, float)) or (_rv <= 0) or (_vv is None):
+                continue
+            if _kk.endswith('PerSec'):
+                _delta = (_rv - _vv) * 100.0 / _rv
+            elif _kk.endswith('MS') or _kk.endswith('US'):
+                _delta = (_vv - _rv) * 100.0 / _rv
+            else:
+                continue
+            if _delta > tolerancePct_:
+                res.append({ 'scenario' : _sc, 'metric' : _kk, 'baseline' : _rv, 'current' : _vv, 'regressionPct' : round(_delta, 1) })
+    return res
+
+def Main():
+    _args = ParseArgs()
+
+    if _args.run_scenario is not None:
+        _res = RunScenario(_args.run_scenario, _args)
+        with open(_args.result_file, 'w') as _ff:
+            json.dump(_res, _ff)
+        return 0 if 'error' not in _res else 71
+
+    _report = { 'formatVersion' : BENCH_FORMAT_VERSION
+              , 'meta' : { 'timestamp'     : datetime.now().isoformat(timespec='seconds')
+                         , 'xcofdkVersion' : fwutil.GetXcofdkVersion()
+                         , 'pythonVersion' : fwutil.GetPythonVersion()
+                         , 'platform'      : fwutil.GetPlatform()
+                         , 'numCpuCores'   : fwutil.GetAvailableCpuCoresCount()
+                         , 'params'        : { 'numMsgs' : _args.num_msgs, 'numPeers' : _args.num_peers, 'numTasks' : _args.num_tasks
+                                             , 'numProcs' : _args.num_procs, 'numLogs' : _args.num_logs, 'repeat' : _args.repeat } }
+              , 'runs'    : dict()
+              , 'summary' : dict() }
+
+    _bErr = False
+    for _sc in _args.scenario:
+        _runs = [ SpawnScenario(_sc, _args) for _ in range(max(1, _args.repeat)) ]
+        _bErr = _bErr or any('error' in _rr for _rr in _runs)
+        _report['runs'][_sc]    = _runs
+        _report['summary'][_sc] = Summarize(_runs)
+        print(f'[xcoBench] {_sc:<12s} : {json.dumps(_report["summary"][_sc])}', file=sys.stderr)
+
+    if _args.baseline is not None:
+        _report['regressions'] = CompareToBaseline(_report, _args.baseline, _args.tolerance)
+
+    _txt = json.dumps(_report, indent=2)
+    if _args.out is None:
+        print(_txt)
+    else:
+        with open(_args.out, 'w') as _ff:
+            _ff.write(_txt + '\n')
+
+    if _bErr:
+        return 72
+    return 73 if len(_report.get('regressions', [])) else 0
+
+
+# ------------------------------------------------------------------------------
+# Execution
+# ------------------------------------------------------------------------------
+if __name__ == "__main__":
+    exit(Main())